@@ -4,7 +4,9 @@ from flask import Flask, current_app
 from qsomap.upload import upload_bp
 from qsomap.handlers import register_routes, register_error_handlers
 from qsomap.utils.version import get_version
+from qsomap.utils.logging_setup import configure_queue_logging
 from qsomap.common.callinfo_provider import CallInfoProvider
+from qsomap.common.result_cache import processed_logs, wrapped_statistics
 
 # Initialize Flask app
 app = Flask(__name__,
@@ -23,19 +25,18 @@ DEBUG = os.environ.get('FLASK_DEBUG', 'False').lower() in ('true', '1', 'yes')
 app.debug = DEBUG
 
 # Configure logging EARLY (before other initializations)
-# Create logs directory if it doesn't exist
-logs_dir = os.path.join(os.path.dirname(__file__), 'logs')
+# Create logs directory if it doesn't exist (LOG_DIR overrides the default logs/)
+logs_dir = os.environ.get('LOG_DIR') or os.path.join(os.path.dirname(__file__), 'logs')
 os.makedirs(logs_dir, exist_ok=True)
 
-# Configure logging to file and console
+# Configure logging to file and console through a non-blocking queue
 log_file = os.path.join(logs_dir, 'app.log')
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+configure_queue_logging(
     handlers=[
         logging.FileHandler(log_file),
         logging.StreamHandler()
-    ]
+    ],
+    level=logging.INFO
 )
 logger = logging.getLogger(__name__)
 
@@ -43,6 +44,18 @@ logger = logging.getLogger(__name__)
 # This will be stored for the entire lifetime of the application
 app.callinfo = CallInfoProvider.get()
 
+
+def start_country_data_refresher():
+    """Start background reloading of country data (COUNTRY_DATA_RELOAD_INTERVAL)."""
+    def _swap_callinfo(callinfo):
+        app.callinfo = callinfo
+        # Cached logs were processed with the previous country data
+        processed_logs.clear()
+        wrapped_statistics.clear()
+
+    return CallInfoProvider.start_refresher(on_reload=_swap_callinfo)
+
+
 # Populate Redis cache at app startup (only once)
 def _populate_redis_at_startup():
     """Populate Redis with country data at app startup."""
@@ -84,6 +97,7 @@ def inject_version():
 
 
 if __name__ == '__main__':
+    start_country_data_refresher()
     if DEBUG:
         # Show debugger PIN when in debug mode
         from werkzeug.debug import DebuggedApplication  # noqa: F401
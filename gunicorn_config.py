@@ -36,3 +36,11 @@ certfile = None
 
 # Application
 raw_env = ["FLASK_ENV=production"]
+
+
+def post_fork(server, worker):
+    """Start background threads in each worker (threads do not survive fork)."""
+    from qsomap.utils.logging_setup import restart_queue_listener
+    from app import start_country_data_refresher
+    restart_queue_listener()
+    start_country_data_refresher()
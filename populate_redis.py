@@ -5,9 +5,9 @@ Uses pyhamtools copy_data_in_redis() method to copy lookup data to Redis.
 Run this during app initialization or manually to cache country data.
 """
 import os
+import time
 import logging
 import redis
-from pyhamtools import LookupLib
 
 # Configure logging
 logging.basicConfig(
@@ -19,6 +19,9 @@ logger = logging.getLogger(__name__)
 # Redis prefix for storing country file data
 REDIS_PREFIX = "CF"
 
+# Version key watched by running workers to hot reload country data
+REDIS_VERSION_KEY = f"{REDIS_PREFIX}:version"
+
 
 def get_redis_client():
     """Get Redis client connection."""
@@ -32,6 +35,9 @@ def populate_redis_from_countryfile():
     
     This is the recommended way according to pyhamtools documentation.
     """
+    # Imported here so verify_redis() does not pay for loading pyhamtools
+    from pyhamtools import LookupLib
+
     logger.info("Populating Redis with country file data using pyhamtools...")
     
     try:
@@ -57,6 +63,9 @@ def populate_redis_from_countryfile():
         
         if result:
             logger.info(f"✓ Successfully copied lookup data to Redis")
+
+            # Bump version so running workers reload country data
+            r.set(REDIS_VERSION_KEY, str(time.time_ns()))
             
             # Verify by counting keys
             key_pattern = f"{REDIS_PREFIX}*".encode()
@@ -1,8 +1,18 @@
 """Provider for Callinfo with Redis caching."""
 import os
+import time
 import logging
-import redis
-from pyhamtools import LookupLib, Callinfo
+import threading
+from contextlib import contextmanager
+from .cty_index import (
+    CtyIndex, compile_cty_index, compressed_index_file, is_index_stale, DEFAULT_CTY_DAT, DEFAULT_INDEX_FILE
+)
+from .circuit_breaker import CircuitBreaker
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory file locks
+    fcntl = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -10,12 +20,151 @@ logger = logging.getLogger(__name__)
 # Redis prefix matching populate_redis.py
 REDIS_PREFIX = "CF"
 
+# Redis key bumped by populate_redis.py whenever country data is replaced
+REDIS_VERSION_KEY = f"{REDIS_PREFIX}:version"
+
+
+class ResilientCallinfo:
+    """
+    Redis-backed Callinfo guarded by a circuit breaker.
+
+    Redis errors and timeouts count as failures; after repeated failures the
+    breaker opens and lookups go straight to the local compiled index until
+    Redis recovers. Unknown callsigns (KeyError) are not failures.
+    """
+
+    def __init__(self, primary, fallback=None, breaker=None):
+        """
+        Initialize resilient lookup.
+
+        Args:
+            primary: Redis-backed pyhamtools Callinfo
+            fallback: Local lookup with get_all (e.g. CtyIndex), optional
+            breaker: CircuitBreaker instance (created if not provided)
+        """
+        self.primary = primary
+        self.fallback = fallback
+        self.breaker = breaker or CircuitBreaker()
+        self.fallback_lookups = 0
+
+        import redis
+        self._redis_errors = (redis.RedisError, OSError)
+
+    def _fallback_lookup(self, callsign, timestamp):
+        self.fallback_lookups += 1
+        if self.fallback is None:
+            raise KeyError(callsign)
+        return self.fallback.get_all(callsign, timestamp)
+
+    def get_all(self, callsign, timestamp=None):
+        """
+        Lookup callsign, compatible with pyhamtools ``Callinfo.get_all``.
+
+        Raises:
+            KeyError: Callsign could not be identified
+        """
+        if not self.breaker.allow_request():
+            return self._fallback_lookup(callsign, timestamp)
+
+        try:
+            result = self.primary.get_all(callsign, timestamp)
+        except KeyError:
+            self.breaker.record_success()
+            raise
+        except self._redis_errors as e:
+            if self.breaker.record_failure():
+                logger.warning(f"Redis lookups failing ({e}), circuit breaker opened, using local index")
+            return self._fallback_lookup(callsign, timestamp)
+
+        self.breaker.record_success()
+        return result
+
+    def metrics(self):
+        """Get circuit breaker metrics."""
+        metrics = self.breaker.metrics()
+        metrics['fallback_lookups'] = self.fallback_lookups
+        return metrics
+
+
+@contextmanager
+def _index_compile_lock(index_file):
+    """
+    Hold an exclusive lock next to the compiled index while compiling it.
+
+    Every worker runs its own refresher, so without the lock all of them
+    would compile the same CTY.DAT at once when it changes.
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(f"{index_file}.lock", 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class CountryDataRefresher(threading.Thread):
+    """
+    Background thread which reloads country data when its source changes.
+
+    The new lookup is built on this thread and swapped in atomically, so
+    requests never wait for it and in-flight requests keep the old snapshot.
+    """
+
+    def __init__(self, interval, on_reload=None):
+        super().__init__(name='country-data-refresher', daemon=True)
+        self.interval = interval
+        self.on_reload = on_reload
+        self._stop_event = threading.Event()
+        self._version = CallInfoProvider.source_version()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                logger.warning(f"Country data refresh failed: {e}")
+
+    def check(self):
+        """
+        Reload country data if the source version changed.
+
+        Returns:
+            True if new country data was swapped in
+        """
+        version = CallInfoProvider.source_version()
+        if version is None or version == self._version:
+            return False
+
+        logger.info(f"Country data source changed ({self._version} -> {version}), reloading")
+        callinfo = CallInfoProvider.reload()
+        self._version = version
+        if self.on_reload:
+            self.on_reload(callinfo)
+        return True
+
+    def stop(self):
+        """Stop the refresher thread."""
+        self._stop_event.set()
+
 
 class CallInfoProvider:
-    """Provider class for initializing and managing Callinfo with Redis caching."""
+    """
+    Provider class for initializing and managing Callinfo with Redis caching.
+
+    Without Redis the provider returns a memory-mapped CtyIndex, which exposes
+    the same ``get_all`` interface as pyhamtools Callinfo.
+    """
     
     _instance = None
     _cic = None
+    _source = None
+    _refresher = None
+    _refresher_pid = None
+    _redis_pool = None
+    _lock = threading.Lock()
     
     def __init__(self):
         if CallInfoProvider._cic is None:
@@ -28,22 +177,92 @@ class CallInfoProvider:
         return use_redis
     
     @staticmethod
-    def _get_redis_client():
-        """Get or create Redis client."""
-        try:
+    def _get_redis_pool():
+        """Get or create shared Redis connection pool with tight timeouts."""
+        if CallInfoProvider._redis_pool is None:
+            import redis
             redis_url = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+            timeout = float(os.environ.get('REDIS_SOCKET_TIMEOUT', '0.25'))
             # decode_responses=False is required for pyhamtools to properly deserialize data
-            client = redis.from_url(redis_url, decode_responses=False)
-            client.ping()
-            logger.info("✓ Redis connection successful")
+            CallInfoProvider._redis_pool = redis.ConnectionPool.from_url(
+                redis_url,
+                decode_responses=False,
+                socket_timeout=timeout,
+                socket_connect_timeout=timeout,
+                max_connections=int(os.environ.get('REDIS_MAX_CONNECTIONS', '10'))
+            )
+        return CallInfoProvider._redis_pool
+
+    @staticmethod
+    def _get_redis_client(ping=True):
+        """Get Redis client using the shared connection pool."""
+        try:
+            import redis
+            client = redis.Redis(connection_pool=CallInfoProvider._get_redis_pool())
+            if ping:
+                client.ping()
+                logger.info("✓ Redis connection successful")
             return client
         except Exception as e:
             logger.warning(f"Redis connection failed: {e}")
             return None
+
+    @staticmethod
+    def _create_circuit_breaker():
+        """Create circuit breaker for Redis lookups from environment settings."""
+        return CircuitBreaker(
+            failure_threshold=int(os.environ.get('REDIS_BREAKER_FAILURES', '5')),
+            recovery_timeout=float(os.environ.get('REDIS_BREAKER_RECOVERY', '30'))
+        )
     
+    @staticmethod
+    def _get_cty_files():
+        """Get paths of CTY.DAT source and its compiled index."""
+        cty_file = os.environ.get('CTY_DAT_FILE', DEFAULT_CTY_DAT)
+        index_file = os.environ.get('CTY_INDEX_FILE', DEFAULT_INDEX_FILE)
+        return cty_file, index_file
+
+    @staticmethod
+    def get_index_files():
+        """
+        Get compiled country index and its gzip copy, compiling CTY.DAT if needed.
+
+        Returns:
+            Tuple (index_file, compressed_index_file) or None if the index
+            is stale and CTY.DAT is not available
+        """
+        cty_file, index_file = CallInfoProvider._get_cty_files()
+        if is_index_stale(cty_file, index_file):
+            if not os.path.exists(cty_file):
+                logger.warning(f"CTY.DAT not found at {cty_file}, cannot compile country index")
+                return None
+            with _index_compile_lock(index_file):
+                # Another worker may have compiled it while we waited for the lock
+                if is_index_stale(cty_file, index_file):
+                    logger.info(f"Compiling country index from {cty_file}")
+                    compile_cty_index(cty_file, index_file)
+        return index_file, compressed_index_file(index_file)
+
+    @staticmethod
+    def _get_compiled_index():
+        """Open compiled country index, compiling CTY.DAT if needed."""
+        try:
+            index_files = CallInfoProvider.get_index_files()
+            if index_files is None:
+                return None
+            index_file = index_files[0]
+            index = CtyIndex(index_file)
+            index.preload()
+            logger.info(f"✓ Using compiled country index at {index_file}")
+            return index
+        except Exception as e:
+            logger.warning(f"Failed to load compiled country index: {e}")
+            return None
+
     @staticmethod
     def _build_callinfo():
         """Build and return Callinfo instance with optional Redis caching."""
+        # pyhamtools takes ~0.1s to import, so it is only loaded when the compiled index is not used
         
         # If Redis is enabled, try to use it
         if CallInfoProvider._should_use_redis():
@@ -51,13 +270,19 @@ class CallInfoProvider:
             if redis_client:
                 try:
                     logger.info("Creating LookupLib with Redis backend (USE_COUNTRYFILE_FROM_REDIS=true)")
+                    from pyhamtools import LookupLib, Callinfo
                     # Use Redis directly via pyhamtools LookupLib
                     my_lookuplib = LookupLib(
                         lookuptype="redis",
                         redis_instance=redis_client,
                         redis_prefix=REDIS_PREFIX
                     )
-                    return Callinfo(my_lookuplib)
+                    CallInfoProvider._source = 'redis'
+                    return ResilientCallinfo(
+                        Callinfo(my_lookuplib),
+                        fallback=CallInfoProvider._get_compiled_index(),
+                        breaker=CallInfoProvider._create_circuit_breaker()
+                    )
                 except Exception as e:
                     logger.warning(f"Failed to create Redis-backed LookupLib: {e}")
                     logger.info("Falling back to file-based lookup")
@@ -65,8 +290,16 @@ class CallInfoProvider:
                 logger.warning("USE_COUNTRYFILE_FROM_REDIS=true but Redis not available")
                 logger.info("Falling back to file-based lookup")
         
+        # Preferred: memory-mapped index compiled from bundled CTY.DAT (no network needed)
+        compiled_index = CallInfoProvider._get_compiled_index()
+        if compiled_index:
+            CallInfoProvider._source = 'index'
+            return compiled_index
+
         # Fallback: Use file-based country file
         logger.info("Using file-based country file lookup (USE_COUNTRYFILE_FROM_REDIS=false)")
+        CallInfoProvider._source = 'countryfile'
+        from pyhamtools import LookupLib, Callinfo
         cty_file = os.path.join(os.path.dirname(__file__), 'cty.plist')
         
         # Check if file exists locally (bundled with Docker image or pre-downloaded)
@@ -90,3 +323,95 @@ class CallInfoProvider:
         if CallInfoProvider._cic is None:
             CallInfoProvider()
         return CallInfoProvider._cic
+
+    @staticmethod
+    def source_version():
+        """
+        Get version of the country data source currently in use.
+
+        Returns:
+            Redis version key value, modification time of CTY.DAT (the index
+            is derived from it, so recompiling it is not a new version), or
+            None if the version cannot be determined
+        """
+        if CallInfoProvider._source == 'redis':
+            callinfo = CallInfoProvider._cic
+            if isinstance(callinfo, ResilientCallinfo) and callinfo.breaker.state == CircuitBreaker.OPEN:
+                # Do not reload from Redis while it is known to be failing
+                return None
+            redis_client = CallInfoProvider._get_redis_client(ping=False)
+            if redis_client is None:
+                return None
+            return redis_client.get(REDIS_VERSION_KEY)
+
+        if CallInfoProvider._source == 'index':
+            cty_file, _ = CallInfoProvider._get_cty_files()
+            try:
+                return os.stat(cty_file).st_mtime_ns
+            except OSError:
+                return None
+
+        return None
+
+    @staticmethod
+    def reload():
+        """
+        Build new Callinfo and atomically swap it in.
+
+        Callers which already hold the previous instance keep using it until
+        they finish, so no lookup ever sees half-loaded data.
+
+        Returns:
+            The new Callinfo instance
+        """
+        started = time.monotonic()
+        callinfo = CallInfoProvider._build_callinfo()
+        CallInfoProvider._cic = callinfo
+        logger.info(f"✓ Country data reloaded in {time.monotonic() - started:.2f}s")
+        return callinfo
+
+    @staticmethod
+    def start_refresher(on_reload=None):
+        """
+        Start background refresher if COUNTRY_DATA_RELOAD_INTERVAL is set.
+
+        Threads do not survive fork, so this must be called in every worker
+        process (see post_fork in gunicorn_config.py).
+
+        Args:
+            on_reload: Optional callback receiving the new Callinfo instance
+
+        Returns:
+            The running CountryDataRefresher or None if reloading is disabled
+        """
+        interval = float(os.environ.get('COUNTRY_DATA_RELOAD_INTERVAL', '0'))
+        if interval <= 0:
+            return None
+
+        with CallInfoProvider._lock:
+            pid = os.getpid()
+            if CallInfoProvider._refresher is not None and CallInfoProvider._refresher_pid == pid:
+                return CallInfoProvider._refresher
+
+            CallInfoProvider.get()
+            refresher = CountryDataRefresher(interval, on_reload)
+            refresher.start()
+            CallInfoProvider._refresher = refresher
+            CallInfoProvider._refresher_pid = pid
+            logger.info(f"Country data refresher started (every {interval:g}s)")
+            return refresher
+
+    @staticmethod
+    def get_metrics():
+        """
+        Get country lookup metrics.
+
+        Returns:
+            Dictionary with the active source and circuit breaker metrics
+            (None when Redis is not used)
+        """
+        callinfo = CallInfoProvider._cic
+        return {
+            'source': CallInfoProvider._source,
+            'circuit_breaker': callinfo.metrics() if isinstance(callinfo, ResilientCallinfo) else None,
+        }
@@ -0,0 +1,113 @@
+"""
+Circuit breaker for calls to external services (e.g. Redis).
+"""
+import time
+import threading
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker with closed, open and half-open states.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    callers should use their fallback immediately. Once ``recovery_timeout``
+    seconds have passed a single probe call is let through (half-open); its
+    success closes the breaker again, its failure re-opens it.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold=5, recovery_timeout=30.0, clock=time.monotonic):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures which trip the breaker
+            recovery_timeout: Seconds to wait before probing again
+            clock: Monotonic clock function (injectable for tests)
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+
+        # Metrics
+        self.successes = 0
+        self.failures = 0
+        self.rejected = 0
+        self.trips = 0
+
+    @property
+    def state(self):
+        """Current breaker state."""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self):
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.recovery_timeout:
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow_request(self):
+        """
+        Check if a call to the protected service may be attempted.
+
+        Returns:
+            True if the call should be made, False if the fallback should be used
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        """Record successful call."""
+        with self._lock:
+            self.successes += 1
+            self._consecutive_failures = 0
+            self._state = self.CLOSED
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        """
+        Record failed call.
+
+        Returns:
+            True if this failure tripped the breaker open
+        """
+        with self._lock:
+            self.failures += 1
+            self._consecutive_failures += 1
+            self._probe_in_flight = False
+            state = self._current_state()
+            if state == self.HALF_OPEN or (
+                    state == self.CLOSED and self._consecutive_failures >= self.failure_threshold):
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self.trips += 1
+                return True
+            return False
+
+    def metrics(self):
+        """Get breaker state and counters."""
+        with self._lock:
+            return {
+                'state': self._current_state(),
+                'consecutive_failures': self._consecutive_failures,
+                'successes': self.successes,
+                'failures': self.failures,
+                'rejected': self.rejected,
+                'trips': self.trips,
+            }
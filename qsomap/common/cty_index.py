@@ -0,0 +1,607 @@
+"""
+Precompiled, memory-mapped country database built from CTY.DAT.
+
+The compiled index is a single binary file made of a header, an entity
+table, a table of distinct alias overrides, prefix and exact callsign
+tables and a string table. Aliases are grouped by key length, so keys are
+stored as fixed-width sorted byte arrays that can be binary searched
+without per-key offsets. Workers open it with
+``mmap`` so lookups need no parsing at startup, the pages are shared between
+gunicorn workers and no network access is ever required.
+
+The same file (and its gzip copy written next to it) is served to Ham
+Wrapped, which reads it with a ``DataView`` instead of parsing CTY.DAT in
+the browser (see callsign-lookup.js).
+
+Build the index with::
+
+    python -m qsomap.common.cty_index [source_cty_dat] [destination_index]
+"""
+import os
+import re
+import sys
+import gzip
+import mmap
+import struct
+import logging
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+# CTY.DAT bundled with the application (shared with Ham Wrapped)
+DEFAULT_CTY_DAT = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)),
+    'static', 'ham-wrapped', 'data', 'cty.dat'
+)
+
+# Default location of the compiled index
+DEFAULT_INDEX_FILE = os.path.join(os.path.dirname(__file__), 'cty.idx')
+
+MAGIC = b'HLMCTY\x00\x00'
+FORMAT_VERSION = 2
+
+# magic, format version, entity count, override count, prefix count,
+# exact call count, prefix group count, exact call group count, string table size
+HEADER = struct.Struct('<8sIIIIIIII')
+# name offset/length, primary prefix offset/length, lat, lon, tz, CQ zone, ITU zone, continent
+ENTITY = struct.Struct('<IHIHfffBB2s')
+# override flags, lat, lon, tz, CQ zone, ITU zone, continent
+OVERRIDE = struct.Struct('<BfffBB2s')
+# key length, alias count, data offset; group data is ``count`` keys of
+# ``length`` bytes, then ``count`` entity ids (u16), then ``count`` override
+# ids (u16, 0 = no overrides)
+GROUP = struct.Struct('<BII')
+ALIAS_ID = struct.Struct('<H')
+
+# Override flags stored with each alias
+OVERRIDE_CQZ = 0x01
+OVERRIDE_ITUZ = 0x02
+OVERRIDE_CONTINENT = 0x04
+OVERRIDE_LATLON = 0x08
+OVERRIDE_TZ = 0x10
+
+# Suffixes which do not change the DXCC entity of a portable callsign
+PORTABLE_SUFFIXES = {
+    'P', 'M', 'MM', 'AM', 'QRP', 'A', 'B', 'LH', 'LGT', 'J', 'T', 'G', 'E',
+    '0', '1', '2', '3', '4', '5', '6', '7', '8', '9'
+}
+
+_CALLSIGN_TAIL = re.compile(r'\d[A-Z]{2,}$')
+
+
+class CtyIndexError(Exception):
+    """Raised when a compiled index file is missing or corrupted."""
+
+
+# ==================== CTY.DAT PARSER ====================
+
+def _parse_entity_header(line):
+    """
+    Parse CTY.DAT entity header line.
+
+    Format: Country Name: CQ: ITU: Cont: Lat: Lon: TZ: Prefix:
+
+    Args:
+        line: Header line from CTY.DAT
+
+    Returns:
+        Entity dictionary or None if the line is malformed
+    """
+    parts = line.split(':')
+    if len(parts) < 8:
+        return None
+
+    primary_prefix = parts[7].strip()
+    if primary_prefix.startswith('*'):
+        # Asterisk marks WAEDC-only entities
+        primary_prefix = primary_prefix[1:]
+
+    try:
+        return {
+            'name': parts[0].strip(),
+            'cqz': int(parts[1]),
+            'ituz': int(parts[2]),
+            'continent': parts[3].strip(),
+            'latitude': float(parts[4]),
+            # CTY.DAT uses West as positive, we want East as positive
+            'longitude': float(parts[5]) * -1,
+            'tz': float(parts[6]),
+            'primary_prefix': primary_prefix,
+        }
+    except ValueError:
+        return None
+
+
+def _parse_alias(alias):
+    """
+    Parse single CTY.DAT alias with its overrides.
+
+    Overrides: (#) CQ zone, [#] ITU zone, {aa} continent, <lat/lon>, ~tz~
+
+    Args:
+        alias: Alias string (e.g. '=3D2AG/P' or 'UA9(17)[30]')
+
+    Returns:
+        Tuple (key, is_exact_call, overrides)
+    """
+    overrides = {}
+
+    match = re.search(r'\((\d+)\)', alias)
+    if match:
+        overrides['cqz'] = int(match.group(1))
+        alias = alias.replace(match.group(0), '', 1)
+
+    match = re.search(r'\[(\d+)\]', alias)
+    if match:
+        overrides['ituz'] = int(match.group(1))
+        alias = alias.replace(match.group(0), '', 1)
+
+    match = re.search(r'\{([A-Z]{2})\}', alias)
+    if match:
+        overrides['continent'] = match.group(1)
+        alias = alias.replace(match.group(0), '', 1)
+
+    match = re.search(r'<([^>]+)>', alias)
+    if match:
+        coords = match.group(1).split('/')
+        if len(coords) == 2:
+            overrides['latitude'] = float(coords[0])
+            overrides['longitude'] = float(coords[1]) * -1
+        alias = alias.replace(match.group(0), '', 1)
+
+    match = re.search(r'~([^~]+)~', alias)
+    if match:
+        overrides['tz'] = float(match.group(1))
+        alias = alias.replace(match.group(0), '', 1)
+
+    is_exact = alias.startswith('=')
+    if is_exact:
+        alias = alias[1:]
+
+    return alias.strip().upper(), is_exact, overrides
+
+
+def parse_cty_dat(content):
+    """
+    Parse CTY.DAT content.
+
+    Args:
+        content: CTY.DAT file content as string
+
+    Returns:
+        Tuple (entities, prefixes, exact_calls) where prefixes and exact_calls
+        map alias keys to (entity_id, overrides) tuples
+    """
+    entities = []
+    prefixes = {}
+    exact_calls = {}
+    alias_buffer = []
+
+    def flush_aliases():
+        if not entities or not alias_buffer:
+            return
+        entity_id = len(entities) - 1
+        aliases = ''.join(alias_buffer).strip().rstrip(';')
+        for raw_alias in aliases.split(','):
+            raw_alias = raw_alias.strip()
+            if not raw_alias:
+                continue
+            key, is_exact, overrides = _parse_alias(raw_alias)
+            if not key:
+                continue
+            if is_exact:
+                exact_calls[key] = (entity_id, overrides)
+            elif key not in prefixes:
+                prefixes[key] = (entity_id, overrides)
+
+    for line in content.splitlines():
+        if line and not line[0].isspace() and ':' in line:
+            flush_aliases()
+            alias_buffer = []
+            entity = _parse_entity_header(line)
+            if entity:
+                entities.append(entity)
+            else:
+                logger.warning(f"Skipping malformed CTY.DAT header: {line}")
+        elif entities and line.strip():
+            alias_buffer.append(line.strip())
+
+    flush_aliases()
+    return entities, prefixes, exact_calls
+
+
+# ==================== INDEX COMPILER ====================
+
+def _pack_overrides(overrides):
+    """Pack alias overrides record."""
+    flags = 0
+    if 'cqz' in overrides:
+        flags |= OVERRIDE_CQZ
+    if 'ituz' in overrides:
+        flags |= OVERRIDE_ITUZ
+    if 'continent' in overrides:
+        flags |= OVERRIDE_CONTINENT
+    if 'latitude' in overrides:
+        flags |= OVERRIDE_LATLON
+    if 'tz' in overrides:
+        flags |= OVERRIDE_TZ
+
+    return OVERRIDE.pack(
+        flags,
+        overrides.get('latitude', 0.0),
+        overrides.get('longitude', 0.0),
+        overrides.get('tz', 0.0),
+        overrides.get('cqz', 0),
+        overrides.get('ituz', 0),
+        overrides.get('continent', '').encode('ascii')
+    )
+
+
+def build_cty_index(content):
+    """
+    Compile CTY.DAT content into binary index.
+
+    Args:
+        content: CTY.DAT file content as string
+
+    Returns:
+        Compiled index as bytes
+    """
+    entities, prefixes, exact_calls = parse_cty_dat(content)
+
+    strings = bytearray()
+
+    def add_string(value):
+        data = value.encode('utf-8')
+        offset = len(strings)
+        strings.extend(data)
+        return offset, len(data)
+
+    entity_table = bytearray()
+    for entity in entities:
+        name_offset, name_length = add_string(entity['name'])
+        prefix_offset, prefix_length = add_string(entity['primary_prefix'])
+        entity_table += ENTITY.pack(
+            name_offset,
+            name_length,
+            prefix_offset,
+            prefix_length,
+            entity['latitude'],
+            entity['longitude'],
+            entity['tz'],
+            entity['cqz'],
+            entity['ituz'],
+            entity['continent'].encode('ascii')
+        )
+
+    # Most aliases have no overrides, the rest share a few dozen distinct ones
+    override_ids = {_pack_overrides({}): 0}
+    for aliases in (prefixes, exact_calls):
+        for _, overrides in aliases.values():
+            override_ids.setdefault(_pack_overrides(overrides), len(override_ids))
+
+    directory_size = HEADER.size + len(entities) * ENTITY.size + len(override_ids) * OVERRIDE.size
+    group_data = bytearray()
+    directories = []
+
+    def build_groups(aliases):
+        groups = {}
+        for key, (entity_id, overrides) in aliases.items():
+            data = key.encode('utf-8')
+            groups.setdefault(len(data), []).append((data, entity_id, override_ids[_pack_overrides(overrides)]))
+        directories.append(groups)
+        return len(groups)
+
+    prefix_groups = build_groups(prefixes)
+    exact_groups = build_groups(exact_calls)
+    data_offset = directory_size + (prefix_groups + exact_groups) * GROUP.size
+
+    directory = bytearray()
+    for groups in directories:
+        for length in sorted(groups):
+            # Sort bytewise so that lookups can use binary search
+            group = sorted(groups[length])
+            directory += GROUP.pack(length, len(group), data_offset + len(group_data))
+            group_data += b''.join(key for key, _, _ in group)
+            group_data += struct.pack(f'<{len(group)}H', *(entity_id for _, entity_id, _ in group))
+            group_data += struct.pack(f'<{len(group)}H', *(override_id for _, _, override_id in group))
+
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        len(entities),
+        len(override_ids),
+        len(prefixes),
+        len(exact_calls),
+        prefix_groups,
+        exact_groups,
+        len(strings)
+    )
+    return bytes(header + entity_table + b''.join(override_ids) + directory + group_data + strings)
+
+
+def compressed_index_file(index_file=DEFAULT_INDEX_FILE):
+    """Get path of the gzip copy of compiled index served to the browser."""
+    return index_file + '.gz'
+
+
+def _write_atomic(destination, data):
+    """Write file through a temporary file renamed over the destination."""
+    directory = os.path.dirname(os.path.abspath(destination))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.cty-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, destination)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def compile_cty_index(source=DEFAULT_CTY_DAT, destination=DEFAULT_INDEX_FILE):
+    """
+    Compile CTY.DAT file into binary index file and its gzip copy.
+
+    Both files are written to temporary files and atomically renamed, so
+    workers which already have the previous index mapped keep using it. The
+    gzip copy is written first, so an up to date index always has one.
+
+    Args:
+        source: Path to CTY.DAT file
+        destination: Path of the compiled index file
+
+    Returns:
+        Path of the compiled index file
+    """
+    with open(source, 'r', encoding='utf-8', errors='replace') as f:
+        data = build_cty_index(f.read())
+
+    # mtime=0 keeps the compressed copy (and its ETag) stable for the same data
+    _write_atomic(compressed_index_file(destination), gzip.compress(data, compresslevel=9, mtime=0))
+    _write_atomic(destination, data)
+
+    logger.info(f"✓ Compiled {source} into {destination} ({len(data)} bytes)")
+    return destination
+
+
+def is_index_stale(source=DEFAULT_CTY_DAT, index_file=DEFAULT_INDEX_FILE):
+    """
+    Check if compiled index has to be (re)compiled.
+
+    The index is stale when it or its gzip copy is missing, it was written
+    in another format version, or it is older than its CTY.DAT source.
+    """
+    if not os.path.exists(index_file) or not os.path.exists(compressed_index_file(index_file)):
+        return True
+    with open(index_file, 'rb') as f:
+        header = f.read(HEADER.size)
+    if len(header) < HEADER.size or HEADER.unpack(header)[:2] != (MAGIC, FORMAT_VERSION):
+        return True
+    if not os.path.exists(source):
+        return False
+    return os.path.getmtime(source) > os.path.getmtime(index_file)
+
+
+# ==================== INDEX READER ====================
+
+class CtyIndex:
+    """
+    Read-only, memory-mapped country lookup.
+
+    Exposes ``get_all`` compatible with pyhamtools ``Callinfo.get_all`` so it
+    can be used as a drop-in replacement for country file lookups.
+    """
+
+    def __init__(self, filename=DEFAULT_INDEX_FILE):
+        """
+        Open compiled index file.
+
+        Args:
+            filename: Path of the compiled index file
+
+        Raises:
+            CtyIndexError: If the file is not a valid compiled index
+        """
+        self.filename = filename
+        with open(filename, 'rb') as f:
+            try:
+                self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise CtyIndexError(f"Empty country index file: {filename}") from e
+
+        if len(self._buffer) < HEADER.size:
+            self.close()
+            raise CtyIndexError(f"Truncated country index file: {filename}")
+
+        (magic, version, n_entities, n_overrides, n_prefixes, n_exact,
+         n_prefix_groups, n_exact_groups, strings_size) = HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise CtyIndexError(f"Unsupported country index file: {filename}")
+
+        self.entity_count = n_entities
+        self.prefix_count = n_prefixes
+        self.exact_count = n_exact
+
+        self._entities_offset = HEADER.size
+        self._overrides_offset = self._entities_offset + n_entities * ENTITY.size
+        groups_offset = self._overrides_offset + n_overrides * OVERRIDE.size
+        self._prefix_groups = self._read_groups(groups_offset, n_prefix_groups)
+        self._exact_groups = self._read_groups(groups_offset + n_prefix_groups * GROUP.size, n_exact_groups)
+        # Longest prefix bounds the number of probes in the prefix table
+        self._max_prefix_length = max(self._prefix_groups, default=0)
+        self._strings_offset = len(self._buffer) - strings_size
+
+        groups_end = max(
+            (offset + count * (length + 2 * ALIAS_ID.size)
+             for groups in (self._prefix_groups, self._exact_groups)
+             for length, (offset, count) in groups.items()),
+            default=groups_offset + (n_prefix_groups + n_exact_groups) * GROUP.size
+        )
+        if groups_end != self._strings_offset:
+            self.close()
+            raise CtyIndexError(f"Corrupted country index file: {filename}")
+
+    def _read_groups(self, offset, count):
+        """Read alias group directory as {key length: (data offset, alias count)}."""
+        if offset + count * GROUP.size > len(self._buffer):
+            self.close()
+            raise CtyIndexError(f"Corrupted country index file: {self.filename}")
+        groups = {}
+        for i in range(count):
+            length, alias_count, data_offset = GROUP.unpack_from(self._buffer, offset + i * GROUP.size)
+            groups[length] = (data_offset, alias_count)
+        return groups
+
+    def preload(self):
+        """Ask the kernel to page the whole index in ahead of the first lookups."""
+        if hasattr(self._buffer, 'madvise') and hasattr(mmap, 'MADV_WILLNEED'):
+            self._buffer.madvise(mmap.MADV_WILLNEED)
+
+    def close(self):
+        """Unmap the index file."""
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+
+    def _string(self, offset, length):
+        start = self._strings_offset + offset
+        return self._buffer[start:start + length]
+
+    def _find(self, groups, key):
+        """Binary search for exact key in its key length group."""
+        length = len(key)
+        if length not in groups:
+            return None
+        offset, count = groups[length]
+
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            start = offset + middle * length
+            current = self._buffer[start:start + length]
+            if current == key:
+                ids_offset = offset + count * length + middle * ALIAS_ID.size
+                entity_id, = ALIAS_ID.unpack_from(self._buffer, ids_offset)
+                override_id, = ALIAS_ID.unpack_from(self._buffer, ids_offset + count * ALIAS_ID.size)
+                return entity_id, override_id
+            if current < key:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def _find_exact(self, callsign):
+        return self._find(self._exact_groups, callsign.encode('utf-8'))
+
+    def _find_prefix(self, callsign):
+        """Find longest prefix of callsign present in the prefix table."""
+        key = callsign.encode('utf-8')
+        for length in range(min(len(key), self._max_prefix_length), 0, -1):
+            record = self._find(self._prefix_groups, key[:length])
+            if record:
+                return record
+        return None
+
+    def _resolve_portable(self, callsign):
+        """Resolve callsign with slash to the part which decides the DXCC entity."""
+        parts = callsign.split('/')
+
+        if len(parts) == 2:
+            first, second = parts
+
+            if second in PORTABLE_SUFFIXES or len(second) == 1:
+                return first
+
+            # PREFIX/CALL, e.g. EA8/SP3WKW
+            if len(first) <= 4 and not _CALLSIGN_TAIL.search(first):
+                return first
+
+            # CALL/PREFIX, e.g. SP3WKW/EA8
+            if len(second) <= 4 and not _CALLSIGN_TAIL.search(second) and self._find_prefix(second):
+                return second
+
+            return first
+
+        for part in parts:
+            if part and self._find_prefix(part):
+                return part
+
+        return parts[0]
+
+    def _build_result(self, record):
+        entity_id, override_id = record
+        flags, lat, lon, tz, cqz, ituz, continent = OVERRIDE.unpack_from(
+            self._buffer, self._overrides_offset + override_id * OVERRIDE.size)
+        (name_offset, name_length, prefix_offset, prefix_length,
+         e_lat, e_lon, e_tz, e_cqz, e_ituz, e_continent) = ENTITY.unpack_from(
+            self._buffer, self._entities_offset + entity_id * ENTITY.size)
+
+        if not flags & OVERRIDE_LATLON:
+            lat, lon = e_lat, e_lon
+
+        return {
+            'country': self._string(name_offset, name_length).decode('utf-8'),
+            'prefix': self._string(prefix_offset, prefix_length).decode('utf-8'),
+            'continent': (continent if flags & OVERRIDE_CONTINENT else e_continent).decode('ascii'),
+            'latitude': round(lat, 2),
+            'longitude': round(lon, 2),
+            'cqz': cqz if flags & OVERRIDE_CQZ else e_cqz,
+            'ituz': ituz if flags & OVERRIDE_ITUZ else e_ituz,
+            'tz': round(tz if flags & OVERRIDE_TZ else e_tz, 1),
+        }
+
+    def lookup(self, callsign):
+        """
+        Lookup callsign in the index.
+
+        Args:
+            callsign: Callsign to lookup
+
+        Returns:
+            Dictionary with country data or None if callsign is unknown
+        """
+        if not callsign:
+            return None
+
+        callsign = callsign.strip().upper()
+
+        record = self._find_exact(callsign)
+        if record is None and '/' in callsign:
+            search_call = self._resolve_portable(callsign)
+            if search_call != callsign:
+                record = self._find_exact(search_call) or self._find_prefix(search_call)
+        if record is None:
+            record = self._find_prefix(callsign)
+
+        return self._build_result(record) if record else None
+
+    def get_all(self, callsign, timestamp=None):
+        """
+        Lookup callsign, compatible with pyhamtools ``Callinfo.get_all``.
+
+        Args:
+            callsign: Callsign to lookup
+            timestamp: Ignored, CTY.DAT has no validity periods
+
+        Returns:
+            Dictionary with country data
+
+        Raises:
+            KeyError: Callsign could not be identified
+        """
+        result = self.lookup(callsign)
+        if result is None:
+            raise KeyError(callsign)
+        return result
+
+
+if __name__ == '__main__':
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    source_file = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_CTY_DAT
+    index_file = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_INDEX_FILE
+    compile_cty_index(source_file, index_file)
@@ -0,0 +1,107 @@
+"""
+QSO density grid over 4-char Maidenhead squares.
+
+The grid is a dense matrix of QSO counts (one cell per square, 2 degrees
+longitude by 1 degree latitude), cropped to the squares which contain any
+QSOs and encoded as base64 little-endian uint16. Its size depends only on
+the covered area, not on the number of QSOs, so the heatmap overlay costs
+the client the same for small and very large logs.
+"""
+import sys
+import base64
+from array import array
+from collections import Counter, defaultdict
+
+# 18 fields x 10 squares in each direction
+GRID_COLUMNS = 180
+GRID_ROWS = 180
+CELL_LONGITUDE = 2
+CELL_LATITUDE = 1
+
+# Counts are saturated to fit in uint16
+MAX_COUNT = 0xFFFF
+
+SPLIT_KEYS = {
+    'band': lambda qso: qso.get('band') or '',
+    'mode': lambda qso: qso.get('mode') or '',
+    'year': lambda qso: (qso.get('date') or '')[:4],
+}
+
+
+def square_cell(locator):
+    """
+    Get matrix cell of 4-char Maidenhead square.
+
+    Args:
+        locator: Locator with at least 4 characters (e.g. 'JO60' or 'JO60AA')
+
+    Returns:
+        Tuple (row, column) counted from south-west corner, or None if the
+        locator is not valid
+    """
+    if not locator or len(locator) < 4:
+        return None
+
+    field_lon, field_lat = ord(locator[0].upper()) - ord('A'), ord(locator[1].upper()) - ord('A')
+    if not (0 <= field_lon < 18 and 0 <= field_lat < 18 and locator[2:4].isdigit()):
+        return None
+
+    return field_lat * 10 + int(locator[3]), field_lon * 10 + int(locator[2])
+
+
+def _encode_matrix(counts, row0, col0, rows, cols):
+    matrix = array('H', bytes(2 * rows * cols))
+    for (row, col), count in counts.items():
+        matrix[(row - row0) * cols + (col - col0)] = min(count, MAX_COUNT)
+    if sys.byteorder == 'big':
+        matrix.byteswap()
+    return base64.b64encode(matrix.tobytes()).decode('ascii')
+
+
+def build_density_grid(qsos, split_by=None):
+    """
+    Count QSOs per Maidenhead square.
+
+    Args:
+        qsos: Enhanced QSO dictionaries (see LogFileProcessor)
+        split_by: Optional 'band', 'mode' or 'year' to get one matrix per value
+
+    Returns:
+        Dictionary with matrix position (``south``, ``west``), size (``rows``,
+        ``cols``), cell size in degrees, highest cell count (``max``) and
+        ``layers`` mapping split value (or 'all') to encoded matrix.
+        Rows go from south to north, columns from west to east.
+
+    Raises:
+        ValueError: If split_by is not supported
+    """
+    if split_by is not None and split_by not in SPLIT_KEYS:
+        raise ValueError(f"Unsupported density grid split: {split_by}")
+
+    key_of = SPLIT_KEYS[split_by] if split_by else (lambda qso: 'all')
+    counts = defaultdict(Counter)
+    for qso in qsos:
+        cell = square_cell(qso.get('grid'))
+        if cell is not None:
+            counts[key_of(qso)][cell] += 1
+
+    cells = {cell for layer in counts.values() for cell in layer}
+    if not cells:
+        return {'south': -90, 'west': -180, 'rows': 0, 'cols': 0,
+                'cell_lat': CELL_LATITUDE, 'cell_lon': CELL_LONGITUDE, 'max': 0, 'layers': {}}
+
+    row0 = min(row for row, _ in cells)
+    col0 = min(col for _, col in cells)
+    rows = max(row for row, _ in cells) - row0 + 1
+    cols = max(col for _, col in cells) - col0 + 1
+
+    return {
+        'south': row0 * CELL_LATITUDE - 90,
+        'west': col0 * CELL_LONGITUDE - 180,
+        'rows': rows,
+        'cols': cols,
+        'cell_lat': CELL_LATITUDE,
+        'cell_lon': CELL_LONGITUDE,
+        'max': min(max(max(layer.values()) for layer in counts.values()), MAX_COUNT),
+        'layers': {key: _encode_matrix(layer, row0, col0, rows, cols) for key, layer in sorted(counts.items())},
+    }
@@ -0,0 +1,147 @@
+"""
+ARRL DXCC entity numbers and names.
+
+CTY.DAT identifies entities by primary prefix only, so DXCC numbers come from
+a prefix map. The map and the DXCC entity table live in ``dxcc.json``, the
+single source for both sides: the server reads it here, and Ham Wrapped gets
+the same tables as ``dxcc-tables.js``, generated from it with::
+
+    python -m qsomap.common.dxcc_entities [output_file]
+"""
+import json
+import logging
+import os
+import re
+import sys
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DXCC_FILE = os.path.join(os.path.dirname(__file__), 'dxcc.json')
+DEFAULT_TABLES_JS = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                                 'static', 'ham-wrapped', 'js', 'dxcc-tables.js')
+
+# Maximum line length of the generated prefix map
+JS_LINE_WIDTH = 73
+
+
+def load_dxcc_tables(path=DEFAULT_DXCC_FILE):
+    """
+    Load DXCC entity table and prefix map.
+
+    Args:
+        path: Path to dxcc.json
+
+    Returns:
+        Tuple (entities, prefixes): {number: entity dict}, {prefix: number}
+
+    Raises:
+        ValueError: Either table is missing or empty
+    """
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    entities = {int(code): entity for code, entity in data.get('entities', {}).items()}
+    prefixes = data.get('prefixes', {})
+    if not entities or not prefixes:
+        raise ValueError(f"DXCC tables in {path} are missing or empty")
+    return entities, prefixes
+
+
+DXCC_ENTITIES, PREFIX_TO_DXCC = load_dxcc_tables()
+
+
+def dxcc_code(prefix):
+    """
+    ARRL DXCC number of a CTY.DAT primary prefix (same as ``getDxccCode``).
+
+    Args:
+        prefix: Primary prefix, e.g. 'DL', '*TA1' or 'CE0X'
+
+    Returns:
+        DXCC number, or None if the prefix is not known
+    """
+    if not prefix:
+        return None
+    prefix = prefix.lstrip('*')
+    if prefix in PREFIX_TO_DXCC:
+        return PREFIX_TO_DXCC[prefix]
+    # Without variants (e.g. 'CE' instead of 'CE0X')
+    base_prefix = re.sub(r'[0-9]+$', '', prefix.split('/', 1)[0])
+    return PREFIX_TO_DXCC.get(base_prefix)
+
+
+def dxcc_name(code):
+    """
+    ARRL name of a DXCC entity (as in ``DXCC_DATA``).
+
+    Args:
+        code: DXCC number
+
+    Returns:
+        Entity name, or None if the number is not known
+    """
+    entity = DXCC_ENTITIES.get(code)
+    return entity['name'] if entity else None
+
+
+def render_tables_js(entities=None, prefixes=None):
+    """
+    Render ``dxcc-tables.js`` defining ``DXCC_DATA`` and ``PREFIX_TO_DXCC``.
+
+    Args:
+        entities: DXCC entity table (defaults to dxcc.json)
+        prefixes: Prefix map (defaults to dxcc.json)
+
+    Returns:
+        Script source as string
+    """
+    entities = DXCC_ENTITIES if entities is None else entities
+    prefixes = PREFIX_TO_DXCC if prefixes is None else prefixes
+
+    lines = [
+        '/**',
+        ' * Tabele DXCC - kraje ARRL DXCC i mapowanie głównych prefiksów CTY na kody DXCC',
+        ' * (CTY.DAT nie zawiera bezpośrednio kodów DXCC).',
+        ' * Plik wygenerowany z qsomap/common/dxcc.json (make dxcc-tables) - nie edytuj ręcznie.',
+        ' */',
+        '',
+        'const DXCC_DATA = {',
+    ]
+    for code, entity in entities.items():
+        lines.append(
+            f"    {code}: {{ name: {json.dumps(entity['name'], ensure_ascii=False)}, "
+            f"continent: \"{entity['continent']}\", lat: {entity['lat']}, lon: {entity['lon']}, "
+            f"cqZone: {entity['cqZone']} }},"
+        )
+    lines += ['};', '', 'const PREFIX_TO_DXCC = {']
+
+    entries = [f'{json.dumps(prefix)}: {code}' for prefix, code in prefixes.items()]
+    line = ''
+    for i, entry in enumerate(entries):
+        entry += ',' if i < len(entries) - 1 else ''
+        if line and len(line) + 1 + len(entry) > JS_LINE_WIDTH:
+            lines.append(line)
+            line = ''
+        line = f'{line} {entry}' if line else f'    {entry}'
+    lines += [line, '};', '', '// Eksport globalny', 'window.DXCC_DATA = DXCC_DATA;',
+              'window.PREFIX_TO_DXCC = PREFIX_TO_DXCC;', '']
+    return '\n'.join(lines)
+
+
+def write_tables_js(output_file=DEFAULT_TABLES_JS):
+    """
+    Generate ``dxcc-tables.js`` for Ham Wrapped from dxcc.json.
+
+    Args:
+        output_file: Path of the generated script
+    """
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(render_tables_js())
+    logger.info(f"Wrote {len(DXCC_ENTITIES)} DXCC entities and {len(PREFIX_TO_DXCC)} prefixes to {output_file}")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    write_tables_js(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_TABLES_JS)
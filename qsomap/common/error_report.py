@@ -0,0 +1,70 @@
+"""
+Per-file aggregation of parse and lookup errors.
+"""
+from collections import Counter
+
+
+class ErrorReport:
+    """
+    Aggregates errors found while processing a single log file.
+
+    Instead of logging every bad line or failed lookup, errors are counted
+    by type and only the first few samples of each type are kept. The
+    report is logged once and returned together with the processed QSOs.
+    """
+
+    def __init__(self, max_samples=3):
+        """
+        Initialize empty report.
+
+        Args:
+            max_samples: Maximum number of samples kept per error type
+        """
+        self.max_samples = max_samples
+        self.counts = Counter()
+        self.samples = {}
+
+    def record(self, error_type, sample):
+        """
+        Record single error.
+
+        Args:
+            error_type: Short error category (e.g. 'invalid_line')
+            sample: Description of the offending input
+        """
+        self.counts[error_type] += 1
+        samples = self.samples.setdefault(error_type, [])
+        if len(samples) < self.max_samples:
+            samples.append(str(sample)[:200])
+
+    @property
+    def total(self):
+        """Total number of recorded errors."""
+        return sum(self.counts.values())
+
+    def summary(self):
+        """
+        Get report as JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with total, counts by error type and samples
+        """
+        return {
+            'total': self.total,
+            'counts': dict(self.counts),
+            'samples': {error_type: list(samples) for error_type, samples in self.samples.items()},
+        }
+
+    def log(self, logger, context):
+        """
+        Log the whole report as a single warning (nothing if there were no errors).
+
+        Args:
+            logger: Logger to write to
+            context: Description of the processed input (e.g. 'adif file')
+        """
+        if not self.counts:
+            return
+        counts = ', '.join(f"{error_type}={count}" for error_type, count in self.counts.most_common())
+        samples = '; '.join(f"{error_type}: {self.samples[error_type]}" for error_type, _ in self.counts.most_common())
+        logger.warning(f"{self.total} errors while processing {context} ({counts}); samples: {samples}")
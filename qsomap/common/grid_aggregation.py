@@ -0,0 +1,97 @@
+"""
+Zoom-dependent aggregation of QSOs by Maidenhead locator.
+
+At low zoom levels the map draws one counted marker per field (2-char) or
+square (4-char) locator instead of every single QSO. Aggregates are
+computed once per uploaded log, so the client only draws a few hundred
+symbols.
+"""
+import re
+from collections import defaultdict
+
+# Aggregation levels ordered by zoom; individual QSOs are shown above the last max_zoom
+AGGREGATION_LEVELS = (
+    ('field', 2, 3),
+    ('square', 4, 5),
+)
+
+_LOCATOR_PATTERN = re.compile(r'^[A-R]{2}([0-9]{2})?$')
+
+
+def locator_center(locator):
+    """
+    Get center of field (2-char) or square (4-char) Maidenhead locator.
+
+    Args:
+        locator: Locator of length 2 or 4 (e.g. 'JO' or 'JO60')
+
+    Returns:
+        Tuple (latitude, longitude) of the locator center
+
+    Raises:
+        ValueError: If locator is not a valid field or square
+    """
+    locator = locator.upper()
+    if not _LOCATOR_PATTERN.match(locator):
+        raise ValueError(f"Invalid field or square locator: {locator}")
+
+    longitude = (ord(locator[0]) - ord('A')) * 20 - 180
+    latitude = (ord(locator[1]) - ord('A')) * 10 - 90
+    if len(locator) == 2:
+        return latitude + 5.0, longitude + 10.0
+
+    longitude += int(locator[2]) * 2
+    latitude += int(locator[3])
+    return latitude + 0.5, longitude + 1.0
+
+
+def aggregate_qsos(qsos, length):
+    """
+    Count QSOs per locator prefix of given length.
+
+    Counts are split by band and mode (key ``"band|mode"``, the same key the
+    map uses for its layer groups), so the client can apply its filters
+    without access to the individual QSOs.
+
+    Args:
+        qsos: Enhanced QSO dictionaries (see LogFileProcessor)
+        length: Locator length, 2 for fields or 4 for squares
+
+    Returns:
+        List of cells with locator, latitude, longitude, total count and
+        counts by band and mode, sorted by locator
+    """
+    counts = defaultdict(lambda: defaultdict(int))
+    for qso in qsos:
+        locator = (qso.get('grid') or '')[:length].upper()
+        if len(locator) != length or not _LOCATOR_PATTERN.match(locator):
+            continue
+        counts[locator][f"{qso.get('band', '')}|{qso.get('mode', '')}"] += 1
+
+    cells = []
+    for locator in sorted(counts):
+        latitude, longitude = locator_center(locator)
+        cells.append({
+            'locator': locator,
+            'latitude': latitude,
+            'longitude': longitude,
+            'count': sum(counts[locator].values()),
+            'counts': dict(counts[locator]),
+        })
+    return cells
+
+
+def build_grid_aggregates(qsos):
+    """
+    Build aggregates for all zoom levels.
+
+    Args:
+        qsos: Enhanced QSO dictionaries
+
+    Returns:
+        List of levels ordered by zoom, each with name, max_zoom and cells
+    """
+    return [
+        {'level': name, 'max_zoom': max_zoom, 'cells': aggregate_qsos(qsos, length)}
+        for name, length, max_zoom in AGGREGATION_LEVELS
+    ]
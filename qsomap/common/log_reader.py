@@ -1,10 +1,9 @@
 import logging
 import re
 import math
-import adif_io
-from flask import current_app
-from pyhamtools.locator import latlong_to_locator, locator_to_latlong
 from .grid_validator import validate_grid_square
+from .error_report import ErrorReport
+from .qso_summary import QsoSummary
 
 logger = logging.getLogger(__name__)
 
@@ -101,16 +100,19 @@ class CabrilloParser:
         ((1240000, 1300000), '23cm'),
     ]
     
-    def parse(self, content):
+    def parse(self, content, errors=None):
         """
         Parse Cabrillo content to list of QSO dictionaries.
         
         Args:
             content: Cabrillo file content as string
+            errors: Optional ErrorReport collecting invalid lines (if not
+                provided, the errors are logged once after parsing)
             
         Returns:
             List of QSO dictionaries in ADIF-like format
         """
+        report = errors if errors is not None else ErrorReport()
         qsos = []
         
         for line in content.split('\n'):
@@ -121,13 +123,12 @@ class CabrilloParser:
                 continue
             
             try:
-                qso = self._parse_qso_line(line)
-                if qso:
-                    qsos.append(qso)
-            except Exception as e:
-                logger.warning(f"Failed to parse Cabrillo QSO line: {line} - {e}")
-                continue
+                qsos.append(self._parse_qso_line(line))
+            except (ValueError, IndexError) as e:
+                report.record('invalid_line', f"{line} - {e}")
         
+        if errors is None:
+            report.log(logger, 'Cabrillo content')
         return qsos
     
     def _parse_qso_line(self, line):
@@ -141,54 +142,51 @@ class CabrilloParser:
             line: Single QSO line from Cabrillo file
             
         Returns:
-            Dictionary with ADIF-like field names or None if parsing fails
+            Dictionary with ADIF-like field names
+            
+        Raises:
+            ValueError: If the line has too few or invalid fields
         """
         # Remove 'QSO:' prefix and split by whitespace
         parts = line[4:].split()
         
         if len(parts) < 8:
-            logger.warning(f"Cabrillo QSO line has too few fields: {line}")
-            return None
+            raise ValueError(f"too few fields ({len(parts)})")
         
-        try:
-            # Common Cabrillo format:
-            # freq mode date time mycall rst sent_exch theircall rst rcvd_exch
-            freq_khz = int(parts[0])
-            mode = parts[1].upper()
-            date_str = parts[2]  # YYYY-MM-DD format
-            time_str = parts[3]  # HHMM format
-            # mycall = parts[4]
-            # my_rst = parts[5]
-            # my_exch = parts[6]
-            their_call = parts[7].upper()
-            # their_rst = parts[8] if len(parts) > 8 else ''
-            # their_exch = parts[9] if len(parts) > 9 else ''
-            
-            # Convert date from YYYY-MM-DD to YYYYMMDD (ADIF format)
-            qso_date = date_str.replace('-', '')
-            
-            # Time is already in HHMM format
-            time_on = time_str.replace(':', '')[:4]  # Ensure 4 digits
-            
-            # Convert frequency to band
-            band = self._freq_to_band(freq_khz)
-            
-            # Normalize mode
-            mode = self._normalize_mode(mode)
-            
-            return {
-                'CALL': their_call,
-                'QSO_DATE': qso_date,
-                'TIME_ON': time_on,
-                'MODE': mode,
-                'BAND': band,
-                'GRIDSQUARE': '',  # Cabrillo doesn't have grid, will be resolved later
-                'FREQ': str(freq_khz)  # Keep original frequency for reference
-            }
-            
-        except (ValueError, IndexError) as e:
-            logger.warning(f"Error parsing Cabrillo QSO fields: {line} - {e}")
-            return None
+        # Common Cabrillo format:
+        # freq mode date time mycall rst sent_exch theircall rst rcvd_exch
+        freq_khz = int(parts[0])
+        mode = parts[1].upper()
+        date_str = parts[2]  # YYYY-MM-DD format
+        time_str = parts[3]  # HHMM format
+        # mycall = parts[4]
+        # my_rst = parts[5]
+        # my_exch = parts[6]
+        their_call = parts[7].upper()
+        # their_rst = parts[8] if len(parts) > 8 else ''
+        # their_exch = parts[9] if len(parts) > 9 else ''
+        
+        # Convert date from YYYY-MM-DD to YYYYMMDD (ADIF format)
+        qso_date = date_str.replace('-', '')
+        
+        # Time is already in HHMM format
+        time_on = time_str.replace(':', '')[:4]  # Ensure 4 digits
+        
+        # Convert frequency to band
+        band = self._freq_to_band(freq_khz)
+        
+        # Normalize mode
+        mode = self._normalize_mode(mode)
+        
+        return {
+            'CALL': their_call,
+            'QSO_DATE': qso_date,
+            'TIME_ON': time_on,
+            'MODE': mode,
+            'BAND': band,
+            'GRIDSQUARE': '',  # Cabrillo doesn't have grid, will be resolved later
+            'FREQ': str(freq_khz)  # Keep original frequency for reference
+        }
     
     def _freq_to_band(self, freq_khz):
         """
@@ -275,7 +273,10 @@ class CallsignGridResolver:
         Args:
             callinfo: Optional Callinfo instance (uses current_app.callinfo if not provided)
         """
-        self.cic = callinfo or current_app.callinfo
+        if callinfo is None:
+            from flask import current_app
+            callinfo = current_app.callinfo
+        self.cic = callinfo
     
     def get_grid_from_call(self, call):
         """
@@ -287,6 +288,8 @@ class CallsignGridResolver:
         Returns:
             Grid square string or default grid if lookup fails
         """
+        from pyhamtools.locator import latlong_to_locator
+
         try:
             info = self.cic.get_all(call)
             latitude = info.get('latitude', 0)
@@ -343,6 +346,8 @@ class LogFileProcessor:
         self.cabrillo_parser = CabrilloParser()
         self.my_latitude = my_latitude
         self.my_longitude = my_longitude
+        self.errors = ErrorReport()
+        self.statistics = QsoSummary()
     
     def process(self, file_content):
         """
@@ -353,16 +358,22 @@ class LogFileProcessor:
             file_content: Log file content as string (ADIF or Cabrillo)
             
         Returns:
-            List of enhanced QSO dictionaries with grid, DXCC, and coordinate info
+            List of enhanced QSO dictionaries with grid, DXCC, and coordinate info.
+            Parse and lookup errors are aggregated in ``self.errors``, summary
+            statistics in ``self.statistics``.
         """
+        self.errors = ErrorReport()
+        self.statistics = QsoSummary()
+
         # Auto-detect format
         log_format = detect_log_format(file_content)
         logger.info(f"Detected log format: {log_format}")
         
         # Parse based on format
         if log_format == 'cabrillo':
-            raw_qsos = self.cabrillo_parser.parse(file_content)
+            raw_qsos = self.cabrillo_parser.parse(file_content, errors=self.errors)
         else:
+            import adif_io
             raw_qsos, header = adif_io.read_from_string(file_content)
         
         # Enhance all QSOs
@@ -370,8 +381,10 @@ class LogFileProcessor:
         for qso in raw_qsos:
             enhanced_qso = self._enhance_qso(qso)
             enhanced_qsos.append(enhanced_qso)
+            self.statistics.add(enhanced_qso)
         
         logger.info(f"Processed {len(enhanced_qsos)} QSOs from {log_format} file")
+        self.errors.log(logger, f"{log_format} file")
         return enhanced_qsos
     
     def _enhance_qso(self, qso):
@@ -388,7 +401,20 @@ class LogFileProcessor:
         
         # Get callsign info
         info = self._get_callsign_info(call)
-        
+        return self._build_qso(qso, call, info)
+
+    def _build_qso(self, qso, call, info):
+        """
+        Build enhanced QSO dictionary from QSO record and callsign info.
+
+        Args:
+            qso: QSO record from ADIF file
+            call: Callsign of the QSO
+            info: Callsign info (see _get_callsign_info)
+
+        Returns:
+            Enhanced QSO dictionary
+        """
         # Extract basic QSO data
         date = qso.get('QSO_DATE', '')
         time = qso.get('TIME_ON', '')
@@ -401,6 +427,7 @@ class LogFileProcessor:
         grid = self._resolve_grid(call, grid)
         
         # Convert grid to coordinates
+        from pyhamtools.locator import locator_to_latlong
         latitude, longitude = locator_to_latlong(grid)
         
         # Calculate distance if user location is available
@@ -438,11 +465,12 @@ class LogFileProcessor:
             Dictionary with callsign info or defaults
         """
         try:
-            
             return self.grid_resolver.cic.get_all(call)
-        except (KeyError, Exception) as e:
-            logger.exception(f"Error getting callsign info for {call}: {e}")
-            return {'country': 'Unknown', 'latitude': 0, 'longitude': 0}
+        except KeyError:
+            self.errors.record('unknown_callsign', call)
+        except Exception as e:
+            self.errors.record('lookup_error', f"{call}: {type(e).__name__}: {e}")
+        return {'country': 'Unknown', 'latitude': 0, 'longitude': 0}
     
     def _resolve_grid(self, call, grid):
         """
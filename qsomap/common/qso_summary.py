@@ -0,0 +1,97 @@
+"""
+Summary statistics collected while processing a log file.
+"""
+import heapq
+from collections import Counter, defaultdict
+
+# Number of entries in the longest distance table
+LONGEST_DISTANCE_COUNT = 20
+
+# Custom order of modes in DXCC breakdown, others sorted alphabetically
+MODE_ORDER = {'CW': 1, 'SSB': 2, 'FT8': 3, 'FT4': 4}
+
+# QSO fields kept for the longest distance table
+LONGEST_DISTANCE_FIELDS = ('call', 'dxcc', 'distance', 'band', 'mode', 'date', 'grid')
+
+
+class QsoSummary:
+    """
+    Accumulates statistics shown on the QSO list page.
+
+    QSOs are added one by one during the enhancement pass, so the summary
+    needs no extra pass over the log: DXCC, band and mode counts are kept in
+    counters and the longest distances in a bounded heap.
+    """
+
+    def __init__(self, longest_count=LONGEST_DISTANCE_COUNT):
+        """
+        Initialize empty summary.
+
+        Args:
+            longest_count: Number of longest distance QSOs to keep
+        """
+        self.longest_count = longest_count
+        self.total = 0
+        self.dxcc = Counter()
+        self.dxcc_modes = defaultdict(Counter)
+        self.bands = Counter()
+        self._longest = []
+
+    def add(self, qso):
+        """
+        Add single enhanced QSO.
+
+        Args:
+            qso: Enhanced QSO dictionary (see LogFileProcessor)
+        """
+        sequence = self.total
+        self.total += 1
+        self.dxcc[qso['dxcc']] += 1
+        self.dxcc_modes[qso['dxcc']][qso['mode']] += 1
+        self.bands[qso['band']] += 1
+
+        distance = qso.get('distance')
+        if distance is None:
+            return
+        # Min-heap of (distance, -sequence): on equal distance the later QSO is dropped first
+        entry = (distance, -sequence, {field: qso.get(field) for field in LONGEST_DISTANCE_FIELDS})
+        if len(self._longest) < self.longest_count:
+            heapq.heappush(self._longest, entry)
+        elif entry[:2] > self._longest[0][:2]:
+            heapq.heapreplace(self._longest, entry)
+
+    @staticmethod
+    def _mode_sort_key(item):
+        mode = item[0]
+        return MODE_ORDER.get(mode, 999), mode
+
+    def summary(self):
+        """
+        Get summary as JSON-serializable dictionary.
+
+        Lists are sorted by count (descending); entries with equal counts keep
+        the order in which they first appeared in the log.
+
+        Returns:
+            Dictionary with total, dxcc_count, band_count, dxcc (name, total
+            and mode breakdown), bands ([band, count]) and longest (QSOs with
+            the longest distance)
+        """
+        dxcc = [
+            {
+                'name': name,
+                'total': total,
+                'modes': [[mode, count] for mode, count in sorted(self.dxcc_modes[name].items(), key=self._mode_sort_key)],
+            }
+            for name, total in sorted(self.dxcc.items(), key=lambda item: -item[1])
+        ]
+        longest = sorted(self._longest, key=lambda entry: (-entry[0], -entry[1]))
+
+        return {
+            'total': self.total,
+            'dxcc_count': len(self.dxcc),
+            'band_count': len(self.bands),
+            'dxcc': dxcc,
+            'bands': [[band, count] for band, count in sorted(self.bands.items(), key=lambda item: -item[1])],
+            'longest': [qso for _, _, qso in longest],
+        }
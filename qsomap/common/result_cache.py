@@ -0,0 +1,90 @@
+"""
+In-memory cache of processed log files.
+
+Uploading the same log again (e.g. after reloading the page) reuses the
+processed QSOs together with everything computed from them, instead of
+parsing the file and looking up every callsign again.
+"""
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+def log_hash(content, *params):
+    """
+    Compute cache key of log file content and processing parameters.
+
+    Args:
+        content: Log file content as string
+        *params: Values the result depends on (e.g. own coordinates)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256(content.encode('utf-8', 'surrogatepass'))
+    for param in params:
+        digest.update(b'\x00' + repr(param).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ProcessedLogCache:
+    """Thread-safe LRU cache of processed log results."""
+
+    def __init__(self, max_entries=16):
+        """
+        Initialize empty cache.
+
+        Args:
+            max_entries: Maximum number of cached logs (0 disables caching)
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Get cached result.
+
+        Args:
+            key: Cache key (see log_hash)
+
+        Returns:
+            Cached result or None
+        """
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+
+    def put(self, key, result):
+        """
+        Store result, evicting the least recently used one if the cache is full.
+
+        Args:
+            key: Cache key (see log_hash)
+            result: Processed log result
+        """
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries (e.g. after country data has been reloaded)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+processed_logs = ProcessedLogCache(int(os.environ.get('PROCESSED_LOG_CACHE_SIZE', '16')))
+
+# Ham Wrapped statistics of every year of a log, keyed like processed_logs
+wrapped_statistics = ProcessedLogCache(int(os.environ.get('WRAPPED_STATS_CACHE_SIZE', '16')))
@@ -0,0 +1,74 @@
+"""
+Timeline index sent with the map data.
+
+QSOs are sorted by time once on the server. The map gets the sorted epoch
+seconds, the permutation into its QSO list and a per-minute histogram, so
+rate charts and peak rates for any interval can be answered with prefix
+sums instead of rescanning every QSO.
+"""
+import calendar
+from datetime import datetime
+
+
+def parse_qso_timestamp(date, time=''):
+    """
+    Convert ADIF date and time (UTC) to epoch seconds.
+
+    Args:
+        date: QSO date as YYYYMMDD
+        time: QSO time as HHMM or HHMMSS (optional)
+
+    Returns:
+        Epoch seconds, or None if date or time is not valid
+    """
+    date = (date or '').strip()
+    time = (time or '').strip()
+    if len(date) != 8 or not date.isdigit() or (time and not time.isdigit()):
+        return None
+
+    try:
+        moment = datetime(
+            int(date[0:4]), int(date[4:6]), int(date[6:8]),
+            int(time[0:2] or 0), int(time[2:4] or 0), int(time[4:6] or 0)
+        )
+    except ValueError:
+        return None
+    return calendar.timegm(moment.timetuple())
+
+
+def build_timeline_index(qsos):
+    """
+    Build sorted timeline index for QSOs.
+
+    Args:
+        qsos: Enhanced QSO dictionaries (see LogFileProcessor)
+
+    Returns:
+        Dictionary with ``times`` (sorted epoch seconds), ``order`` (index
+        into ``qsos`` for each entry of ``times``), and per-minute histogram
+        of minutes with at least one QSO: ``minutes`` (epoch minutes, sorted)
+        and ``counts``. QSOs without valid date are left out.
+    """
+    entries = []
+    for index, qso in enumerate(qsos):
+        timestamp = parse_qso_timestamp(qso.get('date'), qso.get('time'))
+        if timestamp is not None:
+            entries.append((timestamp, index))
+    entries.sort()
+
+    minutes = []
+    counts = []
+    for timestamp, _ in entries:
+        minute = timestamp // 60
+        if minutes and minutes[-1] == minute:
+            counts[-1] += 1
+        else:
+            minutes.append(minute)
+            counts.append(1)
+
+    return {
+        'times': [timestamp for timestamp, _ in entries],
+        'order': [index for _, index in entries],
+        'minutes': minutes,
+        'counts': counts,
+    }
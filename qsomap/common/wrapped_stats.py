@@ -0,0 +1,513 @@
+"""
+Ham Wrapped statistics computed on the server.
+
+Python port of ``StatisticsCalculator`` from Ham Wrapped (statistics.js),
+running over QSOs enhanced by the same pipeline as the map page, so both
+share parsing, callsign lookups and distances. Statistics of every year in
+the log are collected in one pass and have the same shape as in the
+browser; dates and times are ISO strings (UTC, as logged).
+"""
+import logging
+from datetime import datetime, timedelta
+from decimal import Decimal, ROUND_HALF_UP
+
+from .dxcc_entities import dxcc_code, dxcc_name
+from .grid_validator import validate_grid_square
+from .log_reader import LogFileProcessor, calculate_distance
+
+logger = logging.getLogger(__name__)
+
+# Own position assumed for the estimated ODX when no locator is given (Poland)
+DEFAULT_USER_COORDS = (52.0, 20.0)
+
+# Raw ADIF fields used by Ham Wrapped statistics (enhanced QSO key: ADIF field)
+WRAPPED_ADIF_FIELDS = {
+    'submode': 'SUBMODE',
+    'contest_id': 'CONTEST_ID',
+    'sat_name': 'SAT_NAME',
+    'prop_mode': 'PROP_MODE',
+    'sota_ref': 'SOTA_REF',
+    'pota_ref': 'POTA_REF',
+    'iota': 'IOTA',
+    'wwff_ref': 'WWFF_REF',
+}
+
+# Labels of special activities (same as in statistics.js)
+SPECIAL_MODE_LABELS = {
+    'satellite': 'Satelitarne',
+    'sota': 'SOTA',
+    'pota': 'POTA',
+    'iota': 'IOTA',
+    'wwff': 'WWFF',
+}
+
+
+def _parse_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_fixed(value):
+    """Format number with one decimal place, rounding halves up like Number.toFixed(1)."""
+    return str(Decimal(value).quantize(Decimal('0.1'), rounding=ROUND_HALF_UP))
+
+
+def _percentage(count, total):
+    return _to_fixed(count / total * 100)
+
+
+def _find_best(distribution):
+    """Key with the highest count (first one on ties) and the count."""
+    best, best_count = None, 0
+    for key, count in distribution.items():
+        if count > best_count:
+            best, best_count = key, count
+    return best, best_count
+
+
+def _iso(moment):
+    return moment.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+
+def _qso_moment(qso):
+    """
+    Date and time of QSO.
+
+    Returns:
+        Tuple (datetime, whether time was logged); None for an invalid date
+    """
+    try:
+        day = datetime.strptime(qso['date'][:8], '%Y%m%d')
+    except ValueError:
+        return None
+    try:
+        return datetime.strptime(qso['date'][:8] + qso['time'][:4], '%Y%m%d%H%M'), True
+    except ValueError:
+        return day, False
+
+
+class WrappedLogProcessor(LogFileProcessor):
+    """
+    Log processor keeping the fields Ham Wrapped statistics need.
+
+    Besides the enhanced QSO data used by the map, QSOs carry continent, CQ
+    zone and DXCC number (from the log, otherwise from the callsign lookup
+    and its primary prefix), the distance stored in the log and special
+    activity references. QSOs with unknown callsigns and no logged locator
+    have no position, so they get no distances.
+    """
+
+    def _build_qso(self, qso, call, info):
+        enhanced = super()._build_qso(qso, call, info)
+        # Bands and modes are shown upper case, as in the browser
+        enhanced['band'] = enhanced['band'].upper()
+        enhanced['mode'] = enhanced['mode'].upper()
+        for key, field in WRAPPED_ADIF_FIELDS.items():
+            enhanced[key] = qso.get(field, '').strip().upper()
+
+        # Failed lookups report 'Unknown', which must not be counted as a country
+        enhanced['country'] = enhanced['dxcc'] if enhanced['dxcc'] != 'Unknown' else None
+        enhanced['continent'] = qso.get('CONT', '').strip().upper() or info.get('continent')
+        enhanced['cq_zone'] = _parse_int(qso.get('CQZ')) or info.get('cqz')
+        # CTY.DAT lookups carry no DXCC number, it comes from the primary prefix
+        enhanced['dxcc_id'] = (_parse_int(qso.get('DXCC')) or info.get('adif')
+                               or dxcc_code(info.get('prefix')))
+        enhanced['log_distance'] = _parse_float(qso.get('DISTANCE'))
+
+        # Without a country and a logged locator the position is only the
+        # default grid of failed lookups; the browser has no position either
+        if enhanced['country'] is None and not validate_grid_square(qso.get('GRIDSQUARE', '')):
+            enhanced.update({'grid': '', 'latitude': None, 'longitude': None, 'distance': None})
+        return enhanced
+
+
+class WrappedAccumulator:
+    """Counters of one year, updated QSO by QSO (see StatisticsCalculator.addQSO)."""
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self.total = 0
+        self.callsign_counts = {}
+        self.months = {}
+        self.days = {}
+        self.days_of_week = dict.fromkeys(range(7), 0)
+        self.hours = dict.fromkeys(range(24), 0)
+        self.modes = {}
+        self.bands = {}
+        self.continents = {}
+        self.countries = {}
+        self.zones = {}
+        self.odx = None
+        self.closest = None
+        self.estimated_odx = None
+        self.hourly_buckets = {}
+        self.day_activity = {}
+        self.first_qso = None
+        self.last_qso = None
+        self.contests = {}
+        self.special = dict.fromkeys(SPECIAL_MODE_LABELS, 0)
+        self.slots = set()
+        self.slots_by_dxcc = {}
+        self.slots_by_band = {}
+
+    def add(self, qso, moment, has_time, distance, estimated):
+        """
+        Add single QSO.
+
+        Args:
+            qso: Enhanced QSO dictionary (see WrappedLogProcessor)
+            moment: QSO date and time
+            has_time: Whether the QSO time was logged
+            distance: Distance to the QSO partner in km or None
+            estimated: Distance estimated from the default position, used
+                when no distance is known, or None
+        """
+        self.total += 1
+        call = qso['call']
+        if call:
+            self.callsign_counts[call] = self.callsign_counts.get(call, 0) + 1
+
+        day_key = moment.strftime('%Y-%m-%d')
+        self.months[moment.month] = self.months.get(moment.month, 0) + 1
+        self.days[day_key] = self.days.get(day_key, 0) + 1
+
+        if has_time:
+            self.days_of_week[(moment.weekday() + 1) % 7] += 1
+            self.hours[moment.hour] += 1
+            if self.first_qso is None or moment < self.first_qso[0]:
+                self.first_qso = (moment, qso)
+            if self.last_qso is None or moment > self.last_qso[0]:
+                self.last_qso = (moment, qso)
+
+            hour_key = f'{day_key}T{moment.hour:02d}:00:00.000Z'
+            self.hourly_buckets[hour_key] = self.hourly_buckets.get(hour_key, 0) + 1
+
+            activity = self.day_activity.get(day_key)
+            if activity is None:
+                activity = self.day_activity[day_key] = [moment, moment, 0]
+            activity[0] = min(activity[0], moment)
+            activity[1] = max(activity[1], moment)
+            activity[2] += 1
+
+        mode = qso['submode'] or qso['mode'] or 'UNKNOWN'
+        self.modes[mode] = self.modes.get(mode, 0) + 1
+        band = qso['band'] or 'UNKNOWN'
+        self.bands[band] = self.bands.get(band, 0) + 1
+
+        continent = qso['continent']
+        if continent:
+            self.continents[continent] = self.continents.get(continent, 0) + 1
+        zone = qso['cq_zone']
+        if zone and 1 <= zone <= 40:
+            self.zones[zone] = self.zones.get(zone, 0) + 1
+
+        self._add_country(qso)
+
+        if distance is not None:
+            if distance > (self.odx[1] if self.odx else 0):
+                self.odx = (qso, distance)
+            if 0 < distance < (self.closest[1] if self.closest else float('inf')):
+                self.closest = (qso, distance)
+        elif estimated is not None and estimated > (self.estimated_odx[1] if self.estimated_odx else 0):
+            self.estimated_odx = (qso, estimated)
+
+        if qso['contest_id']:
+            self.contests[qso['contest_id']] = self.contests.get(qso['contest_id'], 0) + 1
+        if qso['sat_name'] or qso['prop_mode'] == 'SAT':
+            self.special['satellite'] += 1
+        for activity, field in (('sota', 'sota_ref'), ('pota', 'pota_ref'), ('iota', 'iota'), ('wwff', 'wwff_ref')):
+            if qso[field]:
+                self.special[activity] += 1
+
+    def _add_country(self, qso):
+        # Keyed by DXCC number, or by country name when the number is unknown
+        key = str(qso['dxcc_id'] or qso['country'] or '')
+        if not key:
+            return
+        # Known entities are named as in DXCC_DATA, like in the browser
+        name = dxcc_name(qso['dxcc_id']) or qso['country'] or f'DXCC {key}'
+        country = self.countries.get(key)
+        if country is None:
+            country = self.countries[key] = {'dxcc': qso['dxcc_id'], 'name': name, 'count': 0}
+        country['count'] += 1
+
+        band = qso['band']
+        if not band or (key, band) in self.slots:
+            return
+        self.slots.add((key, band))
+        slots = self.slots_by_dxcc.get(key)
+        if slots is None:
+            slots = self.slots_by_dxcc[key] = {'name': name, 'bands': [], 'count': 0}
+        slots['bands'].append(band)
+        slots['count'] += 1
+        self.slots_by_band.setdefault(band, set()).add(key)
+
+    def _sort_distribution(self, distribution, name):
+        return [
+            {name: key, 'count': count, 'percentage': _percentage(count, self.total)}
+            for key, count in sorted(distribution.items(), key=lambda item: -item[1])
+        ]
+
+    def finalize(self):
+        """
+        Get statistics of the year.
+
+        Returns:
+            Dictionary with the same keys as StatisticsCalculator.finalize()
+            in Ham Wrapped
+        """
+        top_callsigns = self._sort_distribution(self.callsign_counts, 'call')
+        modes = self._sort_distribution(self.modes, 'mode')
+        bands = self._sort_distribution(self.bands, 'band')
+        countries = sorted(self.countries.values(), key=lambda country: -country['count'])
+        best_month, best_month_count = _find_best(dict(sorted(self.months.items())))
+        best_day, best_day_count = _find_best(self.days)
+        best_weekday, best_weekday_count = _find_best(self.days_of_week)
+        peak_hour, peak_hour_count = _find_best(self.hours)
+        active_days = len(self.days)
+
+        return {
+            'totalQSOs': self.total,
+            'uniqueCallsigns': {'count': len(self.callsign_counts), 'list': list(self.callsign_counts)},
+            'topCallsigns': {
+                'top5': top_callsigns[:5],
+                'top10': top_callsigns[:10],
+                'favorite': top_callsigns[0] if top_callsigns else None,
+            },
+            'byMonth': {'distribution': self.months, 'best': {'month': best_month, 'count': best_month_count}},
+            'byDay': {'distribution': self.days, 'best': {'date': best_day, 'count': best_day_count}},
+            'byDayOfWeek': {
+                'distribution': self.days_of_week,
+                'best': {'day': best_weekday or 0, 'dayIndex': best_weekday or 0, 'count': best_weekday_count},
+            },
+            'byHour': {'distribution': self.hours, 'peak': {'hour': peak_hour or 0, 'count': peak_hour_count}},
+            'byMode': {'distribution': self.modes, 'sorted': modes, 'favorite': modes[0] if modes else None},
+            'byBand': {
+                'distribution': self.bands,
+                'sorted': bands,
+                'favorite': bands[0] if bands else None,
+                'count': len(self.bands),
+            },
+            'byContinent': {
+                'distribution': self.continents,
+                'sorted': self._sort_distribution(self.continents, 'continent'),
+                'count': len(self.continents),
+            },
+            'byDXCC': {
+                'distribution': self.countries,
+                'sorted': countries,
+                'count': len(self.countries),
+                'top': countries[0] if countries else None,
+                'top5': countries[:5],
+                'top10': countries[:10],
+            },
+            'byCQZone': {'distribution': self.zones, 'count': len(self.zones)},
+            'odx': self._distance_qso(self.odx or self.estimated_odx),
+            'closestQSO': self._distance_qso(self.closest),
+            'qsoRate': self._qso_rate(),
+            'longestDay': self._longest_day(),
+            'firstQSO': self._qso_view(*self.first_qso) if self.first_qso else None,
+            'lastQSO': self._qso_view(*self.last_qso) if self.last_qso else None,
+            'contestActivity': {
+                'total': len(self.contests),
+                'contests': [
+                    {'contest': contest, 'count': count}
+                    for contest, count in sorted(self.contests.items(), key=lambda item: -item[1])
+                ],
+                'qsosInContests': sum(self.contests.values()),
+            },
+            'specialModes': {
+                activity: {'count': self.special[activity], 'label': label}
+                for activity, label in SPECIAL_MODE_LABELS.items()
+            },
+            'averageQSOsPerDay': {
+                'average': _to_fixed(self.total / active_days) if active_days else 0,
+                'activeDays': active_days,
+            },
+            'activeDays': active_days,
+            'streaks': self._streaks(),
+            'bandSlots': self._band_slots(),
+        }
+
+    @staticmethod
+    def _qso_view(moment, qso):
+        # Field names of QSOs parsed in the browser (adif-parser.js)
+        return {
+            'call': qso['call'],
+            'band': qso['band'],
+            'mode': qso['mode'],
+            'submode': qso['submode'],
+            'gridsquare': qso['grid'],
+            'country': qso['country'],
+            'continent': qso['continent'],
+            'cqZone': qso['cq_zone'],
+            'dxcc': qso['dxcc_id'],
+            'datetime': _iso(moment),
+        }
+
+    def _distance_qso(self, entry):
+        if entry is None:
+            return None
+        qso, distance = entry
+        view = self._qso_view(_qso_moment(qso)[0], qso)
+        view.update({'distance': distance, 'dxccName': qso['country']})
+        return view
+
+    def _qso_rate(self):
+        peak_hour, max_rate = _find_best(self.hourly_buckets)
+        return {'maxRate': max_rate, 'peakHour': peak_hour, 'peakDate': peak_hour}
+
+    def _longest_day(self):
+        longest, max_duration = None, 0
+        for day, (first, last, count) in self.day_activity.items():
+            duration = (last - first).total_seconds() / 3600
+            if duration > max_duration:
+                max_duration = duration
+                longest = {
+                    'date': day,
+                    'duration': _to_fixed(duration),
+                    'count': count,
+                    'firstQSO': _iso(first),
+                    'lastQSO': _iso(last),
+                }
+        return longest
+
+    def _streaks(self):
+        days = sorted(self.days)
+        max_streak, max_start, max_end = 0, None, None
+        current, current_start = 1, days[0] if days else None
+        for previous, day in zip(days, days[1:]):
+            if datetime.strptime(day, '%Y-%m-%d') - datetime.strptime(previous, '%Y-%m-%d') == timedelta(days=1):
+                current += 1
+                continue
+            if current > max_streak:
+                max_streak, max_start, max_end = current, current_start, previous
+            current, current_start = 1, day
+        if current > max_streak:
+            max_streak, max_start, max_end = current, current_start, days[-1] if days else None
+        return {'maxStreak': max_streak, 'maxStreakStart': max_start, 'maxStreakEnd': max_end}
+
+    def _band_slots(self):
+        all_dxcc = sorted(
+            (
+                {'dxcc': key, 'name': slots['name'], 'slots': slots['count'], 'bands': slots['bands']}
+                for key, slots in self.slots_by_dxcc.items()
+            ),
+            key=lambda entry: -entry['slots'],
+        )
+        return {
+            'totalSlots': len(self.slots),
+            'dxccCount': len(self.slots_by_dxcc),
+            'bandCount': len(self.slots_by_band),
+            'topDxcc': all_dxcc[:5],
+            'allDxcc': all_dxcc,
+        }
+
+
+class WrappedStatisticsCalculator:
+    """Computes Ham Wrapped statistics of every year in a processed log."""
+
+    def __init__(self, qsos, has_locator=False):
+        """
+        Initialize calculator.
+
+        Args:
+            qsos: Enhanced QSO dictionaries (see WrappedLogProcessor)
+            has_locator: Whether distances were computed from own locator;
+                otherwise distances stored in the log are used and the ODX is
+                estimated from DEFAULT_USER_COORDS when the log has none
+        """
+        self.qsos = qsos
+        self.has_locator = has_locator
+
+    def calculate_by_year(self):
+        """
+        Compute statistics of each year in one pass over the log.
+
+        QSOs without a valid date are skipped.
+
+        Returns:
+            Dictionary {year: statistics}; yearOverYear holds the summary of
+            the previous year or None
+        """
+        years = {}
+        estimated_distances = {}
+
+        for qso in self.qsos:
+            parsed = _qso_moment(qso)
+            if parsed is None:
+                continue
+            moment, has_time = parsed
+
+            if self.has_locator:
+                distance, estimated = qso['distance'], None
+            else:
+                distance, estimated = qso['log_distance'], None
+                if distance is None and qso['latitude'] is not None:
+                    position = (qso['latitude'], qso['longitude'])
+                    estimated = estimated_distances.get(position)
+                    if estimated is None:
+                        estimated = estimated_distances[position] = calculate_distance(*DEFAULT_USER_COORDS, *position)
+
+            accumulator = years.get(moment.year)
+            if accumulator is None:
+                accumulator = years[moment.year] = WrappedAccumulator()
+            accumulator.add(qso, moment, has_time, distance, estimated)
+
+        stats = {year: accumulator.finalize() for year, accumulator in years.items()}
+        for year, year_stats in stats.items():
+            previous = stats.get(year - 1)
+            year_stats['yearOverYear'] = self.summarize_year(year - 1, previous) if previous else None
+        return stats
+
+    @staticmethod
+    def summarize_year(year, stats):
+        """
+        Summary of a year for the year-over-year comparison.
+
+        Args:
+            year: Year
+            stats: Statistics of the year
+
+        Returns:
+            Dictionary with the compared values
+        """
+        return {
+            'year': year,
+            'totalQSOs': stats['totalQSOs'],
+            'uniqueCallsigns': stats['uniqueCallsigns']['count'],
+            'dxcc': stats['byDXCC']['count'],
+            'continents': stats['byContinent']['count'],
+            'bands': stats['byBand']['count'],
+            'bandSlots': stats['bandSlots']['totalSlots'],
+            'activeDays': stats['activeDays'],
+            'odx': stats['odx']['distance'] if stats['odx'] else None,
+        }
+
+
+def compute_wrapped_statistics(file_content, my_latitude=None, my_longitude=None):
+    """
+    Process log file and compute Ham Wrapped statistics of every year.
+
+    Args:
+        file_content: Log file content as string (ADIF or Cabrillo)
+        my_latitude: Own latitude (optional, for distances)
+        my_longitude: Own longitude (optional, for distances)
+
+    Returns:
+        Dictionary {year: statistics} (see WrappedStatisticsCalculator)
+    """
+    processor = WrappedLogProcessor(my_latitude, my_longitude)
+    qsos = processor.process(file_content)
+    years = WrappedStatisticsCalculator(qsos, has_locator=my_latitude is not None).calculate_by_year()
+    logger.info(f"Computed Ham Wrapped statistics of {len(qsos)} QSOs in {len(years)} years")
+    return years
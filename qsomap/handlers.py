@@ -4,7 +4,10 @@ Routes and error handlers for HamLogMap application
 
 import os
 import logging
-from flask import render_template, request, redirect, url_for, send_from_directory, current_app
+from flask import (
+    render_template, request, redirect, url_for, send_file, send_from_directory, current_app, jsonify, abort
+)
+from qsomap.common.callinfo_provider import CallInfoProvider
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +29,43 @@ def register_routes(app):
         ham_wrapped_dir = os.path.join(current_app.static_folder, 'ham-wrapped')
         return send_from_directory(ham_wrapped_dir, 'index.html')
 
+    @app.route('/ham-wrapped/sw.js')
+    def ham_wrapped_service_worker():
+        """Serve Ham Wrapped service worker, allowed to control the /ham-wrapped page"""
+        ham_wrapped_dir = os.path.join(current_app.static_folder, 'ham-wrapped')
+        response = send_from_directory(ham_wrapped_dir, 'sw.js', mimetype='text/javascript')
+        response.headers['Service-Worker-Allowed'] = '/ham-wrapped'
+        # Browsers check for a new service worker on every visit
+        response.cache_control.no_cache = True
+        return response
+
+    @app.route('/ham-wrapped/data/cty.idx')
+    def ham_wrapped_cty_index():
+        """Serve compiled country index (gzip copy if accepted) for callsign lookups in Ham Wrapped"""
+        try:
+            index_files = CallInfoProvider.get_index_files()
+        except OSError as e:
+            logger.error(f"Failed to compile country index: {e}")
+            index_files = None
+        if index_files is None:
+            abort(404)
+
+        index_file, compressed_file = index_files
+        if 'gzip' in request.accept_encodings:
+            response = send_file(compressed_file, mimetype='application/octet-stream', conditional=True)
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = send_file(index_file, mimetype='application/octet-stream', conditional=True)
+        response.vary.add('Accept-Encoding')
+        # Revalidate on every visit, the ETag changes whenever the index is recompiled
+        response.cache_control.no_cache = True
+        return response
+
+    @app.route('/api/v1/metrics')
+    def metrics():
+        """Expose country lookup source and Redis circuit breaker state"""
+        return jsonify({'country_lookup': CallInfoProvider.get_metrics()})
+
 
 def register_error_handlers(app):  # noqa: C901
     """Register error handlers for the application"""
@@ -4,9 +4,30 @@
  * Obsługuje również pola specyficzne dla N1MM Logger
  */
 
+// Liczba QSO w jednej paczce wysyłanej z workera
+const ADIF_BATCH_SIZE = 2000;
+
+// Maksymalna długość nagłówka pola (<NAZWA:DŁUGOŚĆ:TYP>) - dłuższy tekst po '<' to nie pole
+const ADIF_MAX_TAG_LENGTH = 256;
+
+// Koniec rekordu - wyszukiwany od zadanej pozycji (lastIndex)
+const ADIF_END_OF_RECORD = /<EOR>/gi;
+
+// Nagłówek pola ADIF: NAZWA:DŁUGOŚĆ lub NAZWA:DŁUGOŚĆ:TYP
+// Obsługuje nazwy z podkreśleniami (np. APP_N1MM_CONTINENT)
+const ADIF_FIELD_TAG = /^([A-Za-z0-9_]+):(\d+)(?::[A-Za-z])?$/;
+
 class ADIFParser {
-    constructor() {
+    /**
+     * @param {Object} options - year: rok do zachowania (domyślnie WRAPPED_YEAR,
+     *                           null - wszystkie lata), enrich: uzupełniaj dane
+     *                           z callsign lookup (domyślnie true)
+     */
+    constructor(options = {}) {
         this.qsos = [];
+        this.year = options.year === undefined ? WRAPPED_YEAR : options.year;
+        this.enrich = options.enrich !== false;
+        this.resetStream();
     }
 
     /**
@@ -15,128 +36,228 @@ class ADIFParser {
      * @returns {Array} - Tablica obiektów QSO
      */
     parse(content) {
-        this.qsos = [];
-
-        // Usuń nagłówek ADIF (wszystko przed <EOH> lub pierwszym rekordem)
-        let dataSection = content;
-        const eohMatch = content.match(/<EOH>/i);
-        if (eohMatch) {
-            dataSection = content.substring(eohMatch.index + 5);
-        }
-
-        // Podziel na rekordy po <EOR> - prostsza i bardziej niezawodna metoda
-        const records = dataSection.split(/<EOR>/i);
-
-        console.log(`Znaleziono ${records.length} potencjalnych rekordów`);
+        this.resetStream();
+        this.pushText(content);
+        this.finishStream();
+        this.logYearAnalysis();
+        return this.qsos;
+    }
 
-        for (const recordContent of records) {
-            // Pomiń puste rekordy
-            if (!recordContent.trim() || !recordContent.includes('<')) {
-                continue;
+    /**
+     * Parsuje plik ADIF strumieniowo, fragment po fragmencie
+     * @param {File|Blob} file - Plik ADIF
+     * @param {Object} callbacks - onBatch(qsos): paczki QSO (zamiast zbierania w this.qsos),
+     *                             onProgress(loaded, total): postęp w bajtach
+     * @returns {Promise<Array>} - Tablica obiektów QSO (pusta, jeśli podano onBatch)
+     */
+    async parseFile(file, callbacks = {}) {
+        const { onBatch, onProgress } = callbacks;
+        const reader = file.stream().getReader();
+        const decoder = new TextDecoder();
+        let loaded = 0;
+
+        this.resetStream();
+        for (;;) {
+            const { done, value } = await reader.read();
+            if (done) break;
+
+            loaded += value.length;
+            this.pushText(decoder.decode(value, { stream: true }));
+
+            if (onBatch && this.qsos.length >= ADIF_BATCH_SIZE) {
+                onBatch(this.qsos);
+                this.qsos = [];
             }
-
-            const qso = this.parseRecord(recordContent);
-            if (qso && qso.call) {
-                // Uzupełnij brakujące dane z callsign lookup
-                this.enrichQSOData(qso);
-                this.qsos.push(qso);
+            if (onProgress) {
+                onProgress(loaded, file.size);
             }
         }
+        this.pushText(decoder.decode());
+        this.finishStream();
 
-        console.log(`Parsed ${this.qsos.length} QSOs total`);
-        if (this.qsos.length > 0) {
-            console.log('Sample QSO:', this.qsos[0]);
-            console.log('Last QSO:', this.qsos[this.qsos.length - 1]);
+        if (onBatch && this.qsos.length > 0) {
+            onBatch(this.qsos);
+            this.qsos = [];
         }
-
-        // Check and log QSOs from other years
-        this.checkNon2025QSOs();
-
-        // Filter to keep only 2025 QSOs
-        this.filterTo2025();
-
+        this.logYearAnalysis();
         return this.qsos;
     }
 
     /**
-     * Filters QSOs to keep only those from 2025
+     * Zeruje stan parsowania strumieniowego
      */
-    filterTo2025() {
-        const totalBefore = this.qsos.length;
+    resetStream() {
+        this.qsos = [];
+        this.buffer = '';
+        this.record = {};
+        this.recordCount = 0;
+        this.yearCounts = {};
+        this.yearExamples = {};
+    }
 
-        this.qsos = this.qsos.filter(qso => {
-            // Use dateRaw (original string YYYYMMDD) or date object
-            if (qso.dateRaw) {
-                return qso.dateRaw.startsWith('2025');
+    /**
+     * Tokenizuje kolejny fragment tekstu - pola czytane są według długości
+     * z nagłówka, niepełne pole na końcu fragmentu czeka na następny fragment
+     * @param {string} text - Fragment zawartości pliku
+     * @param {boolean} final - Czy to koniec pliku
+     */
+    pushText(text, final = false) {
+        const buffer = this.buffer + text;
+        let pos = 0;
+
+        for (;;) {
+            const tagStart = buffer.indexOf('<', pos);
+            if (tagStart === -1) {
+                pos = buffer.length;
+                break;
             }
-            if (qso.date && qso.date.year) {
-                return qso.date.year === 2025;
+
+            const tagEnd = buffer.indexOf('>', tagStart);
+            if (tagEnd === -1 || tagEnd - tagStart > ADIF_MAX_TAG_LENGTH) {
+                if (tagEnd === -1 && !final && buffer.length - tagStart <= ADIF_MAX_TAG_LENGTH) {
+                    // Niepełny nagłówek pola - poczekaj na dalszą część pliku
+                    pos = tagStart;
+                    break;
+                }
+                pos = tagStart + 1;
+                continue;
             }
-            return false;
-        });
 
-        const filtered = totalBefore - this.qsos.length;
-        if (filtered > 0) {
-            console.log(`📅 Filtered out ${filtered} QSOs from years other than 2025`);
+            const tag = buffer.substring(tagStart + 1, tagEnd);
+            const fieldMatch = ADIF_FIELD_TAG.exec(tag);
+
+            if (fieldMatch) {
+                const valueStart = tagEnd + 1;
+                const valueEnd = valueStart + parseInt(fieldMatch[2], 10);
+                // Zapas na <EOR> tuż za wartością (patrz niżej)
+                if (valueEnd + 5 > buffer.length && !final) {
+                    pos = tagStart;
+                    break;
+                }
+                let value = buffer.substring(valueStart, valueEnd);
+                // Długość bywa liczona w bajtach UTF-8 - wartość nie może wyjść
+                // poza rekord, a skanowanie wraca do następnego znacznika
+                const nextTag = value.indexOf('<');
+                if (nextTag !== -1) {
+                    ADIF_END_OF_RECORD.lastIndex = valueStart + nextTag;
+                    const recordEnd = ADIF_END_OF_RECORD.exec(buffer);
+                    if (recordEnd && recordEnd.index < valueEnd) {
+                        value = value.substring(0, recordEnd.index - valueStart);
+                    }
+                }
+                this.applyField(this.record, fieldMatch[1].toUpperCase(), value.trim());
+                pos = nextTag === -1 ? Math.min(valueEnd, buffer.length) : valueStart + nextTag;
+            } else {
+                const marker = tag.toUpperCase();
+                if (marker === 'EOR') {
+                    this.endRecord();
+                } else if (marker === 'EOH') {
+                    // Pola nagłówka pliku nie należą do żadnego QSO
+                    this.record = {};
+                }
+                pos = tagEnd + 1;
+            }
         }
-        console.log(`📊 Using ${this.qsos.length} QSOs from 2025 for Wrapped`);
+
+        this.buffer = buffer.substring(pos);
     }
 
     /**
-     * Checks and logs QSOs from years other than 2025
+     * Kończy parsowanie - ostatni rekord może nie mieć <EOR>
      */
-    checkNon2025QSOs() {
-        const qsosByYear = {};
+    finishStream() {
+        this.pushText('', true);
+        this.buffer = '';
+        this.endRecord();
+        console.log(`Parsed ${this.recordCount} QSOs total`);
+    }
 
-        this.qsos.forEach(qso => {
-            let year = null;
+    /**
+     * Zamyka bieżący rekord; zachowuje QSO z roku podsumowania
+     * (lub wszystkie QSO z datą, gdy rok nie jest ustawiony)
+     */
+    endRecord() {
+        const qso = this.completeRecord(this.record);
+        this.record = {};
+        if (!qso.call) return;
+
+        this.recordCount++;
+
+        // Rok z dateRaw (oryginalny YYYYMMDD) lub z obiektu daty
+        let year = null;
+        if (qso.dateRaw) {
+            year = qso.dateRaw.substring(0, 4);
+        } else if (qso.date && qso.date.year) {
+            year = String(qso.date.year);
+        }
 
-            // Get year from dateRaw (original YYYYMMDD string) or date object
-            if (qso.dateRaw) {
-                year = qso.dateRaw.substring(0, 4);
-            } else if (qso.date && qso.date.year) {
-                year = String(qso.date.year);
-            }
+        if (year) {
+            this.yearCounts[year] = (this.yearCounts[year] || 0) + 1;
+        }
 
+        if (!year || (this.year && year !== String(this.year))) {
             if (year) {
-                if (!qsosByYear[year]) {
-                    qsosByYear[year] = [];
+                // Przykładowe QSO z innych lat do analizy w konsoli
+                const examples = this.yearExamples[year] || (this.yearExamples[year] = []);
+                if (examples.length < 5) {
+                    examples.push(`${qso.dateRaw || year} ${qso.call} ${qso.band || ''} ${qso.mode || ''}`);
                 }
-                qsosByYear[year].push(qso);
             }
-        });
+            return;
+        }
+
+        // Uzupełnij brakujące dane z callsign lookup
+        if (this.enrich) {
+            this.enrichQSOData(qso);
+        }
+        this.qsos.push(qso);
+    }
+
+    /**
+     * Loguje liczbę QSO w poszczególnych latach i pominięte QSO z innych lat
+     * @param {Object} yearCounts - Liczba QSO per rok (domyślnie z ostatniego parsowania)
+     * @param {Object} yearExamples - Przykładowe QSO z innych lat
+     */
+    logYearAnalysis(yearCounts = this.yearCounts, yearExamples = this.yearExamples) {
+        const years = Object.keys(yearCounts).sort();
+        const total = years.reduce((sum, year) => sum + yearCounts[year], 0);
 
-        const years = Object.keys(qsosByYear).sort();
         console.log('=== YEAR ANALYSIS IN LOG ===');
         console.log(`Years found: ${years.join(', ')}`);
 
+        if (!this.year) {
+            years.forEach(year => console.log(`  ${year}: ${yearCounts[year]} QSO`));
+            console.log('=== END OF YEAR ANALYSIS ===');
+            console.log(`📊 Using ${total} QSOs from ${years.length} years for Wrapped`);
+            return;
+        }
+
+        const target = String(this.year);
+
         years.forEach(year => {
-            const count = qsosByYear[year].length;
-            const percentage = ((count / this.qsos.length) * 100).toFixed(1);
-            const marker = year !== '2025' ? ' ⚠️ NOT 2025!' : ' ✓';
+            const count = yearCounts[year];
+            const percentage = ((count / total) * 100).toFixed(1);
+            const marker = year !== target ? ` ⚠️ NOT ${target}!` : ' ✓';
             console.log(`  ${year}: ${count} QSO (${percentage}%)${marker}`);
         });
 
-        const non2025Years = years.filter(y => y !== '2025');
-        if (non2025Years.length > 0) {
-            console.warn('⚠️ WARNING: Log contains QSOs from years other than 2025:');
-            non2025Years.forEach(year => {
-                const qsos = qsosByYear[year];
-                console.warn(`  Year ${year}: ${qsos.length} QSO`);
-                // Show first 5 example QSOs from this year
-                const examples = qsos.slice(0, 5);
-                examples.forEach(qso => {
-                    const dateStr = qso.dateRaw || `${qso.date.year}-${qso.date.month}-${qso.date.day}`;
-                    console.warn(`    - ${dateStr} ${qso.call} ${qso.band || ''} ${qso.mode || ''}`);
-                });
-                if (qsos.length > 5) {
-                    console.warn(`    ... and ${qsos.length - 5} more`);
+        const otherYears = years.filter(year => year !== target);
+        if (otherYears.length > 0) {
+            console.warn(`⚠️ WARNING: Log contains QSOs from years other than ${target}:`);
+            otherYears.forEach(year => {
+                console.warn(`  Year ${year}: ${yearCounts[year]} QSO`);
+                (yearExamples[year] || []).forEach(example => console.warn(`    - ${example}`));
+                if (yearCounts[year] > 5) {
+                    console.warn(`    ... and ${yearCounts[year] - 5} more`);
                 }
             });
+            const filtered = otherYears.reduce((sum, year) => sum + yearCounts[year], 0);
+            console.log(`📅 Filtered out ${filtered} QSOs from years other than ${target}`);
         } else {
-            console.log('✓ All QSOs are from 2025');
+            console.log(`✓ All QSOs are from ${target}`);
         }
         console.log('=== END OF YEAR ANALYSIS ===');
+        console.log(`📊 Using ${yearCounts[target] || 0} QSOs from ${target} for Wrapped`);
     }
 
     /**
@@ -168,155 +289,160 @@ class ADIFParser {
      * @returns {Object} - Obiekt QSO
      */
     parseRecord(record) {
-        const qso = {};
-
-        // Regex do wyciągania pól ADIF: <FIELD_NAME:LENGTH>VALUE lub <FIELD_NAME:LENGTH:TYPE>VALUE
-        // Obsługuje nazwy z podkreśleniami (np. APP_N1MM_CONTINENT)
-        const fieldRegex = /<([A-Za-z0-9_]+):(\d+)(?::[A-Za-z])?>/gi;
-        let fieldMatch;
-
-        while ((fieldMatch = fieldRegex.exec(record)) !== null) {
-            const fieldName = fieldMatch[1].toUpperCase();
-            const fieldLength = parseInt(fieldMatch[2], 10);
-            const valueStart = fieldMatch.index + fieldMatch[0].length;
-            const value = record.substring(valueStart, valueStart + fieldLength).trim();
-
-            // Mapuj pola ADIF na właściwości obiektu
-            switch (fieldName) {
-                case 'CALL':
-                    qso.call = value.toUpperCase();
-                    break;
-                case 'QSO_DATE':
-                    qso.date = this.parseDate(value);
-                    qso.dateRaw = value;
-                    break;
-                case 'TIME_ON':
-                    qso.timeOn = this.parseTime(value);
-                    qso.timeOnRaw = value;
-                    break;
-                case 'TIME_OFF':
-                    qso.timeOff = this.parseTime(value);
-                    break;
-                case 'BAND':
-                    qso.band = value.toUpperCase();
-                    break;
-                case 'FREQ':
-                    qso.freq = parseFloat(value);
-                    break;
-                case 'MODE':
-                    qso.mode = value.toUpperCase();
-                    break;
-                case 'SUBMODE':
-                    qso.submode = value.toUpperCase();
-                    break;
-                case 'RST_SENT':
-                    qso.rstSent = value;
-                    break;
-                case 'RST_RCVD':
-                    qso.rstRcvd = value;
-                    break;
-                case 'DXCC':
-                    qso.dxcc = parseInt(value, 10);
-                    break;
-                case 'COUNTRY':
-                    qso.country = value;
-                    break;
-                case 'CONT':
+        const parser = new ADIFParser({ year: this.year, enrich: false });
+        parser.pushText(record, true);
+        return this.completeRecord(parser.record);
+    }
+
+    /**
+     * Mapuje pole ADIF na właściwość obiektu QSO
+     * @param {Object} qso - Obiekt QSO
+     * @param {string} fieldName - Nazwa pola (wielkimi literami)
+     * @param {string} value - Wartość pola
+     */
+    applyField(qso, fieldName, value) {
+        // Mapuj pola ADIF na właściwości obiektu
+        switch (fieldName) {
+            case 'CALL':
+                qso.call = value.toUpperCase();
+                break;
+            case 'QSO_DATE':
+                qso.date = this.parseDate(value);
+                qso.dateRaw = value;
+                break;
+            case 'TIME_ON':
+                qso.timeOn = this.parseTime(value);
+                qso.timeOnRaw = value;
+                break;
+            case 'TIME_OFF':
+                qso.timeOff = this.parseTime(value);
+                break;
+            case 'BAND':
+                qso.band = value.toUpperCase();
+                break;
+            case 'FREQ':
+                qso.freq = parseFloat(value);
+                break;
+            case 'MODE':
+                qso.mode = value.toUpperCase();
+                break;
+            case 'SUBMODE':
+                qso.submode = value.toUpperCase();
+                break;
+            case 'RST_SENT':
+                qso.rstSent = value;
+                break;
+            case 'RST_RCVD':
+                qso.rstRcvd = value;
+                break;
+            case 'DXCC':
+                qso.dxcc = parseInt(value, 10);
+                break;
+            case 'COUNTRY':
+                qso.country = value;
+                break;
+            case 'CONT':
+                qso.continent = value.toUpperCase();
+                break;
+            // Pola N1MM Logger
+            case 'APP_N1MM_CONTINENT':
+                if (!qso.continent) {
                     qso.continent = value.toUpperCase();
-                    break;
-                // Pola N1MM Logger
-                case 'APP_N1MM_CONTINENT':
-                    if (!qso.continent) {
-                        qso.continent = value.toUpperCase();
-                    }
-                    break;
-                case 'PFX':
-                    qso.prefix = value.toUpperCase();
-                    break;
-                case 'CQZ':
-                    qso.cqZone = parseInt(value, 10);
-                    break;
-                case 'ITUZ':
-                    qso.ituZone = parseInt(value, 10);
-                    break;
-                case 'GRIDSQUARE':
-                    qso.gridsquare = value.toUpperCase();
-                    break;
-                case 'MY_GRIDSQUARE':
-                    qso.myGridsquare = value.toUpperCase();
-                    break;
-                case 'NAME':
-                    qso.name = value;
-                    break;
-                case 'QTH':
-                    qso.qth = value;
-                    break;
-                case 'COMMENT':
-                case 'COMMENTS':
-                    qso.comment = value;
-                    break;
-                case 'TX_PWR':
-                    qso.txPower = parseFloat(value);
-                    break;
-                case 'CONTEST_ID':
-                    qso.contestId = value;
-                    break;
-                case 'SRX':
-                case 'SRX_STRING':
-                    qso.serialReceived = value;
-                    break;
-                case 'STX':
-                case 'STX_STRING':
-                    qso.serialSent = value;
-                    break;
-                case 'OPERATOR':
-                    qso.operator = value.toUpperCase();
-                    break;
-                case 'STATION_CALLSIGN':
-                    qso.stationCallsign = value.toUpperCase();
-                    break;
-                case 'MY_DXCC':
-                    qso.myDxcc = parseInt(value, 10);
-                    break;
-                case 'MY_COUNTRY':
-                    qso.myCountry = value;
-                    break;
-                case 'DISTANCE':
-                    qso.distance = parseFloat(value);
-                    break;
-                case 'PROP_MODE':
-                    qso.propMode = value.toUpperCase();
-                    break;
-                case 'SAT_NAME':
-                    qso.satName = value.toUpperCase();
-                    break;
-                case 'LOTW_QSL_RCVD':
-                    qso.lotwQslRcvd = value.toUpperCase();
-                    break;
-                case 'EQSL_QSL_RCVD':
-                    qso.eqslQslRcvd = value.toUpperCase();
-                    break;
-                case 'QSL_RCVD':
-                    qso.qslRcvd = value.toUpperCase();
-                    break;
-                case 'QSL_SENT':
-                    qso.qslSent = value.toUpperCase();
-                    break;
-                case 'IOTA':
-                    qso.iota = value.toUpperCase();
-                    break;
-                case 'SOTA_REF':
-                    qso.sotaRef = value.toUpperCase();
-                    break;
-                case 'POTA_REF':
-                    qso.potaRef = value.toUpperCase();
-                    break;
-                case 'WWFF_REF':
-                    qso.wwffRef = value.toUpperCase();
-                    break;
-            }
+                }
+                break;
+            case 'PFX':
+                qso.prefix = value.toUpperCase();
+                break;
+            case 'CQZ':
+                qso.cqZone = parseInt(value, 10);
+                break;
+            case 'ITUZ':
+                qso.ituZone = parseInt(value, 10);
+                break;
+            case 'GRIDSQUARE':
+                qso.gridsquare = value.toUpperCase();
+                break;
+            case 'MY_GRIDSQUARE':
+                qso.myGridsquare = value.toUpperCase();
+                break;
+            case 'NAME':
+                qso.name = value;
+                break;
+            case 'QTH':
+                qso.qth = value;
+                break;
+            case 'COMMENT':
+            case 'COMMENTS':
+                qso.comment = value;
+                break;
+            case 'TX_PWR':
+                qso.txPower = parseFloat(value);
+                break;
+            case 'CONTEST_ID':
+                qso.contestId = value;
+                break;
+            case 'SRX':
+            case 'SRX_STRING':
+                qso.serialReceived = value;
+                break;
+            case 'STX':
+            case 'STX_STRING':
+                qso.serialSent = value;
+                break;
+            case 'OPERATOR':
+                qso.operator = value.toUpperCase();
+                break;
+            case 'STATION_CALLSIGN':
+                qso.stationCallsign = value.toUpperCase();
+                break;
+            case 'MY_DXCC':
+                qso.myDxcc = parseInt(value, 10);
+                break;
+            case 'MY_COUNTRY':
+                qso.myCountry = value;
+                break;
+            case 'DISTANCE':
+                qso.distance = parseFloat(value);
+                break;
+            case 'PROP_MODE':
+                qso.propMode = value.toUpperCase();
+                break;
+            case 'SAT_NAME':
+                qso.satName = value.toUpperCase();
+                break;
+            case 'LOTW_QSL_RCVD':
+                qso.lotwQslRcvd = value.toUpperCase();
+                break;
+            case 'EQSL_QSL_RCVD':
+                qso.eqslQslRcvd = value.toUpperCase();
+                break;
+            case 'QSL_RCVD':
+                qso.qslRcvd = value.toUpperCase();
+                break;
+            case 'QSL_SENT':
+                qso.qslSent = value.toUpperCase();
+                break;
+            case 'IOTA':
+                qso.iota = value.toUpperCase();
+                break;
+            case 'SOTA_REF':
+                qso.sotaRef = value.toUpperCase();
+                break;
+            case 'POTA_REF':
+                qso.potaRef = value.toUpperCase();
+                break;
+            case 'WWFF_REF':
+                qso.wwffRef = value.toUpperCase();
+                break;
         }
+    }
 
+    /**
+     * Uzupełnia rekord po odczytaniu wszystkich pól
+     * @param {Object} qso - Obiekt QSO
+     * @returns {Object} - Obiekt QSO
+     */
+    completeRecord(qso) {
         // Utwórz pełny timestamp
         if (qso.date && qso.timeOn) {
             qso.datetime = new Date(
@@ -400,5 +526,9 @@ class ADIFParser {
     }
 }
 
-// Export dla użycia w innych modułach
-window.ADIFParser = ADIFParser;
+// Export dla użycia w innych modułach (w workerze klasa jest dostępna przez importScripts)
+if (typeof window !== 'undefined') {
+    window.ADIFParser = ADIFParser;
+    // Worker parsujący pliki w tle leży obok tego skryptu
+    window.ADIF_WORKER_URL = document.currentScript ? new URL('adif-worker.js', document.currentScript.src).href : null;
+}
@@ -0,0 +1,36 @@
+/**
+ * ADIF Worker - parsuje plik ADIF strumieniowo poza głównym wątkiem
+ *
+ * Wiadomość wejściowa: { file, year }
+ * Odpowiedzi: { type: 'batch', qsos }, { type: 'progress', loaded, total },
+ *             { type: 'done', yearCounts, yearExamples }, { type: 'error', message }
+ * Uzupełnianie danych z callsign lookup odbywa się w głównym wątku.
+ */
+
+// modules.js definiuje WRAPPED_YEAR używany przez parser
+importScripts('modules.js', 'adif-parser.js');
+
+// Postęp wysyłany co najwyżej co 1% pliku
+const PROGRESS_STEP = 0.01;
+
+self.onmessage = async (event) => {
+    const { file, year } = event.data;
+    const parser = new ADIFParser({ year, enrich: false });
+    let lastProgress = -1;
+
+    try {
+        await parser.parseFile(file, {
+            onBatch: qsos => self.postMessage({ type: 'batch', qsos }),
+            onProgress: (loaded, total) => {
+                const progress = total > 0 ? loaded / total : 1;
+                if (progress - lastProgress >= PROGRESS_STEP || loaded === total) {
+                    lastProgress = progress;
+                    self.postMessage({ type: 'progress', loaded, total });
+                }
+            }
+        });
+        self.postMessage({ type: 'done', yearCounts: parser.yearCounts, yearExamples: parser.yearExamples });
+    } catch (error) {
+        self.postMessage({ type: 'error', message: error.message });
+    }
+};
@@ -2,12 +2,25 @@
  * Ham Wrapped - Główna aplikacja
  */
 
+// Service worker (zasięg /ham-wrapped - strona, skrypty i indeks CTY działają offline)
+const SERVICE_WORKER_URL = '/ham-wrapped/sw.js';
+const SERVICE_WORKER_SCOPE = '/ham-wrapped';
+
+// Statystyki liczone na serwerze (ten sam parser i callsign lookup co mapa)
+const WRAPPED_API_URL = '/api/v1/wrapped';
+
 class HamWrappedApp {
     constructor() {
-        this.parser = new ADIFParser();
+        // Parser jest ładowany na żądanie (loadParser) - tylko gdy statystyki
+        // liczy przeglądarka
+        this.parser = null;
         this.presentation = null;
         this.qsos = [];
         this.stats = null;
+        this.yearStats = null;
+        this.userCallsign = null;
+        // Skrót ostatniego logu zapisanego w IndexedDB (WrappedCache)
+        this.logHash = null;
 
         // Swipe support variables
         this.touchStartX = 0;
@@ -16,26 +29,102 @@ class HamWrappedApp {
         this.init();
     }
 
-    init() {
-        // Inicjalizuj i18n - aktualizuj teksty na stronie
-        if (window.i18n) {
-            i18n.updatePageTexts();
-        }
-
-        // Sprawdź czy URL zawiera zakodowane statystyki
-        this.checkUrlForStats();
+    async init() {
+        this.registerServiceWorker();
 
         this.setupFileUpload();
         this.setupNavigation();
         this.setupKeyboardNavigation();
         this.setupShareButton();
+        this.setupYearSelect();
+
+        // Inicjalizuj i18n - aktualizuj teksty na stronie (po załadowaniu języka)
+        if (window.i18n) {
+            await i18n.ready;
+            i18n.updatePageTexts();
+        }
+
+        // Sprawdź czy URL zawiera zakodowane statystyki, a jeśli nie,
+        // pokaż ostatnio przetworzony log
+        if (!(await this.checkUrlForStats())) {
+            this.restoreLastLog();
+        }
+    }
+
+    /**
+     * Załaduj parser ADIF z callsign lookup (i indeks CTY)
+     */
+    async loadParser() {
+        if (!this.parser) {
+            await loadModules('parser');
+            // Parser zachowuje QSO ze wszystkich lat - rok wybiera się w prezentacji
+            this.parser = new ADIFParser({ year: null });
+        }
+        await window.ctyIndexReady;
+        return this.parser;
+    }
+
+    /**
+     * Zarejestruj service worker (cache strony i danych do pracy offline)
+     */
+    registerServiceWorker() {
+        if (!('serviceWorker' in navigator)) return;
+
+        navigator.serviceWorker.register(SERVICE_WORKER_URL, { scope: SERVICE_WORKER_SCOPE })
+            .catch(error => console.warn('Rejestracja service workera nie powiodła się:', error));
+    }
+
+    /**
+     * Pokaż prezentację ostatnio przetworzonego logu z IndexedDB
+     */
+    async restoreLastLog() {
+        if (!window.WrappedCache) return;
+
+        const entry = await WrappedCache.loadLastLog();
+        if (!entry || entry.autoOpen === false || !entry.yearStats) return;
+
+        try {
+            await loadModules('presentation', 'share');
+        } catch (error) {
+            console.warn('Nie udało się załadować prezentacji:', error);
+            return;
+        }
+        // Użytkownik mógł w międzyczasie wgrać inny plik
+        if (this.yearStats) return;
+
+        console.log('📦 Restoring last log from cache:', entry.fileName);
+        this.logHash = entry.hash;
+        this.qsos = entry.qsos;
+        this.yearStats = entry.yearStats;
+        this.userCallsign = entry.userCallsign;
+        document.getElementById('user-locator').value = entry.userLocator || '';
+        document.getElementById('user-callsign').value = entry.userCallsign || '';
+
+        const year = this.yearStats[entry.year] ? entry.year : this.detectYear();
+        this.renderYearSelect(year);
+        this.showYear(year);
+        this.showPresentation();
+
+        const shareBtn = document.getElementById('share-btn');
+        if (shareBtn) shareBtn.classList.remove('hidden');
     }
 
     /**
      * Sprawdza czy URL zawiera zakodowane statystyki i jeśli tak, wyświetla je
+     * (ładuje tylko prezentację i dekoder linków - bez parsera i danych CTY)
+     * @returns {Promise<boolean>} - Czy statystyki zostały wczytane z URL
      */
-    checkUrlForStats() {
-        const urlData = window.getStatsFromUrl ? getStatsFromUrl() : null;
+    async checkUrlForStats() {
+        if (!new URL(window.location.href).searchParams.has('d')) return false;
+
+        try {
+            await loadModules('presentation', 'share');
+        } catch (error) {
+            console.warn('Nie udało się załadować prezentacji:', error);
+            return false;
+        }
+
+        const urlData = getStatsFromUrl();
         if (urlData && urlData.stats) {
             console.log('📊 Loading stats from URL...', urlData);
             this.stats = urlData.stats;
@@ -58,7 +147,9 @@ class HamWrappedApp {
             if (shareBtn) shareBtn.classList.remove('hidden');
 
             console.log('✓ Stats loaded from URL');
+            return true;
         }
+        return false;
     }
 
     /**
@@ -82,6 +173,22 @@ class HamWrappedApp {
         }
     }
 
+    /**
+     * Konfiguracja wyboru roku - statystyki wszystkich lat są już policzone
+     */
+    setupYearSelect() {
+        const yearSelect = document.getElementById('year-select');
+        if (yearSelect) {
+            yearSelect.addEventListener('change', () => {
+                const year = parseInt(yearSelect.value, 10);
+                this.showYear(year);
+                if (this.logHash) {
+                    WrappedCache.updateLog(this.logHash, { year });
+                }
+            });
+        }
+    }
+
     /**
      * Konfiguracja uploadu plików
      */
@@ -204,41 +311,61 @@ class HamWrappedApp {
     async processFile(file) {
         const loading = document.getElementById('loading');
         loading.classList.remove('hidden');
+        this.showProgress(0, 0);
 
         try {
-            const content = await this.readFile(file);
-            this.qsos = this.parser.parse(content);
-
-            if (this.qsos.length === 0) {
-                throw new Error('Nie znaleziono żadnych QSO w pliku');
-            }
+            // Prezentacja ładuje się w tle, równolegle z liczeniem statystyk
+            const presentationReady = loadModules('presentation', 'share');
 
             // Pobierz lokator i callsign użytkownika
             const userLocator = document.getElementById('user-locator').value.trim() || null;
-            const userCallsign = document.getElementById('user-callsign').value.trim().toUpperCase() || null;
-
-            // Określ rok (domyślnie najczęściej występujący w logu lub bieżący)
-            const year = this.detectYear();
-
-            // Filtruj QSO po roku (opcjonalnie)
-            // const yearQsos = this.parser.filterByYear(year);
-            // Użyj wszystkich QSO
-            const yearQsos = this.qsos;
-
-            // Oblicz statystyki
-            const calculator = new StatisticsCalculator(yearQsos, userLocator);
-            this.stats = calculator.calculateAll();
+            this.userCallsign = document.getElementById('user-callsign').value.trim().toUpperCase() || null;
+
+            // Ten sam plik co ostatnio - QSO i statystyki są już w IndexedDB
+            // (statystyki zależą tylko od lokatora, więc zapisane można użyć ponownie)
+            const hash = window.WrappedCache ? await WrappedCache.hashLogFile(file) : null;
+            const cached = hash ? await WrappedCache.findLog(hash) : null;
+            this.qsos = cached && cached.qsos ? cached.qsos : null;
+
+            if (cached && cached.userLocator === userLocator) {
+                this.yearStats = cached.yearStats;
+            } else {
+                // Statystyki z serwera, a gdy serwer jest niedostępny - liczone w przeglądarce
+                this.yearStats = await this.fetchServerStats(file, userLocator);
+                if (!this.yearStats) {
+                    this.qsos = this.qsos || await this.parseFile(file);
+                    await loadModules('statistics');
+                    // Wszystkie lata w jednym przejściu po logu
+                    const calculator = new StatisticsCalculator(this.qsos, userLocator);
+                    this.yearStats = calculator.calculateByYear();
+                }
+            }
 
-            console.log('Statystyki:', this.stats);
+            if (Object.keys(this.yearStats).length === 0) {
+                throw new Error('Nie znaleziono żadnych QSO w pliku');
+            }
 
-            // Utwórz prezentację
-            this.presentation = new Presentation(this.stats, year, userCallsign);
-            this.presentation.generateSlides();
+            console.log('Statystyki:', this.yearStats);
+            await presentationReady;
 
-            // Zakoduj statystyki w URL do udostępnienia
-            if (window.updateUrlWithStats) {
-                const shareUrl = updateUrlWithStats(this.stats, userCallsign, year);
-                console.log('📎 Share URL generated:', shareUrl);
+            // Określ rok (domyślnie rok podsumowania lub najnowszy w logu)
+            const year = this.detectYear();
+            this.renderYearSelect(year);
+            this.showYear(year);
+
+            // Zapamiętaj log na kolejne wizyty
+            this.logHash = hash;
+            if (hash) {
+                WrappedCache.saveLog({
+                    hash,
+                    fileName: file.name,
+                    qsos: this.qsos,
+                    yearStats: this.yearStats,
+                    userLocator,
+                    userCallsign: this.userCallsign,
+                    year,
+                    autoOpen: true
+                });
             }
 
             // Pokaż prezentację
@@ -256,6 +383,115 @@ class HamWrappedApp {
         }
     }
 
+    /**
+     * Statystyki wszystkich lat policzone na serwerze
+     * @returns {Promise<Object|null>} - Jak StatisticsCalculator.calculateByYear();
+     *                                   null, gdy serwer jest niedostępny lub odrzucił plik
+     */
+    async fetchServerStats(file, userLocator) {
+        if (!window.fetch || !window.FormData) return null;
+
+        const form = new FormData();
+        form.append('file', file);
+        if (userLocator) form.append('my_locator', userLocator);
+
+        try {
+            const response = await fetch(WRAPPED_API_URL, { method: 'POST', body: form });
+            if (!response.ok) {
+                console.warn('Serwer nie policzył statystyk:', response.status);
+                return null;
+            }
+            const { years } = await response.json();
+
+            // Daty przychodzą jako tekst ISO - prezentacja oczekuje obiektu Date
+            for (const stats of Object.values(years)) {
+                if (stats.qsoRate && stats.qsoRate.peakDate) {
+                    stats.qsoRate.peakDate = new Date(stats.qsoRate.peakDate);
+                }
+            }
+            return years;
+        } catch (error) {
+            console.warn('Statystyki z serwera niedostępne, liczę w przeglądarce:', error);
+            return null;
+        }
+    }
+
+    /**
+     * Sparsuj plik ADIF - w Web Workerze, jeśli to możliwe, inaczej w głównym wątku
+     */
+    async parseFile(file) {
+        await this.loadParser();
+
+        if (window.Worker && window.ADIF_WORKER_URL && file.stream) {
+            try {
+                return await this.parseFileInWorker(file);
+            } catch (error) {
+                console.warn('Parsowanie w workerze nie powiodło się, parsuję w głównym wątku:', error);
+            }
+        }
+
+        if (file.stream) {
+            return this.parser.parseFile(file, {
+                onProgress: (loaded, total) => this.showProgress(loaded / total, this.parser.qsos.length)
+            });
+        }
+        return this.parser.parse(await this.readFile(file));
+    }
+
+    /**
+     * Sparsuj plik ADIF w Web Workerze - plik jest czytany strumieniowo,
+     * QSO przychodzą paczkami, więc strona nie zamarza nawet przy dużych logach
+     */
+    parseFileInWorker(file) {
+        return new Promise((resolve, reject) => {
+            const worker = new Worker(window.ADIF_WORKER_URL);
+            const qsos = [];
+
+            worker.onmessage = (event) => {
+                const message = event.data;
+                if (message.type === 'batch') {
+                    // Callsign lookup (z indeksem CTY) działa w głównym wątku
+                    for (const qso of message.qsos) {
+                        this.parser.enrichQSOData(qso);
+                        qsos.push(qso);
+                    }
+                } else if (message.type === 'progress') {
+                    this.showProgress(message.loaded / message.total, qsos.length);
+                } else if (message.type === 'done') {
+                    worker.terminate();
+                    this.parser.qsos = qsos;
+                    this.parser.yearCounts = message.yearCounts;
+                    this.parser.yearExamples = message.yearExamples;
+                    resolve(qsos);
+                } else if (message.type === 'error') {
+                    worker.terminate();
+                    reject(new Error(message.message));
+                }
+            };
+
+            worker.onerror = (event) => {
+                worker.terminate();
+                reject(new Error(event.message || 'Błąd workera ADIF'));
+            };
+
+            worker.postMessage({ file, year: this.parser.year });
+        });
+    }
+
+    /**
+     * Pokaż postęp parsowania
+     * @param {number} fraction - Odczytana część pliku (0-1)
+     * @param {number} qsoCount - Liczba dotychczas znalezionych QSO
+     */
+    showProgress(fraction, qsoCount) {
+        const progress = document.getElementById('loading-progress');
+        if (!progress) return;
+
+        progress.textContent = fraction > 0
+            ? `${Math.round(Math.min(fraction, 1) * 100)}% · ${qsoCount} QSO`
+            : '';
+    }
+
     /**
      * Odczytaj zawartość pliku
      */
@@ -276,29 +512,51 @@ class HamWrappedApp {
     }
 
     /**
-     * Wykryj rok z logu
+     * Wykryj rok z logu - rok podsumowania, jeśli log go zawiera, inaczej najnowszy
      */
     detectYear() {
-        const years = {};
+        const years = this.getAvailableYears();
+        return years.includes(WRAPPED_YEAR) ? WRAPPED_YEAR : years[0];
+    }
 
-        this.qsos.forEach(qso => {
-            if (qso.date && qso.date.year) {
-                years[qso.date.year] = (years[qso.date.year] || 0) + 1;
-            }
-        });
+    /**
+     * Lata z policzonymi statystykami, od najnowszego
+     */
+    getAvailableYears() {
+        return Object.keys(this.yearStats || {})
+            .map(year => parseInt(year, 10))
+            .sort((a, b) => b - a);
+    }
 
-        // Znajdź rok z największą liczbą QSO
-        let maxYear = new Date().getFullYear();
-        let maxCount = 0;
+    /**
+     * Wypełnij listę wyboru roku (ukryta, gdy log obejmuje jeden rok)
+     */
+    renderYearSelect(selectedYear) {
+        const yearSelect = document.getElementById('year-select');
+        if (!yearSelect) return;
+
+        const years = this.getAvailableYears();
+        yearSelect.innerHTML = years
+            .map(year => `<option value="${year}">${year} (${this.yearStats[year].totalQSOs} QSO)</option>`)
+            .join('');
+        yearSelect.value = String(selectedYear);
+        yearSelect.classList.toggle('hidden', years.length < 2);
+    }
 
-        for (const [year, count] of Object.entries(years)) {
-            if (count > maxCount) {
-                maxCount = count;
-                maxYear = parseInt(year);
-            }
-        }
+    /**
+     * Pokaż prezentację wybranego roku - statystyki są już policzone
+     */
+    showYear(year) {
+        this.stats = this.yearStats[year];
 
-        return maxYear;
+        this.presentation = new Presentation(this.stats, year, this.userCallsign);
+        this.presentation.generateSlides();
+
+        // Zakoduj statystyki w URL do udostępnienia
+        if (window.updateUrlWithStats) {
+            const shareUrl = updateUrlWithStats(this.stats, this.userCallsign, year);
+            console.log('📎 Share URL generated:', shareUrl);
+        }
     }
 
     /**
@@ -318,7 +576,17 @@ class HamWrappedApp {
         document.getElementById('file-input').value = '';
         this.qsos = [];
         this.stats = null;
+        this.yearStats = null;
         this.presentation = null;
+
+        // Po powrocie na stronę pokaż upload zamiast ostatniej prezentacji
+        if (this.logHash) {
+            WrappedCache.updateLog(this.logHash, { autoOpen: false });
+            this.logHash = null;
+        }
+
+        const yearSelect = document.getElementById('year-select');
+        if (yearSelect) yearSelect.classList.add('hidden');
     }
 }
 
@@ -1,188 +1,222 @@
 /**
- * Callsign Lookup - Parser pliku CTY.DAT
+ * Callsign Lookup - wyszukiwanie DXCC w skompilowanym indeksie CTY.DAT
  * Źródło danych: https://www.country-files.com/ (Big CTY by Jim Reisert AD1C)
- * Format pliku: CTY.DAT v9
+ *
+ * Serwer kompiluje CTY.DAT do binarnego indeksu (qsomap/common/cty_index.py,
+ * ten sam plik służy do wyszukiwań po stronie serwera). Przeglądarka czyta
+ * go bezpośrednio przez DataView - bez parsowania tekstu. Aliasy są pogrupowane
+ * według długości klucza, więc wyszukiwanie to wyszukiwanie binarne w tablicy
+ * kluczy o stałej szerokości.
  */
 
-// Globalna baza DXCC załadowana z CTY.DAT
+const CTY_INDEX_URL = '/ham-wrapped/data/cty.idx';
+const CTY_INDEX_MAGIC = 'HLMCTY\0\0';
+const CTY_INDEX_VERSION = 2;
+
+// Rozmiary rekordów (struct w cty_index.py)
+const CTY_HEADER_SIZE = 40;
+const CTY_ENTITY_SIZE = 28;
+const CTY_OVERRIDE_SIZE = 17;
+const CTY_GROUP_SIZE = 9;
+
+// Flagi override'ów aliasu
+const OVERRIDE_CQZ = 0x01;
+const OVERRIDE_ITUZ = 0x02;
+const OVERRIDE_CONTINENT = 0x04;
+const OVERRIDE_LATLON = 0x08;
+const OVERRIDE_TZ = 0x10;
+
+// Globalna baza DXCC załadowana z indeksu
 let CTY_DATABASE = [];
-let PREFIX_INDEX = {};
-let EXACT_CALLSIGN_INDEX = {};
-let SORTED_PREFIXES = [];
+let CTY_OVERRIDES = [];
+let CTY_BYTES = null;
+let PREFIX_GROUPS = new Map();
+let EXACT_CALLSIGN_GROUPS = new Map();
+let MAX_PREFIX_LENGTH = 0;
 let CTY_LOADED = false;
 
+// Wyniki wyszukiwań w bieżącej sesji - callsigny i prefiksy powtarzają się w logu
+const LOOKUP_CACHE_LIMIT = 100000;
+const LOOKUP_CACHE = new Map();
+const PREFIX_CACHE = new Map();
+
+// Typowe sufiksy do ignorowania w callsignach z ukośnikiem
+const PORTABLE_SUFFIXES = new Set(['P', 'M', 'MM', 'AM', 'QRP', 'A', 'B', 'LH', 'LGT', 'J', 'T', 'G', 'E',
+                                   '0', '1', '2', '3', '4', '5', '6', '7', '8', '9']);
+
+const CTY_TEXT_DECODER = new TextDecoder();
+const CTY_TEXT_ENCODER = new TextEncoder();
+
 /**
- * Parsuje plik CTY.DAT i buduje bazę danych
- * @param {string} ctyContent - Zawartość pliku CTY.DAT
+ * Wczytuje skompilowany indeks CTY.DAT
+ * @param {ArrayBuffer} buffer - Zawartość pliku cty.idx
  */
-function parseCtyDat(ctyContent) {
-    CTY_DATABASE = [];
-    PREFIX_INDEX = {};
-    EXACT_CALLSIGN_INDEX = {};
-
-    const lines = ctyContent.split('\n');
-    let currentEntity = null;
-    let aliasBuffer = '';
-
-    for (let i = 0; i < lines.length; i++) {
-        const line = lines[i];
-
-        // Linia nagłówka encji (zaczyna się od nazwy kraju, nie od spacji)
-        if (line.length > 0 && line[0] !== ' ' && line.includes(':')) {
-            // Zapisz poprzednią encję jeśli istnieje
-            if (currentEntity && aliasBuffer) {
-                parseAliases(currentEntity, aliasBuffer);
-            }
-
-            // Parsuj nową encję
-            currentEntity = parseEntityHeader(line);
-            if (currentEntity) {
-                CTY_DATABASE.push(currentEntity);
-            }
-            aliasBuffer = '';
-        } else if (currentEntity && line.trim()) {
-            // Linia z aliasami (prefiksy i callsigny)
-            aliasBuffer += line.trim();
-        }
+function parseCtyIndex(buffer) {
+    const bytes = new Uint8Array(buffer);
+    const view = new DataView(buffer);
+
+    if (bytes.length < CTY_HEADER_SIZE ||
+        String.fromCharCode(...bytes.subarray(0, 8)) !== CTY_INDEX_MAGIC ||
+        view.getUint32(8, true) !== CTY_INDEX_VERSION) {
+        throw new Error('Nieobsługiwany format indeksu CTY');
     }
 
-    // Zapisz ostatnią encję
-    if (currentEntity && aliasBuffer) {
-        parseAliases(currentEntity, aliasBuffer);
+    const entityCount = view.getUint32(12, true);
+    const overrideCount = view.getUint32(16, true);
+    const prefixCount = view.getUint32(20, true);
+    const exactCount = view.getUint32(24, true);
+    const prefixGroupCount = view.getUint32(28, true);
+    const exactGroupCount = view.getUint32(32, true);
+    const stringsOffset = bytes.length - view.getUint32(36, true);
+
+    const readString = (offset, length) =>
+        CTY_TEXT_DECODER.decode(bytes.subarray(stringsOffset + offset, stringsOffset + offset + length));
+    const readContinent = offset => String.fromCharCode(bytes[offset], bytes[offset + 1]);
+
+    // Encje DXCC
+    const database = [];
+    let offset = CTY_HEADER_SIZE;
+    for (let i = 0; i < entityCount; i++, offset += CTY_ENTITY_SIZE) {
+        const primaryPrefix = readString(view.getUint32(offset + 6, true), view.getUint16(offset + 10, true));
+        database.push({
+            name: readString(view.getUint32(offset, true), view.getUint16(offset + 4, true)),
+            cqZone: view.getUint8(offset + 24),
+            ituZone: view.getUint8(offset + 25),
+            continent: readContinent(offset + 26),
+            lat: roundCoordinate(view.getFloat32(offset + 12, true)),
+            lon: roundCoordinate(view.getFloat32(offset + 16, true)),
+            tz: roundCoordinate(view.getFloat32(offset + 20, true)),
+            primaryPrefix,
+            dxcc: getDxccCode(primaryPrefix)
+        });
     }
 
-    // Buduj posortowany indeks prefiksów
-    buildSortedPrefixIndex();
+    // Override'y aliasów - tylko pola ustawione w CTY.DAT
+    const overrides = [];
+    for (let i = 0; i < overrideCount; i++, offset += CTY_OVERRIDE_SIZE) {
+        const flags = view.getUint8(offset);
+        const override = {};
+        if (flags & OVERRIDE_CQZ) override.cqZone = view.getUint8(offset + 13);
+        if (flags & OVERRIDE_ITUZ) override.ituZone = view.getUint8(offset + 14);
+        if (flags & OVERRIDE_CONTINENT) override.continent = readContinent(offset + 15);
+        if (flags & OVERRIDE_LATLON) {
+            override.lat = roundCoordinate(view.getFloat32(offset + 1, true));
+            override.lon = roundCoordinate(view.getFloat32(offset + 5, true));
+        }
+        if (flags & OVERRIDE_TZ) override.tz = roundCoordinate(view.getFloat32(offset + 9, true));
+        overrides.push(override);
+    }
 
+    // Katalogi grup aliasów: długość klucza -> { offset, count }
+    const readGroups = count => {
+        const groups = new Map();
+        for (let i = 0; i < count; i++, offset += CTY_GROUP_SIZE) {
+            groups.set(view.getUint8(offset), {
+                offset: view.getUint32(offset + 5, true),
+                count: view.getUint32(offset + 1, true)
+            });
+        }
+        return groups;
+    };
+    const prefixGroups = readGroups(prefixGroupCount);
+    const exactGroups = readGroups(exactGroupCount);
+
+    CTY_DATABASE = database;
+    CTY_OVERRIDES = overrides;
+    CTY_BYTES = bytes;
+    PREFIX_GROUPS = prefixGroups;
+    EXACT_CALLSIGN_GROUPS = exactGroups;
+    MAX_PREFIX_LENGTH = Math.max(0, ...prefixGroups.keys());
+    LOOKUP_CACHE.clear();
+    PREFIX_CACHE.clear();
     CTY_LOADED = true;
-    console.log(`Załadowano CTY.DAT: ${CTY_DATABASE.length} encji DXCC, ${SORTED_PREFIXES.length} prefiksów, ${Object.keys(EXACT_CALLSIGN_INDEX).length} dokładnych callsignów`);
+    console.log(`Załadowano indeks CTY: ${entityCount} encji DXCC, ${prefixCount} prefiksów, ${exactCount} dokładnych callsignów (${bytes.length} B)`);
 }
 
 /**
- * Parsuje linię nagłówka encji DXCC
- * Format: Country Name:   CQ:  ITU:  Cont:    Lat:      Lon:     TZ:  Prefix:
+ * Zaokrągla współrzędne zapisane jako float32 do dokładności CTY.DAT
  */
-function parseEntityHeader(line) {
-    // Podziel po dwukropkach
-    const parts = line.split(':');
-    if (parts.length < 8) return null;
-
-    const name = parts[0].trim();
-    const cqZone = parseInt(parts[1].trim(), 10);
-    const ituZone = parseInt(parts[2].trim(), 10);
-    const continent = parts[3].trim();
-    const lat = parseFloat(parts[4].trim());
-    const lon = parseFloat(parts[5].trim()) * -1; // CTY używa West jako +, my chcemy East jako +
-    const tz = parseFloat(parts[6].trim());
-    let primaryPrefix = parts[7].trim();
-
-    // Usuń gwiazdkę z prefiksu (oznacza WAEDC)
-    const isWaedc = primaryPrefix.startsWith('*');
-    if (isWaedc) {
-        primaryPrefix = primaryPrefix.substring(1);
-    }
-
-    return {
-        name,
-        cqZone,
-        ituZone,
-        continent,
-        lat,
-        lon,
-        tz,
-        primaryPrefix,
-        isWaedc,
-        prefixes: [],
-        exactCalls: []
-    };
+function roundCoordinate(value) {
+    return Math.round(value * 100) / 100;
 }
 
 /**
- * Parsuje aliasy (prefiksy i dokładne callsigny) dla encji
+ * Wyszukiwanie binarne pierwszych `length` bajtów klucza w grupie aliasów
+ * @returns {Object|null} - { entity, overrides } lub null
  */
-function parseAliases(entity, aliasString) {
-    // Usuń średnik końcowy i podziel po przecinkach
-    aliasString = aliasString.replace(/;$/, '').trim();
-    const aliases = aliasString.split(',').map(a => a.trim()).filter(a => a);
-
-    for (const alias of aliases) {
-        if (!alias) continue;
+function findAlias(groups, key, length) {
+    const group = groups.get(length);
+    if (!group) return null;
 
-        let prefix = alias;
-        let overrides = {};
+    const { offset, count } = group;
+    let low = 0;
+    let high = count;
 
-        // Wyciągnij override'y: (#) CQ zone, [#] ITU zone, {aa} continent, <lat/lon>, ~tz~
-
-        // Override CQ zone: (nn)
-        const cqMatch = prefix.match(/\((\d+)\)/);
-        if (cqMatch) {
-            overrides.cqZone = parseInt(cqMatch[1], 10);
-            prefix = prefix.replace(/\(\d+\)/, '');
-        }
+    while (low < high) {
+        const middle = (low + high) >>> 1;
+        const start = offset + middle * length;
 
-        // Override ITU zone: [nn]
-        const ituMatch = prefix.match(/\[(\d+)\]/);
-        if (ituMatch) {
-            overrides.ituZone = parseInt(ituMatch[1], 10);
-            prefix = prefix.replace(/\[\d+\]/, '');
+        let cmp = 0;
+        for (let i = 0; i < length && cmp === 0; i++) {
+            cmp = CTY_BYTES[start + i] - key[i];
         }
 
-        // Override continent: {aa}
-        const contMatch = prefix.match(/\{([A-Z]{2})\}/);
-        if (contMatch) {
-            overrides.continent = contMatch[1];
-            prefix = prefix.replace(/\{[A-Z]{2}\}/, '');
-        }
-
-        // Override lat/lon: <lat/lon>
-        const latLonMatch = prefix.match(/<([^>]+)>/);
-        if (latLonMatch) {
-            const coords = latLonMatch[1].split('/');
-            if (coords.length === 2) {
-                overrides.lat = parseFloat(coords[0]);
-                overrides.lon = parseFloat(coords[1]) * -1;
-            }
-            prefix = prefix.replace(/<[^>]+>/, '');
+        if (cmp === 0) {
+            // Po kluczach: count × u16 id encji, potem count × u16 id override'u
+            const idsOffset = offset + count * length + middle * 2;
+            const entityId = CTY_BYTES[idsOffset] | (CTY_BYTES[idsOffset + 1] << 8);
+            const overrideOffset = idsOffset + count * 2;
+            const overrideId = CTY_BYTES[overrideOffset] | (CTY_BYTES[overrideOffset + 1] << 8);
+            return {
+                entity: CTY_DATABASE[entityId],
+                overrides: CTY_OVERRIDES[overrideId]
+            };
         }
-
-        // Override timezone: ~tz~
-        const tzMatch = prefix.match(/~([^~]+)~/);
-        if (tzMatch) {
-            overrides.tz = parseFloat(tzMatch[1]);
-            prefix = prefix.replace(/~[^~]+~/, '');
+        if (cmp < 0) {
+            low = middle + 1;
+        } else {
+            high = middle;
         }
+    }
 
-        // Czy to dokładny callsign (zaczyna się od =)?
-        const isExactCall = prefix.startsWith('=');
-        if (isExactCall) {
-            prefix = prefix.substring(1);
-        }
+    return null;
+}
 
-        prefix = prefix.toUpperCase();
+/**
+ * Dokładne dopasowanie callsigna
+ */
+function findExactCall(callsign) {
+    const key = CTY_TEXT_ENCODER.encode(callsign);
+    return findAlias(EXACT_CALLSIGN_GROUPS, key, key.length);
+}
 
-        if (isExactCall) {
-            entity.exactCalls.push(prefix);
-            EXACT_CALLSIGN_INDEX[prefix] = {
-                entity,
-                overrides
-            };
-        } else {
-            entity.prefixes.push(prefix);
-            if (!PREFIX_INDEX[prefix]) {
-                PREFIX_INDEX[prefix] = {
-                    entity,
-                    overrides
-                };
-            }
-        }
+/**
+ * Najdłuższy prefiks z indeksu, od którego zaczyna się callsign
+ * (co najwyżej MAX_PREFIX_LENGTH wyszukiwań binarnych, wynik zapamiętany)
+ */
+function findLongestPrefix(callsign) {
+    let match = PREFIX_CACHE.get(callsign);
+    if (match !== undefined) return match;
+
+    match = null;
+    const key = CTY_TEXT_ENCODER.encode(callsign);
+    for (let length = Math.min(key.length, MAX_PREFIX_LENGTH); length > 0; length--) {
+        match = findAlias(PREFIX_GROUPS, key, length);
+        if (match) break;
     }
+
+    rememberLookup(PREFIX_CACHE, callsign, match);
+    return match;
 }
 
 /**
- * Buduje posortowany indeks prefiksów (od najdłuższych do najkrótszych)
+ * Zapamiętaj wynik wyszukiwania (pamięć czyszczona po przekroczeniu limitu)
  */
-function buildSortedPrefixIndex() {
-    SORTED_PREFIXES = Object.keys(PREFIX_INDEX).sort((a, b) => b.length - a.length);
+function rememberLookup(cache, key, value) {
+    if (cache.size >= LOOKUP_CACHE_LIMIT) {
+        cache.clear();
+    }
+    cache.set(key, value);
 }
 
 /**
@@ -193,11 +227,24 @@ function buildSortedPrefixIndex() {
 function lookupCallsign(callsign) {
     if (!callsign || !CTY_LOADED) return null;
 
-    callsign = callsign.toUpperCase().trim();
+    let result = LOOKUP_CACHE.get(callsign);
+    if (result === undefined) {
+        result = resolveCallsign(callsign.toUpperCase().trim());
+        rememberLookup(LOOKUP_CACHE, callsign, result);
+    }
 
+    // Kopia, żeby zmiany wyniku nie trafiły do pamięci podręcznej
+    return result ? { ...result } : null;
+}
+
+/**
+ * Wyszukaj DXCC dla znormalizowanego callsigna (bez pamięci podręcznej)
+ */
+function resolveCallsign(callsign) {
     // 1. Sprawdź dokładne dopasowanie callsigna
-    if (EXACT_CALLSIGN_INDEX[callsign]) {
-        return buildResult(EXACT_CALLSIGN_INDEX[callsign]);
+    let match = findExactCall(callsign);
+    if (match) {
+        return buildResult(match);
     }
 
     // 2. Obsłuż callsigny z ukośnikiem (np. EA8/SP3WKW, SP3WKW/P)
@@ -207,27 +254,22 @@ function lookupCallsign(callsign) {
     }
 
     // 3. Sprawdź dokładne dopasowanie po rozwiązaniu portable
-    if (searchCall !== callsign && EXACT_CALLSIGN_INDEX[searchCall]) {
-        return buildResult(EXACT_CALLSIGN_INDEX[searchCall]);
+    if (searchCall !== callsign) {
+        match = findExactCall(searchCall);
+        if (match) {
+            return buildResult(match);
+        }
     }
 
     // 4. Szukaj najdłuższego pasującego prefiksu
-    for (const prefix of SORTED_PREFIXES) {
-        if (searchCall.startsWith(prefix)) {
-            return buildResult(PREFIX_INDEX[prefix]);
-        }
-    }
+    match = findLongestPrefix(searchCall);
 
     // 5. Jeśli nie znaleziono, spróbuj z oryginalnym callsign
-    if (searchCall !== callsign) {
-        for (const prefix of SORTED_PREFIXES) {
-            if (callsign.startsWith(prefix)) {
-                return buildResult(PREFIX_INDEX[prefix]);
-            }
-        }
+    if (!match && searchCall !== callsign) {
+        match = findLongestPrefix(callsign);
     }
 
-    return null;
+    return match ? buildResult(match) : null;
 }
 
 /**
@@ -236,17 +278,13 @@ function lookupCallsign(callsign) {
 function resolvePortableCallsign(callsign) {
     const parts = callsign.split('/');
 
-    // Typowe sufiksy do ignorowania
-    const suffixes = ['P', 'M', 'MM', 'AM', 'QRP', 'A', 'B', 'LH', 'LGT', 'J', 'T', 'G', 'E',
-                      '0', '1', '2', '3', '4', '5', '6', '7', '8', '9'];
-
     if (parts.length === 2) {
         // Format: PREFIX/CALL lub CALL/SUFFIX
         const first = parts[0];
         const second = parts[1];
 
         // Jeśli druga część to typowy sufiks, użyj pierwszej
-        if (suffixes.includes(second) || second.length === 1) {
+        if (PORTABLE_SUFFIXES.has(second) || second.length === 1) {
             return first;
         }
 
@@ -257,14 +295,10 @@ function resolvePortableCallsign(callsign) {
         }
 
         // Jeśli druga część jest krótka i nie jest sufiksem, może być prefiksem
-        if (second.length <= 4 && !suffixes.includes(second) && !second.match(/\d[A-Z]{2,}$/)) {
-            // Format: SP3WKW/EA8 - użyj prefiksu EA8
-            // Ale szukaj najpierw w indeksie
-            for (const prefix of SORTED_PREFIXES) {
-                if (second.startsWith(prefix) || second === prefix) {
-                    return second;
-                }
-            }
+        // Format: SP3WKW/EA8 - użyj prefiksu EA8, jeśli jest w indeksie
+        if (second.length <= 4 && !PORTABLE_SUFFIXES.has(second) && !second.match(/\d[A-Z]{2,}$/) &&
+            findLongestPrefix(second)) {
+            return second;
         }
 
         // Domyślnie użyj pierwszej części
@@ -273,10 +307,8 @@ function resolvePortableCallsign(callsign) {
 
     // Więcej niż 2 części - użyj pierwszej która pasuje do prefiksu
     for (const part of parts) {
-        for (const prefix of SORTED_PREFIXES) {
-            if (part.startsWith(prefix)) {
-                return part;
-            }
+        if (findLongestPrefix(part)) {
+            return part;
         }
     }
 
@@ -299,80 +331,12 @@ function buildResult(match) {
         lon: overrides.lon || entity.lon,
         tz: overrides.tz || entity.tz,
         primaryPrefix: entity.primaryPrefix,
-        dxcc: getDxccCode(entity.primaryPrefix)
+        dxcc: entity.dxcc
     };
 }
 
 /**
- * Mapowanie głównych prefiksów CTY na kody DXCC ARRL
- * Ta mapa jest potrzebna bo CTY.DAT nie zawiera bezpośrednio kodów DXCC
- */
-const PREFIX_TO_DXCC = {
-    "1A": 246, "1S": 247, "3A": 260, "3B6": 4, "3B8": 165, "3B9": 207,
-    "3C": 49, "3C0": 195, "3D2": 176, "3D2/c": 489, "3D2/r": 460,
-    "3DA": 468, "3V": 474, "3W": 293, "3X": 107, "3Y/b": 24, "3Y/p": 199,
-    "4J": 18, "4L": 75, "4O": 514, "4S": 315, "4U1I": 117, "4U1U": 289,
-    "4U1V": 117, "4W": 511, "4X": 336, "5A": 436, "5B": 215, "5H": 470,
-    "5N": 450, "5R": 438, "5T": 444, "5U": 187, "5V": 483, "5W": 190,
-    "5X": 286, "5Z": 430, "6W": 456, "6Y": 82, "7O": 492, "7P": 432,
-    "7Q": 440, "7X": 400, "8P": 62, "8Q": 159, "8R": 129, "9A": 497,
-    "9G": 424, "9H": 257, "9J": 482, "9K": 348, "9L": 458, "9M2": 299,
-    "9M6": 46, "9N": 369, "9Q": 414, "9U": 404, "9V": 381, "9X": 454,
-    "9Y": 90, "A2": 402, "A3": 160, "A4": 370, "A5": 306, "A6": 391,
-    "A7": 376, "A9": 304, "AP": 372, "BS7": 506, "BV": 386, "BV9P": 505,
-    "BY": 318, "C2": 157, "C3": 203, "C5": 422, "C6": 60, "C9": 181,
-    "CE": 112, "CE0X": 217, "CE0Y": 47, "CE0Z": 125, "CE9": 13,
-    "CM": 70, "CN": 446, "CP": 104, "CT": 272, "CT3": 256, "CU": 149,
-    "CX": 144, "CY0": 252, "CY9": 211, "D2": 401, "D4": 409, "D6": 39,
-    "DL": 81, "DU": 375, "E3": 51, "E4": 510, "E5/n": 191, "E5/s": 234,
-    "E6": 188, "E7": 501, "EA": 281, "EA6": 21, "EA8": 29, "EA9": 32,
-    "EI": 245, "EK": 14, "EL": 434, "EP": 330, "ER": 179, "ES": 52,
-    "ET": 53, "EU": 27, "EX": 135, "EY": 262, "EZ": 280, "F": 227,
-    "FG": 79, "FH": 169, "FJ": 516, "FK": 162, "FK/c": 512, "FM": 84,
-    "FO": 175, "FO/a": 508, "FO/c": 36, "FO/m": 509, "FP": 277,
-    "FR": 453, "FR/g": 99, "FR/j": 124, "FR/t": 276, "FS": 213,
-    "FT5W": 41, "FT5X": 131, "FT5Z": 10, "FW": 298, "FY": 63,
-    "G": 223, "GD": 114, "GI": 265, "GJ": 122, "GM": 279, "GU": 106,
-    "GW": 294, "H4": 185, "H40": 507, "HA": 239, "HB": 287, "HB0": 251,
-    "HC": 120, "HC8": 71, "HH": 78, "HI": 72, "HK": 116, "HK0/a": 216,
-    "HK0/m": 161, "HL": 137, "HP": 88, "HR": 80, "HS": 387, "HV": 295,
-    "HZ": 378, "I": 248, "IS": 225, "IS0": 225, "IT9": 248, "J2": 382,
-    "J3": 77, "J5": 109, "J6": 97, "J7": 95, "J8": 98, "JA": 339,
-    "JD/m": 177, "JD/o": 192, "JT": 363, "JW": 259, "JX": 118, "JY": 342,
-    "K": 291, "KG4": 105, "KH0": 166, "KH1": 20, "KH2": 103, "KH3": 123,
-    "KH4": 174, "KH5": 197, "KH5K": 134, "KH6": 110, "KH7K": 138,
-    "KH8": 9, "KH8/s": 515, "KH9": 297, "KL": 6, "KP1": 182, "KP2": 285,
-    "KP4": 202, "KP5": 43, "LA": 266, "LU": 100, "LX": 254, "LY": 146,
-    "LZ": 212, "OA": 136, "OD": 354, "OE": 206, "OH": 224, "OH0": 5,
-    "OJ0": 167, "OK": 503, "OM": 504, "ON": 209, "OX": 237, "OY": 222,
-    "OZ": 221, "P2": 163, "P4": 91, "P5": 344, "PA": 263, "PJ2": 517,
-    "PJ4": 520, "PJ5": 519, "PJ7": 518, "PY": 108, "PY0F": 56,
-    "PY0S": 253, "PY0T": 273, "PZ": 140, "R1FJ": 61, "R1MV": 151,
-    "S0": 302, "S2": 305, "S5": 499, "S7": 379, "S9": 219, "SM": 284,
-    "SP": 269, "ST": 466, "ST0": 244, "SU": 478, "SV": 236, "SV/a": 180,
-    "SV5": 45, "SV9": 40, "T2": 282, "T30": 301, "T31": 31, "T32": 48,
-    "T33": 490, "T5": 232, "T7": 278, "T8": 22, "TA": 390, "TF": 242,
-    "TG": 76, "TI": 308, "TI9": 37, "TJ": 406, "TK": 214, "TL": 408,
-    "TN": 412, "TR": 420, "TT": 410, "TU": 428, "TY": 416, "TZ": 442,
-    "UA": 54, "UA2": 126, "UA9": 15, "UK": 292, "UN": 130, "UR": 288,
-    "V2": 94, "V3": 66, "V4": 249, "V5": 464, "V6": 173, "V7": 168,
-    "V8": 345, "VE": 1, "VK": 150, "VK0H": 111, "VK0M": 153,
-    "VK9C": 38, "VK9L": 147, "VK9M": 171, "VK9N": 189, "VK9W": 303,
-    "VK9X": 35, "VP2E": 12, "VP2M": 96, "VP2V": 65, "VP5": 89,
-    "VP6": 172, "VP6/d": 513, "VP8": 141, "VP8/g": 235, "VP8/h": 238,
-    "VP8/o": 238, "VP8/s": 240, "VP9": 64, "VQ9": 33, "VR": 321,
-    "VU": 324, "VU4": 11, "VU7": 142, "XE": 50, "XF4": 204, "XT": 480,
-    "XU": 312, "XW": 143, "XX9": 152, "XZ": 309, "YA": 3, "YB": 327,
-    "YI": 333, "YJ": 158, "YK": 384, "YL": 145, "YN": 86, "YO": 275,
-    "YS": 74, "YU": 296, "YV": 148, "YV0": 17, "Z2": 452, "Z3": 502,
-    "Z6": 522, "Z8": 521, "ZA": 7, "ZB": 233, "ZC4": 283, "ZD7": 250,
-    "ZD8": 205, "ZD9": 274, "ZF": 69, "ZK1/n": 191, "ZK1/s": 234,
-    "ZK2": 188, "ZK3": 270, "ZL": 170, "ZL7": 34, "ZL8": 133, "ZL9": 16,
-    "ZP": 132, "ZS": 462, "ZS8": 201
-};
-
-/**
- * Pobierz kod DXCC ARRL na podstawie głównego prefiksu
+ * Pobierz kod DXCC ARRL na podstawie głównego prefiksu (PREFIX_TO_DXCC z dxcc-tables.js)
  */
 function getDxccCode(prefix) {
     // Normalizuj prefix
@@ -393,19 +357,18 @@ function getDxccCode(prefix) {
 }
 
 /**
- * Załaduj plik CTY.DAT z URL lub lokalnego pliku
+ * Załaduj skompilowany indeks CTY.DAT
  */
-async function loadCtyDat(url = '/static/ham-wrapped/data/cty.dat') {
+async function loadCtyIndex(url = CTY_INDEX_URL) {
     try {
         const response = await fetch(url);
         if (!response.ok) {
             throw new Error(`HTTP error! status: ${response.status}`);
         }
-        const content = await response.text();
-        parseCtyDat(content);
+        parseCtyIndex(await response.arrayBuffer());
         return true;
     } catch (error) {
-        console.error('Błąd ładowania CTY.DAT:', error);
+        console.error('Błąd ładowania indeksu CTY:', error);
         return false;
     }
 }
@@ -419,7 +382,7 @@ function getAllDxccEntities() {
         continent: entity.continent,
         cqZone: entity.cqZone,
         primaryPrefix: entity.primaryPrefix,
-        dxcc: getDxccCode(entity.primaryPrefix)
+        dxcc: entity.dxcc
     }));
 }
 
@@ -431,19 +394,18 @@ function isCtyLoaded() {
 }
 
 // Eksport do globalnego scope
-window.loadCtyDat = loadCtyDat;
+window.loadCtyIndex = loadCtyIndex;
 window.lookupCallsign = lookupCallsign;
 window.getAllDxccEntities = getAllDxccEntities;
 window.isCtyLoaded = isCtyLoaded;
-window.PREFIX_TO_DXCC = PREFIX_TO_DXCC;
 
-// Automatyczne ładowanie CTY.DAT przy starcie strony
-document.addEventListener('DOMContentLoaded', () => {
-    loadCtyDat().then(success => {
-        if (success) {
-            console.log('CTY.DAT załadowany pomyślnie');
-        } else {
-            console.warn('Nie udało się załadować CTY.DAT');
-        }
-    });
+// Indeks CTY jest ładowany razem z tym skryptem (moduł parsera, na żądanie);
+// parsowanie czeka na ctyIndexReady, żeby lookup korzystał z pełnych danych
+window.ctyIndexReady = loadCtyIndex().then(success => {
+    if (success) {
+        console.log('Indeks CTY załadowany pomyślnie');
+    } else {
+        console.warn('Nie udało się załadować indeksu CTY');
+    }
+    return success;
 });
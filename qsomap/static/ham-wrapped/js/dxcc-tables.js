@@ -0,0 +1,467 @@
+/**
+ * Tabele DXCC - kraje ARRL DXCC i mapowanie głównych prefiksów CTY na kody DXCC
+ * (CTY.DAT nie zawiera bezpośrednio kodów DXCC).
+ * Plik wygenerowany z qsomap/common/dxcc.json (make dxcc-tables) - nie edytuj ręcznie.
+ */
+
+const DXCC_DATA = {
+    2: { name: "Abu Ail Is.", continent: "AS", lat: 11.52, lon: 42.73, cqZone: 21 },
+    3: { name: "Afghanistan", continent: "AS", lat: 33.93, lon: 67.71, cqZone: 21 },
+    4: { name: "Agalega & St. Brandon Is.", continent: "AF", lat: -10.45, lon: 56.67, cqZone: 39 },
+    5: { name: "Aland Is.", continent: "EU", lat: 60.18, lon: 20.38, cqZone: 15 },
+    6: { name: "Alaska", continent: "NA", lat: 64.2, lon: -152.49, cqZone: 1 },
+    7: { name: "Albania", continent: "EU", lat: 41.15, lon: 20.17, cqZone: 15 },
+    8: { name: "Aldabra", continent: "AF", lat: -9.42, lon: 46.33, cqZone: 39 },
+    9: { name: "American Samoa", continent: "OC", lat: -14.27, lon: -170.13, cqZone: 32 },
+    10: { name: "Amsterdam & St. Paul Is.", continent: "AF", lat: -37.85, lon: 77.53, cqZone: 39 },
+    11: { name: "Andaman & Nicobar Is.", continent: "AS", lat: 11.68, lon: 92.77, cqZone: 26 },
+    12: { name: "Anguilla", continent: "NA", lat: 18.23, lon: -63.07, cqZone: 8 },
+    14: { name: "Armenia", continent: "AS", lat: 40.07, lon: 45.04, cqZone: 21 },
+    16: { name: "New Zealand Subantarctic Islands", continent: "OC", lat: -40.9, lon: 174.89, cqZone: 32 },
+    17: { name: "Aves I.", continent: "NA", lat: 40.0, lon: -100.0, cqZone: 8 },
+    18: { name: "Azerbaijan", continent: "AS", lat: 40.14, lon: 47.58, cqZone: 21 },
+    19: { name: "Bajo Nuevo", continent: "NA", lat: 40.0, lon: -100.0, cqZone: 8 },
+    20: { name: "Baker & Howland Is.", continent: "OC", lat: 0.22, lon: -176.47, cqZone: 31 },
+    21: { name: "Balearic Is.", continent: "EU", lat: 39.57, lon: 2.65, cqZone: 14 },
+    22: { name: "Palau", continent: "OC", lat: 7.35, lon: 134.47, cqZone: 27 },
+    23: { name: "Blenheim Reef", continent: "AF", lat: 10.0, lon: 20.0, cqZone: 39 },
+    24: { name: "Bouvet", continent: "AF", lat: -54.43, lon: 3.38, cqZone: 38 },
+    25: { name: "British North Borneo", continent: "OC", lat: -20.0, lon: 140.0, cqZone: 28 },
+    26: { name: "British Somaliland", continent: "AF", lat: 17.57, lon: -4.0, cqZone: 37 },
+    27: { name: "Belarus", continent: "EU", lat: 53.71, lon: 27.95, cqZone: 16 },
+    28: { name: "Canal Zone", continent: "NA", lat: 40.0, lon: -100.0, cqZone: 7 },
+    29: { name: "Canary Is.", continent: "AF", lat: 28.1, lon: -15.4, cqZone: 33 },
+    30: { name: "Celebe & Molucca Is.", continent: "OC", lat: -20.0, lon: 140.0, cqZone: 28 },
+    31: { name: "C. Kiribati (British Phoenix Is.)", continent: "OC", lat: -20.0, lon: 140.0, cqZone: 31 },
+    32: { name: "Ceuta & Melilla", continent: "AF", lat: 35.89, lon: -5.32, cqZone: 33 },
+    33: { name: "Chagos Is.", continent: "AF", lat: -7.32, lon: 72.42, cqZone: 39 },
+    34: { name: "Chatham Is.", continent: "OC", lat: -43.85, lon: -176.47, cqZone: 32 },
+    35: { name: "Christmas I.", continent: "OC", lat: -10.48, lon: 105.63, cqZone: 29 },
+    36: { name: "Clipperton I.", continent: "NA", lat: 10.28, lon: -109.22, cqZone: 7 },
+    37: { name: "Cocos I.", continent: "NA", lat: 5.52, lon: -87.07, cqZone: 7 },
+    38: { name: "Cocos (Keeling) Is.", continent: "OC", lat: -12.17, lon: 96.83, cqZone: 29 },
+    39: { name: "Comoros", continent: "AF", lat: -11.65, lon: 43.33, cqZone: 39 },
+    40: { name: "Crete", continent: "EU", lat: 35.24, lon: 24.9, cqZone: 20 },
+    41: { name: "Crozet I.", continent: "AF", lat: -46.43, lon: 51.87, cqZone: 39 },
+    42: { name: "Damao, Diu", continent: "AS", lat: 35.0, lon: 100.0, cqZone: 22 },
+    43: { name: "Desecheo I.", continent: "NA", lat: 18.38, lon: -67.48, cqZone: 8 },
+    44: { name: "Desroches", continent: "AF", lat: 10.0, lon: 20.0, cqZone: 39 },
+    45: { name: "Dodecanese", continent: "EU", lat: 36.18, lon: 28.0, cqZone: 20 },
+    46: { name: "East Malaysia", continent: "OC", lat: 4.17, lon: 117.63, cqZone: 28 },
+    47: { name: "Easter I.", continent: "SA", lat: -27.12, lon: -109.37, cqZone: 12 },
+    48: { name: "E. Kiribati (Line Is.)", continent: "OC", lat: -20.0, lon: 140.0, cqZone: 31 },
+    49: { name: "Equatorial Guinea", continent: "AF", lat: 1.65, lon: 10.27, cqZone: 36 },
+    50: { name: "Mexico", continent: "NA", lat: 23.63, lon: -102.55, cqZone: 6 },
+    51: { name: "Eritrea", continent: "AF", lat: 15.18, lon: 39.78, cqZone: 37 },
+    52: { name: "Estonia", continent: "EU", lat: 58.6, lon: 25.01, cqZone: 15 },
+    53: { name: "Ethiopia", continent: "AF", lat: 9.15, lon: 40.49, cqZone: 37 },
+    55: { name: "Farquhar", continent: "AF", lat: 10.0, lon: 20.0, cqZone: 39 },
+    56: { name: "Fernando de Noronha", continent: "SA", lat: -3.85, lon: -32.42, cqZone: 11 },
+    57: { name: "French Equatorial Africa", continent: "AF", lat: 10.0, lon: 20.0, cqZone: 36 },
+    58: { name: "French Indo-China", continent: "AS", lat: 35.0, lon: 100.0, cqZone: 26 },
+    59: { name: "French West Africa", continent: "AF", lat: 10.0, lon: 20.0, cqZone: 35 },
+    60: { name: "Bahamas", continent: "NA", lat: 25.03, lon: -77.4, cqZone: 8 },
+    61: { name: "Franz Josef Land", continent: "EU", lat: 80.65, lon: 54.78, cqZone: 40 },
+    62: { name: "Barbados", continent: "NA", lat: 13.19, lon: -59.54, cqZone: 8 },
+    63: { name: "French Guiana", continent: "SA", lat: 3.93, lon: -53.13, cqZone: 9 },
+    64: { name: "Bermuda", continent: "NA", lat: 32.31, lon: -64.75, cqZone: 5 },
+    65: { name: "British Virgin Is.", continent: "NA", lat: 18.43, lon: -64.62, cqZone: 8 },
+    66: { name: "Belize", continent: "NA", lat: 17.19, lon: -88.5, cqZone: 7 },
+    67: { name: "French India", continent: "AS", lat: 20.59, lon: 78.96, cqZone: 22 },
+    68: { name: "Kuwait/Saudi Arabia Neutral Zone", continent: "AS", lat: 29.31, lon: 47.48, cqZone: 21 },
+    69: { name: "Cayman Is.", continent: "NA", lat: 19.31, lon: -81.25, cqZone: 8 },
+    70: { name: "Cuba", continent: "NA", lat: 21.52, lon: -77.78, cqZone: 8 },
+    71: { name: "Galapagos Is.", continent: "SA", lat: -0.77, lon: -91.13, cqZone: 10 },
+    72: { name: "Dominican Republic", continent: "NA", lat: 18.73, lon: -70.17, cqZone: 8 },
+    74: { name: "El Salvador", continent: "NA", lat: 13.79, lon: -88.9, cqZone: 7 },
+    75: { name: "Georgia", continent: "AS", lat: 42.32, lon: 43.36, cqZone: 21 },
+    76: { name: "Guatemala", continent: "NA", lat: 15.78, lon: -90.23, cqZone: 7 },
+    77: { name: "Grenada", continent: "NA", lat: 12.12, lon: -61.68, cqZone: 8 },
+    78: { name: "Haiti", continent: "NA", lat: 18.97, lon: -72.29, cqZone: 8 },
+    79: { name: "Guadeloupe", continent: "NA", lat: 16.25, lon: -61.58, cqZone: 8 },
+    80: { name: "Honduras", continent: "NA", lat: 15.2, lon: -86.24, cqZone: 7 },
+    81: { name: "Germany", continent: "EU", lat: 51.17, lon: 10.45, cqZone: 14 },
+    82: { name: "Jamaica", continent: "NA", lat: 18.11, lon: -77.29, cqZone: 8 },
+    84: { name: "Martinique", continent: "NA", lat: 14.64, lon: -61.02, cqZone: 8 },
+    85: { name: "Bonaire, Curacao", continent: "SA", lat: 12.18, lon: -68.98, cqZone: 9 },
+    86: { name: "Nicaragua", continent: "NA", lat: 12.87, lon: -85.21, cqZone: 7 },
+    88: { name: "Panama", continent: "NA", lat: 8.54, lon: -80.78, cqZone: 7 },
+    89: { name: "Turks & Caicos Is.", continent: "NA", lat: 21.69, lon: -71.8, cqZone: 8 },
+    90: { name: "Trinidad & Tobago", continent: "SA", lat: 10.69, lon: -61.22, cqZone: 9 },
+    91: { name: "Aruba", continent: "SA", lat: 12.52, lon: -69.97, cqZone: 9 },
+    93: { name: "Geyser Reef", continent: "AF", lat: 10.0, lon: 20.0, cqZone: 39 },
+    94: { name: "Antigua & Barbuda", continent: "NA", lat: 17.06, lon: -61.8, cqZone: 8 },
+    95: { name: "Dominica", continent: "NA", lat: 15.41, lon: -61.34, cqZone: 8 },
+    96: { name: "Montserrat", continent: "NA", lat: 16.74, lon: -62.19, cqZone: 8 },
+    97: { name: "St. Lucia", continent: "NA", lat: 13.91, lon: -60.98, cqZone: 8 },
+    98: { name: "St. Vincent", continent: "NA", lat: 13.25, lon: -61.2, cqZone: 8 },
+    99: { name: "Glorioso Is.", continent: "AF", lat: -11.55, lon: 47.3, cqZone: 39 },
+    100: { name: "Argentina", continent: "SA", lat: -38.42, lon: -63.62, cqZone: 13 },
+    101: { name: "Goa", continent: "AS", lat: 35.0, lon: 100.0, cqZone: 22 },
+    102: { name: "Gold Coast, Togoland", continent: "AF", lat: 8.62, lon: 0.82, cqZone: 35 },
+    103: { name: "Guam", continent: "OC", lat: 13.44, lon: 144.79, cqZone: 27 },
+    104: { name: "Bolivia", continent: "SA", lat: -16.29, lon: -63.59, cqZone: 10 },
+    105: { name: "Guantanamo Bay", continent: "NA", lat: 19.9, lon: -75.13, cqZone: 8 },
+    106: { name: "Guernsey", continent: "EU", lat: 49.45, lon: -2.54, cqZone: 14 },
+    107: { name: "Guinea", continent: "AF", lat: 9.95, lon: -9.7, cqZone: 35 },
+    109: { name: "Guinea-Bissau", continent: "AF", lat: 11.8, lon: -15.18, cqZone: 35 },
+    110: { name: "Hawaii", continent: "OC", lat: 21.09, lon: -157.53, cqZone: 31 },
+    111: { name: "Heard I.", continent: "AF", lat: -53.1, lon: 73.52, cqZone: 39 },
+    112: { name: "Chile", continent: "SA", lat: -35.68, lon: -71.54, cqZone: 12 },
+    113: { name: "Ifni", continent: "AF", lat: 10.0, lon: 20.0, cqZone: 33 },
+    114: { name: "Isle of Man", continent: "EU", lat: 54.24, lon: -4.55, cqZone: 14 },
+    115: { name: "Italian Somaliland", continent: "AF", lat: 17.57, lon: -4.0, cqZone: 37 },
+    116: { name: "Colombia", continent: "SA", lat: 4.57, lon: -74.3, cqZone: 9 },
+    117: { name: "ITU HQ", continent: "EU", lat: 50.0, lon: 10.0, cqZone: 14 },
+    118: { name: "Jan Mayen", continent: "EU", lat: 71.03, lon: -8.29, cqZone: 40 },
+    119: { name: "Java", continent: "OC", lat: -20.0, lon: 140.0, cqZone: 28 },
+    120: { name: "Ecuador", continent: "SA", lat: -1.83, lon: -78.18, cqZone: 10 },
+    122: { name: "Jersey", continent: "EU", lat: 49.21, lon: -2.13, cqZone: 14 },
+    123: { name: "Johnston I.", continent: "OC", lat: 16.73, lon: -169.53, cqZone: 31 },
+    124: { name: "Juan de Nova, Europa", continent: "AF", lat: -22.35, lon: 40.35, cqZone: 39 },
+    125: { name: "Juan Fernandez Is.", continent: "SA", lat: -33.62, lon: -78.83, cqZone: 12 },
+    126: { name: "Kaliningrad", continent: "EU", lat: 54.42, lon: 20.52, cqZone: 15 },
+    127: { name: "Kamaran Is.", continent: "AS", lat: 35.0, lon: 100.0, cqZone: 21 },
+    128: { name: "Karelo-Finnish Republic", continent: "EU", lat: 50.0, lon: 10.0, cqZone: 16 },
+    129: { name: "Guyana", continent: "SA", lat: 4.86, lon: -58.93, cqZone: 9 },
+    131: { name: "Kerguelen Is.", continent: "AF", lat: -49.35, lon: 69.35, cqZone: 39 },
+    132: { name: "Paraguay", continent: "SA", lat: -23.44, lon: -58.44, cqZone: 11 },
+    133: { name: "Kermadec Is.", continent: "OC", lat: -29.27, lon: -177.92, cqZone: 32 },
+    134: { name: "Kingman Reef", continent: "OC", lat: -20.0, lon: 140.0, cqZone: 31 },
+    135: { name: "Kyrgyzstan", continent: "AS", lat: 41.2, lon: 74.77, cqZone: 17 },
+    136: { name: "Peru", continent: "SA", lat: -9.19, lon: -75.02, cqZone: 10 },
+    137: { name: "Republic of Korea", continent: "AS", lat: 37.57, lon: 126.98, cqZone: 25 },
+    138: { name: "Kure I.", continent: "OC", lat: -20.0, lon: 140.0, cqZone: 31 },
+    139: { name: "Kuria Muria I.", continent: "AS", lat: 35.0, lon: 100.0, cqZone: 21 },
+    140: { name: "Suriname", continent: "SA", lat: -15.0, lon: -60.0, cqZone: 9 },
+    141: { name: "Falkland Is.", continent: "SA", lat: -51.8, lon: -59.53, cqZone: 13 },
+    142: { name: "Lakshadweep Is.", continent: "AS", lat: 11.22, lon: 72.77, cqZone: 22 },
+    143: { name: "Laos", continent: "AS", lat: 19.86, lon: 102.5, cqZone: 26 },
+    144: { name: "Uruguay", continent: "SA", lat: -32.52, lon: -55.77, cqZone: 13 },
+    145: { name: "Latvia", continent: "EU", lat: 56.88, lon: 24.6, cqZone: 15 },
+    146: { name: "Lithuania", continent: "EU", lat: 55.17, lon: 23.88, cqZone: 15 },
+    147: { name: "Lord Howe I.", continent: "OC", lat: -31.56, lon: 159.08, cqZone: 30 },
+    148: { name: "Venezuela", continent: "SA", lat: 6.42, lon: -66.59, cqZone: 9 },
+    149: { name: "Azores", continent: "EU", lat: 38.72, lon: -27.22, cqZone: 14 },
+    151: { name: "Malyj Vysotskij I.", continent: "EU", lat: 50.0, lon: 10.0, cqZone: 16 },
+    152: { name: "Macao", continent: "AS", lat: 22.2, lon: 113.55, cqZone: 24 },
+    153: { name: "Macquarie I.", continent: "OC", lat: -54.62, lon: 158.88, cqZone: 30 },
+    154: { name: "Yemen Arab Republic", continent: "AS", lat: 15.55, lon: 48.52, cqZone: 21 },
+    155: { name: "Malaya", continent: "AS", lat: 35.0, lon: 100.0, cqZone: 28 },
+    157: { name: "Nauru", continent: "OC", lat: -0.52, lon: 166.92, cqZone: 31 },
+    158: { name: "Vanuatu", continent: "OC", lat: -15.38, lon: 166.96, cqZone: 32 },
+    160: { name: "Tonga", continent: "OC", lat: -21.21, lon: -175.2, cqZone: 32 },
+    161: { name: "Malpelo I.", continent: "SA", lat: 4.0, lon: -81.6, cqZone: 9 },
+    162: { name: "New Caledonia", continent: "OC", lat: -20.9, lon: 165.62, cqZone: 32 },
+    163: { name: "Papua New Guinea", continent: "OC", lat: -6.31, lon: 143.96, cqZone: 28 },
+    164: { name: "Manchuria", continent: "AS", lat: 35.0, lon: 100.0, cqZone: 24 },
+    165: { name: "Mauritius", continent: "AF", lat: -20.35, lon: 57.55, cqZone: 39 },
+    166: { name: "Mariana Is.", continent: "OC", lat: 15.18, lon: 145.75, cqZone: 27 },
+    167: { name: "Market Reef", continent: "EU", lat: 60.3, lon: 19.13, cqZone: 15 },
+    168: { name: "Marshall Is.", continent: "OC", lat: 7.13, lon: 171.18, cqZone: 31 },
+    169: { name: "Mayotte", continent: "AF", lat: -12.84, lon: 45.15, cqZone: 39 },
+    170: { name: "New Zealand", continent: "OC", lat: -40.9, lon: 174.89, cqZone: 32 },
+    171: { name: "Mellish Reef", continent: "OC", lat: -17.4, lon: 155.85, cqZone: 30 },
+    172: { name: "Pitcairn I.", continent: "OC", lat: -25.07, lon: -130.08, cqZone: 32 },
+    173: { name: "Micronesia", continent: "OC", lat: 6.89, lon: 158.22, cqZone: 27 },
+    174: { name: "Midway I.", continent: "OC", lat: 28.21, lon: -177.38, cqZone: 31 },
+    175: { name: "French Polynesia", continent: "OC", lat: -17.68, lon: -149.41, cqZone: 32 },
+    176: { name: "Fiji", continent: "OC", lat: -18.14, lon: 178.44, cqZone: 32 },
+    177: { name: "Minami Torishima", continent: "OC", lat: -20.0, lon: 140.0, cqZone: 27 },
+    178: { name: "Minerva Reef", continent: "OC", lat: -20.0, lon: 140.0, cqZone: 32 },
+    179: { name: "Moldova", continent: "EU", lat: 47.41, lon: 28.37, cqZone: 16 },
+    180: { name: "Mount Athos", continent: "EU", lat: 40.16, lon: 24.33, cqZone: 20 },
+    181: { name: "Mozambique", continent: "AF", lat: -18.67, lon: 35.53, cqZone: 37 },
+    182: { name: "Navassa I.", continent: "NA", lat: 18.4, lon: -75.01, cqZone: 8 },
+    183: { name: "Netherlands Borneo", continent: "OC", lat: 52.13, lon: 5.29, cqZone: 28 },
+    184: { name: "Netherlands New Guinea", continent: "OC", lat: 9.95, lon: -9.7, cqZone: 28 },
+    185: { name: "Solomon Is.", continent: "OC", lat: -9.43, lon: 160.02, cqZone: 28 },
+    186: { name: "Newfoundland, Labrador", continent: "NA", lat: 40.0, lon: -100.0, cqZone: 2 },
+    187: { name: "Niger", continent: "AF", lat: 17.61, lon: 8.08, cqZone: 35 },
+    188: { name: "Niue", continent: "OC", lat: -19.05, lon: -169.87, cqZone: 32 },
+    189: { name: "Norfolk I.", continent: "OC", lat: -29.04, lon: 167.95, cqZone: 32 },
+    190: { name: "Samoa", continent: "OC", lat: -13.84, lon: -171.76, cqZone: 32 },
+    191: { name: "North Cook Is.", continent: "OC", lat: -20.0, lon: 140.0, cqZone: 32 },
+    192: { name: "Ogasawara", continent: "AS", lat: 35.0, lon: 100.0, cqZone: 27 },
+    193: { name: "Okinawa (Ryukyu Is.)", continent: "AS", lat: 35.0, lon: 100.0, cqZone: 25 },
+    194: { name: "Okino Tori-shima", continent: "AS", lat: 35.0, lon: 100.0, cqZone: 27 },
+    195: { name: "Annobon I.", continent: "AF", lat: -1.45, lon: 5.63, cqZone: 36 },
+    196: { name: "Palestine", continent: "AS", lat: 35.0, lon: 100.0, cqZone: 20 },
+    197: { name: "Palmyra & Jarvis Is.", continent: "OC", lat: 5.87, lon: -162.08, cqZone: 31 },
+    198: { name: "Papua Territory", continent: "OC", lat: -20.0, lon: 140.0, cqZone: 28 },
+    199: { name: "Peter 1 I.", continent: "AN", lat: -68.78, lon: -90.52, cqZone: 12 },
+    200: { name: "Portuguese Timor", continent: "OC", lat: -20.0, lon: 140.0, cqZone: 28 },
+    201: { name: "Prince Edward & Marion Is.", continent: "AF", lat: -46.88, lon: 37.73, cqZone: 38 },
+    202: { name: "Puerto Rico", continent: "NA", lat: 18.22, lon: -66.59, cqZone: 8 },
+    203: { name: "Andorra", continent: "EU", lat: 42.51, lon: 1.52, cqZone: 14 },
+    204: { name: "Revillagigedo", continent: "NA", lat: 18.77, lon: -110.97, cqZone: 6 },
+    205: { name: "Ascension I.", continent: "AF", lat: -7.95, lon: -14.37, cqZone: 36 },
+    206: { name: "Austria", continent: "EU", lat: 47.52, lon: 14.55, cqZone: 15 },
+    207: { name: "Rodrigues I.", continent: "AF", lat: -19.72, lon: 63.42, cqZone: 39 },
+    208: { name: "Ruanda-Urundi", continent: "AF", lat: 10.0, lon: 20.0, cqZone: 36 },
+    209: { name: "Belgium", continent: "EU", lat: 50.5, lon: 4.47, cqZone: 14 },
+    210: { name: "Saar", continent: "EU", lat: 50.0, lon: 10.0, cqZone: 14 },
+    211: { name: "Sable I.", continent: "NA", lat: 43.93, lon: -60.01, cqZone: 5 },
+    212: { name: "Bulgaria", continent: "EU", lat: 42.73, lon: 25.49, cqZone: 20 },
+    213: { name: "Saint Martin", continent: "NA", lat: 18.07, lon: -63.05, cqZone: 8 },
+    214: { name: "Corsica", continent: "EU", lat: 42.04, lon: 9.01, cqZone: 15 },
+    215: { name: "Cyprus", continent: "AS", lat: 35.13, lon: 33.43, cqZone: 20 },
+    216: { name: "San Andres & Providencia", continent: "NA", lat: 12.55, lon: -81.72, cqZone: 7 },
+    217: { name: "San Felix & San Ambrosio", continent: "SA", lat: -26.3, lon: -80.07, cqZone: 12 },
+    218: { name: "Czechoslovakia", continent: "EU", lat: 50.0, lon: 10.0, cqZone: 15 },
+    219: { name: "Sao Tome & Principe", continent: "AF", lat: 0.19, lon: 6.61, cqZone: 36 },
+    220: { name: "Sarawak", continent: "OC", lat: -20.0, lon: 140.0, cqZone: 28 },
+    221: { name: "Denmark", continent: "EU", lat: 56.26, lon: 9.5, cqZone: 14 },
+    222: { name: "Faroe Is.", continent: "EU", lat: 61.89, lon: -6.91, cqZone: 14 },
+    223: { name: "England", continent: "EU", lat: 52.35, lon: -1.17, cqZone: 14 },
+    224: { name: "Finland", continent: "EU", lat: 61.92, lon: 25.75, cqZone: 15 },
+    225: { name: "Sardinia", continent: "EU", lat: 39.87, lon: 8.97, cqZone: 15 },
+    226: { name: "Saudi Arabia/Iraq Neutral Zone", continent: "AS", lat: 33.22, lon: 43.68, cqZone: 21 },
+    227: { name: "France", continent: "EU", lat: 46.23, lon: 2.21, cqZone: 14 },
+    228: { name: "Serrana Bank & Roncador Cay", continent: "NA", lat: 40.0, lon: -100.0, cqZone: 7 },
+    229: { name: "German Democratic Republic", continent: "EU", lat: 50.0, lon: 10.0, cqZone: 14 },
+    230: { name: "Federal Republic of Germany", continent: "EU", lat: 51.17, lon: 10.45, cqZone: 14 },
+    231: { name: "Sikkim", continent: "AS", lat: 35.0, lon: 100.0, cqZone: 22 },
+    232: { name: "Somalia", continent: "AF", lat: 17.57, lon: -4.0, cqZone: 37 },
+    233: { name: "Gibraltar", continent: "EU", lat: 36.14, lon: -5.35, cqZone: 14 },
+    234: { name: "South Cook Is.", continent: "OC", lat: -21.23, lon: -159.78, cqZone: 32 },
+    235: { name: "South Georgia I.", continent: "SA", lat: -54.25, lon: -36.75, cqZone: 13 },
+    236: { name: "Greece", continent: "EU", lat: 39.07, lon: 21.82, cqZone: 20 },
+    237: { name: "Greenland", continent: "NA", lat: 71.71, lon: -42.6, cqZone: 40 },
+    238: { name: "South Orkney Is.", continent: "SA", lat: -60.6, lon: -45.55, cqZone: 13 },
+    239: { name: "Hungary", continent: "EU", lat: 47.16, lon: 19.5, cqZone: 15 },
+    240: { name: "South Sandwich Is.", continent: "SA", lat: -58.43, lon: -26.37, cqZone: 13 },
+    241: { name: "South Shetland Is.", continent: "SA", lat: -62.09, lon: -58.47, cqZone: 13 },
+    242: { name: "Iceland", continent: "EU", lat: 64.96, lon: -19.02, cqZone: 40 },
+    243: { name: "People's Democratic Rep. of Yemen", continent: "AS", lat: 15.55, lon: 48.52, cqZone: 21 },
+    244: { name: "Southern Sudan", continent: "AF", lat: 7.86, lon: 29.7, cqZone: 34 },
+    245: { name: "Ireland", continent: "EU", lat: 53.41, lon: -8.24, cqZone: 14 },
+    246: { name: "Sovereign Military Order of Malta", continent: "EU", lat: 41.9, lon: 12.45, cqZone: 15 },
+    247: { name: "Spratly Is.", continent: "AS", lat: 9.88, lon: 114.23, cqZone: 26 },
+    248: { name: "Italy", continent: "EU", lat: 41.87, lon: 12.57, cqZone: 15 },
+    249: { name: "St. Kitts & Nevis", continent: "NA", lat: 17.36, lon: -62.78, cqZone: 8 },
+    250: { name: "St. Helena", continent: "AF", lat: -15.97, lon: -5.7, cqZone: 36 },
+    251: { name: "Liechtenstein", continent: "EU", lat: 47.17, lon: 9.52, cqZone: 14 },
+    252: { name: "St. Paul I.", continent: "NA", lat: 47.2, lon: -60.15, cqZone: 5 },
+    253: { name: "St. Peter & St. Paul Rocks", continent: "SA", lat: 0.92, lon: -29.35, cqZone: 11 },
+    254: { name: "Luxembourg", continent: "EU", lat: 49.82, lon: 6.13, cqZone: 14 },
+    255: { name: "St. Maarten, Saba, St. Eustatius", continent: "NA", lat: 18.02, lon: -63.07, cqZone: 8 },
+    256: { name: "Madeira Is.", continent: "AF", lat: 32.65, lon: -16.91, cqZone: 33 },
+    257: { name: "Malta", continent: "EU", lat: 35.94, lon: 14.38, cqZone: 15 },
+    258: { name: "Sumatra", continent: "OC", lat: -20.0, lon: 140.0, cqZone: 28 },
+    259: { name: "Svalbard", continent: "EU", lat: 77.87, lon: 20.98, cqZone: 40 },
+    260: { name: "Monaco", continent: "EU", lat: 43.73, lon: 7.42, cqZone: 14 },
+    261: { name: "Swan Is.", continent: "NA", lat: 40.0, lon: -100.0, cqZone: 7 },
+    262: { name: "Tajikistan", continent: "AS", lat: 38.86, lon: 71.28, cqZone: 17 },
+    263: { name: "Netherlands", continent: "EU", lat: 52.13, lon: 5.29, cqZone: 14 },
+    264: { name: "Tangier", continent: "AF", lat: 10.0, lon: 20.0, cqZone: 33 },
+    265: { name: "Northern Ireland", continent: "EU", lat: 54.79, lon: -6.49, cqZone: 14 },
+    266: { name: "Norway", continent: "EU", lat: 60.47, lon: 8.47, cqZone: 14 },
+    267: { name: "Territory of New Guinea", continent: "OC", lat: 9.95, lon: -9.7, cqZone: 28 },
+    268: { name: "Tibet", continent: "AS", lat: 31.17, lon: 92.0, cqZone: 23 },
+    269: { name: "Poland", continent: "EU", lat: 51.92, lon: 19.15, cqZone: 15 },
+    270: { name: "Tokelau Is.", continent: "OC", lat: -9.2, lon: -171.85, cqZone: 31 },
+    271: { name: "Trieste", continent: "EU", lat: 50.0, lon: 10.0, cqZone: 15 },
+    272: { name: "Portugal", continent: "EU", lat: 39.4, lon: -8.22, cqZone: 14 },
+    273: { name: "Trindade & Martim Vaz Is.", continent: "SA", lat: -20.52, lon: -29.32, cqZone: 11 },
+    274: { name: "Tristan da Cunha & Gough I.", continent: "AF", lat: -37.07, lon: -12.32, cqZone: 38 },
+    275: { name: "Romania", continent: "EU", lat: 45.94, lon: 24.97, cqZone: 20 },
+    276: { name: "Tromelin I.", continent: "AF", lat: -15.88, lon: 54.52, cqZone: 39 },
+    277: { name: "St. Pierre & Miquelon", continent: "NA", lat: 46.88, lon: -56.32, cqZone: 5 },
+    278: { name: "San Marino", continent: "EU", lat: 43.94, lon: 12.46, cqZone: 15 },
+    279: { name: "Scotland", continent: "EU", lat: 56.49, lon: -4.2, cqZone: 14 },
+    280: { name: "Turkmenistan", continent: "AS", lat: 38.97, lon: 59.56, cqZone: 17 },
+    281: { name: "Spain", continent: "EU", lat: 40.46, lon: -3.75, cqZone: 14 },
+    282: { name: "Tuvalu", continent: "OC", lat: -7.48, lon: 178.68, cqZone: 31 },
+    283: { name: "UK Sovereign Base Areas on Cyprus", continent: "AS", lat: 34.98, lon: 33.75, cqZone: 20 },
+    284: { name: "Sweden", continent: "EU", lat: 60.13, lon: 18.64, cqZone: 14 },
+    285: { name: "Virgin Is.", continent: "NA", lat: 18.34, lon: -64.93, cqZone: 8 },
+    286: { name: "Uganda", continent: "AF", lat: 1.37, lon: 32.29, cqZone: 37 },
+    287: { name: "Switzerland", continent: "EU", lat: 46.82, lon: 8.23, cqZone: 14 },
+    288: { name: "Ukraine", continent: "EU", lat: 48.38, lon: 31.17, cqZone: 16 },
+    289: { name: "United Nations HQ", continent: "NA", lat: 40.75, lon: -73.97, cqZone: 5 },
+    292: { name: "Uzbekistan", continent: "AS", lat: 41.38, lon: 64.59, cqZone: 17 },
+    293: { name: "Viet Nam", continent: "AS", lat: 14.06, lon: 108.28, cqZone: 26 },
+    294: { name: "Wales", continent: "EU", lat: 52.13, lon: -3.78, cqZone: 14 },
+    295: { name: "Vatican", continent: "EU", lat: 41.9, lon: 12.45, cqZone: 15 },
+    296: { name: "Serbia", continent: "EU", lat: 44.02, lon: 20.81, cqZone: 15 },
+    297: { name: "Wake I.", continent: "OC", lat: 19.28, lon: 166.65, cqZone: 31 },
+    298: { name: "Wallis & Futuna Is.", continent: "OC", lat: -13.77, lon: -177.17, cqZone: 32 },
+    299: { name: "West Malaysia", continent: "AS", lat: 4.21, lon: 101.98, cqZone: 28 },
+    301: { name: "W. Kiribati (Gilbert Is. )", continent: "OC", lat: -20.0, lon: 140.0, cqZone: 31 },
+    302: { name: "Western Sahara", continent: "AF", lat: 24.22, lon: -12.89, cqZone: 33 },
+    303: { name: "Willis I.", continent: "OC", lat: -16.22, lon: 149.97, cqZone: 30 },
+    304: { name: "Bahrain", continent: "AS", lat: 26.07, lon: 50.56, cqZone: 21 },
+    305: { name: "Bangladesh", continent: "AS", lat: 23.69, lon: 90.36, cqZone: 22 },
+    306: { name: "Bhutan", continent: "AS", lat: 27.51, lon: 90.43, cqZone: 22 },
+    307: { name: "Zanzibar", continent: "AF", lat: -6.17, lon: 39.2, cqZone: 37 },
+    308: { name: "Costa Rica", continent: "NA", lat: 9.75, lon: -83.75, cqZone: 7 },
+    309: { name: "Myanmar", continent: "AS", lat: 19.86, lon: 96.09, cqZone: 26 },
+    312: { name: "Cambodia", continent: "AS", lat: 12.57, lon: 104.99, cqZone: 26 },
+    315: { name: "Sri Lanka", continent: "AS", lat: 7.87, lon: 80.77, cqZone: 22 },
+    321: { name: "Hong Kong", continent: "AS", lat: 22.4, lon: 114.11, cqZone: 24 },
+    324: { name: "India", continent: "AS", lat: 20.59, lon: 78.96, cqZone: 22 },
+    327: { name: "Indonesia", continent: "OC", lat: -0.79, lon: 113.92, cqZone: 28 },
+    330: { name: "Iran", continent: "AS", lat: 32.43, lon: 53.69, cqZone: 21 },
+    333: { name: "Iraq", continent: "AS", lat: 33.22, lon: 43.68, cqZone: 21 },
+    336: { name: "Israel", continent: "AS", lat: 31.05, lon: 34.85, cqZone: 20 },
+    339: { name: "Japan", continent: "AS", lat: 36.2, lon: 138.25, cqZone: 25 },
+    342: { name: "Jordan", continent: "AS", lat: 31.95, lon: 35.93, cqZone: 20 },
+    344: { name: "Democratic People's Rep. of Korea", continent: "AS", lat: 35.0, lon: 100.0, cqZone: 25 },
+    345: { name: "Brunei Darussalam", continent: "OC", lat: 4.54, lon: 114.73, cqZone: 28 },
+    348: { name: "Kuwait", continent: "AS", lat: 29.31, lon: 47.48, cqZone: 21 },
+    354: { name: "Lebanon", continent: "AS", lat: 33.85, lon: 35.86, cqZone: 20 },
+    363: { name: "Mongolia", continent: "AS", lat: 46.86, lon: 103.85, cqZone: 23 },
+    369: { name: "Nepal", continent: "AS", lat: 28.39, lon: 84.12, cqZone: 22 },
+    370: { name: "Oman", continent: "AS", lat: 21.51, lon: 55.92, cqZone: 21 },
+    372: { name: "Pakistan", continent: "AS", lat: 30.38, lon: 69.35, cqZone: 21 },
+    375: { name: "Philippines", continent: "OC", lat: 12.88, lon: 121.77, cqZone: 27 },
+    376: { name: "Qatar", continent: "AS", lat: 25.35, lon: 51.18, cqZone: 21 },
+    378: { name: "Saudi Arabia", continent: "AS", lat: 23.89, lon: 45.08, cqZone: 21 },
+    379: { name: "Seychelles", continent: "AF", lat: -4.68, lon: 55.49, cqZone: 39 },
+    381: { name: "Singapore", continent: "AS", lat: 1.35, lon: 103.82, cqZone: 28 },
+    382: { name: "Djibouti", continent: "AF", lat: 11.83, lon: 42.59, cqZone: 37 },
+    384: { name: "Syria", continent: "AS", lat: 34.8, lon: 38.99, cqZone: 20 },
+    386: { name: "Taiwan", continent: "AS", lat: 23.7, lon: 120.96, cqZone: 24 },
+    387: { name: "Thailand", continent: "AS", lat: 15.87, lon: 100.99, cqZone: 26 },
+    391: { name: "United Arab Emirates", continent: "AS", lat: 24.0, lon: 54.0, cqZone: 21 },
+    400: { name: "Algeria", continent: "AF", lat: 28.03, lon: 1.66, cqZone: 33 },
+    401: { name: "Angola", continent: "AF", lat: -11.2, lon: 17.87, cqZone: 36 },
+    402: { name: "Botswana", continent: "AF", lat: -22.33, lon: 24.68, cqZone: 38 },
+    404: { name: "Burundi", continent: "AF", lat: -3.37, lon: 29.92, cqZone: 36 },
+    406: { name: "Cameroon", continent: "AF", lat: 7.37, lon: 12.35, cqZone: 36 },
+    408: { name: "Central Africa", continent: "AF", lat: 6.61, lon: 20.94, cqZone: 36 },
+    409: { name: "Cape Verde", continent: "AF", lat: 16.0, lon: -24.0, cqZone: 35 },
+    410: { name: "Chad", continent: "AF", lat: 15.45, lon: 18.73, cqZone: 36 },
+    411: { name: "Comoros", continent: "AF", lat: -11.65, lon: 43.33, cqZone: 39 },
+    412: { name: "Republic of the Congo", continent: "AF", lat: -0.23, lon: 15.83, cqZone: 36 },
+    414: { name: "Democratic Republic of the Congo", continent: "AF", lat: -4.04, lon: 21.76, cqZone: 36 },
+    416: { name: "Benin", continent: "AF", lat: 9.31, lon: 2.32, cqZone: 35 },
+    420: { name: "Gabon", continent: "AF", lat: -0.8, lon: 11.61, cqZone: 36 },
+    422: { name: "The Gambia", continent: "AF", lat: 13.44, lon: -15.31, cqZone: 35 },
+    424: { name: "Ghana", continent: "AF", lat: 7.95, lon: -1.02, cqZone: 35 },
+    428: { name: "Cote d'Ivoire", continent: "AF", lat: 7.54, lon: -5.55, cqZone: 35 },
+    430: { name: "Kenya", continent: "AF", lat: -0.02, lon: 37.91, cqZone: 37 },
+    432: { name: "Lesotho", continent: "AF", lat: -29.61, lon: 28.23, cqZone: 38 },
+    434: { name: "Liberia", continent: "AF", lat: 6.43, lon: -9.43, cqZone: 35 },
+    436: { name: "Libya", continent: "AF", lat: 26.34, lon: 17.23, cqZone: 34 },
+    438: { name: "Madagascar", continent: "AF", lat: -18.77, lon: 46.87, cqZone: 39 },
+    440: { name: "Malawi", continent: "AF", lat: -13.25, lon: 34.3, cqZone: 37 },
+    442: { name: "Mali", continent: "AF", lat: 17.57, lon: -4.0, cqZone: 35 },
+    444: { name: "Mauritania", continent: "AF", lat: 21.01, lon: -10.94, cqZone: 35 },
+    446: { name: "Morocco", continent: "AF", lat: 31.79, lon: -7.09, cqZone: 33 },
+    450: { name: "Nigeria", continent: "AF", lat: 9.08, lon: 8.68, cqZone: 35 },
+    452: { name: "Zimbabwe", continent: "AF", lat: -19.02, lon: 29.15, cqZone: 38 },
+    453: { name: "Reunion I.", continent: "AF", lat: -21.12, lon: 55.54, cqZone: 39 },
+    454: { name: "Rwanda", continent: "AF", lat: -1.94, lon: 29.87, cqZone: 36 },
+    456: { name: "Senegal", continent: "AF", lat: 14.5, lon: -14.45, cqZone: 35 },
+    458: { name: "Sierra Leone", continent: "AF", lat: 8.46, lon: -11.78, cqZone: 35 },
+    460: { name: "Rotuma I.", continent: "OC", lat: -12.5, lon: 177.07, cqZone: 32 },
+    462: { name: "South Africa", continent: "AF", lat: -30.56, lon: 22.94, cqZone: 38 },
+    464: { name: "Namibia", continent: "AF", lat: -22.96, lon: 18.49, cqZone: 38 },
+    466: { name: "Sudan", continent: "AF", lat: 12.86, lon: 30.22, cqZone: 34 },
+    468: { name: "Swaziland", continent: "AF", lat: -26.52, lon: 31.47, cqZone: 38 },
+    470: { name: "Tanzania", continent: "AF", lat: -6.37, lon: 34.89, cqZone: 37 },
+    474: { name: "Tunisia", continent: "AF", lat: 33.89, lon: 9.54, cqZone: 33 },
+    478: { name: "Egypt", continent: "AF", lat: 26.82, lon: 30.8, cqZone: 34 },
+    480: { name: "Burkina Faso", continent: "AF", lat: 12.24, lon: -1.56, cqZone: 35 },
+    482: { name: "Zambia", continent: "AF", lat: -13.13, lon: 27.85, cqZone: 36 },
+    483: { name: "Togo", continent: "AF", lat: 8.62, lon: 0.82, cqZone: 35 },
+    488: { name: "Walvis Bay", continent: "AF", lat: 10.0, lon: 20.0, cqZone: 38 },
+    489: { name: "Conway Reef", continent: "OC", lat: -21.77, lon: 174.63, cqZone: 32 },
+    490: { name: "Banaba I. (Ocean I.)", continent: "OC", lat: -0.87, lon: 169.53, cqZone: 31 },
+    492: { name: "Yemen", continent: "AS", lat: 15.55, lon: 48.52, cqZone: 21 },
+    493: { name: "Penguin Is.", continent: "AF", lat: 10.0, lon: 20.0, cqZone: 38 },
+    497: { name: "Croatia", continent: "EU", lat: 45.17, lon: 15.97, cqZone: 15 },
+    499: { name: "Slovenia", continent: "EU", lat: 46.15, lon: 14.99, cqZone: 15 },
+    501: { name: "Bosnia-Herzegovina", continent: "EU", lat: 43.92, lon: 17.68, cqZone: 15 },
+    502: { name: "North Macedonia (Republic of)", continent: "EU", lat: 50.0, lon: 10.0, cqZone: 15 },
+    503: { name: "Czech Republic", continent: "EU", lat: 49.82, lon: 15.47, cqZone: 15 },
+    504: { name: "Slovak Republic", continent: "EU", lat: 48.67, lon: 19.7, cqZone: 15 },
+    505: { name: "Pratas I.", continent: "AS", lat: 20.7, lon: 116.7, cqZone: 24 },
+    506: { name: "Scarborough Reef", continent: "AS", lat: 15.18, lon: 117.76, cqZone: 27 },
+    507: { name: "Temotu Province", continent: "OC", lat: -20.0, lon: 140.0, cqZone: 32 },
+    508: { name: "Austral I.", continent: "OC", lat: -20.0, lon: 140.0, cqZone: 32 },
+    509: { name: "Marquesas Is.", continent: "OC", lat: -20.0, lon: 140.0, cqZone: 31 },
+    510: { name: "Palestine", continent: "AS", lat: 35.0, lon: 100.0, cqZone: 20 },
+    511: { name: "Timor-Leste", continent: "OC", lat: -8.87, lon: 125.73, cqZone: 28 },
+    512: { name: "Chesterfield Is.", continent: "OC", lat: -20.0, lon: 140.0, cqZone: 30 },
+    513: { name: "Ducie I.", continent: "OC", lat: -20.0, lon: 140.0, cqZone: 32 },
+    514: { name: "Montenegro", continent: "EU", lat: 42.71, lon: 19.37, cqZone: 15 },
+    515: { name: "Swains I.", continent: "OC", lat: -20.0, lon: 140.0, cqZone: 32 },
+    516: { name: "Saint Barthelemy", continent: "NA", lat: 40.0, lon: -100.0, cqZone: 8 },
+    517: { name: "Curacao", continent: "SA", lat: 12.17, lon: -69.0, cqZone: 9 },
+    518: { name: "St Maarten", continent: "NA", lat: 40.0, lon: -100.0, cqZone: 8 },
+    519: { name: "Saba & St. Eustatius", continent: "NA", lat: 40.0, lon: -100.0, cqZone: 8 },
+    520: { name: "Bonaire", continent: "SA", lat: 12.2, lon: -68.27, cqZone: 9 },
+    521: { name: "South Sudan (Republic of)", continent: "AF", lat: 12.86, lon: 30.22, cqZone: 34 },
+    522: { name: "Republic of Kosovo", continent: "EU", lat: 42.58, lon: 20.9, cqZone: 15 },
+};
+
+const PREFIX_TO_DXCC = {
+    "1A": 246, "1S": 247, "3A": 260, "3B6": 4, "3B8": 165, "3B9": 207,
+    "3C": 49, "3C0": 195, "3D2": 176, "3D2/c": 489, "3D2/r": 460,
+    "3DA": 468, "3V": 474, "3W": 293, "3X": 107, "3Y/b": 24, "3Y/p": 199,
+    "4J": 18, "4L": 75, "4O": 514, "4S": 315, "4U1I": 117, "4U1U": 289,
+    "4U1V": 117, "4W": 511, "4X": 336, "5A": 436, "5B": 215, "5H": 470,
+    "5N": 450, "5R": 438, "5T": 444, "5U": 187, "5V": 483, "5W": 190,
+    "5X": 286, "5Z": 430, "6W": 456, "6Y": 82, "7O": 492, "7P": 432,
+    "7Q": 440, "7X": 400, "8P": 62, "8Q": 159, "8R": 129, "9A": 497,
+    "9G": 424, "9H": 257, "9J": 482, "9K": 348, "9L": 458, "9M2": 299,
+    "9M6": 46, "9N": 369, "9Q": 414, "9U": 404, "9V": 381, "9X": 454,
+    "9Y": 90, "A2": 402, "A3": 160, "A4": 370, "A5": 306, "A6": 391,
+    "A7": 376, "A9": 304, "AP": 372, "BS7": 506, "BV": 386, "BV9P": 505,
+    "BY": 318, "C2": 157, "C3": 203, "C5": 422, "C6": 60, "C9": 181,
+    "CE": 112, "CE0X": 217, "CE0Y": 47, "CE0Z": 125, "CE9": 13, "CM": 70,
+    "CN": 446, "CP": 104, "CT": 272, "CT3": 256, "CU": 149, "CX": 144,
+    "CY0": 252, "CY9": 211, "D2": 401, "D4": 409, "D6": 39, "DL": 230,
+    "DU": 375, "E3": 51, "E4": 510, "E5/n": 191, "E5/s": 234, "E6": 188,
+    "E7": 501, "EA": 281, "EA6": 21, "EA8": 29, "EA9": 32, "EI": 245,
+    "EK": 14, "EL": 434, "EP": 330, "ER": 179, "ES": 52, "ET": 53,
+    "EU": 27, "EX": 135, "EY": 262, "EZ": 280, "F": 227, "FG": 79,
+    "FH": 169, "FJ": 516, "FK": 162, "FK/c": 512, "FM": 84, "FO": 175,
+    "FO/a": 508, "FO/c": 36, "FO/m": 509, "FP": 277, "FR": 453,
+    "FR/g": 99, "FR/j": 124, "FR/t": 276, "FS": 213, "FT5W": 41,
+    "FT5X": 131, "FT5Z": 10, "FW": 298, "FY": 63, "G": 223, "GD": 114,
+    "GI": 265, "GJ": 122, "GM": 279, "GU": 106, "GW": 294, "H4": 185,
+    "H40": 507, "HA": 239, "HB": 287, "HB0": 251, "HC": 120, "HC8": 71,
+    "HH": 78, "HI": 72, "HK": 116, "HK0/a": 216, "HK0/m": 161, "HL": 137,
+    "HP": 88, "HR": 80, "HS": 387, "HV": 295, "HZ": 378, "I": 248,
+    "IS": 225, "IS0": 225, "IT9": 248, "J2": 382, "J3": 77, "J5": 109,
+    "J6": 97, "J7": 95, "J8": 98, "JA": 339, "JD/m": 177, "JD/o": 192,
+    "JT": 363, "JW": 259, "JX": 118, "JY": 342, "K": 291, "KG4": 105,
+    "KH0": 166, "KH1": 20, "KH2": 103, "KH3": 123, "KH4": 174,
+    "KH5": 197, "KH5K": 134, "KH6": 110, "KH7K": 138, "KH8": 9,
+    "KH8/s": 515, "KH9": 297, "KL": 6, "KP1": 182, "KP2": 285,
+    "KP4": 202, "KP5": 43, "LA": 266, "LU": 100, "LX": 254, "LY": 146,
+    "LZ": 212, "OA": 136, "OD": 354, "OE": 206, "OH": 224, "OH0": 5,
+    "OJ0": 167, "OK": 503, "OM": 504, "ON": 209, "OX": 237, "OY": 222,
+    "OZ": 221, "P2": 163, "P4": 91, "P5": 344, "PA": 263, "PJ2": 517,
+    "PJ4": 520, "PJ5": 519, "PJ7": 518, "PY": 108, "PY0F": 56,
+    "PY0S": 253, "PY0T": 273, "PZ": 140, "R1FJ": 61, "R1MV": 151,
+    "S0": 302, "S2": 305, "S5": 499, "S7": 379, "S9": 219, "SM": 284,
+    "SP": 269, "ST": 466, "ST0": 244, "SU": 478, "SV": 236, "SV/a": 180,
+    "SV5": 45, "SV9": 40, "T2": 282, "T30": 301, "T31": 31, "T32": 48,
+    "T33": 490, "T5": 232, "T7": 278, "T8": 22, "TA": 390, "TF": 242,
+    "TG": 76, "TI": 308, "TI9": 37, "TJ": 406, "TK": 214, "TL": 408,
+    "TN": 412, "TR": 420, "TT": 410, "TU": 428, "TY": 416, "TZ": 442,
+    "UA": 54, "UA2": 126, "UA9": 15, "UK": 292, "UN": 130, "UR": 288,
+    "V2": 94, "V3": 66, "V4": 249, "V5": 464, "V6": 173, "V7": 168,
+    "V8": 345, "VE": 1, "VK": 150, "VK0H": 111, "VK0M": 153, "VK9C": 38,
+    "VK9L": 147, "VK9M": 171, "VK9N": 189, "VK9W": 303, "VK9X": 35,
+    "VP2E": 12, "VP2M": 96, "VP2V": 65, "VP5": 89, "VP6": 172,
+    "VP6/d": 513, "VP8": 141, "VP8/g": 235, "VP8/h": 238, "VP8/o": 238,
+    "VP8/s": 240, "VP9": 64, "VQ9": 33, "VR": 321, "VU": 324, "VU4": 11,
+    "VU7": 142, "XE": 50, "XF4": 204, "XT": 480, "XU": 312, "XW": 143,
+    "XX9": 152, "XZ": 309, "YA": 3, "YB": 327, "YI": 333, "YJ": 158,
+    "YK": 384, "YL": 145, "YN": 86, "YO": 275, "YS": 74, "YU": 296,
+    "YV": 148, "YV0": 17, "Z2": 452, "Z3": 502, "Z6": 522, "Z8": 521,
+    "ZA": 7, "ZB": 233, "ZC4": 283, "ZD7": 250, "ZD8": 205, "ZD9": 274,
+    "ZF": 69, "ZK1/n": 191, "ZK1/s": 234, "ZK2": 188, "ZK3": 270,
+    "ZL": 170, "ZL7": 34, "ZL8": 133, "ZL9": 16, "ZP": 132, "ZS": 462,
+    "ZS8": 201
+};
+
+// Eksport globalny
+window.DXCC_DATA = DXCC_DATA;
+window.PREFIX_TO_DXCC = PREFIX_TO_DXCC;
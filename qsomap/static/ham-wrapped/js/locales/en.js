@@ -0,0 +1,168 @@
+/**
+ * Tłumaczenia Ham Wrapped - angielski
+ * Ładowane przez i18n.js tylko wtedy, gdy to język strony
+ */
+
+registerTranslations('en', {
+    // Main page
+    appTitle: 'Ham Wrapped',
+    appSubtitle: 'Your amateur radio year in review',
+    yourCallsign: 'Your callsign:',
+    callsignPlaceholder: 'e.g. W1AW',
+    yourLocator: 'Your locator:',
+    locatorPlaceholder: 'e.g. FN31pr',
+    locatorHint: 'Required to calculate QSO distances',
+    uploadTitle: 'Upload your ADIF log',
+    uploadDragDrop: 'Drag and drop .adi or .adif file here',
+    uploadOr: 'or',
+    uploadButton: 'Choose file',
+    processing: 'Processing...',
+    restart: 'Start over',
+    shareLink: 'Copy share link',
+    linkCopied: 'Copied!',
+
+    // Slides - intro
+    introTitle: 'Your year {year}',
+    introTitleWithCall: '{callsign} - year {year}',
+    introValue: 'HAM WRAPPED',
+    introDescription: 'Discover your amateur radio year in review!',
+    introSubtitle: 'Swipe to see your stats →',
+
+    // Slides - QSO
+    totalQSOsTitle: 'Contacts this year',
+    totalQSOsDescription: 'You made {count} QSOs!',
+    qsoComment1: 'Good start!',
+    qsoComment2: 'Great job!',
+    qsoComment3: 'Very active year!',
+    qsoComment4: 'You are a true DX-er!',
+    qsoComment5: 'Incredible achievement!',
+    qsoComment6: 'Legend of the bands!',
+
+    // Slides - unique stations
+    uniqueCallsignsTitle: 'Unique stations',
+    uniqueCallsignsDescription: 'You talked to this many different stations!',
+    uniqueCallsignsSubtitle: 'That\'s an average of {avg} QSOs per station',
+
+    // Slides - top callsigns
+    topCallsignsTitle: 'Top 5 stations',
+    topCallsignsSubtitle: 'Stations you had the most QSOs with',
+    favoriteStationTitle: 'Favorite station',
+
+    // Slides - month
+    bestMonthTitle: 'Your best month',
+    bestMonthDescription: '{count} QSOs this month!',
+    bestMonthSubtitle: 'This was your most active month',
+
+    // Slides - day
+    bestDayTitle: 'Record day',
+    bestDaySubtitle: 'Your most active day of the year!',
+
+    // Slides - modes
+    favoriteModeTitle: 'Your favorite mode',
+    favoriteModeDescription: '{percentage}% of all contacts',
+    favoriteModeSubtitle: '{count} QSOs in this mode',
+    allModesTitle: 'Mode distribution',
+
+    // Slides - band
+    favoriteBandTitle: 'Favorite band',
+    favoriteBandDescription: '{percentage}% of contacts',
+    favoriteBandSubtitle: 'You worked on {count} different bands',
+    bandDistributionTitle: 'Band distribution',
+    bandDistributionSubtitle: 'You worked on {count} bands',
+
+    // Slides - continents
+    continentsTitle: 'Continents',
+    continentsNoData: 'No continent data',
+    continentsNoDataHint: 'Check if ADIF file contains continent data',
+    continentsSubtitle: 'You reached {count} continents!',
+
+    // Slides - DXCC
+    topDXCCTitle: 'Top 5 DXCC',
+    dxccNoData: 'No DXCC country data',
+    dxccNoDataHint: 'Check if ADIF file contains valid callsigns',
+    dxccSubtitle: 'You worked {count} DXCC entities!',
+
+    // Slides - Band Slots
+    bandSlotsTitle: 'Band Slots',
+    bandSlotsDescription: 'Unique DXCC + band combinations',
+    bandSlotsSubtitle: '{dxcc} DXCC across {bands} bands',
+    bandSlotsTopTitle: 'Top countries by slots',
+
+    // Slides - ODX
+    odxTitle: 'Your ODX',
+    odxStation: 'Station: {call}',
+    odxBand: 'Band: {band}',
+    odxMode: 'Mode: {mode}',
+
+    // Slides - closest QSO
+    closestQSOTitle: 'Closest QSO',
+    unknownCountry: 'Unknown country',
+
+    // Slides - QSO Rate
+    qsoRateTitle: 'Highest QSO Rate',
+    qsoRateUnit: 'QSO/h',
+    qsoRateDescription: 'Your speed record!',
+    qsoRateSubtitle: 'Achieved: {date}',
+
+    // Slides - activity
+    activityTitle: 'Your activity',
+    activeDays: 'Active days',
+    avgQSOPerDay: 'Avg QSO/day',
+    favoriteDay: 'Favorite day',
+
+    // Slides - peak hour
+    peakHourTitle: 'Peak activity',
+    peakHourDescription: 'This is when you transmit most often',
+    peakHourSubtitle: '{count} QSOs at this hour',
+
+    // Slides - streaks
+    streaksTitle: 'Longest streak',
+    streaksUnit: 'days in a row',
+    streaksDescription: 'This many consecutive days you made contacts!',
+    streaksSubtitle: 'From {start} to {end}',
+
+    // Slides - CQ zones
+    cqZonesTitle: 'CQ Zones',
+    cqZonesDescription: 'You worked this many CQ zones!',
+    cqZonesSubtitle: 'There are 40 CQ zones in the world',
+
+    // Slides - contests
+    contestsTitle: 'Contests',
+    contestsDescription: 'You participated in {count} contests!',
+    contestsSubtitle: 'Top 5 contests with most QSOs',
+    contestsQSO: 'QSO',
+
+    // Slides - year over year
+    yearOverYearTitle: '{year} vs {previousYear}',
+    yearOverYearSubtitle: 'Your year compared with {previousYear}',
+
+    // Slides - summary
+    summaryTitle: '{year} wrapped',
+    summaryTitleWithCall: '{callsign} {year} wrapped',
+    summaryQSO: 'QSO',
+    summaryDXCC: 'DXCC',
+    summaryContinents: 'Continents',
+    summaryModes: 'Modes',
+    summaryBands: 'Bands',
+    summaryCQZones: 'CQ Zones',
+    summaryODX: 'ODX',
+    summaryActiveDays: 'Active days',
+
+    // Months
+    months: ['January', 'February', 'March', 'April', 'May', 'June',
+             'July', 'August', 'September', 'October', 'November', 'December'],
+
+    // Days of week
+    days: ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday'],
+
+    // Continents
+    continentNames: {
+        'EU': 'Europe',
+        'NA': 'North America',
+        'SA': 'South America',
+        'AF': 'Africa',
+        'AS': 'Asia',
+        'OC': 'Oceania',
+        'AN': 'Antarctica'
+    }
+});
@@ -0,0 +1,168 @@
+/**
+ * Tłumaczenia Ham Wrapped - polski
+ * Ładowane przez i18n.js tylko wtedy, gdy to język strony
+ */
+
+registerTranslations('pl', {
+    // Strona główna
+    appTitle: 'Ham Wrapped',
+    appSubtitle: 'Twoje krótkofalarskie podsumowanie roku',
+    yourCallsign: 'Twój znak wywoławczy:',
+    callsignPlaceholder: 'np. SP1ABC',
+    yourLocator: 'Twój lokator:',
+    locatorPlaceholder: 'np. KO02MC',
+    locatorHint: 'Potrzebny do obliczenia odległości QSO',
+    uploadTitle: 'Wrzuć swój log ADIF',
+    uploadDragDrop: 'Przeciągnij plik .adi lub .adif tutaj',
+    uploadOr: 'lub',
+    uploadButton: 'Wybierz plik',
+    processing: 'Przetwarzanie...',
+    restart: 'Od nowa',
+    shareLink: 'Kopiuj link',
+    linkCopied: 'Skopiowano!',
+
+    // Slajdy - intro
+    introTitle: 'Twój rok {year}',
+    introTitleWithCall: '{callsign} - rok {year}',
+    introValue: 'HAM WRAPPED',
+    introDescription: 'Odkryj swoje krótkofalarskie podsumowanie roku!',
+    introSubtitle: 'Przesuń, aby zobaczyć statystyki →',
+
+    // Slajdy - QSO
+    totalQSOsTitle: 'Łączności w tym roku',
+    totalQSOsDescription: 'Nawiązałeś {count} QSO!',
+    qsoComment1: 'Dobry początek!',
+    qsoComment2: 'Świetna robota!',
+    qsoComment3: 'Bardzo aktywny rok!',
+    qsoComment4: 'Jesteś prawdziwym DX-erem!',
+    qsoComment5: 'Niesamowite osiągnięcie!',
+    qsoComment6: 'Legenda pasm!',
+
+    // Slajdy - unikalne stacje
+    uniqueCallsignsTitle: 'Unikalne stacje',
+    uniqueCallsignsDescription: 'Miałeś qso z tyloma unikalnymi znakami',
+    uniqueCallsignsSubtitle: 'To średnio {avg} QSO na stację',
+
+    // Slajdy - top callsigns
+    topCallsignsTitle: 'Top 5 stacji',
+    topCallsignsSubtitle: 'Stacje z którymi miałeś najwięcej QSO',
+    favoriteStationTitle: 'Ulubiona stacja',
+
+    // Slajdy - miesiąc
+    bestMonthTitle: 'Twój najlepszy miesiąc',
+    bestMonthDescription: '{count} QSO w tym miesiącu!',
+    bestMonthSubtitle: 'To był Twój najbardziej aktywny miesiąc',
+
+    // Slajdy - dzień
+    bestDayTitle: 'Rekordowy dzień',
+    bestDaySubtitle: 'Twój najbardziej aktywny dzień w roku!',
+
+    // Slajdy - mody
+    favoriteModeTitle: 'Twoja ulubionya emisja',
+    favoriteModeDescription: '{percentage}% wszystkich łączności',
+    favoriteModeSubtitle: '{count} QSO w tej emisji',
+    allModesTitle: 'Rozkład emisji',
+
+    // Slajdy - pasmo
+    favoriteBandTitle: 'Ulubione pasmo',
+    favoriteBandDescription: '{percentage}% łączności',
+    favoriteBandSubtitle: 'Pracowałeś na {count} różnych pasmach',
+    bandDistributionTitle: 'Rozkład pasm',
+    bandDistributionSubtitle: 'Pracowałeś na {count} pasmach',
+
+    // Slajdy - kontynenty
+    continentsTitle: 'Kontynenty',
+    continentsNoData: 'Brak danych o kontynentach',
+    continentsNoDataHint: 'Sprawdź czy plik ADIF zawiera dane o kontynentach',
+    continentsSubtitle: 'Dotarłeś do {count} kontynentów!',
+
+    // Slajdy - DXCC
+    topDXCCTitle: 'Top 5 DXCC',
+    dxccNoData: 'Brak danych o krajach DXCC',
+    dxccNoDataHint: 'Sprawdź czy plik ADIF zawiera poprawne callsigns',
+    dxccSubtitle: 'Pracowałeś z {count} podmiotami DXCC!',
+
+    // Slajdy - Band Slots
+    bandSlotsTitle: 'Band Slots',
+    bandSlotsDescription: 'Unikalne kombinacje DXCC + pasmo',
+    bandSlotsSubtitle: '{dxcc} DXCC na {bands} pasmach',
+    bandSlotsTopTitle: 'Top kraje wg slotów',
+
+    // Slajdy - ODX
+    odxTitle: 'Twój ODX',
+    odxStation: 'Stacja: {call}',
+    odxBand: 'Pasmo: {band}',
+    odxMode: 'Emisja: {mode}',
+
+    // Slajdy - najbliższe QSO
+    closestQSOTitle: 'Najbliższe QSO',
+    unknownCountry: 'Nieznany kraj',
+
+    // Slajdy - QSO Rate
+    qsoRateTitle: 'Najwyższy QSO Rate',
+    qsoRateUnit: 'QSO/h',
+    qsoRateDescription: 'Twój rekord prędkości!',
+    qsoRateSubtitle: 'Osiągnięty: {date}',
+
+    // Slajdy - aktywność
+    activityTitle: 'Twoja aktywność',
+    activeDays: 'Aktywne dni',
+    avgQSOPerDay: 'Średnio QSO/dzień',
+    favoriteDay: 'Ulubiony dzień',
+
+    // Slajdy - szczyt aktywności
+    peakHourTitle: 'Szczyt aktywności',
+    peakHourDescription: 'O tej godzinie najczęściej nadajesz',
+    peakHourSubtitle: '{count} QSO w tej godzinie',
+
+    // Slajdy - serie
+    streaksTitle: 'Najdłuższa seria',
+    streaksUnit: 'dni z rzędu',
+    streaksDescription: 'Tyle dni z rzędu nawiązywałeś łączności!',
+    streaksSubtitle: 'Od {start} do {end}',
+
+    // Slajdy - strefy CQ
+    cqZonesTitle: 'Strefy CQ',
+    cqZonesDescription: 'Z tyloma strefami CQ udało Ci się zrobić łączności!',
+    cqZonesSubtitle: 'Na świecie jest 40 stref CQ',
+
+    // Slajdy - kontesty
+    contestsTitle: 'Kontesty',
+    contestsDescription: 'Brałeś udział w {count} kontestach!',
+    contestsSubtitle: 'Top 5 kontestów z największą liczbą QSO',
+    contestsQSO: 'QSO',
+
+    // Slajdy - rok do roku
+    yearOverYearTitle: '{year} vs {previousYear}',
+    yearOverYearSubtitle: 'Twój rok w porównaniu z {previousYear}',
+
+    // Slajdy - podsumowanie
+    summaryTitle: '{year} wrapped',
+    summaryTitleWithCall: '{callsign} {year} wrapped',
+    summaryQSO: 'QSO',
+    summaryDXCC: 'DXCC',
+    summaryContinents: 'Kontynentów',
+    summaryModes: 'Modów',
+    summaryBands: 'Pasm',
+    summaryCQZones: 'Stref CQ',
+    summaryODX: 'ODX',
+    summaryActiveDays: 'Aktywnych dni',
+
+    // Miesiące
+    months: ['Styczeń', 'Luty', 'Marzec', 'Kwiecień', 'Maj', 'Czerwiec',
+             'Lipiec', 'Sierpień', 'Wrzesień', 'Październik', 'Listopad', 'Grudzień'],
+
+    // Dni tygodnia
+    days: ['Niedziela', 'Poniedziałek', 'Wtorek', 'Środa', 'Czwartek', 'Piątek', 'Sobota'],
+
+    // Kontynenty
+    continentNames: {
+        'EU': 'Europa',
+        'NA': 'Ameryka Płn.',
+        'SA': 'Ameryka Płd.',
+        'AF': 'Afryka',
+        'AS': 'Azja',
+        'OC': 'Oceania',
+        'AN': 'Antarktyda'
+    }
+});
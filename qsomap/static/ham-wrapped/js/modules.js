@@ -0,0 +1,61 @@
+/**
+ * Ham Wrapped - Ładowanie modułów na żądanie
+ *
+ * Strona startowa ładuje tylko ten plik, i18n.js (z tłumaczeniem aktywnego
+ * języka), wrapped-cache.js i app.js. Prezentacja, udostępnianie, parser
+ * i statystyki są doładowywane dopiero wtedy, gdy są potrzebne - link ze
+ * statystykami nie pobiera parsera ani indeksu CTY.
+ * Plik jest też importowany przez adif-worker.js (poza oknem nic nie ładuje).
+ */
+
+// Rok podsumowania Ham Wrapped - QSO z innych lat są pomijane już przy parsowaniu
+const WRAPPED_YEAR = 2025;
+
+// Katalog skryptów Ham Wrapped
+const WRAPPED_SCRIPTS_URL = '/static/ham-wrapped/js/';
+
+// Moduły i ich skrypty (w kolejności wykonania)
+const WRAPPED_MODULES = {
+    presentation: ['presentation.js'],
+    share: ['dxcc-tables.js', 'dxcc-data.js', 'url-share.js'],
+    parser: ['dxcc-tables.js', 'dxcc-data.js', 'callsign-lookup.js', 'adif-parser.js'],
+    statistics: ['dxcc-tables.js', 'dxcc-data.js', 'statistics.js']
+};
+
+// Obietnice załadowania skryptów (każdy skrypt jest pobierany raz)
+const loadedScripts = new Map();
+
+/**
+ * Załaduj skrypt (względem WRAPPED_SCRIPTS_URL)
+ * @param {string} path - Ścieżka skryptu, np. 'locales/pl.js'
+ * @returns {Promise<void>}
+ */
+function loadScript(path) {
+    let promise = loadedScripts.get(path);
+    if (!promise) {
+        promise = new Promise((resolve, reject) => {
+            const script = document.createElement('script');
+            script.src = WRAPPED_SCRIPTS_URL + path;
+            // Skrypty wstawione dynamicznie wykonują się w kolejności wstawienia
+            script.async = false;
+            script.onload = () => resolve();
+            script.onerror = () => {
+                loadedScripts.delete(path);
+                reject(new Error(`Nie udało się załadować ${path}`));
+            };
+            document.head.appendChild(script);
+        });
+        loadedScripts.set(path, promise);
+    }
+    return promise;
+}
+
+/**
+ * Załaduj moduły Ham Wrapped (np. 'presentation', 'share')
+ * @param {...string} names - Nazwy modułów z WRAPPED_MODULES
+ * @returns {Promise<void>}
+ */
+function loadModules(...names) {
+    const paths = new Set(names.flatMap(name => WRAPPED_MODULES[name]));
+    return Promise.all(Array.from(paths, loadScript)).then(() => undefined);
+}
@@ -94,11 +94,17 @@ class Presentation {
             this.addContestsSlide();
         }
 
-        // Slajd 19: Podsumowanie końcowe
+        // Slajd 19: Porównanie z poprzednim rokiem (jeśli log go obejmuje)
+        if (this.stats.yearOverYear) {
+            this.addYearOverYearSlide();
+        }
+
+        // Slajd 20: Podsumowanie końcowe
         this.addSummarySlide();
 
         this.renderSlides();
         this.renderDots();
+        this.updateNavButtons();
     }
 
     /**
@@ -538,6 +544,47 @@ class Presentation {
         });
     }
 
+    /**
+     * Slajd z porównaniem do poprzedniego roku
+     */
+    addYearOverYearSlide() {
+        const previous = this.stats.yearOverYear;
+        const rows = [
+            [t('summaryQSO'), previous.totalQSOs, this.stats.totalQSOs],
+            [t('uniqueCallsignsTitle'), previous.uniqueCallsigns, this.stats.uniqueCallsigns.count],
+            ['DXCC', previous.dxcc, this.stats.byDXCC.count],
+            [t('continentsTitle'), previous.continents, this.stats.byContinent.count],
+            [t('summaryBands'), previous.bands, this.stats.byBand.count],
+            [t('bandSlotsTitle'), previous.bandSlots, this.stats.bandSlots.totalSlots],
+            [t('activeDays'), previous.activeDays, this.stats.activeDays]
+        ];
+        if (previous.odx !== null && this.stats.odx) {
+            rows.push([t('summaryODX'), previous.odx, this.stats.odx.distance, ' km']);
+        }
+
+        this.slides.push({
+            theme: 'theme-5',
+            icon: '⏳',
+            title: t('yearOverYearTitle', { year: this.year, previousYear: previous.year }),
+            type: 'stats',
+            items: rows.map(([label, before, now, unit = '']) => ({
+                label,
+                value: `${this.formatNumber(before)} → ${this.formatNumber(now)}${unit} ${this.formatChange(before, now)}`
+            })),
+            subtitle: t('yearOverYearSubtitle', { previousYear: previous.year })
+        });
+    }
+
+    /**
+     * Zmiana względem poprzedniego roku, np. "(+12%)"
+     */
+    formatChange(before, now) {
+        if (before === now) return '(=)';
+        if (!before) return '(+)';
+        const percent = Math.round(((now - before) / before) * 100);
+        return `(${percent > 0 ? '+' : ''}${percent}%)`;
+    }
+
     /**
      * Slajd podsumowujący - zbiera dane ze wszystkich slajdów
      */
@@ -1,18 +1,83 @@
 /**
  * Statistics Calculator - Oblicza wszystkie statystyki z logu QSO
+ *
+ * Log jest przeglądany raz (accumulate): każde QSO aktualizuje liczniki,
+ * stan ODX / najbliższego QSO, aktywność dni itd. Metody calculate* tylko
+ * finalizują wyniki z tych akumulatorów. Akumulatory mogą być prowadzone
+ * osobno dla każdego roku (calculateByYear) - wciąż w jednym przejściu.
+ * Odległości QSO są liczone raz na log i lokator do kolumny Float64Array,
+ * więc ODX i najbliższe QSO to tylko porównania gotowych liczb.
  */
 
+// Domyślna lokalizacja użytkownika (Polska), gdy brak lokatora i odległości w logu
+const DEFAULT_USER_COORDS = { lat: 52.0, lon: 20.0 };
+
+// Pamięć podręczna na całą sesję: współrzędne lokatorów (lokator -> { lat, lon } lub null)
+// oraz kolumny odległości (log -> lokator użytkownika -> kolumny)
+const locatorCoordsCache = new Map();
+const distanceColumnsCache = new WeakMap();
+
 class StatisticsCalculator {
     constructor(qsos, userLocator = null) {
         this.qsos = qsos;
         this.userLocator = userLocator;
         this.stats = {};
+        this.accumulators = null;
     }
 
     /**
      * Oblicza wszystkie statystyki
      */
     calculateAll() {
+        this.accumulators = null;
+        return this.finalize();
+    }
+
+    /**
+     * Oblicza statystyki osobno dla każdego roku w logu - jedno przejście po
+     * logu, a zmiana roku w prezentacji to tylko odczyt z wyniku
+     * @returns {Object} - Statystyki per rok ({ 2024: {...}, 2025: {...} });
+     *                     yearOverYear zawiera skrót poprzedniego roku lub null
+     */
+    calculateByYear() {
+        const buckets = this.accumulate(qso => (qso.date && Number.isInteger(qso.date.year) ? qso.date.year : null));
+        const years = {};
+
+        for (const [year, acc] of buckets) {
+            this.accumulators = acc;
+            years[year] = this.finalize();
+        }
+        this.accumulators = null;
+
+        for (const year of Object.keys(years)) {
+            const previous = years[year - 1];
+            years[year].yearOverYear = previous ? this.summarizeYear(year - 1, previous) : null;
+        }
+
+        return years;
+    }
+
+    /**
+     * Skrót statystyk roku do porównania rok do roku
+     */
+    summarizeYear(year, stats) {
+        return {
+            year,
+            totalQSOs: stats.totalQSOs,
+            uniqueCallsigns: stats.uniqueCallsigns.count,
+            dxcc: stats.byDXCC.count,
+            continents: stats.byContinent.count,
+            bands: stats.byBand.count,
+            bandSlots: stats.bandSlots.totalSlots,
+            activeDays: stats.activeDays,
+            odx: stats.odx ? stats.odx.distance : null
+        };
+    }
+
+    /**
+     * Zbiera statystyki z bieżących akumulatorów
+     */
+    finalize() {
         this.stats = {
             totalQSOs: this.calculateTotalQSOs(),
             uniqueCallsigns: this.calculateUniqueCallsigns(),
@@ -43,18 +108,445 @@ class StatisticsCalculator {
         return this.stats;
     }
 
+    /**
+     * Akumulatory wszystkich statystyk (liczone przy pierwszym użyciu)
+     */
+    getAccumulators() {
+        if (!this.accumulators) {
+            this.accumulators = this.accumulate(() => 'all').get('all') || this.createAccumulators();
+        }
+        return this.accumulators;
+    }
+
+    /**
+     * Puste akumulatory
+     */
+    createAccumulators() {
+        const acc = {
+            total: 0,
+            callsigns: new Set(),
+            callsignCounts: {},
+            months: {},
+            days: {},
+            activeDayKeys: new Set(),
+            daysOfWeek: { 0: 0, 1: 0, 2: 0, 3: 0, 4: 0, 5: 0, 6: 0 },
+            hours: {},
+            modes: {},
+            bands: {},
+            continents: {},
+            countries: {},
+            zones: {},
+            odx: null,
+            closest: null,
+            estimatedOdx: null,
+            hourlyBuckets: {},
+            dayActivity: {},
+            firstQSO: null,
+            lastQSO: null,
+            contests: {},
+            special: { satellite: 0, sota: 0, pota: 0, iota: 0, wwff: 0 },
+            slots: new Set(),
+            slotsByDxcc: {},
+            slotsByBand: {}
+        };
+        for (let i = 0; i < 24; i++) acc.hours[i] = 0;
+        return acc;
+    }
+
+    /**
+     * Jedno przejście po logu - aktualizuje akumulatory grupy, do której należy QSO
+     * @param {Function} groupOf - Klucz grupy QSO (np. rok); null pomija QSO
+     * @returns {Map} - Akumulatory per grupa, w kolejności pierwszego wystąpienia
+     */
+    accumulate(groupOf) {
+        const groups = new Map();
+
+        // Pamięć podręczna wyszukiwań - kraje i godziny powtarzają się w logu
+        // (wspólna dla wszystkich grup)
+        this.dxccByName = new Map();
+        const caches = {
+            ...this.getDistanceColumns(),
+            hourKeys: new Map()
+        };
+
+        for (let i = 0; i < this.qsos.length; i++) {
+            const qso = this.qsos[i];
+            const group = groupOf(qso);
+            if (group === null) continue;
+
+            let acc = groups.get(group);
+            if (!acc) {
+                acc = this.createAccumulators();
+                groups.set(group, acc);
+            }
+            this.addQSO(acc, qso, i, caches);
+        }
+
+        return groups;
+    }
+
+    /**
+     * Kolumny odległości logu dla lokatora użytkownika - liczone raz na sesję
+     * @returns {Object} - { distances, estimated }: Float64Array indeksowane jak
+     *                     this.qsos, NaN gdy odległość nieznana; estimated (tylko bez
+     *                     lokatora) - szacunek od DEFAULT_USER_COORDS do współrzędnych DXCC
+     */
+    getDistanceColumns() {
+        let byLocator = distanceColumnsCache.get(this.qsos);
+        if (!byLocator) {
+            byLocator = new Map();
+            distanceColumnsCache.set(this.qsos, byLocator);
+        }
+
+        const key = this.userLocator || '';
+        let columns = byLocator.get(key);
+        if (!columns) {
+            columns = this.computeDistanceColumns();
+            byLocator.set(key, columns);
+        }
+        return columns;
+    }
+
+    /**
+     * Oblicz kolumny odległości (getDistanceColumns) - jedno przejście po logu,
+     * każdy lokator i kraj DXCC jest liczony tylko raz
+     */
+    computeDistanceColumns() {
+        const count = this.qsos.length;
+        const distances = new Float64Array(count).fill(NaN);
+        const estimated = this.userLocator ? null : new Float64Array(count).fill(NaN);
+        const userCoords = this.userLocator ? this.locatorToCoords(this.userLocator) : null;
+        const gridDistances = new Map();
+        const dxccDistances = new Map();
+
+        for (let i = 0; i < count; i++) {
+            const qso = this.qsos[i];
+
+            if (this.userLocator) {
+                if (!userCoords) break;
+
+                let distance = null;
+                if (qso.gridsquare) {
+                    distance = gridDistances.get(qso.gridsquare);
+                    if (distance === undefined) {
+                        const coords = this.locatorToCoords(qso.gridsquare);
+                        distance = coords ? this.calculateDistance(userCoords, coords) : null;
+                        gridDistances.set(qso.gridsquare, distance);
+                    }
+                }
+                if (distance === null) {
+                    distance = this.getDxccDistance(dxccDistances, userCoords, this.getDxccInfo(qso));
+                }
+                if (distance !== null) {
+                    distances[i] = distance;
+                }
+            } else {
+                // Odległość z logu (pole DISTANCE), a oprócz niej szacunek z DXCC
+                if (qso.distance) {
+                    distances[i] = qso.distance;
+                }
+                const distance = this.getDxccDistance(dxccDistances, DEFAULT_USER_COORDS, this.getDxccInfo(qso));
+                if (distance !== null) {
+                    estimated[i] = distance;
+                }
+            }
+        }
+
+        return { distances, estimated };
+    }
+
+    /**
+     * Dodaje QSO do akumulatorów
+     * @param {number} index - Indeks QSO w this.qsos (wiersz kolumn odległości)
+     */
+    addQSO(acc, qso, index, caches) {
+        const { distances, estimated, hourKeys } = caches;
+        const dxccInfo = this.getDxccInfo(qso);
+        acc.total++;
+
+        // Znaki wywoławcze
+        acc.callsigns.add(qso.call);
+        if (qso.call) {
+            acc.callsignCounts[qso.call] = (acc.callsignCounts[qso.call] || 0) + 1;
+        }
+
+        // Miesiące, dni, serie
+        let dayKey = null;
+        if (qso.date) {
+            acc.months[qso.date.month] = (acc.months[qso.date.month] || 0) + 1;
+
+            dayKey = `${qso.date.year}-${String(qso.date.month).padStart(2, '0')}-${String(qso.date.day).padStart(2, '0')}`;
+            if (acc.days[dayKey] === undefined) {
+                acc.days[dayKey] = 0;
+                acc.activeDayKeys.add(`${qso.date.year}-${qso.date.month}-${qso.date.day}`);
+            }
+            acc.days[dayKey]++;
+        }
+
+        if (qso.datetime) {
+            acc.daysOfWeek[qso.datetime.getDay()]++;
+            this.updateFirstLast(acc, qso);
+        }
+
+        if (qso.timeOn) {
+            acc.hours[qso.timeOn.hours]++;
+        }
+
+        // Mody i pasma
+        const mode = qso.submode || qso.mode || 'UNKNOWN';
+        acc.modes[mode] = (acc.modes[mode] || 0) + 1;
+
+        const band = qso.band || 'UNKNOWN';
+        acc.bands[band] = (acc.bands[band] || 0) + 1;
+
+        // Kontynenty i strefy CQ - z QSO, a jeśli brak, z DXCC
+        const continent = qso.continent || (dxccInfo ? dxccInfo.continent : undefined);
+        if (continent) {
+            acc.continents[continent] = (acc.continents[continent] || 0) + 1;
+        }
+
+        const zone = qso.cqZone || (dxccInfo ? dxccInfo.cqZone : undefined);
+        if (zone) {
+            const zoneNum = parseInt(zone, 10);
+            // Walidacja: strefa CQ musi być liczbą od 1 do 40
+            if (!isNaN(zoneNum) && zoneNum >= 1 && zoneNum <= 40) {
+                acc.zones[zoneNum] = (acc.zones[zoneNum] || 0) + 1;
+            }
+        }
+
+        this.updateCountries(acc, qso);
+        this.updateBandSlots(acc, qso, dxccInfo);
+
+        // ODX i najbliższe QSO - odległości z kolumny (NaN nie przechodzi porównań)
+        const distance = distances[index];
+        if (distance > (acc.odx ? acc.odx.distance : 0)) {
+            acc.odx = { qso, distance };
+        }
+        if (distance > 0 && distance < (acc.closest ? acc.closest.distance : Infinity)) {
+            acc.closest = { qso, distance };
+        }
+
+        // Oszacowanie ODX na podstawie DXCC, jeśli log nie zawiera odległości
+        if (estimated && estimated[index] > (acc.estimatedOdx ? acc.estimatedOdx.distance : 0)) {
+            acc.estimatedOdx = { qso, distance: estimated[index], dxccInfo };
+        }
+
+        // QSO rate - klucz: data + godzina w formacie ISO z :00:00
+        let hourKey = null;
+        if (qso.datetime && !isNaN(qso.datetime.getTime())) {
+            const hour = Math.floor(qso.datetime.getTime() / 3600000);
+            hourKey = hourKeys.get(hour);
+            if (hourKey === undefined) {
+                hourKey = qso.datetime.toISOString().substring(0, 13) + ':00:00.000Z';
+                hourKeys.set(hour, hourKey);
+            }
+        } else if (qso.date && qso.timeOn) {
+            // Fallback - utwórz klucz z date i timeOn
+            hourKey = `${dayKey}T${String(qso.timeOn.hours).padStart(2, '0')}:00:00.000Z`;
+        }
+        if (hourKey) {
+            acc.hourlyBuckets[hourKey] = (acc.hourlyBuckets[hourKey] || 0) + 1;
+        }
+
+        // Aktywność w ciągu dnia
+        if (qso.datetime && qso.date) {
+            let activity = acc.dayActivity[dayKey];
+            if (!activity) {
+                activity = acc.dayActivity[dayKey] = {
+                    firstQSO: qso.datetime,
+                    lastQSO: qso.datetime,
+                    count: 0
+                };
+            }
+            if (qso.datetime < activity.firstQSO) {
+                activity.firstQSO = qso.datetime;
+            }
+            if (qso.datetime > activity.lastQSO) {
+                activity.lastQSO = qso.datetime;
+            }
+            activity.count++;
+        }
+
+        // Zawody i specjalne aktywności
+        if (qso.contestId) {
+            acc.contests[qso.contestId] = (acc.contests[qso.contestId] || 0) + 1;
+        }
+        if (qso.satName || qso.propMode === 'SAT') acc.special.satellite++;
+        if (qso.sotaRef) acc.special.sota++;
+        if (qso.potaRef) acc.special.pota++;
+        if (qso.iota) acc.special.iota++;
+        if (qso.wwffRef) acc.special.wwff++;
+    }
+
+    /**
+     * Dane DXCC dla QSO - po numerze DXCC, a jeśli brak, po nazwie kraju
+     */
+    getDxccInfo(qso) {
+        if (qso.dxcc && DXCC_DATA[qso.dxcc]) {
+            return DXCC_DATA[qso.dxcc];
+        }
+        if (qso.country && window.findDxccByName) {
+            if (!this.dxccByName.has(qso.country)) {
+                this.dxccByName.set(qso.country, window.findDxccByName(qso.country));
+            }
+            return this.dxccByName.get(qso.country);
+        }
+        return null;
+    }
+
+    /**
+     * Odległość do współrzędnych DXCC (null jeśli brak współrzędnych)
+     */
+    getDxccDistance(cache, origin, dxccInfo) {
+        if (!dxccInfo || !dxccInfo.lat || !dxccInfo.lon) return null;
+
+        let distance = cache.get(dxccInfo);
+        if (distance === undefined) {
+            distance = this.calculateDistance(origin, { lat: dxccInfo.lat, lon: dxccInfo.lon });
+            cache.set(dxccInfo, distance);
+        }
+        return distance;
+    }
+
+    /**
+     * Nazwa kraju QSO - priorytet: qso.country (z callsign lookup), potem DXCC_DATA
+     */
+    getCountryName(qso) {
+        let countryName = qso.country;
+        if (!countryName && qso.dxcc && DXCC_DATA[qso.dxcc]) {
+            countryName = DXCC_DATA[qso.dxcc].name;
+        }
+        return countryName;
+    }
+
+    /**
+     * Aktualizuj pierwsze i ostatnie QSO (przy równym czasie wygrywa wcześniejsze w logu)
+     */
+    updateFirstLast(acc, qso) {
+        if (!acc.firstQSO || qso.datetime < acc.firstQSO.datetime || isNaN(acc.firstQSO.datetime.getTime())) {
+            acc.firstQSO = qso;
+        }
+        if (!acc.lastQSO || qso.datetime > acc.lastQSO.datetime || isNaN(acc.lastQSO.datetime.getTime())) {
+            acc.lastQSO = qso;
+        }
+    }
+
+    /**
+     * Zlicz QSO per kraj DXCC
+     */
+    updateCountries(acc, qso) {
+        // Użyj DXCC z qso lub spróbuj znaleźć na podstawie kraju
+        let dxccKey = qso.dxcc;
+        let countryName = qso.country;
+
+        if (dxccKey) {
+            const dxccInfo = DXCC_DATA[dxccKey];
+            if (dxccInfo) {
+                countryName = dxccInfo.name;
+            }
+        } else if (countryName) {
+            // Użyj nazwy kraju jako klucza jeśli brak DXCC
+            dxccKey = countryName;
+        }
+
+        if (dxccKey) {
+            if (!acc.countries[dxccKey]) {
+                acc.countries[dxccKey] = {
+                    dxcc: qso.dxcc || null,
+                    name: countryName || `DXCC ${dxccKey}`,
+                    count: 0
+                };
+            }
+            acc.countries[dxccKey].count++;
+        }
+    }
+
+    /**
+     * Dodaj band slot (unikalna kombinacja DXCC + pasmo)
+     */
+    updateBandSlots(acc, qso, dxccInfo) {
+        // Pobierz DXCC - z qso.dxcc lub z nazwy kraju
+        let dxccKey = qso.dxcc;
+        let dxccName = qso.country;
+
+        if (dxccKey && DXCC_DATA[dxccKey]) {
+            dxccName = DXCC_DATA[dxccKey].name;
+        } else if (dxccInfo) {
+            dxccKey = dxccInfo.dxcc || dxccName;
+        }
+
+        const band = qso.band;
+
+        // Potrzebujemy zarówno DXCC jak i pasma
+        if (!(dxccKey || dxccName) || !band) return;
+
+        const entityKey = dxccKey || dxccName;
+        const slotKey = `${entityKey}::${band}`;
+        if (acc.slots.has(slotKey)) return;
+
+        acc.slots.add(slotKey);
+
+        // Zlicz sloty per DXCC
+        if (!acc.slotsByDxcc[entityKey]) {
+            acc.slotsByDxcc[entityKey] = {
+                name: dxccName || `DXCC ${entityKey}`,
+                bands: new Set(),
+                count: 0
+            };
+        }
+        acc.slotsByDxcc[entityKey].bands.add(band);
+        acc.slotsByDxcc[entityKey].count++;
+
+        // Zlicz sloty per Band
+        if (!acc.slotsByBand[band]) {
+            acc.slotsByBand[band] = new Set();
+        }
+        acc.slotsByBand[band].add(entityKey);
+    }
+
+    /**
+     * Wpis z największą wartością (przy remisie pierwszy)
+     */
+    findBest(distribution) {
+        let best = null;
+        let max = 0;
+
+        for (const [key, count] of Object.entries(distribution)) {
+            if (count > max) {
+                max = count;
+                best = key;
+            }
+        }
+
+        return { key: best, count: max };
+    }
+
+    /**
+     * Posortowany rozkład z procentami
+     */
+    sortDistribution(distribution, name) {
+        const total = this.getAccumulators().total;
+        return Object.entries(distribution)
+            .sort((a, b) => b[1] - a[1])
+            .map(([key, count]) => ({
+                [name]: key,
+                count,
+                percentage: ((count / total) * 100).toFixed(1)
+            }));
+    }
+
     /**
      * Całkowita liczba QSO
      */
     calculateTotalQSOs() {
-        return this.qsos.length;
+        return this.getAccumulators().total;
     }
 
     /**
      * Unikalne znaki wywoławcze
      */
     calculateUniqueCallsigns() {
-        const callsigns = new Set(this.qsos.map(qso => qso.call));
+        const callsigns = this.getAccumulators().callsigns;
         return {
             count: callsigns.size,
             list: Array.from(callsigns)
@@ -65,22 +557,8 @@ class StatisticsCalculator {
      * Top callsigns - stacje z największą liczbą QSO
      */
     calculateTopCallsigns() {
-        const callsignCounts = {};
-
-        this.qsos.forEach(qso => {
-            if (qso.call) {
-                callsignCounts[qso.call] = (callsignCounts[qso.call] || 0) + 1;
-            }
-        });
-
         // Sortuj według liczby QSO malejąco
-        const sorted = Object.entries(callsignCounts)
-            .sort((a, b) => b[1] - a[1])
-            .map(([call, count]) => ({
-                call,
-                count,
-                percentage: ((count / this.qsos.length) * 100).toFixed(1)
-            }));
+        const sorted = this.sortDistribution(this.getAccumulators().callsignCounts, 'call');
 
         return {
             top5: sorted.slice(0, 5),
@@ -93,31 +571,16 @@ class StatisticsCalculator {
      * QSO według miesięcy
      */
     calculateByMonth() {
-        const months = {};
-
-        this.qsos.forEach(qso => {
-            if (qso.date) {
-                const monthKey = qso.date.month;
-                months[monthKey] = (months[monthKey] || 0) + 1;
-            }
-        });
+        const months = this.getAccumulators().months;
 
         // Znajdź miesiąc z największą liczbą QSO
-        let bestMonth = null;
-        let maxQSOs = 0;
-
-        for (const [month, count] of Object.entries(months)) {
-            if (count > maxQSOs) {
-                maxQSOs = count;
-                bestMonth = parseInt(month);
-            }
-        }
+        const best = this.findBest(months);
 
         return {
             distribution: months,
             best: {
-                month: bestMonth,
-                count: maxQSOs
+                month: best.key === null ? null : parseInt(best.key),
+                count: best.count
             }
         };
     }
@@ -126,31 +589,16 @@ class StatisticsCalculator {
      * QSO według dni (znajdź dzień z największą aktywnością)
      */
     calculateByDay() {
-        const days = {};
-
-        this.qsos.forEach(qso => {
-            if (qso.date) {
-                const dayKey = `${qso.date.year}-${String(qso.date.month).padStart(2, '0')}-${String(qso.date.day).padStart(2, '0')}`;
-                days[dayKey] = (days[dayKey] || 0) + 1;
-            }
-        });
+        const days = this.getAccumulators().days;
 
         // Znajdź dzień z największą liczbą QSO
-        let bestDay = null;
-        let maxQSOs = 0;
-
-        for (const [day, count] of Object.entries(days)) {
-            if (count > maxQSOs) {
-                maxQSOs = count;
-                bestDay = day;
-            }
-        }
+        const best = this.findBest(days);
 
         return {
             distribution: days,
             best: {
-                date: bestDay,
-                count: maxQSOs
+                date: best.key,
+                count: best.count
             }
         };
     }
@@ -159,32 +607,18 @@ class StatisticsCalculator {
      * QSO według dnia tygodnia
      */
     calculateByDayOfWeek() {
-        const days = { 0: 0, 1: 0, 2: 0, 3: 0, 4: 0, 5: 0, 6: 0 };
-
-        this.qsos.forEach(qso => {
-            if (qso.datetime) {
-                const dayOfWeek = qso.datetime.getDay();
-                days[dayOfWeek]++;
-            }
-        });
+        const days = this.getAccumulators().daysOfWeek;
 
         // Znajdź najpopularniejszy dzień
-        let bestDay = 0;
-        let maxQSOs = 0;
-
-        for (const [day, count] of Object.entries(days)) {
-            if (count > maxQSOs) {
-                maxQSOs = count;
-                bestDay = parseInt(day);
-            }
-        }
+        const best = this.findBest(days);
+        const bestDay = best.key === null ? 0 : parseInt(best.key);
 
         return {
             distribution: days,
             best: {
                 day: bestDay,
                 dayIndex: bestDay,
-                count: maxQSOs
+                count: best.count
             }
         };
     }
@@ -193,31 +627,16 @@ class StatisticsCalculator {
      * QSO według godziny (UTC)
      */
     calculateByHour() {
-        const hours = {};
-        for (let i = 0; i < 24; i++) hours[i] = 0;
-
-        this.qsos.forEach(qso => {
-            if (qso.timeOn) {
-                hours[qso.timeOn.hours]++;
-            }
-        });
+        const hours = this.getAccumulators().hours;
 
         // Znajdź najpopularniejszą godzinę
-        let peakHour = 0;
-        let maxQSOs = 0;
-
-        for (const [hour, count] of Object.entries(hours)) {
-            if (count > maxQSOs) {
-                maxQSOs = count;
-                peakHour = parseInt(hour);
-            }
-        }
+        const peak = this.findBest(hours);
 
         return {
             distribution: hours,
             peak: {
-                hour: peakHour,
-                count: maxQSOs
+                hour: peak.key === null ? 0 : parseInt(peak.key),
+                count: peak.count
             }
         };
     }
@@ -226,21 +645,10 @@ class StatisticsCalculator {
      * QSO według modu (SSB, CW, FT8 itp.)
      */
     calculateByMode() {
-        const modes = {};
-
-        this.qsos.forEach(qso => {
-            const mode = qso.submode || qso.mode || 'UNKNOWN';
-            modes[mode] = (modes[mode] || 0) + 1;
-        });
+        const modes = this.getAccumulators().modes;
 
         // Sortuj według popularności
-        const sorted = Object.entries(modes)
-            .sort((a, b) => b[1] - a[1])
-            .map(([mode, count]) => ({
-                mode,
-                count,
-                percentage: ((count / this.qsos.length) * 100).toFixed(1)
-            }));
+        const sorted = this.sortDistribution(modes, 'mode');
 
         return {
             distribution: modes,
@@ -253,21 +661,10 @@ class StatisticsCalculator {
      * QSO według pasma
      */
     calculateByBand() {
-        const bands = {};
-
-        this.qsos.forEach(qso => {
-            const band = qso.band || 'UNKNOWN';
-            bands[band] = (bands[band] || 0) + 1;
-        });
+        const bands = this.getAccumulators().bands;
 
         // Sortuj według popularności
-        const sorted = Object.entries(bands)
-            .sort((a, b) => b[1] - a[1])
-            .map(([band, count]) => ({
-                band,
-                count,
-                percentage: ((count / this.qsos.length) * 100).toFixed(1)
-            }));
+        const sorted = this.sortDistribution(bands, 'band');
 
         return {
             distribution: bands,
@@ -281,40 +678,11 @@ class StatisticsCalculator {
      * QSO według kontynentu
      */
     calculateByContinent() {
-        const continents = {};
-
-        this.qsos.forEach(qso => {
-            let continent = qso.continent;
-
-            // Jeśli brak kontynentu w QSO, spróbuj pobrać z DXCC lub nazwy kraju
-            if (!continent) {
-                if (qso.dxcc && DXCC_DATA[qso.dxcc]) {
-                    continent = DXCC_DATA[qso.dxcc].continent;
-                } else if (qso.country && window.findDxccByName) {
-                    const dxccInfo = window.findDxccByName(qso.country);
-                    if (dxccInfo) {
-                        continent = dxccInfo.continent;
-                    }
-                }
-            }
-
-            if (continent) {
-                continents[continent] = (continents[continent] || 0) + 1;
-            }
-        });
-
-        // Oblicz procenty i sortuj
-        const sorted = Object.entries(continents)
-            .sort((a, b) => b[1] - a[1])
-            .map(([cont, count]) => ({
-                continent: cont,
-                count,
-                percentage: ((count / this.qsos.length) * 100).toFixed(1)
-            }));
+        const continents = this.getAccumulators().continents;
 
         return {
             distribution: continents,
-            sorted,
+            sorted: this.sortDistribution(continents, 'continent'),
             count: Object.keys(continents).length
         };
     }
@@ -323,34 +691,7 @@ class StatisticsCalculator {
      * QSO według kraju DXCC
      */
     calculateByDXCC() {
-        const countries = {};
-
-        this.qsos.forEach(qso => {
-            // Użyj DXCC z qso lub spróbuj znaleźć na podstawie kraju
-            let dxccKey = qso.dxcc;
-            let countryName = qso.country;
-
-            if (dxccKey) {
-                const dxccInfo = DXCC_DATA[dxccKey];
-                if (dxccInfo) {
-                    countryName = dxccInfo.name;
-                }
-            } else if (countryName) {
-                // Użyj nazwy kraju jako klucza jeśli brak DXCC
-                dxccKey = countryName;
-            }
-
-            if (dxccKey) {
-                if (!countries[dxccKey]) {
-                    countries[dxccKey] = {
-                        dxcc: qso.dxcc || null,
-                        name: countryName || `DXCC ${dxccKey}`,
-                        count: 0
-                    };
-                }
-                countries[dxccKey].count++;
-            }
-        });
+        const countries = this.getAccumulators().countries;
 
         // Sortuj według liczby QSO
         const sorted = Object.values(countries)
@@ -370,31 +711,7 @@ class StatisticsCalculator {
      * QSO według strefy CQ
      */
     calculateByCQZone() {
-        const zones = {};
-
-        this.qsos.forEach(qso => {
-            let zone = qso.cqZone;
-
-            // Jeśli brak strefy w QSO, spróbuj pobrać z DXCC lub nazwy kraju
-            if (!zone) {
-                if (qso.dxcc && DXCC_DATA[qso.dxcc]) {
-                    zone = DXCC_DATA[qso.dxcc].cqZone;
-                } else if (qso.country && window.findDxccByName) {
-                    const dxccInfo = window.findDxccByName(qso.country);
-                    if (dxccInfo) {
-                        zone = dxccInfo.cqZone;
-                    }
-                }
-            }
-
-            // Walidacja: strefa CQ musi być liczbą od 1 do 40
-            if (zone) {
-                const zoneNum = parseInt(zone, 10);
-                if (!isNaN(zoneNum) && zoneNum >= 1 && zoneNum <= 40) {
-                    zones[zoneNum] = (zones[zoneNum] || 0) + 1;
-                }
-            }
-        });
+        const zones = this.getAccumulators().zones;
 
         return {
             distribution: zones,
@@ -404,224 +721,52 @@ class StatisticsCalculator {
 
     /**
      * Oblicz ODX (najdalszą łączność)
+     *
+     * Bez lokatora użytkownika używa odległości z logu, a jeśli log ich nie
+     * zawiera, szacuje ODX na podstawie współrzędnych DXCC.
      */
     calculateODX() {
-        if (!this.userLocator) {
-            return this.calculateODXFromLog();
+        const acc = this.getAccumulators();
+
+        if (acc.odx) {
+            return {
+                ...acc.odx.qso,
+                distance: acc.odx.distance,
+                dxccName: this.getCountryName(acc.odx.qso)
+            };
         }
-
-        const userCoords = this.locatorToCoords(this.userLocator);
-        if (!userCoords) return null;
-
-        let maxDistance = 0;
-        let odxQSO = null;
-
-        this.qsos.forEach(qso => {
-            let targetCoords = null;
-
-            // Próbuj użyć gridsquare z QSO
-            if (qso.gridsquare) {
-                targetCoords = this.locatorToCoords(qso.gridsquare);
-            }
-
-            // Jeśli brak, użyj współrzędnych DXCC (najpierw po ID, potem po nazwie)
-            if (!targetCoords) {
-                let dxccInfo = null;
-                if (qso.dxcc && DXCC_DATA[qso.dxcc]) {
-                    dxccInfo = DXCC_DATA[qso.dxcc];
-                } else if (qso.country && window.findDxccByName) {
-                    dxccInfo = window.findDxccByName(qso.country);
-                }
-                if (dxccInfo && dxccInfo.lat && dxccInfo.lon) {
-                    targetCoords = { lat: dxccInfo.lat, lon: dxccInfo.lon };
-                }
-            }
-
-            if (targetCoords) {
-                const distance = this.calculateDistance(userCoords, targetCoords);
-                if (distance > maxDistance) {
-                    maxDistance = distance;
-                    // Priorytet: qso.country (z callsign lookup), potem DXCC_DATA
-                    let countryName = qso.country;
-                    if (!countryName && qso.dxcc && DXCC_DATA[qso.dxcc]) {
-                        countryName = DXCC_DATA[qso.dxcc].name;
-                    }
-                    odxQSO = {
-                        ...qso,
-                        distance,
-                        dxccName: countryName
-                    };
-                }
-            }
-        });
-
-        return odxQSO;
-    }
-
-    /**
-     * Oblicz ODX z danych w logu (jeśli zawierają distance)
-     */
-    calculateODXFromLog() {
-        let maxDistance = 0;
-        let odxQSO = null;
-
-        this.qsos.forEach(qso => {
-            if (qso.distance && qso.distance > maxDistance) {
-                maxDistance = qso.distance;
-                // Priorytet: qso.country (z callsign lookup), potem DXCC_DATA
-                let countryName = qso.country;
-                if (!countryName && qso.dxcc && DXCC_DATA[qso.dxcc]) {
-                    countryName = DXCC_DATA[qso.dxcc].name;
-                }
-                odxQSO = {
-                    ...qso,
-                    dxccName: countryName
-                };
-            }
-        });
-
-        // Jeśli brak distance w logu, oszacuj na podstawie DXCC
-        if (!odxQSO) {
-            // Załóż że użytkownik jest z Polski (domyślnie)
-            const defaultUserCoords = { lat: 52.0, lon: 20.0 };
-
-            this.qsos.forEach(qso => {
-                let dxccInfo = null;
-                if (qso.dxcc && DXCC_DATA[qso.dxcc]) {
-                    dxccInfo = DXCC_DATA[qso.dxcc];
-                } else if (qso.country && window.findDxccByName) {
-                    dxccInfo = window.findDxccByName(qso.country);
-                }
-
-                if (dxccInfo && dxccInfo.lat && dxccInfo.lon) {
-                    const targetCoords = { lat: dxccInfo.lat, lon: dxccInfo.lon };
-                    const distance = this.calculateDistance(defaultUserCoords, targetCoords);
-
-                    if (distance > maxDistance) {
-                        maxDistance = distance;
-                        // Priorytet: qso.country (z callsign lookup), potem DXCC_DATA
-                        let countryName = qso.country || dxccInfo.name;
-                        odxQSO = {
-                            ...qso,
-                            distance,
-                            dxccName: countryName
-                        };
-                    }
-                }
-            });
+        if (!this.userLocator && acc.estimatedOdx) {
+            const { qso, distance, dxccInfo } = acc.estimatedOdx;
+            return {
+                ...qso,
+                distance,
+                dxccName: qso.country || dxccInfo.name
+            };
         }
-
-        return odxQSO;
+        return null;
     }
 
     /**
      * Oblicz najbliższą łączność
      */
     calculateClosestQSO() {
-        if (!this.userLocator) {
-            return this.calculateClosestFromLog();
-        }
-
-        const userCoords = this.locatorToCoords(this.userLocator);
-        if (!userCoords) return null;
-
-        let minDistance = Infinity;
-        let closestQSO = null;
-
-        this.qsos.forEach(qso => {
-            let targetCoords = null;
-
-            if (qso.gridsquare) {
-                targetCoords = this.locatorToCoords(qso.gridsquare);
-            }
-
-            // Jeśli brak gridsquare, użyj współrzędnych DXCC
-            if (!targetCoords) {
-                let dxccInfo = null;
-                if (qso.dxcc && DXCC_DATA[qso.dxcc]) {
-                    dxccInfo = DXCC_DATA[qso.dxcc];
-                } else if (qso.country && window.findDxccByName) {
-                    dxccInfo = window.findDxccByName(qso.country);
-                }
-                if (dxccInfo && dxccInfo.lat && dxccInfo.lon) {
-                    targetCoords = { lat: dxccInfo.lat, lon: dxccInfo.lon };
-                }
-            }
-
-            if (targetCoords) {
-                const distance = this.calculateDistance(userCoords, targetCoords);
-                if (distance > 0 && distance < minDistance) {
-                    minDistance = distance;
-                    // Priorytet: qso.country (z callsign lookup), potem DXCC_DATA
-                    let countryName = qso.country;
-                    if (!countryName && qso.dxcc && DXCC_DATA[qso.dxcc]) {
-                        countryName = DXCC_DATA[qso.dxcc].name;
-                    }
-                    closestQSO = {
-                        ...qso,
-                        distance,
-                        dxccName: countryName
-                    };
-                }
-            }
-        });
-
-        return closestQSO;
-    }
-
-    /**
-     * Oblicz najbliższe QSO z danych w logu
-     */
-    calculateClosestFromLog() {
-        let minDistance = Infinity;
-        let closestQSO = null;
-
-        this.qsos.forEach(qso => {
-            if (qso.distance && qso.distance > 0 && qso.distance < minDistance) {
-                minDistance = qso.distance;
-                // Priorytet: qso.country (z callsign lookup), potem DXCC_DATA
-                let countryName = qso.country;
-                if (!countryName && qso.dxcc && DXCC_DATA[qso.dxcc]) {
-                    countryName = DXCC_DATA[qso.dxcc].name;
-                }
-                closestQSO = {
-                    ...qso,
-                    dxccName: countryName
-                };
-            }
-        });
+        const closest = this.getAccumulators().closest;
+        if (!closest) return null;
 
-        return closestQSO;
+        return {
+            ...closest.qso,
+            distance: closest.distance,
+            dxccName: this.getCountryName(closest.qso)
+        };
     }
 
     /**
      * Oblicz najwyższy QSO rate (QSO na godzinę)
      */
     calculateQSORate() {
-        const hourlyBuckets = {};
-
-        this.qsos.forEach(qso => {
-            if (qso.datetime && !isNaN(qso.datetime.getTime())) {
-                // Klucz: data + godzina w formacie ISO z :00:00
-                const hourKey = qso.datetime.toISOString().substring(0, 13) + ':00:00.000Z';
-                hourlyBuckets[hourKey] = (hourlyBuckets[hourKey] || 0) + 1;
-            } else if (qso.date && qso.timeOn) {
-                // Fallback - utwórz klucz z date i timeOn
-                const hourKey = `${qso.date.year}-${String(qso.date.month).padStart(2, '0')}-${String(qso.date.day).padStart(2, '0')}T${String(qso.timeOn.hours).padStart(2, '0')}:00:00.000Z`;
-                hourlyBuckets[hourKey] = (hourlyBuckets[hourKey] || 0) + 1;
-            }
-        });
-
         // Znajdź maksymalny rate
-        let maxRate = 0;
-        let peakHour = null;
-
-        for (const [hour, count] of Object.entries(hourlyBuckets)) {
-            if (count > maxRate) {
-                maxRate = count;
-                peakHour = hour;
-            }
-        }
+        const peak = this.findBest(this.getAccumulators().hourlyBuckets);
+        const peakHour = peak.key;
 
         // Utwórz datę z peakHour
         let peakDate = null;
@@ -634,7 +779,7 @@ class StatisticsCalculator {
         }
 
         return {
-            maxRate,
+            maxRate: peak.count,
             peakHour,
             peakDate
         };
@@ -644,35 +789,11 @@ class StatisticsCalculator {
      * Znajdź dzień z najdłuższą aktywnością
      */
     calculateLongestDay() {
-        const dayActivity = {};
-
-        this.qsos.forEach(qso => {
-            if (qso.datetime && qso.date) {
-                const dayKey = `${qso.date.year}-${String(qso.date.month).padStart(2, '0')}-${String(qso.date.day).padStart(2, '0')}`;
-
-                if (!dayActivity[dayKey]) {
-                    dayActivity[dayKey] = {
-                        firstQSO: qso.datetime,
-                        lastQSO: qso.datetime,
-                        count: 0
-                    };
-                }
-
-                if (qso.datetime < dayActivity[dayKey].firstQSO) {
-                    dayActivity[dayKey].firstQSO = qso.datetime;
-                }
-                if (qso.datetime > dayActivity[dayKey].lastQSO) {
-                    dayActivity[dayKey].lastQSO = qso.datetime;
-                }
-                dayActivity[dayKey].count++;
-            }
-        });
-
         // Oblicz czas trwania dla każdego dnia
         let longestDay = null;
         let maxDuration = 0;
 
-        for (const [day, activity] of Object.entries(dayActivity)) {
+        for (const [day, activity] of Object.entries(this.getAccumulators().dayActivity)) {
             const duration = (activity.lastQSO - activity.firstQSO) / (1000 * 60 * 60); // godziny
             if (duration > maxDuration) {
                 maxDuration = duration;
@@ -693,35 +814,21 @@ class StatisticsCalculator {
      * Pierwsze QSO w roku
      */
     getFirstQSO() {
-        const sorted = this.qsos
-            .filter(qso => qso.datetime)
-            .sort((a, b) => a.datetime - b.datetime);
-
-        return sorted[0] || null;
+        return this.getAccumulators().firstQSO;
     }
 
     /**
      * Ostatnie QSO w roku
      */
     getLastQSO() {
-        const sorted = this.qsos
-            .filter(qso => qso.datetime)
-            .sort((a, b) => b.datetime - a.datetime);
-
-        return sorted[0] || null;
+        return this.getAccumulators().lastQSO;
     }
 
     /**
      * Aktywność w zawodach
      */
     calculateContestActivity() {
-        const contests = {};
-
-        this.qsos.forEach(qso => {
-            if (qso.contestId) {
-                contests[qso.contestId] = (contests[qso.contestId] || 0) + 1;
-            }
-        });
+        const contests = this.getAccumulators().contests;
 
         const sorted = Object.entries(contests)
             .sort((a, b) => b[1] - a[1])
@@ -738,26 +845,14 @@ class StatisticsCalculator {
      * Specjalne mody (satelity, SOTA, POTA, IOTA)
      */
     calculateSpecialModes() {
-        let satellite = 0;
-        let sota = 0;
-        let pota = 0;
-        let iota = 0;
-        let wwff = 0;
-
-        this.qsos.forEach(qso => {
-            if (qso.satName || qso.propMode === 'SAT') satellite++;
-            if (qso.sotaRef) sota++;
-            if (qso.potaRef) pota++;
-            if (qso.iota) iota++;
-            if (qso.wwffRef) wwff++;
-        });
+        const special = this.getAccumulators().special;
 
         return {
-            satellite: { count: satellite, label: 'Satelitarne' },
-            sota: { count: sota, label: 'SOTA' },
-            pota: { count: pota, label: 'POTA' },
-            iota: { count: iota, label: 'IOTA' },
-            wwff: { count: wwff, label: 'WWFF' }
+            satellite: { count: special.satellite, label: 'Satelitarne' },
+            sota: { count: special.sota, label: 'SOTA' },
+            pota: { count: special.pota, label: 'POTA' },
+            iota: { count: special.iota, label: 'IOTA' },
+            wwff: { count: special.wwff, label: 'WWFF' }
         };
     }
 
@@ -765,18 +860,9 @@ class StatisticsCalculator {
      * Średnia liczba QSO na dzień
      */
     calculateAverageQSOsPerDay() {
-        const days = new Set();
-
-        this.qsos.forEach(qso => {
-            if (qso.date) {
-                const dayKey = `${qso.date.year}-${qso.date.month}-${qso.date.day}`;
-                days.add(dayKey);
-            }
-        });
-
-        const activeDays = days.size;
+        const activeDays = this.calculateActiveDays();
         return {
-            average: activeDays > 0 ? (this.qsos.length / activeDays).toFixed(1) : 0,
+            average: activeDays > 0 ? (this.getAccumulators().total / activeDays).toFixed(1) : 0,
             activeDays
         };
     }
@@ -785,32 +871,14 @@ class StatisticsCalculator {
      * Liczba aktywnych dni
      */
     calculateActiveDays() {
-        const days = new Set();
-
-        this.qsos.forEach(qso => {
-            if (qso.date) {
-                const dayKey = `${qso.date.year}-${qso.date.month}-${qso.date.day}`;
-                days.add(dayKey);
-            }
-        });
-
-        return days.size;
+        return this.getAccumulators().activeDayKeys.size;
     }
 
     /**
      * Oblicz serie (streaks) - dni z rzędu z QSO
      */
     calculateStreaks() {
-        const days = new Set();
-
-        this.qsos.forEach(qso => {
-            if (qso.date) {
-                const dayKey = `${qso.date.year}-${String(qso.date.month).padStart(2, '0')}-${String(qso.date.day).padStart(2, '0')}`;
-                days.add(dayKey);
-            }
-        });
-
-        const sortedDays = Array.from(days).sort();
+        const sortedDays = Object.keys(this.getAccumulators().days).sort();
 
         let maxStreak = 0;
         let currentStreak = 1;
@@ -851,13 +919,23 @@ class StatisticsCalculator {
     }
 
     /**
-     * Konwertuj lokator Maidenhead na współrzędne
+     * Konwertuj lokator Maidenhead na współrzędne (zapamiętane na sesję)
      */
     locatorToCoords(locator) {
         if (!locator || locator.length < 4) return null;
 
-        locator = locator.toUpperCase();
+        let coords = locatorCoordsCache.get(locator);
+        if (coords === undefined) {
+            coords = this.decodeLocator(locator.toUpperCase());
+            locatorCoordsCache.set(locator, coords);
+        }
+        return coords;
+    }
 
+    /**
+     * Dekoduj lokator Maidenhead (wielkie litery, co najmniej 4 znaki)
+     */
+    decodeLocator(locator) {
         // Pierwsza para (field) - AA do RR
         const lon1 = (locator.charCodeAt(0) - 65) * 20 - 180;
         const lat1 = (locator.charCodeAt(1) - 65) * 10 - 90;
@@ -884,56 +962,10 @@ class StatisticsCalculator {
      * Oblicz band slots (unikalne kombinacje DXCC + pasmo)
      */
     calculateBandSlots() {
-        const slots = new Set();
-        const slotsByDxcc = {};
-        const slotsByBand = {};
-
-        this.qsos.forEach(qso => {
-            // Pobierz DXCC - z qso.dxcc lub z nazwy kraju
-            let dxccKey = qso.dxcc;
-            let dxccName = qso.country;
-
-            if (dxccKey && DXCC_DATA[dxccKey]) {
-                dxccName = DXCC_DATA[dxccKey].name;
-            } else if (dxccName && window.findDxccByName) {
-                const dxccInfo = window.findDxccByName(dxccName);
-                if (dxccInfo) {
-                    dxccKey = dxccInfo.dxcc || dxccName;
-                }
-            }
-
-            const band = qso.band;
-
-            // Potrzebujemy zarówno DXCC jak i pasma
-            if ((dxccKey || dxccName) && band) {
-                const entityKey = dxccKey || dxccName;
-                const slotKey = `${entityKey}::${band}`;
-                
-                if (!slots.has(slotKey)) {
-                    slots.add(slotKey);
-
-                    // Zlicz sloty per DXCC
-                    if (!slotsByDxcc[entityKey]) {
-                        slotsByDxcc[entityKey] = {
-                            name: dxccName || `DXCC ${entityKey}`,
-                            bands: new Set(),
-                            count: 0
-                        };
-                    }
-                    slotsByDxcc[entityKey].bands.add(band);
-                    slotsByDxcc[entityKey].count++;
-
-                    // Zlicz sloty per Band
-                    if (!slotsByBand[band]) {
-                        slotsByBand[band] = new Set();
-                    }
-                    slotsByBand[band].add(entityKey);
-                }
-            }
-        });
+        const acc = this.getAccumulators();
 
         // Sortuj DXCC według liczby slotów
-        const topDxcc = Object.entries(slotsByDxcc)
+        const topDxcc = Object.entries(acc.slotsByDxcc)
             .map(([key, data]) => ({
                 dxcc: key,
                 name: data.name,
@@ -943,9 +975,9 @@ class StatisticsCalculator {
             .sort((a, b) => b.slots - a.slots);
 
         return {
-            totalSlots: slots.size,
-            dxccCount: Object.keys(slotsByDxcc).length,
-            bandCount: Object.keys(slotsByBand).length,
+            totalSlots: acc.slots.size,
+            dxccCount: Object.keys(acc.slotsByDxcc).length,
+            bandCount: Object.keys(acc.slotsByBand).length,
             topDxcc: topDxcc.slice(0, 5),
             allDxcc: topDxcc
         };
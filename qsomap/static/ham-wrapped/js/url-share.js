@@ -1,19 +1,50 @@
 /**
  * URL Share - Kodowanie i dekodowanie statystyk w URL
- * Używa kompresji LZString dla krótkich URLi
+ *
+ * Linki w formacie 2 to binarna serializacja (varinty, tabela napisów)
+ * zapisana w base64url z prefiksem SHARE_BINARY_PREFIX. Starsze linki
+ * (format 1: JSON skompresowany LZString) są nadal odczytywane.
  */
 
 // LZString - biblioteka kompresji (MIT License)
 // https://github.com/pieroxy/lz-string
 var LZString=function(){function o(o,r){if(!t[o]){t[o]={};for(var n=0;n<o.length;n++)t[o][o.charAt(n)]=n}return t[o][r]}var r=String.fromCharCode,n="ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+-$",t={},e={compressToEncodedURIComponent:function(o){return null==o?"":e._compress(o,6,function(o){return n.charAt(o)})},decompressFromEncodedURIComponent:function(r){return null==r?"":""==r?null:(r=r.replace(/ /g,"+"),e._decompress(r.length,32,function(t){return o(n,r.charAt(t))}))},_compress:function(o,n,t){if(null==o)return"";var e,i,s,u={},c={},a="",p="",h="",l=2,f=3,d=2,m=[],v=0,g=0;for(s=0;s<o.length;s+=1)if(a=o.charAt(s),Object.prototype.hasOwnProperty.call(u,a)||(u[a]=f++,c[a]=!0),p=h+a,Object.prototype.hasOwnProperty.call(u,p))h=p;else{if(Object.prototype.hasOwnProperty.call(c,h)){if(h.charCodeAt(0)<256){for(e=0;e<d;e++)v<<=1,g==n-1?(g=0,m.push(t(v)),v=0):g++;for(i=h.charCodeAt(0),e=0;e<8;e++)v=v<<1|1&i,g==n-1?(g=0,m.push(t(v)),v=0):g++,i>>=1}else{for(i=1,e=0;e<d;e++)v=v<<1|i,g==n-1?(g=0,m.push(t(v)),v=0):g++,i=0;for(i=h.charCodeAt(0),e=0;e<16;e++)v=v<<1|1&i,g==n-1?(g=0,m.push(t(v)),v=0):g++,i>>=1}0==--l&&(l=Math.pow(2,d),d++),delete c[h]}else for(i=u[h],e=0;e<d;e++)v=v<<1|1&i,g==n-1?(g=0,m.push(t(v)),v=0):g++,i>>=1;0==--l&&(l=Math.pow(2,d),d++),u[p]=f++,h=String(a)}if(""!==h){if(Object.prototype.hasOwnProperty.call(c,h)){if(h.charCodeAt(0)<256){for(e=0;e<d;e++)v<<=1,g==n-1?(g=0,m.push(t(v)),v=0):g++;for(i=h.charCodeAt(0),e=0;e<8;e++)v=v<<1|1&i,g==n-1?(g=0,m.push(t(v)),v=0):g++,i>>=1}else{for(i=1,e=0;e<d;e++)v=v<<1|i,g==n-1?(g=0,m.push(t(v)),v=0):g++,i=0;for(i=h.charCodeAt(0),e=0;e<16;e++)v=v<<1|1&i,g==n-1?(g=0,m.push(t(v)),v=0):g++,i>>=1}0==--l&&(l=Math.pow(2,d),d++),delete c[h]}else for(i=u[h],e=0;e<d;e++)v=v<<1|1&i,g==n-1?(g=0,m.push(t(v)),v=0):g++,i>>=1;0==--l&&(l=Math.pow(2,d),d++)}for(i=2,e=0;e<d;e++)v=v<<1|1&i,g==n-1?(g=0,m.push(t(v)),v=0):g++,i>>=1;for(;;){if(v<<=1,g==n-1){m.push(t(v));break}g++}return m.join("")},_decompress:function(o,n,t){var e,i,s,u,c,a,p,h=[],l=4,f=4,d=3,m="",v=[],g={val:t(0),position:n,index:1};for(e=0;e<3;e+=1)h[e]=e;for(s=0,c=Math.pow(2,2),a=1;a!=c;)u=g.val&g.position,g.position>>=1,0==g.position&&(g.position=n,g.val=t(g.index++)),s|=(u>0?1:0)*a,a<<=1;switch(s){case 0:for(s=0,c=Math.pow(2,8),a=1;a!=c;)u=g.val&g.position,g.position>>=1,0==g.position&&(g.position=n,g.val=t(g.index++)),s|=(u>0?1:0)*a,a<<=1;p=r(s);break;case 1:for(s=0,c=Math.pow(2,16),a=1;a!=c;)u=g.val&g.position,g.position>>=1,0==g.position&&(g.position=n,g.val=t(g.index++)),s|=(u>0?1:0)*a,a<<=1;p=r(s);break;case 2:return""}for(h[3]=p,i=p,v.push(p);;){if(g.index>o)return"";for(s=0,c=Math.pow(2,d),a=1;a!=c;)u=g.val&g.position,g.position>>=1,0==g.position&&(g.position=n,g.val=t(g.index++)),s|=(u>0?1:0)*a,a<<=1;switch(p=s){case 0:for(s=0,c=Math.pow(2,8),a=1;a!=c;)u=g.val&g.position,g.position>>=1,0==g.position&&(g.position=n,g.val=t(g.index++)),s|=(u>0?1:0)*a,a<<=1;h[f++]=r(s),p=f-1,l--;break;case 1:for(s=0,c=Math.pow(2,16),a=1;a!=c;)u=g.val&g.position,g.position>>=1,0==g.position&&(g.position=n,g.val=t(g.index++)),s|=(u>0?1:0)*a,a<<=1;h[f++]=r(s),p=f-1,l--;break;case 2:return v.join("")}if(0==l&&(l=Math.pow(2,d),d++),h[p])m=h[p];else{if(p!==f)return null;m=i+i.charAt(0)}v.push(m),h[f++]=i+m.charAt(0),i=m,0==--l&&(l=Math.pow(2,d),d++)}}};return e}();"function"==typeof define&&define.amd?define(function(){return LZString}):"undefined"!=typeof module&&null!=module?module.exports=LZString:"undefined"!=typeof angular&&null!=angular&&angular.module("LZString",[]).factory("LZString",function(){return LZString});
 
+// Wersja formatu danych udostępniania
+const SHARE_FORMAT_VERSION = 2;
+
+// Prefiks linków binarnych - '.' nie występuje w alfabecie LZString (format 1)
+const SHARE_BINARY_PREFIX = '2.';
+
+// Bity obecności opcjonalnych pól w formacie binarnym
+const SHARE_HAS_BEST_DAY = 1;
+const SHARE_HAS_ODX = 2;
+const SHARE_HAS_CLOSEST = 4;
+const SHARE_HAS_PEAK_HOUR = 8;
+const SHARE_HAS_DAY_OF_WEEK = 16;
+const SHARE_HAS_BAND_SLOTS = 32;
+const SHARE_HAS_YEAR_OVER_YEAR = 64;
+
+// Częste napisy (pasma, mody, kontynenty) - zapisywane jako indeks bez wpisu
+// w tabeli napisów. Lista może być tylko rozszerzana na końcu.
+const SHARE_DICTIONARY = [
+    '', 'UNKNOWN',
+    '160M', '80M', '60M', '40M', '30M', '20M', '17M', '15M', '12M', '10M', '6M', '4M', '2M', '70CM', '23CM', '13CM',
+    'SSB', 'CW', 'FT8', 'FT4', 'RTTY', 'PSK31', 'FM', 'AM', 'MFSK', 'JT65', 'JS8', 'Q65', 'SSTV', 'OLIVIA', 'DIGITALVOICE', 'USB', 'LSB',
+    'EU', 'AS', 'NA', 'SA', 'AF', 'OC', 'AN'
+];
+const SHARE_DICTIONARY_INDEX = new Map(SHARE_DICTIONARY.map((value, index) => [value, index]));
+
+// Pola skrótu poprzedniego roku (stats.yearOverYear), w kolejności zapisu
+const SHARE_YEAR_OVER_YEAR_FIELDS = ['totalQSOs', 'uniqueCallsigns', 'dxcc', 'continents', 'bands', 'bandSlots', 'activeDays'];
+
 /**
  * Serializuje statystyki do krótkiego formatu
  * Używa jednoliterowych kluczy dla minimalnego rozmiaru
  */
 function serializeStats(stats, userCallsign, year) {
     const data = {
-        v: 1, // wersja formatu
+        v: SHARE_FORMAT_VERSION, // wersja formatu
         c: userCallsign || '', // callsign
         y: year || 2025, // rok
         // Podstawowe statystyki
@@ -53,12 +84,12 @@ function serializeStats(stats, userCallsign, year) {
         // Band count
         bc: stats.byBand?.count || 0,
         // Band distribution
-        bd2: stats.byBand?.sorted?.map(b => [b.band, parseFloat(b.percentage)]) || [],
+        bd2: stats.byBand?.sorted?.map(b => [b.band, parseFloat(b.percentage), b.count || 0]) || [],
         // Continents
-        co: stats.byContinent?.sorted?.map(c => [c.continent, parseFloat(c.percentage)]) || [],
+        co: stats.byContinent?.sorted?.map(c => [c.continent, parseFloat(c.percentage), c.count || 0]) || [],
         cc: stats.byContinent?.count || 0,
-        // DXCC
-        dx: stats.byDXCC?.sorted?.slice(0, 5).map(d => [d.dxccName || d.dxcc, d.count]) || [],
+        // DXCC (nazwa, liczba QSO, numer DXCC)
+        dx: stats.byDXCC?.sorted?.slice(0, 5).map(d => [d.name || d.dxccName || d.dxcc, d.count, d.dxcc || null]) || [],
         dc: stats.byDXCC?.count || 0,
         // CQ Zones
         cq: stats.byCQZone?.count || 0,
@@ -97,17 +128,328 @@ function serializeStats(stats, userCallsign, year) {
             t: stats.bandSlots.totalSlots || 0,
             d: stats.bandSlots.dxccCount || 0,
             b: stats.bandSlots.bandCount || 0
-        } : null
+        } : null,
+        // Poprzedni rok
+        yy: stats.yearOverYear || null
     };
 
     return data;
 }
 
+/**
+ * Bufor zapisu formatu binarnego - liczby jako varinty (LEB128),
+ * napisy jako indeksy do tabeli napisów
+ */
+class ShareWriter {
+    constructor() {
+        this.bytes = [];
+        this.strings = new Map();
+    }
+
+    /**
+     * Zapisz nieujemną liczbę całkowitą
+     */
+    uint(value) {
+        let n = Math.max(0, Math.round(value || 0));
+        while (n >= 128) {
+            this.bytes.push((n % 128) | 128);
+            n = Math.floor(n / 128);
+        }
+        this.bytes.push(n);
+    }
+
+    /**
+     * Zapisz liczbę z dokładnością do 0.1
+     */
+    tenths(value) {
+        this.uint(parseFloat(value || 0) * 10);
+    }
+
+    /**
+     * Zapisz napis - indeks w słowniku częstych napisów, a za nim w tabeli
+     * napisów; powtórzenia zajmują tylko indeks
+     */
+    string(value) {
+        const key = value === null || value === undefined ? '' : String(value);
+        let index = SHARE_DICTIONARY_INDEX.get(key);
+        if (index === undefined) {
+            index = this.strings.get(key);
+            if (index === undefined) {
+                index = SHARE_DICTIONARY.length + this.strings.size;
+                this.strings.set(key, index);
+            }
+        }
+        this.uint(index);
+    }
+
+    /**
+     * Zapisz listę par [napis, liczba]
+     */
+    countList(items) {
+        this.uint(items.length);
+        for (const [label, count] of items) {
+            this.string(label);
+            this.uint(count);
+        }
+    }
+
+    /**
+     * Wersja formatu, tabela napisów (UTF-8) i dane
+     */
+    toBytes() {
+        const header = new ShareWriter();
+        const encoder = new TextEncoder();
+        header.uint(SHARE_FORMAT_VERSION);
+        header.uint(this.strings.size);
+        for (const value of this.strings.keys()) {
+            const encoded = encoder.encode(value);
+            header.uint(encoded.length);
+            header.bytes.push(...encoded);
+        }
+        return Uint8Array.from(header.bytes.concat(this.bytes));
+    }
+}
+
+/**
+ * Bufor odczytu formatu binarnego (patrz ShareWriter)
+ */
+class ShareReader {
+    constructor(bytes) {
+        this.bytes = bytes;
+        this.pos = 0;
+        this.strings = [];
+    }
+
+    uint() {
+        let value = 0;
+        let scale = 1;
+        let byte;
+        do {
+            if (this.pos >= this.bytes.length) {
+                throw new Error('Unexpected end of share data');
+            }
+            byte = this.bytes[this.pos++];
+            value += (byte & 127) * scale;
+            scale *= 128;
+        } while (byte & 128);
+        return value;
+    }
+
+    tenths() {
+        return this.uint() / 10;
+    }
+
+    string() {
+        const index = this.uint();
+        if (index < SHARE_DICTIONARY.length) {
+            return SHARE_DICTIONARY[index];
+        }
+        if (index - SHARE_DICTIONARY.length >= this.strings.length) {
+            throw new Error('Invalid string index in share data');
+        }
+        return this.strings[index - SHARE_DICTIONARY.length];
+    }
+
+    countList() {
+        const items = [];
+        for (let i = this.uint(); i > 0; i--) {
+            items.push([this.string(), this.uint()]);
+        }
+        return items;
+    }
+
+    /**
+     * Odczytaj wersję formatu i tabelę napisów
+     */
+    readHeader() {
+        const version = this.uint();
+        if (version !== SHARE_FORMAT_VERSION) {
+            throw new Error(`Unsupported share format version ${version}`);
+        }
+        const decoder = new TextDecoder();
+        for (let i = this.uint(); i > 0; i--) {
+            const length = this.uint();
+            this.strings.push(decoder.decode(this.bytes.subarray(this.pos, this.pos + length)));
+            this.pos += length;
+        }
+    }
+}
+
+/**
+ * Procent z liczby QSO - tak jak w StatisticsCalculator.sortDistribution
+ */
+function sharePercentage(count, total) {
+    return total > 0 ? parseFloat(((count / total) * 100).toFixed(1)) : 0;
+}
+
+/**
+ * Koduje dane z serializeStats do formatu binarnego
+ *
+ * Ulubiony znak, mod i pasmo to pierwsze pozycje list, a procenty wynikają
+ * z liczby QSO, więc nie są zapisywane. Miesiąc, godzina i dzień tygodnia
+ * zajmują wspólnie jedną liczbę (4 + 5 + 3 bity).
+ */
+function encodeShareData(data) {
+    const writer = new ShareWriter();
+    const flags = (data.bd && data.bd.d ? SHARE_HAS_BEST_DAY : 0) |
+        (data.ox ? SHARE_HAS_ODX : 0) |
+        (data.cl ? SHARE_HAS_CLOSEST : 0) |
+        (data.ph ? SHARE_HAS_PEAK_HOUR : 0) |
+        (data.dw ? SHARE_HAS_DAY_OF_WEEK : 0) |
+        (data.bs ? SHARE_HAS_BAND_SLOTS : 0) |
+        (data.yy ? SHARE_HAS_YEAR_OVER_YEAR : 0);
+
+    writer.uint(flags);
+    writer.uint(data.y);
+    writer.string(data.c);
+    writer.uint(data.t);
+    writer.uint(data.u);
+    writer.countList(data.t5);
+
+    writer.uint((data.bm && data.bm.m ? data.bm.m : 0) |
+        (data.ph ? data.ph.h << 4 : 0) |
+        (data.dw ? data.dw.d << 9 : 0));
+    writer.uint(data.bm ? data.bm.n : 0);
+    if (data.ph) writer.uint(data.ph.n);
+    if (data.dw) writer.uint(data.dw.n);
+    if (flags & SHARE_HAS_BEST_DAY) {
+        writer.uint(Date.parse(data.bd.d) / 86400000);
+        writer.uint(data.bd.n);
+    }
+
+    writer.countList(data.md.map(([mode, , count]) => [mode, count]));
+    writer.countList(data.bd2.map(([band, , count]) => [band, count]));
+    writer.countList(data.co.map(([continent, , count]) => [continent, count]));
+
+    // DXCC: (numer + 1) * 2, 0 = brak numeru; najmłodszy bit oznacza nazwę
+    // w tabeli napisów - pomijaną, gdy zgadza się z nazwą z DXCC_DATA
+    writer.uint(data.dx.length);
+    for (const [name, count, dxcc] of data.dx) {
+        const code = dxcc ? parseInt(dxcc, 10) : NaN;
+        const known = Number.isInteger(code) && code >= 0;
+        const named = !(known && window.DXCC_DATA && DXCC_DATA[code] && DXCC_DATA[code].name === name);
+        writer.uint((known ? code + 1 : 0) * 2 + (named ? 1 : 0));
+        if (named) writer.string(name);
+        writer.uint(count);
+    }
+    writer.uint(data.dc);
+    writer.uint(data.cq);
+
+    for (const qso of [data.ox, data.cl]) {
+        if (!qso) continue;
+        writer.string(qso.c);
+        writer.tenths(qso.d);
+        writer.string(qso.n);
+    }
+
+    writer.uint(data.qr);
+    writer.uint(data.ad);
+    writer.tenths(data.av);
+    writer.uint(data.st);
+    if (data.bs) {
+        writer.uint(data.bs.t);
+        writer.uint(data.bs.d);
+        writer.uint(data.bs.b);
+    }
+    if (data.yy) {
+        writer.uint(data.yy.year);
+        SHARE_YEAR_OVER_YEAR_FIELDS.forEach(field => writer.uint(data.yy[field]));
+        // ODX w dziesiątych km + 1, 0 = brak
+        writer.uint(data.yy.odx === null ? 0 : Math.round(data.yy.odx * 10) + 1);
+    }
+
+    return writer.toBytes();
+}
+
+/**
+ * Dekoduje format binarny do danych w postaci z serializeStats
+ */
+function decodeShareData(bytes) {
+    const reader = new ShareReader(bytes);
+    reader.readHeader();
+
+    const flags = reader.uint();
+    const data = { v: SHARE_FORMAT_VERSION, y: reader.uint(), c: reader.string() };
+    data.t = reader.uint();
+    data.u = reader.uint();
+    data.t5 = reader.countList();
+    data.tc = data.t5.length > 0 ? { c: data.t5[0][0], n: data.t5[0][1] } : null;
+
+    const packed = reader.uint();
+    const bestMonthCount = reader.uint();
+    data.bm = packed & 15 ? { m: packed & 15, n: bestMonthCount } : null;
+    data.ph = flags & SHARE_HAS_PEAK_HOUR ? { h: (packed >> 4) & 31, n: reader.uint() } : null;
+    data.dw = flags & SHARE_HAS_DAY_OF_WEEK ? { d: (packed >> 9) & 7, n: reader.uint() } : null;
+    data.bd = null;
+    if (flags & SHARE_HAS_BEST_DAY) {
+        const date = new Date(reader.uint() * 86400000).toISOString().substring(0, 10);
+        data.bd = { d: date, n: reader.uint() };
+    }
+
+    const withPercentage = ([label, count]) => [label, sharePercentage(count, data.t), count];
+    data.md = reader.countList().map(withPercentage);
+    data.bd2 = reader.countList().map(withPercentage);
+    data.co = reader.countList().map(withPercentage);
+    data.fm = data.md.length > 0 ? { m: data.md[0][0], p: data.md[0][1], n: data.md[0][2] } : null;
+    data.fb = data.bd2.length > 0 ? { b: data.bd2[0][0], p: data.bd2[0][1], n: data.bd2[0][2] } : null;
+    data.bc = data.bd2.length;
+    data.cc = data.co.length;
+
+    data.dx = [];
+    for (let i = reader.uint(); i > 0; i--) {
+        const tag = reader.uint();
+        const code = tag >= 2 ? Math.floor(tag / 2) - 1 : null;
+        const name = tag & 1 ? reader.string() : DXCC_DATA[code].name;
+        data.dx.push([name, reader.uint(), code]);
+    }
+    data.dc = reader.uint();
+    data.cq = reader.uint();
+
+    const readQso = () => ({ c: reader.string(), d: reader.tenths(), n: reader.string() || null });
+    data.ox = flags & SHARE_HAS_ODX ? readQso() : null;
+    data.cl = flags & SHARE_HAS_CLOSEST ? readQso() : null;
+
+    data.qr = reader.uint();
+    data.ad = reader.uint();
+    data.av = reader.tenths().toFixed(1);
+    data.st = reader.uint();
+    data.bs = flags & SHARE_HAS_BAND_SLOTS ? { t: reader.uint(), d: reader.uint(), b: reader.uint() } : null;
+    data.yy = null;
+    if (flags & SHARE_HAS_YEAR_OVER_YEAR) {
+        data.yy = { year: reader.uint() };
+        SHARE_YEAR_OVER_YEAR_FIELDS.forEach(field => { data.yy[field] = reader.uint(); });
+        const odx = reader.uint();
+        data.yy.odx = odx === 0 ? null : (odx - 1) / 10;
+    }
+
+    return data;
+}
+
+/**
+ * Bajty do base64url (bez dopełnienia)
+ */
+function bytesToBase64Url(bytes) {
+    let binary = '';
+    for (const byte of bytes) {
+        binary += String.fromCharCode(byte);
+    }
+    return btoa(binary).replace(/\+/g, '-').replace(/\//g, '_').replace(/=+$/, '');
+}
+
+/**
+ * base64url do bajtów
+ */
+function base64UrlToBytes(text) {
+    const base64 = text.replace(/-/g, '+').replace(/_/g, '/');
+    const binary = atob(base64 + '==='.slice((base64.length + 3) % 4));
+    return Uint8Array.from(binary, char => char.charCodeAt(0));
+}
+
 /**
  * Deserializuje statystyki z krótkiego formatu
  */
 function deserializeStats(data) {
-    if (!data || data.v !== 1) return null;
+    if (!data || (data.v !== 1 && data.v !== SHARE_FORMAT_VERSION)) return null;
 
     // Pełna rekonstrukcja obiektu statystyk
     const stats = {
@@ -137,18 +479,18 @@ function deserializeStats(data) {
         },
         byBand: {
             favorite: data.fb ? { band: data.fb.b, percentage: String(data.fb.p), count: data.fb.n || 0 } : { band: '20M', percentage: '0', count: 0 },
-            sorted: data.bd2?.map(([band, percentage]) => ({ band, percentage: String(percentage), count: 0 })) || [],
+            sorted: data.bd2?.map(([band, percentage, count]) => ({ band, percentage: String(percentage), count: count || 0 })) || [],
             count: data.bc || 0,
             distribution: {}
         },
         byContinent: {
-            sorted: data.co?.map(([continent, percentage]) => ({ continent, percentage: String(percentage), count: 0 })) || [],
+            sorted: data.co?.map(([continent, percentage, count]) => ({ continent, percentage: String(percentage), count: count || 0 })) || [],
             count: data.cc || 0,
             distribution: {}
         },
         byDXCC: {
-            sorted: data.dx?.map(([name, count]) => ({ dxccName: name, dxcc: name, name: name, count })) || [],
-            top5: data.dx?.map(([name, count]) => ({ dxccName: name, dxcc: name, name: name, count })) || [],
+            sorted: data.dx?.map(([name, count, dxcc]) => ({ dxccName: name, dxcc: dxcc || name, name: name, count })) || [],
+            top5: data.dx?.map(([name, count, dxcc]) => ({ dxccName: name, dxcc: dxcc || name, name: name, count })) || [],
             count: data.dc || 0,
             distribution: {}
         },
@@ -198,6 +540,8 @@ function deserializeStats(data) {
             dxccCount: data.bs.d || 0,
             bandCount: data.bs.b || 0
         } : null,
+        // Porównanie z poprzednim rokiem
+        yearOverYear: data.yy || null,
         // Flaga że to dane z URL
         fromUrl: true
     };
@@ -211,9 +555,7 @@ function deserializeStats(data) {
 function encodeStatsToUrl(stats, userCallsign, year) {
     try {
         const serialized = serializeStats(stats, userCallsign, year);
-        const json = JSON.stringify(serialized);
-        const compressed = LZString.compressToEncodedURIComponent(json);
-        return compressed;
+        return SHARE_BINARY_PREFIX + bytesToBase64Url(encodeShareData(serialized));
     } catch (e) {
         console.error('Error encoding stats:', e);
         return null;
@@ -225,9 +567,15 @@ function encodeStatsToUrl(stats, userCallsign, year) {
  */
 function decodeStatsFromUrl(encoded) {
     try {
-        const json = LZString.decompressFromEncodedURIComponent(encoded);
-        if (!json) return null;
-        const data = JSON.parse(json);
+        let data;
+        if (encoded.startsWith(SHARE_BINARY_PREFIX)) {
+            data = decodeShareData(base64UrlToBytes(encoded.substring(SHARE_BINARY_PREFIX.length)));
+        } else {
+            // Format 1 - JSON skompresowany LZString
+            const json = LZString.decompressFromEncodedURIComponent(encoded);
+            if (!json) return null;
+            data = JSON.parse(json);
+        }
         return {
             stats: deserializeStats(data),
             userCallsign: data.c || null,
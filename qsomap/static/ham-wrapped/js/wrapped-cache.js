@@ -0,0 +1,129 @@
+/**
+ * Wrapped Cache - Pamięć ostatnio przetworzonego logu w IndexedDB
+ *
+ * Przechowywany jest jeden wpis (ostatni log), kluczem jest skrót SHA-256
+ * zawartości pliku. Wpis zawiera sparsowane QSO (ponowny upload tego samego
+ * pliku pomija parsowanie i callsign lookup; null, gdy statystyki policzył
+ * serwer) oraz policzone statystyki wszystkich lat (powrót na stronę od razu
+ * pokazuje prezentację).
+ * Wszystkie funkcje zwracają null zamiast błędu, gdy IndexedDB nie działa.
+ */
+
+const WRAPPED_DB_NAME = 'ham-wrapped';
+const WRAPPED_DB_VERSION = 1;
+const WRAPPED_LOG_STORE = 'logs';
+
+let wrappedDbPromise = null;
+
+/**
+ * Otwórz bazę (raz na sesję)
+ */
+function openWrappedDb() {
+    if (!wrappedDbPromise) {
+        wrappedDbPromise = new Promise((resolve, reject) => {
+            if (!window.indexedDB) {
+                reject(new Error('IndexedDB is not available'));
+                return;
+            }
+            const request = indexedDB.open(WRAPPED_DB_NAME, WRAPPED_DB_VERSION);
+            request.onupgradeneeded = () => {
+                request.result.createObjectStore(WRAPPED_LOG_STORE, { keyPath: 'hash' });
+            };
+            request.onsuccess = () => resolve(request.result);
+            request.onerror = () => reject(request.error);
+        });
+    }
+    return wrappedDbPromise;
+}
+
+/**
+ * Wykonaj operację na magazynie logów
+ * @param {string} mode - 'readonly' lub 'readwrite'
+ * @param {Function} operation - Otrzymuje magazyn, zwraca IDBRequest (lub nic)
+ */
+async function withLogStore(mode, operation) {
+    try {
+        const db = await openWrappedDb();
+        return await new Promise((resolve, reject) => {
+            const transaction = db.transaction(WRAPPED_LOG_STORE, mode);
+            const request = operation(transaction.objectStore(WRAPPED_LOG_STORE));
+            transaction.oncomplete = () => resolve(request ? request.result : null);
+            transaction.onerror = () => reject(transaction.error);
+            transaction.onabort = () => reject(transaction.error);
+        });
+    } catch (error) {
+        console.warn('Pamięć logów niedostępna:', error);
+        return null;
+    }
+}
+
+/**
+ * Skrót SHA-256 zawartości pliku (null bez Web Crypto, np. poza HTTPS)
+ * @param {File|Blob} file - Plik logu
+ * @returns {Promise<string|null>}
+ */
+async function hashLogFile(file) {
+    if (!window.crypto || !crypto.subtle) return null;
+    try {
+        const digest = await crypto.subtle.digest('SHA-256', await file.arrayBuffer());
+        return Array.from(new Uint8Array(digest), byte => byte.toString(16).padStart(2, '0')).join('');
+    } catch (error) {
+        console.warn('Nie udało się obliczyć skrótu pliku:', error);
+        return null;
+    }
+}
+
+/**
+ * Ostatnio zapisany log
+ * @returns {Promise<Object|null>} - { hash, fileName, qsos, yearStats, userLocator,
+ *                                   userCallsign, year, autoOpen }
+ */
+async function loadLastLog() {
+    const entries = await withLogStore('readonly', store => store.getAll());
+    return entries && entries.length > 0 ? entries[0] : null;
+}
+
+/**
+ * Zapisany log o podanym skrócie
+ * @param {string} hash - Skrót pliku (hashLogFile)
+ */
+async function findLog(hash) {
+    const entry = await withLogStore('readonly', store => store.get(hash));
+    return entry || null;
+}
+
+/**
+ * Zapisz log jako ostatni (poprzedni wpis jest usuwany)
+ * @param {Object} entry - Wpis z kluczem hash
+ */
+async function saveLog(entry) {
+    await withLogStore('readwrite', store => {
+        store.clear();
+        store.put(entry);
+    });
+}
+
+/**
+ * Zmień pola zapisanego logu (np. wybrany rok)
+ * @param {string} hash - Skrót pliku
+ * @param {Object} changes - Nowe wartości pól
+ */
+async function updateLog(hash, changes) {
+    await withLogStore('readwrite', store => {
+        const request = store.get(hash);
+        request.onsuccess = () => {
+            if (request.result) {
+                store.put({ ...request.result, ...changes });
+            }
+        };
+    });
+}
+
+// Eksport do globalnego scope
+window.WrappedCache = {
+    hashLogFile,
+    loadLastLog,
+    findLog,
+    saveLog,
+    updateLog
+};
@@ -0,0 +1,90 @@
+/**
+ * Ham Wrapped - Service worker
+ *
+ * Strona, skrypty, style i skompilowany indeks CTY są podawane z cache
+ * (stale-while-revalidate): powrót na stronę nie czeka na sieć i działa
+ * offline, a nowe wersje plików są pobierane w tle na następną wizytę.
+ * Serwowany przez /ham-wrapped/sw.js z nagłówkiem Service-Worker-Allowed.
+ */
+
+// Zmiana wersji usuwa stary cache przy aktywacji
+const CACHE_NAME = 'ham-wrapped-v2';
+
+// Pliki pobierane przy instalacji - strona startowa, tłumaczenia i prezentacja.
+// Parser, statystyki i indeks CTY trafiają do cache przy pierwszym użyciu
+// (wizyta z linku ze statystykami ich nie pobiera).
+const PRECACHE_URLS = [
+    '/ham-wrapped',
+    '/static/ham-wrapped/css/styles.css',
+    '/static/ham-wrapped/js/modules.js',
+    '/static/ham-wrapped/js/i18n.js',
+    '/static/ham-wrapped/js/locales/pl.js',
+    '/static/ham-wrapped/js/locales/en.js',
+    '/static/ham-wrapped/js/wrapped-cache.js',
+    '/static/ham-wrapped/js/app.js',
+    '/static/ham-wrapped/js/presentation.js',
+    '/static/ham-wrapped/js/dxcc-tables.js',
+    '/static/ham-wrapped/js/dxcc-data.js',
+    '/static/ham-wrapped/js/url-share.js'
+];
+
+self.addEventListener('install', (event) => {
+    event.waitUntil(
+        caches.open(CACHE_NAME)
+            // Brak jednego pliku (np. indeksu CTY) nie blokuje instalacji
+            .then(cache => Promise.all(PRECACHE_URLS.map(url => cache.add(url).catch(() => undefined))))
+            .then(() => self.skipWaiting())
+    );
+});
+
+self.addEventListener('activate', (event) => {
+    event.waitUntil(
+        caches.keys()
+            .then(names => Promise.all(names
+                .filter(name => name.startsWith('ham-wrapped-') && name !== CACHE_NAME)
+                .map(name => caches.delete(name))))
+            .then(() => self.clients.claim())
+    );
+});
+
+/**
+ * Czy żądanie dotyczy plików Ham Wrapped
+ */
+function isWrappedRequest(url) {
+    return url.origin === self.location.origin && (
+        url.pathname === '/ham-wrapped' ||
+        url.pathname.startsWith('/ham-wrapped/') ||
+        url.pathname.startsWith('/static/ham-wrapped/')
+    );
+}
+
+/**
+ * Odpowiedź z cache, a równolegle odświeżenie cache z sieci
+ * (kluczem jest ścieżka - link ze statystykami ?d=... używa tej samej strony)
+ */
+async function staleWhileRevalidate(event, url) {
+    const cache = await caches.open(CACHE_NAME);
+    const cached = await cache.match(url.pathname);
+
+    const update = fetch(event.request).then(response => {
+        if (response.ok) {
+            cache.put(url.pathname, response.clone());
+        }
+        return response;
+    });
+
+    if (cached) {
+        event.waitUntil(update.catch(() => undefined));
+        return cached;
+    }
+    return update;
+}
+
+self.addEventListener('fetch', (event) => {
+    if (event.request.method !== 'GET') return;
+
+    const url = new URL(event.request.url);
+    if (!isWrappedRequest(url)) return;
+
+    event.respondWith(staleWhileRevalidate(event, url));
+});
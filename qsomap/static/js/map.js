@@ -38,17 +38,540 @@ var nightLayer = L.tileLayer('https://{s}.basemaps.cartocdn.com/dark_all/{z}/{x}
 
 var qsos = window.mapData.qsos;
 
+// ==================== RENDERER ====================
+
+// Above this many QSOs markers and arcs are drawn on a shared canvas instead of SVG
+const CANVAS_RENDERER_THRESHOLD = 5000;
+const useCanvasRenderer = qsos.length > CANVAS_RENDERER_THRESHOLD;
+const qsoRenderer = useCanvasRenderer ? L.canvas({ padding: 0.5 }) : null;
+
+// Canvas layers are not interactive - popups are opened through hitTestGrid instead
+function getRendererOptions() {
+    return useCanvasRenderer ? { renderer: qsoRenderer, interactive: false } : {};
+}
+
+// ==================== END RENDERER ====================
+
+// ==================== ARC GEOMETRY ====================
+
+const EARTH_RADIUS_KM = 6371;
+
+const ARC_STYLE = Object.assign({
+    color: 'red',
+    weight: 2,
+    opacity: 0.5
+}, getRendererOptions());
+
+// Cached arcs keyed by QSO index: { polyline, steps, distanceKm }
+const arcCache = new Map();
+
+// Number of arc segments for a given distance and zoom level
+function getArcSegmentCount(distanceKm, zoom) {
+    // About one segment per 500 km on world view, twice as fine for every zoom level in
+    const kmPerSegment = 500 / Math.pow(2, Math.max(0, zoom - 2));
+    return Math.min(100, Math.max(2, Math.ceil(distanceKm / kmPerSegment)));
+}
+
+// Calculate points along the great circle between start and end
+function greatCircleArc(start, end, zoom) {
+    // Convert to radians
+    const startLat = start[0] * Math.PI / 180;
+    const startLng = start[1] * Math.PI / 180;
+    const endLat = end[0] * Math.PI / 180;
+    const endLng = end[1] * Math.PI / 180;
+
+    // Calculate great circle distance
+    const d = 2 * Math.asin(Math.sqrt(
+        Math.pow(Math.sin((endLat - startLat) / 2), 2) +
+        Math.cos(startLat) * Math.cos(endLat) * Math.pow(Math.sin((endLng - startLng) / 2), 2)
+    ));
+    const distanceKm = d * EARTH_RADIUS_KM;
+
+    if (d === 0) {
+        return { points: [start, end], steps: 1, distanceKm };
+    }
+
+    // Start and end vectors are the same for every point
+    const sinD = Math.sin(d);
+    const x1 = Math.cos(startLat) * Math.cos(startLng);
+    const y1 = Math.cos(startLat) * Math.sin(startLng);
+    const z1 = Math.sin(startLat);
+    const x2 = Math.cos(endLat) * Math.cos(endLng);
+    const y2 = Math.cos(endLat) * Math.sin(endLng);
+    const z2 = Math.sin(endLat);
+    const centerLng = window.mapData.my_longitude;
+
+    const steps = getArcSegmentCount(distanceKm, zoom);
+    const points = [];
+    for (let i = 0; i <= steps; i++) {
+        const t = i / steps;
+
+        // Calculate intermediate point using great circle formula
+        const A = Math.sin((1 - t) * d) / sinD;
+        const B = Math.sin(t * d) / sinD;
+        const x = A * x1 + B * x2;
+        const y = A * y1 + B * y2;
+        const z = A * z1 + B * z2;
+
+        const lat = Math.atan2(z, Math.sqrt(x * x + y * y)) * 180 / Math.PI;
+        // Adjust longitude to ensure we take the shortest path
+        const lng = adjustLongitude(Math.atan2(y, x) * 180 / Math.PI, centerLng);
+
+        points.push([lat, lng]);
+    }
+
+    return { points, steps, distanceKm };
+}
+
+// Get arc for QSO, computing its geometry only once (or when zooming in needs more detail)
+function getQsoArc(index) {
+    const zoom = map.getZoom();
+    let entry = arcCache.get(index);
+
+    if (!entry) {
+        const qso = qsos[index];
+        const arc = greatCircleArc(
+            [window.mapData.my_latitude, window.mapData.my_longitude],
+            [qso.latitude, adjustLongitude(qso.longitude, window.mapData.my_longitude)],
+            zoom
+        );
+        entry = { polyline: L.polyline(arc.points, ARC_STYLE), steps: arc.steps, distanceKm: arc.distanceKm };
+        arcCache.set(index, entry);
+    } else if (entry.steps > 1 && getArcSegmentCount(entry.distanceKm, zoom) > entry.steps) {
+        refineArc(index, entry, zoom);
+    }
+
+    return entry.polyline;
+}
+
+// Recompute arc with more points for higher zoom, keeping the same polyline
+function refineArc(index, entry, zoom) {
+    const qso = qsos[index];
+    const arc = greatCircleArc(
+        [window.mapData.my_latitude, window.mapData.my_longitude],
+        [qso.latitude, adjustLongitude(qso.longitude, window.mapData.my_longitude)],
+        zoom
+    );
+    entry.polyline.setLatLngs(arc.points);
+    entry.steps = arc.steps;
+}
+
+// Refine visible arcs when zooming in
+map.on('zoomend', function() {
+    const zoom = map.getZoom();
+    arcCache.forEach((entry, index) => {
+        if (entry.steps > 1 && map.hasLayer(entry.polyline) &&
+            getArcSegmentCount(entry.distanceKm, zoom) > entry.steps) {
+            refineArc(index, entry, zoom);
+        }
+    });
+});
+
+// ==================== END ARC GEOMETRY ====================
+
+// ==================== LAYER GROUPS ====================
+
+// QSO markers and arcs bucketed by band and mode: key -> { band, mode, markers, arcs }
+const qsoGroups = new Map();
+
+// Marker for each QSO index
+const qsoMarkers = [];
+
+function getGroupKey(band, mode) {
+    return `${band}|${mode}`;
+}
+
+// Popup content for single QSO (built only when the popup is opened)
+function buildQsoPopup(qso) {
+    const distanceDisplay = qso.distance !== null && qso.distance !== undefined ? `${qso.distance} km` : 'N/A';
+
+    return `
+        <strong>${qso.call}</strong><br>
+        Date: ${qso.date}<br>
+        Time: ${qso.time}<br>
+        Mode: ${qso.mode}<br>
+        Band: ${qso.band}<br>
+        Grid: ${qso.grid}<br>
+        DXCC: ${qso.dxcc}<br>
+        Distance: ${distanceDisplay}
+    `;
+}
+
+// Create marker for single QSO
+function createQsoMarker(qso) {
+    const adjustedLng = adjustLongitude(qso.longitude, window.mapData.my_longitude);
+
+    const marker = L.circleMarker([qso.latitude, adjustedLng], Object.assign({
+        radius: 3,
+        fillColor: document.getElementById('uniform-color-checkbox').checked ? getBandColor(qso.band) : '#FF0000',
+        color: '#000',
+        weight: 1,
+        opacity: 1,
+        fillOpacity: 0.8
+    }, getRendererOptions()));
+
+    if (!useCanvasRenderer) {
+        marker.bindPopup(() => buildQsoPopup(qso));
+    }
+
+    return marker;
+}
+
+// Build markers and arcs once, grouped by (band, mode)
+function buildQsoGroups() {
+    qsos.forEach((qso, index) => {
+        const key = getGroupKey(qso.band, qso.mode);
+        let group = qsoGroups.get(key);
+        if (!group) {
+            group = { band: qso.band, mode: qso.mode, markers: L.layerGroup(), arcs: L.layerGroup() };
+            qsoGroups.set(key, group);
+        }
+
+        const marker = createQsoMarker(qso);
+        qsoMarkers[index] = marker;
+        group.markers.addLayer(marker);
+        if (useCanvasRenderer) {
+            addToHitTestGrid(index, marker.getLatLng());
+        }
+        try {
+            group.arcs.addLayer(getQsoArc(index));
+        } catch (e) {
+            console.log(e);
+        }
+    });
+}
+
+function setLayerVisible(layer, visible) {
+    if (visible && !map.hasLayer(layer)) {
+        map.addLayer(layer);
+    } else if (!visible && map.hasLayer(layer)) {
+        map.removeLayer(layer);
+    }
+}
+
+// Get selected modes and bands as sets
+function getSelectedFilters() {
+    return {
+        modes: new Set(Array.from(document.querySelectorAll('.mode-checkbox:checked')).map(cb => cb.value)),
+        bands: new Set(Array.from(document.querySelectorAll('.band-checkbox:checked')).map(cb => cb.value))
+    };
+}
+
+// Remove all QSO groups from map (e.g. while timeline is active)
+function hideQsoGroups() {
+    qsoGroups.forEach(group => {
+        setLayerVisible(group.markers, false);
+        setLayerVisible(group.arcs, false);
+    });
+    renderAggregates(null);
+}
+
+// Show groups matching filters; at low zoom markers are replaced by grid aggregates
+function applyFilters(modes, bands) {
+    const hideLinesCheckbox = document.getElementById('hide-lines-checkbox');
+    const hideLines = hideLinesCheckbox && hideLinesCheckbox.checked;
+    const aggregateLevel = getAggregateLevel(map.getZoom());
+
+    // Only groups whose visibility changed are added to or removed from the map
+    qsoGroups.forEach(group => {
+        const visible = modes.has(group.mode) && bands.has(group.band);
+        setLayerVisible(group.markers, visible && !aggregateLevel);
+        setLayerVisible(group.arcs, visible && !hideLines);
+    });
+
+    renderAggregates(aggregateLevel, modes, bands);
+}
+
+// Recolor existing markers after "Color Pins Band" change
+function updateMarkerColors() {
+    const colorByBand = document.getElementById('uniform-color-checkbox').checked;
+    qsoGroups.forEach(group => {
+        const fillColor = colorByBand ? getBandColor(group.band) : '#FF0000';
+        group.markers.eachLayer(marker => marker.setStyle({ fillColor }));
+    });
+
+    if (map.hasLayer(aggregateLayer)) {
+        updateMarkers();
+    }
+}
+
+// Build groups and show all of them (filters start with everything selected)
+function addMarkers() {
+    buildQsoGroups();
+
+    const groups = Array.from(qsoGroups.values());
+    applyFilters(new Set(groups.map(group => group.mode)), new Set(groups.map(group => group.band)));
+}
+
+// ==================== END LAYER GROUPS ====================
+
+// ==================== GRID AGGREGATION ====================
+
+// Aggregates computed on upload, ordered by zoom: [{ level, max_zoom, cells }]
+const gridAggregates = window.mapData.grid_aggregates || [];
+const aggregateLayer = L.layerGroup();
+let renderedAggregateLevel = null;
+
+// Aggregation level for zoom, or null when individual QSOs should be shown
+function getAggregateLevel(zoom) {
+    return gridAggregates.find(level => zoom <= level.max_zoom) || null;
+}
+
+function createAggregateMarker(cell, count, color) {
+    const size = Math.min(48, 18 + Math.round(6 * Math.log10(count)));
+    const marker = L.marker([cell.latitude, adjustLongitude(cell.longitude, window.mapData.my_longitude)], {
+        icon: L.divIcon({
+            className: 'grid-aggregate-marker',
+            html: `<span style="background-color: ${color}">${count}</span>`,
+            iconSize: [size, size]
+        })
+    });
+    marker.bindPopup(() => `<strong>${cell.locator}</strong><br>QSOs: ${count}`);
+    return marker;
+}
+
+// Draw one counted marker per locator, using only QSOs matching the filters
+function renderAggregates(level, modes, bands) {
+    aggregateLayer.clearLayers();
+    renderedAggregateLevel = level ? level.level : null;
+    if (!level) {
+        setLayerVisible(aggregateLayer, false);
+        return;
+    }
+
+    const colorByBand = document.getElementById('uniform-color-checkbox').checked;
+    level.cells.forEach(cell => {
+        let count = 0;
+        let topBand = null;
+        const bandCounts = {};
+
+        Object.entries(cell.counts).forEach(([key, n]) => {
+            const separator = key.indexOf('|');
+            const band = key.slice(0, separator);
+            if (!bands.has(band) || !modes.has(key.slice(separator + 1))) return;
+
+            count += n;
+            bandCounts[band] = (bandCounts[band] || 0) + n;
+            if (!topBand || bandCounts[band] > bandCounts[topBand]) {
+                topBand = band;
+            }
+        });
+
+        if (count > 0) {
+            // Marker is colored by the band with most QSOs in the cell
+            aggregateLayer.addLayer(createAggregateMarker(cell, count, colorByBand ? getBandColor(topBand) : '#FF0000'));
+        }
+    });
+
+    setLayerVisible(aggregateLayer, true);
+}
+
+// Switch between aggregation levels and individual QSOs when zooming
+map.on('zoomend', function() {
+    if (isTimelineActive) return;
+
+    const level = getAggregateLevel(map.getZoom());
+    if ((level ? level.level : null) !== renderedAggregateLevel) {
+        updateMarkers();
+    }
+});
+
+// ==================== END GRID AGGREGATION ====================
+
+// ==================== DENSITY HEATMAP ====================
+
+// QSO counts per Maidenhead square computed on upload (see density_grid.py)
+const densityGrid = window.mapData.density_grid || {};
+const HEATMAP_PX_PER_CELL = 4;
+let heatmapLayer = null;
+
+// Decode base64 little-endian uint16 matrix
+function decodeDensityLayer(encoded) {
+    const binary = atob(encoded);
+    const view = new DataView(new ArrayBuffer(binary.length));
+    for (let i = 0; i < binary.length; i++) {
+        view.setUint8(i, binary.charCodeAt(i));
+    }
+    const counts = new Uint32Array(binary.length / 2);
+    for (let i = 0; i < counts.length; i++) {
+        counts[i] = view.getUint16(i * 2, true);
+    }
+    return counts;
+}
+
+function mercatorY(lat) {
+    const rad = Math.max(-85, Math.min(85, lat)) * Math.PI / 180;
+    return Math.log(Math.tan(Math.PI / 4 + rad / 2));
+}
+
+// Draw density matrix on canvas in Web Mercator, so the image overlay lines up with the map
+function buildHeatmapLayer() {
+    const { rows, cols, south, west, cell_lat: cellLat, cell_lon: cellLon } = densityGrid;
+    const north = south + rows * cellLat;
+    const east = west + cols * cellLon;
+
+    // Sum all layers (the matrix may be split by band, mode or year)
+    const counts = new Uint32Array(rows * cols);
+    Object.values(densityGrid.layers).forEach(encoded => {
+        decodeDensityLayer(encoded).forEach((count, i) => { counts[i] += count; });
+    });
+    const maxCount = counts.reduce((max, count) => Math.max(max, count), 1);
+
+    const width = cols * HEATMAP_PX_PER_CELL;
+    const pxPerRadian = width / (cols * cellLon * Math.PI / 180);
+    const top = mercatorY(north);
+    const canvas = document.createElement('canvas');
+    canvas.width = width;
+    canvas.height = Math.max(1, Math.round((top - mercatorY(south)) * pxPerRadian));
+    const ctx = canvas.getContext('2d');
+
+    for (let row = 0; row < rows; row++) {
+        const y1 = Math.round((top - mercatorY(south + (row + 1) * cellLat)) * pxPerRadian);
+        const y2 = Math.round((top - mercatorY(south + row * cellLat)) * pxPerRadian);
+        if (y2 <= y1) continue;
+
+        for (let col = 0; col < cols; col++) {
+            const count = counts[row * cols + col];
+            if (!count) continue;
+
+            // Logarithmic scale from blue (few QSOs) to red (most QSOs)
+            const t = Math.log(1 + count) / Math.log(1 + maxCount);
+            ctx.fillStyle = `hsla(${Math.round(240 * (1 - t))}, 100%, 50%, ${(0.35 + 0.5 * t).toFixed(2)})`;
+            ctx.fillRect(col * HEATMAP_PX_PER_CELL, y1, HEATMAP_PX_PER_CELL, y2 - y1);
+        }
+    }
+
+    // Copies shifted by 360 degrees match markers moved by adjustLongitude
+    const url = canvas.toDataURL();
+    return L.layerGroup([-360, 0, 360].map(offset => L.imageOverlay(url,
+        [[south, west + offset], [north, east + offset]], { opacity: 0.8, interactive: false })));
+}
+
+function toggleHeatmap() {
+    const visible = document.getElementById('heatmap-checkbox').checked;
+    if (visible && !heatmapLayer) {
+        heatmapLayer = buildHeatmapLayer();
+    }
+    if (heatmapLayer) {
+        setLayerVisible(heatmapLayer, visible);
+    }
+}
+
+if (densityGrid.rows) {
+    document.getElementById('heatmap-checkbox').addEventListener('change', toggleHeatmap);
+} else {
+    document.getElementById('heatmap-checkbox').disabled = true;
+}
+
+// ==================== END DENSITY HEATMAP ====================
+
+// ==================== CANVAS HIT TEST ====================
+
+// Maximum distance in pixels between click and marker
+const HIT_TOLERANCE_PX = 6;
+
+// QSO indices bucketed by 1x1 degree cell: "lat|lng" -> [index, ...]
+const hitTestGrid = new Map();
+
+function getHitTestCell(lat, lng) {
+    return `${Math.floor(lat)}|${Math.floor(lng)}`;
+}
+
+function addToHitTestGrid(index, latlng) {
+    const cell = getHitTestCell(latlng.lat, latlng.lng);
+    let indices = hitTestGrid.get(cell);
+    if (!indices) {
+        indices = [];
+        hitTestGrid.set(cell, indices);
+    }
+    indices.push(index);
+}
+
+// Whether QSO marker is currently drawn (regular view or timeline)
+function isQsoShown(index) {
+    if (isTimelineActive) {
+        return timelineMarkers.has(index);
+    }
+    return map.hasLayer(qsoMarkers[index]);
+}
+
+// Find nearest shown QSO within HIT_TOLERANCE_PX of the clicked point
+function findQsoAt(latlng) {
+    const point = map.latLngToContainerPoint(latlng);
+    const corner1 = map.containerPointToLatLng(L.point(point.x - HIT_TOLERANCE_PX, point.y - HIT_TOLERANCE_PX));
+    const corner2 = map.containerPointToLatLng(L.point(point.x + HIT_TOLERANCE_PX, point.y + HIT_TOLERANCE_PX));
+    const minLat = Math.floor(Math.min(corner1.lat, corner2.lat));
+    const maxLat = Math.floor(Math.max(corner1.lat, corner2.lat));
+    const minLng = Math.floor(Math.min(corner1.lng, corner2.lng));
+    const maxLng = Math.floor(Math.max(corner1.lng, corner2.lng));
+
+    let nearest = null;
+    let nearestDistance = HIT_TOLERANCE_PX * HIT_TOLERANCE_PX;
+    for (let lat = minLat; lat <= maxLat; lat++) {
+        for (let lng = minLng; lng <= maxLng; lng++) {
+            const indices = hitTestGrid.get(`${lat}|${lng}`);
+            if (!indices) continue;
+
+            indices.forEach(index => {
+                if (!isQsoShown(index)) return;
+                const markerPoint = map.latLngToContainerPoint(qsoMarkers[index].getLatLng());
+                const dx = markerPoint.x - point.x;
+                const dy = markerPoint.y - point.y;
+                const distance = dx * dx + dy * dy;
+                if (distance <= nearestDistance) {
+                    nearest = index;
+                    nearestDistance = distance;
+                }
+            });
+        }
+    }
+
+    return nearest;
+}
+
+if (useCanvasRenderer) {
+    map.on('click', function(e) {
+        const index = findQsoAt(e.latlng);
+        if (index === null) return;
+
+        L.popup()
+            .setLatLng(qsoMarkers[index].getLatLng())
+            .setContent(buildQsoPopup(qsos[index]))
+            .openOn(map);
+    });
+}
+
+// ==================== END CANVAS HIT TEST ====================
+
 // ==================== TIMELINE FUNCTIONALITY ====================
 
 // Timeline state variables
-let timelineSortedQsos = [];
+// Sorted epoch milliseconds and QSO index for each timeline position (see timeline_index.py)
+let timelineTimes = new Float64Array(0);
+let timelineOrder = new Int32Array(0);
+// Sorted epoch minutes with at least one QSO and prefix sums of their QSO counts
+let timelineMinutes = new Float64Array(0);
+let timelinePrefixCounts = new Int32Array(1);
 let timelineLayer = L.layerGroup();
+// Timeline markers currently shown, keyed by QSO index
+const timelineMarkers = new Map();
+// Markers created for the timeline, keyed by QSO index
+const timelineMarkerCache = new Map();
 let isTimelineActive = false;
-let animationInterval = null;
+let isTimelinePlaying = false;
+let timelineLastFrameTime = null;
+let timelineSliderValue = 0;
+// Timeline positions [0, timelineCursor) have been added to the map (if they match timelineFilters)
+let timelineCursor = 0;
+let timelineTargetCursor = 0;
+let timelineFilters = null;
+let timelineFrame = null;
+// Maximum number of QSOs added or removed per animation frame
+const TIMELINE_BATCH_SIZE = 2000;
 let timelineMinDate = null;
 let timelineMaxDate = null;
 
-// Parse ADIF date and time to JavaScript Date object
+// Parse ADIF date and time (UTC) to JavaScript Date object
 function parseQsoDateTime(dateStr, timeStr) {
     if (!dateStr) return null;
     
@@ -63,47 +586,114 @@ function parseQsoDateTime(dateStr, timeStr) {
         sec = parseInt(timeStr.slice(4, 6)) || 0;
     }
     
-    return new Date(year, month, day, hour, min, sec);
+    const date = new Date(Date.UTC(year, month, day, hour, min, sec));
+    return isNaN(date.getTime()) ? null : date;
 }
 
-// Format date for display
+// Format date for display (QSO times are UTC)
 function formatDateTime(date) {
     if (!date) return '--';
-    const year = date.getFullYear();
-    const month = String(date.getMonth() + 1).padStart(2, '0');
-    const day = String(date.getDate()).padStart(2, '0');
-    const hour = String(date.getHours()).padStart(2, '0');
-    const min = String(date.getMinutes()).padStart(2, '0');
+    const year = date.getUTCFullYear();
+    const month = String(date.getUTCMonth() + 1).padStart(2, '0');
+    const day = String(date.getUTCDate()).padStart(2, '0');
+    const hour = String(date.getUTCHours()).padStart(2, '0');
+    const min = String(date.getUTCMinutes()).padStart(2, '0');
     return `${year}-${month}-${day} ${hour}:${min}`;
 }
 
 // Format date for label (short version)
 function formatDateShort(date) {
     if (!date) return '--';
-    const year = date.getFullYear();
-    const month = String(date.getMonth() + 1).padStart(2, '0');
-    const day = String(date.getDate()).padStart(2, '0');
+    const year = date.getUTCFullYear();
+    const month = String(date.getUTCMonth() + 1).padStart(2, '0');
+    const day = String(date.getUTCDate()).padStart(2, '0');
     return `${year}-${month}-${day}`;
 }
 
+// Index of first element greater than or equal to value in sorted array
+function lowerBound(sorted, value) {
+    let low = 0;
+    let high = sorted.length;
+    while (low < high) {
+        const mid = (low + high) >>> 1;
+        if (sorted[mid] < value) {
+            low = mid + 1;
+        } else {
+            high = mid;
+        }
+    }
+    return low;
+}
+
+// Index of first element greater than value in sorted array
+function upperBound(sorted, value) {
+    let low = 0;
+    let high = sorted.length;
+    while (low < high) {
+        const mid = (low + high) >>> 1;
+        if (sorted[mid] <= value) {
+            low = mid + 1;
+        } else {
+            high = mid;
+        }
+    }
+    return low;
+}
+
+// Build timeline index in the browser when the server did not send one
+function buildTimelineIndex() {
+    const entries = [];
+    qsos.forEach((qso, index) => {
+        const dateTime = parseQsoDateTime(qso.date, qso.time);
+        if (dateTime) {
+            entries.push([Math.floor(dateTime.getTime() / 1000), index]);
+        }
+    });
+    entries.sort((a, b) => a[0] - b[0] || a[1] - b[1]);
+
+    const minutes = [];
+    const counts = [];
+    entries.forEach(([timestamp]) => {
+        const minute = Math.floor(timestamp / 60);
+        if (minutes.length > 0 && minutes[minutes.length - 1] === minute) {
+            counts[counts.length - 1]++;
+        } else {
+            minutes.push(minute);
+            counts.push(1);
+        }
+    });
+
+    return {
+        times: entries.map(entry => entry[0]),
+        order: entries.map(entry => entry[1]),
+        minutes,
+        counts
+    };
+}
+
 // Initialize timeline data
 function initTimelineData() {
-    // Create sorted copy of QSOs with parsed dates
-    timelineSortedQsos = qsos
-        .map(qso => ({
-            ...qso,
-            dateTime: parseQsoDateTime(qso.date, qso.time)
-        }))
-        .filter(qso => qso.dateTime !== null) // Filter out QSOs without valid dates
-        .sort((a, b) => a.dateTime - b.dateTime);
+    if (timelineTimes.length === 0) {
+        const index = window.mapData.timeline && window.mapData.timeline.times
+            ? window.mapData.timeline
+            : buildTimelineIndex();
+
+        timelineTimes = Float64Array.from(index.times, seconds => seconds * 1000);
+        timelineOrder = Int32Array.from(index.order);
+        timelineMinutes = Float64Array.from(index.minutes);
+        timelinePrefixCounts = new Int32Array(index.counts.length + 1);
+        index.counts.forEach((count, i) => {
+            timelinePrefixCounts[i + 1] = timelinePrefixCounts[i] + count;
+        });
+    }
     
-    if (timelineSortedQsos.length === 0) {
+    if (timelineTimes.length === 0) {
         alert('No QSOs with valid dates found!');
         return false;
     }
     
-    timelineMinDate = timelineSortedQsos[0].dateTime;
-    timelineMaxDate = timelineSortedQsos[timelineSortedQsos.length - 1].dateTime;
+    timelineMinDate = new Date(timelineTimes[0]);
+    timelineMaxDate = new Date(timelineTimes[timelineTimes.length - 1]);
     
     // Update labels
     document.getElementById('timeline-start-label').textContent = formatDateShort(timelineMinDate);
@@ -115,12 +705,18 @@ function initTimelineData() {
     return true;
 }
 
+// Number of QSOs in minutes [fromMinute, toMinute)
+function countQsosInMinutes(fromMinute, toMinute) {
+    return timelinePrefixCounts[lowerBound(timelineMinutes, toMinute)] -
+        timelinePrefixCounts[lowerBound(timelineMinutes, fromMinute)];
+}
+
 // Generate activity bar showing on-air/off-air periods
 function generateActivityBar() {
     const activityBar = document.getElementById('timeline-activity-bar');
     activityBar.innerHTML = ''; // Clear existing segments
     
-    if (timelineSortedQsos.length === 0) return;
+    if (timelineTimes.length === 0) return;
     
     const totalRange = timelineMaxDate.getTime() - timelineMinDate.getTime();
     if (totalRange === 0) {
@@ -138,11 +734,11 @@ function generateActivityBar() {
     
     // Build activity segments - only track on-air periods
     const segments = [];
-    let currentSegmentStart = timelineSortedQsos[0].dateTime.getTime();
+    let currentSegmentStart = timelineTimes[0];
     let lastQsoTime = currentSegmentStart;
     
-    for (let i = 1; i < timelineSortedQsos.length; i++) {
-        const qsoTime = timelineSortedQsos[i].dateTime.getTime();
+    for (let i = 1; i < timelineTimes.length; i++) {
+        const qsoTime = timelineTimes[i];
         const gap = qsoTime - lastQsoTime;
         
         if (gap > offAirThreshold) {
@@ -191,46 +787,30 @@ function generateActivityBar() {
     console.log('Activity segments generated:', segments.length);
 }
 
-// Find the sliding window with maximum QSO count
+// Find the sliding window (at minute resolution) with maximum QSO count
 function findSlidingWindowPeak(intervalMinutes) {
-    if (timelineSortedQsos.length === 0) {
+    if (timelineMinutes.length === 0) {
         return { count: 0, startTime: null, endTime: null };
     }
     
-    const windowMs = intervalMinutes * 60 * 1000;
     let maxCount = 0;
-    let bestStartTime = timelineSortedQsos[0].dateTime;
-    let bestEndTime = new Date(bestStartTime.getTime() + windowMs);
-    
-    // Sliding window using two pointers
-    let left = 0;
-    let right = 0;
-    const n = timelineSortedQsos.length;
+    let bestMinute = timelineMinutes[0];
     
-    while (left < n) {
-        const windowStart = timelineSortedQsos[left].dateTime.getTime();
-        const windowEnd = windowStart + windowMs;
-        
-        // Expand right pointer to include all QSOs within window
-        while (right < n && timelineSortedQsos[right].dateTime.getTime() <= windowEnd) {
-            right++;
-        }
-        
-        const count = right - left;
+    // Windows starting at a minute with QSOs are enough to find the maximum
+    for (let i = 0; i < timelineMinutes.length; i++) {
+        const count = timelinePrefixCounts[lowerBound(timelineMinutes, timelineMinutes[i] + intervalMinutes)] -
+            timelinePrefixCounts[i];
         
         if (count > maxCount) {
             maxCount = count;
-            bestStartTime = timelineSortedQsos[left].dateTime;
-            bestEndTime = new Date(windowEnd);
+            bestMinute = timelineMinutes[i];
         }
-        
-        left++;
     }
     
     return {
         count: maxCount,
-        startTime: bestStartTime,
-        endTime: bestEndTime
+        startTime: new Date(bestMinute * 60000),
+        endTime: new Date((bestMinute + intervalMinutes) * 60000)
     };
 }
 
@@ -241,7 +821,7 @@ function generateRateChart(intervalMinutes = 60) {
     rateChart.innerHTML = '';
     yAxis.innerHTML = '';
     
-    if (timelineSortedQsos.length === 0) return;
+    if (timelineTimes.length === 0) return;
     
     const totalRange = timelineMaxDate.getTime() - timelineMinDate.getTime();
     if (totalRange === 0) return;
@@ -249,23 +829,19 @@ function generateRateChart(intervalMinutes = 60) {
     const intervalMs = intervalMinutes * 60 * 1000;
     const numBuckets = Math.ceil(totalRange / intervalMs) + 1;
     
-    // Count QSOs in each time bucket
-    const buckets = new Array(numBuckets).fill(0);
+    // Count QSOs in each time bucket using per-minute prefix sums
+    const buckets = new Array(numBuckets);
     const bucketTimes = [];
+    const startMinute = timelineMinutes[0];
     
     for (let i = 0; i < numBuckets; i++) {
-        bucketTimes.push(new Date(timelineMinDate.getTime() + i * intervalMs));
+        const fromMinute = startMinute + i * intervalMinutes;
+        buckets[i] = countQsosInMinutes(fromMinute, fromMinute + intervalMinutes);
+        bucketTimes.push(new Date(fromMinute * 60000));
     }
     
-    timelineSortedQsos.forEach(qso => {
-        const bucketIndex = Math.floor((qso.dateTime.getTime() - timelineMinDate.getTime()) / intervalMs);
-        if (bucketIndex >= 0 && bucketIndex < numBuckets) {
-            buckets[bucketIndex]++;
-        }
-    });
-    
     // Find max for scaling
-    const maxCount = Math.max(...buckets, 1);
+    const maxCount = buckets.reduce((max, count) => Math.max(max, count), 1);
     const peakIndex = buckets.indexOf(maxCount);
     const peakTime = bucketTimes[peakIndex];
     
@@ -335,76 +911,139 @@ function getSliderValueFromDate(date) {
     return Math.round(((date.getTime() - timelineMinDate.getTime()) / range) * 1000);
 }
 
-// Add single QSO to timeline layer
-function addQsoToTimelineLayer(qso) {
+// Create timeline marker for QSO (reused when scrubbing back and forth)
+function getTimelineMarker(index) {
+    let marker = timelineMarkerCache.get(index);
+    if (marker) return marker;
+
+    const qso = qsos[index];
     const centerLng = window.mapData.my_longitude;
     const adjustedLng = adjustLongitude(qso.longitude, centerLng);
-    const hideLines = document.getElementById('hide-lines-checkbox')?.checked || false;
     const useColorByBand = document.getElementById('uniform-color-checkbox')?.checked || true;
     
-    // Create marker
-    const marker = L.circleMarker([qso.latitude, adjustedLng], {
+    marker = L.circleMarker([qso.latitude, adjustedLng], Object.assign({
         radius: 4,
         fillColor: useColorByBand ? getBandColor(qso.band) : '#FF0000',
         color: '#000',
         weight: 1,
         opacity: 1,
         fillOpacity: 0.9
-    });
-    
-    const distanceDisplay = qso.distance !== null && qso.distance !== undefined ? `${qso.distance} km` : 'N/A';
-    
-    marker.bindPopup(`
-        <strong>${qso.call}</strong><br>
-        Date: ${qso.date}<br>
-        Time: ${qso.time}<br>
-        Mode: ${qso.mode}<br>
-        Band: ${qso.band}<br>
-        Grid: ${qso.grid}<br>
-        DXCC: ${qso.dxcc}<br>
-        Distance: ${distanceDisplay}
-    `);
-    
+    }, getRendererOptions()));
+
+    if (!useCanvasRenderer) {
+        marker.bindPopup(() => buildQsoPopup(qso));
+    }
+
+    timelineMarkerCache.set(index, marker);
+    return marker;
+}
+
+// Add single QSO to timeline layer
+function addQsoToTimelineLayer(index) {
+    const marker = getTimelineMarker(index);
     timelineLayer.addLayer(marker);
+    timelineMarkers.set(index, marker);
     
     // Draw arc if lines are not hidden
-    if (!hideLines) {
+    if (!timelineFilters.hideLines) {
         try {
-            const arc = drawArc(
-                [window.mapData.my_latitude, window.mapData.my_longitude],
-                [qso.latitude, adjustedLng]
-            );
-            timelineLayer.addLayer(arc);
+            timelineLayer.addLayer(getQsoArc(index));
         } catch (e) {
             console.log('Arc error:', e);
         }
     }
 }
 
-// Update timeline display based on slider position
-function updateTimelineDisplay(sliderValue) {
+// Remove single QSO from timeline layer
+function removeQsoFromTimelineLayer(index) {
+    const marker = timelineMarkers.get(index);
+    if (!marker) return;
+
+    timelineLayer.removeLayer(marker);
+    timelineMarkers.delete(index);
+
+    const arc = arcCache.get(index);
+    if (arc) {
+        timelineLayer.removeLayer(arc.polyline);
+    }
+}
+
+function isQsoInTimelineFilters(qso) {
+    const { modes, bands } = timelineFilters;
+    return (modes.size === 0 || modes.has(qso.mode)) && (bands.size === 0 || bands.has(qso.band));
+}
+
+// Move cursor towards target, adding or removing only QSOs in between
+function applyTimelineCursor() {
+    let budget = TIMELINE_BATCH_SIZE;
+
+    while (timelineCursor < timelineTargetCursor && budget-- > 0) {
+        const index = timelineOrder[timelineCursor++];
+        if (isQsoInTimelineFilters(qsos[index])) {
+            addQsoToTimelineLayer(index);
+        }
+    }
+    while (timelineCursor > timelineTargetCursor && budget-- > 0) {
+        removeQsoFromTimelineLayer(timelineOrder[--timelineCursor]);
+    }
+
+    document.getElementById('timeline-qso-count').textContent = `${timelineMarkers.size} / ${timelineTimes.length} QSOs`;
+}
+
+// Single animation frame: advance playback, then apply at most one batch of layer updates
+function timelineTick(now) {
+    timelineFrame = null;
+
+    if (isTimelinePlaying) {
+        const elapsed = timelineLastFrameTime === null ? 0 : now - timelineLastFrameTime;
+        const speed = parseInt(document.getElementById('timeline-speed').value);
+        timelineLastFrameTime = now;
+
+        // Same pace as before: 5 slider steps every `speed` milliseconds
+        const sliderValue = Math.min(timelineSliderValue + elapsed * 5 / speed, 1000);
+        document.getElementById('timeline-slider').value = Math.round(sliderValue);
+        setTimelineSliderValue(sliderValue);
+
+        if (sliderValue >= 1000) {
+            pauseTimeline();
+        }
+    }
+
+    applyTimelineCursor();
+
+    if (isTimelinePlaying || timelineCursor !== timelineTargetCursor) {
+        scheduleTimelineFrame();
+    }
+}
+
+function scheduleTimelineFrame() {
+    if (timelineFrame === null) {
+        timelineFrame = requestAnimationFrame(timelineTick);
+    }
+}
+
+function setTimelineSliderValue(sliderValue) {
     const currentDate = getDateFromSliderValue(sliderValue);
-    
-    // Get selected filters
-    const selectedModes = Array.from(document.querySelectorAll('.mode-checkbox:checked')).map(cb => cb.value);
-    const selectedBands = Array.from(document.querySelectorAll('.band-checkbox:checked')).map(cb => cb.value);
-    
-    // Clear current timeline layer
-    timelineLayer.clearLayers();
-    
-    // Filter and add QSOs up to current date
-    const visibleQsos = timelineSortedQsos.filter(qso => {
-        if (qso.dateTime > currentDate) return false;
-        if (selectedModes.length > 0 && !selectedModes.includes(qso.mode)) return false;
-        if (selectedBands.length > 0 && !selectedBands.includes(qso.band)) return false;
-        return true;
-    });
-    
-    visibleQsos.forEach(qso => addQsoToTimelineLayer(qso));
-    
-    // Update UI
+    timelineSliderValue = sliderValue;
+    timelineTargetCursor = upperBound(timelineTimes, currentDate.getTime());
     document.getElementById('timeline-current-date').textContent = formatDateTime(currentDate);
-    document.getElementById('timeline-qso-count').textContent = `${visibleQsos.length} / ${timelineSortedQsos.length} QSOs`;
+}
+
+// Update timeline display based on slider position
+// (rebuild is needed when filters change, otherwise only the difference is applied)
+function updateTimelineDisplay(sliderValue, rebuild = false) {
+    if (rebuild || timelineFilters === null) {
+        const { modes, bands } = getSelectedFilters();
+        const hideLinesCheckbox = document.getElementById('hide-lines-checkbox');
+        timelineFilters = { modes, bands, hideLines: !!(hideLinesCheckbox && hideLinesCheckbox.checked) };
+
+        timelineLayer.clearLayers();
+        timelineMarkers.clear();
+        timelineCursor = 0;
+    }
+
+    setTimelineSliderValue(sliderValue);
+    scheduleTimelineFrame();
 }
 
 // Start timeline mode
@@ -417,11 +1056,7 @@ function startTimeline() {
     document.getElementById('timeline-button').classList.add('active');
     
     // Hide all regular markers
-    map.eachLayer((layer) => {
-        if (layer instanceof L.CircleMarker || layer instanceof L.Polyline) {
-            map.removeLayer(layer);
-        }
-    });
+    hideQsoGroups();
     
     // Add timeline layer to map
     timelineLayer.addTo(map);
@@ -432,7 +1067,7 @@ function startTimeline() {
     
     // Reset slider
     document.getElementById('timeline-slider').value = 0;
-    updateTimelineDisplay(0);
+    updateTimelineDisplay(0, true);
     
     // Invalidate map size for proper display
     setTimeout(() => map.invalidateSize(), 100);
@@ -447,9 +1082,18 @@ function stopTimeline() {
     document.getElementById('timeline-container').classList.remove('active');
     document.getElementById('timeline-button').classList.remove('active');
     
+    if (timelineFrame !== null) {
+        cancelAnimationFrame(timelineFrame);
+        timelineFrame = null;
+    }
+
     // Remove timeline layer
     map.removeLayer(timelineLayer);
     timelineLayer.clearLayers();
+    timelineMarkers.clear();
+    timelineCursor = 0;
+    timelineTargetCursor = 0;
+    timelineFilters = null;
     
     // Restore regular markers
     updateMarkers();
@@ -461,10 +1105,8 @@ function stopTimeline() {
 // Play timeline animation
 function playTimeline() {
     const playBtn = document.getElementById('timeline-play-btn');
-    const slider = document.getElementById('timeline-slider');
-    const speed = parseInt(document.getElementById('timeline-speed').value);
     
-    if (animationInterval) {
+    if (isTimelinePlaying) {
         pauseTimeline();
         return;
     }
@@ -472,27 +1114,15 @@ function playTimeline() {
     playBtn.textContent = '⏸ Pause';
     playBtn.classList.add('playing');
     
-    animationInterval = setInterval(() => {
-        let currentValue = parseInt(slider.value);
-        
-        if (currentValue >= 1000) {
-            pauseTimeline();
-            return;
-        }
-        
-        // Increment by small steps for smooth animation
-        currentValue = Math.min(currentValue + 5, 1000);
-        slider.value = currentValue;
-        updateTimelineDisplay(currentValue);
-    }, speed);
+    isTimelinePlaying = true;
+    timelineLastFrameTime = null;
+    timelineSliderValue = parseInt(document.getElementById('timeline-slider').value);
+    scheduleTimelineFrame();
 }
 
 // Pause timeline animation
 function pauseTimeline() {
-    if (animationInterval) {
-        clearInterval(animationInterval);
-        animationInterval = null;
-    }
+    isTimelinePlaying = false;
     
     const playBtn = document.getElementById('timeline-play-btn');
     playBtn.textContent = '▶ Play';
@@ -532,144 +1162,57 @@ function initTimelineEventListeners() {
         updateTimelineDisplay(parseInt(this.value));
     });
     
-    // Speed change (no need to restart if already playing)
-    document.getElementById('timeline-speed').addEventListener('change', function() {
-        if (animationInterval) {
-            pauseTimeline();
-            playTimeline();
-        }
-    });
-    
     // Rate interval change
     document.getElementById('rate-interval').addEventListener('change', function() {
         if (isTimelineActive) {
             generateRateChart(parseInt(this.value));
         }
     });
-    
-    // Update timeline when filters change (if timeline is active)
-    document.querySelectorAll('.mode-checkbox, .band-checkbox').forEach(checkbox => {
-        checkbox.addEventListener('change', function() {
-            if (isTimelineActive) {
-                updateTimelineDisplay(parseInt(document.getElementById('timeline-slider').value));
-            }
-        });
-    });
+
+    // Filter changes reach the timeline through updateMarkers
 }
 
 // ==================== END TIMELINE FUNCTIONALITY ====================
 
-// Set total QSO count
-document.getElementById('total-qso-count').textContent = qsos.length;
-document.getElementById('stats-total-qso-count').textContent = qsos.length;
-
-// Calculate DXCC statistics
-const dxccCount = new Set(qsos.map(qso => qso.dxcc)).size;
-document.getElementById('dxcc-count').textContent = dxccCount;
+// ==================== STATISTICS ====================
 
-// Add markers to the map
-addMarkers();
+function renderDxccRow(data) {
+    const modeBreakdown = data.modes
+        .map(([mode, count]) => {
+            const modeColor = getModeColor(mode);
+            return `<div style="background-color: ${modeColor}; color: white; padding: 2px 5px; border-radius: 3px; margin: 2px; display: inline-block;">${mode}: ${count}</div>`;
+        })
+        .join('');
 
-// Set Color Pins Band checkbox as checked by default
-document.getElementById('uniform-color-checkbox').checked = true;
-
-
-// Create DXCC list with mode breakdown
-const dxccList = qsos.reduce((acc, qso) => {
-    if (!acc[qso.dxcc]) {
-        acc[qso.dxcc] = {
-            total: 0,
-            modes: {}
-        };
-    }
-    acc[qso.dxcc].total++;
-    if (!acc[qso.dxcc].modes[qso.mode]) {
-        acc[qso.dxcc].modes[qso.mode] = 0;
-    }
-    acc[qso.dxcc].modes[qso.mode]++;
-    return acc;
-}, {});
-
-const dxccListElement = document.getElementById('dxcc-list');
-Object.entries(dxccList)
-    .sort((a, b) => b[1].total - a[1].total)
-    .forEach(([dxcc, data]) => {
-        const modeBreakdown = Object.entries(data.modes)
-            .sort((a, b) => {
-                // Custom sorting order
-                const order = {
-                    'CW': 1,
-                    'SSB': 2,
-                    'FT8': 3,
-                    'FT4': 4
-                };
-                const orderA = order[a[0]] || 999;  // Default high number for other modes
-                const orderB = order[b[0]] || 999;
-
-                if (orderA !== orderB) {
-                    return orderA - orderB;
-                }
-                // If both are in the same category, sort alphabetically
-                return a[0].localeCompare(b[0]);
-            })
-            .map(([mode, count]) => {
-                const modeColor = getModeColor(mode);
-                return `<div style="background-color: ${modeColor}; color: white; padding: 2px 5px; border-radius: 3px; margin: 2px; display: inline-block;">${mode}: ${count}</div>`;
-            })
-            .join('');
-
-        dxccListElement.innerHTML += `
-            <tr>
-                <td>${dxcc}</td>
-                <td>${data.total}</td>
-                <td><div style="display: flex; flex-wrap: wrap; gap: 5px;">${modeBreakdown}</div></td>
-            </tr>`;
-    });
-
-// Calculate Band statistics
-const bandCount = new Set(qsos.map(qso => qso.band)).size;
-document.getElementById('band-count').textContent = bandCount;
-
-// Create Band list
-const bandList = qsos.reduce((acc, qso) => {
-    if (!acc[qso.band]) {
-        acc[qso.band] = 0;
-    }
-    acc[qso.band]++;
-    return acc;
-}, {});
-
-const bandListElement = document.getElementById('band-list');
-Object.entries(bandList)
-    .sort((a, b) => b[1] - a[1])
-    .forEach(([band, count]) => {
-        const color = getBandColor(band);
-        bandListElement.innerHTML += `
-            <tr>
-                <td>
-                    <div style="display: flex; align-items: center; gap: 10px;">
-                        <div style="width: 20px; height: 20px; border-radius: 50%; background-color: ${color}; border: 1px solid #ccc;"></div>
-                        ${band}
-                    </div>
-                </td>
-                <td>${count}</td>
-                <td>${((count / qsos.length) * 100).toFixed(1)}%</td>
-            </tr>`;
-    });
+    return `
+        <tr>
+            <td>${data.name}</td>
+            <td>${data.total}</td>
+            <td><div style="display: flex; flex-wrap: wrap; gap: 5px;">${modeBreakdown}</div></td>
+        </tr>`;
+}
 
-// Create Longest Distance QSOs list
-const longestDistanceListElement = document.getElementById('longest-distance-list');
-const qsosWithDistance = qsos
-    .filter(qso => qso.distance !== null && qso.distance !== undefined)
-    .sort((a, b) => b.distance - a.distance)
-    .slice(0, 20);
+function renderBandRow(band, count, total) {
+    const color = getBandColor(band);
+    return `
+        <tr>
+            <td>
+                <div style="display: flex; align-items: center; gap: 10px;">
+                    <div style="width: 20px; height: 20px; border-radius: 50%; background-color: ${color}; border: 1px solid #ccc;"></div>
+                    ${band}
+                </div>
+            </td>
+            <td>${count}</td>
+            <td>${((count / total) * 100).toFixed(1)}%</td>
+        </tr>`;
+}
 
-qsosWithDistance.forEach((qso, index) => {
+function renderLongestDistanceRow(qso, rank) {
     const modeColor = getModeColor(qso.mode);
     const bandColor = getBandColor(qso.band);
-    longestDistanceListElement.innerHTML += `
+    return `
         <tr>
-            <td>${index + 1}</td>
+            <td>${rank}</td>
             <td><strong>${qso.call}</strong></td>
             <td>${qso.dxcc}</td>
             <td><strong>${qso.distance}</strong></td>
@@ -685,7 +1228,47 @@ qsosWithDistance.forEach((qso, index) => {
             <td>${qso.date}</td>
             <td>${qso.grid}</td>
         </tr>`;
-});
+}
+
+// Fill statistics cards and tables from summary, each table with a single DOM update
+function renderStatistics(summary) {
+    document.getElementById('dxcc-count').textContent = summary.dxcc_count;
+    document.getElementById('band-count').textContent = summary.band_count;
+
+    document.getElementById('dxcc-list').innerHTML = summary.dxcc
+        .map(renderDxccRow)
+        .join('');
+
+    document.getElementById('band-list').innerHTML = summary.bands
+        .map(([band, count]) => renderBandRow(band, count, summary.total))
+        .join('');
+
+    document.getElementById('longest-distance-list').innerHTML = summary.longest
+        .map((qso, index) => renderLongestDistanceRow(qso, index + 1))
+        .join('');
+}
+
+let statisticsRendered = false;
+
+// Statistics summary computed on upload is rendered when the panel is opened for the first time
+function ensureStatisticsRendered() {
+    if (statisticsRendered || !window.mapData.summary) return;
+    statisticsRendered = true;
+    renderStatistics(window.mapData.summary);
+}
+
+// ==================== END STATISTICS ====================
+
+// Set total QSO count
+document.getElementById('total-qso-count').textContent = qsos.length;
+document.getElementById('stats-total-qso-count').textContent = qsos.length;
+
+// Add markers to the map
+addMarkers();
+
+// Set Color Pins Band checkbox as checked by default
+document.getElementById('uniform-color-checkbox').checked = true;
+
 
 function getBandColor(band) {
     const bandColors = {
@@ -742,106 +1325,12 @@ function getModeColor(mode) {
     return modeColors[mode] || '#95A5A6';  // Default to light gray if mode not found
 }
 
-function drawArc(start, end) {
-    // Convert to radians
-    const startLat = start[0] * Math.PI / 180;
-    const startLng = start[1] * Math.PI / 180;
-    const endLat = end[0] * Math.PI / 180;
-    const endLng = end[1] * Math.PI / 180;
-
-    // Calculate great circle distance
-    const d = 2 * Math.asin(Math.sqrt(
-        Math.pow(Math.sin((endLat - startLat) / 2), 2) +
-        Math.cos(startLat) * Math.cos(endLat) * Math.pow(Math.sin((endLng - startLng) / 2), 2)
-    ));
-
-    // Calculate points along the great circle
-    const points = [];
-    const steps = 100;
-    for (let i = 0; i <= steps; i++) {
-        const t = i / steps;
-
-        // Calculate intermediate point using great circle formula
-        const A = Math.sin((1 - t) * d) / Math.sin(d);
-        const B = Math.sin(t * d) / Math.sin(d);
-        const x = A * Math.cos(startLat) * Math.cos(startLng) + B * Math.cos(endLat) * Math.cos(endLng);
-        const y = A * Math.cos(startLat) * Math.sin(startLng) + B * Math.cos(endLat) * Math.sin(endLng);
-        const z = A * Math.sin(startLat) + B * Math.sin(endLat);
-
-        let lat = Math.atan2(z, Math.sqrt(x * x + y * y)) * 180 / Math.PI;
-        let lng = Math.atan2(y, x) * 180 / Math.PI;
-
-        // Adjust longitude to ensure we take the shortest path
-        const centerLng = window.mapData.my_longitude;
-        while (lng - centerLng > 180) lng -= 360;
-        while (lng - centerLng < -180) lng += 360;
-
-        points.push([lat, lng]);
-    }
-
-    // Create the polyline
-    return L.polyline(points, {
-        color: 'red',
-        weight: 2,
-        opacity: 0.5
-    });
-}
-
 function adjustLongitude(lng, centerLng) {
     while (lng - centerLng > 180) lng -= 360;
     while (lng - centerLng < -180) lng += 360;
     return lng;
 }
 
-function addMarkers() {
-    const centerLng = window.mapData.my_longitude;
-    // Check if lines should be hidden
-    const hideLinesCheckbox = document.getElementById('hide-lines-checkbox');
-    const hideLines = hideLinesCheckbox && hideLinesCheckbox.checked;
-
-    qsos.forEach(qso => {
-        // Adjust longitude of the marker to match the arc
-        const adjustedLng = adjustLongitude(qso.longitude, centerLng);
-
-        const marker = L.circleMarker([qso.latitude, adjustedLng], {
-            radius: 3,
-            fillColor: document.getElementById('uniform-color-checkbox').checked ? getBandColor(qso.band) : '#FF0000',
-            color: '#000',
-            weight: 1,
-            opacity: 1,
-            fillOpacity: 0.8
-        });
-
-        const distanceDisplay = qso.distance !== null && qso.distance !== undefined ? `${qso.distance} km` : 'N/A';
-        
-        marker.bindPopup(`
-            <strong>${qso.call}</strong><br>
-            Date: ${qso.date}<br>
-            Time: ${qso.time}<br>
-            Mode: ${qso.mode}<br>
-            Band: ${qso.band}<br>
-            Grid: ${qso.grid}<br>
-            DXCC: ${qso.dxcc}<br>
-            Distance: ${distanceDisplay}
-        `);
-
-        marker.addTo(map);
-
-        // Draw arc only if lines are not hidden
-        if (!hideLines) {
-            try {
-                const arc = drawArc(
-                    [window.mapData.my_latitude, window.mapData.my_longitude],
-                    [qso.latitude, adjustedLng]
-                );
-                arc.addTo(map);
-            } catch (e) {
-                console.log(e);
-            }
-        }
-    });
-}
-
 var myMarker = L.marker([window.mapData.my_latitude, window.mapData.my_longitude], {
     icon: L.divIcon({
         className: 'my-marker',
@@ -865,6 +1354,7 @@ const contentContainer = document.querySelector('.content-container');
 const showStatsButton = document.getElementById('show-stats-button');
 showStatsButton.addEventListener('click', function() {
     if (contentContainer.style.display === 'none') {
+        ensureStatisticsRendered();
         contentContainer.style.display = 'block';
         showStatsButton.textContent = 'Hide Statistics';
     } else {
@@ -874,16 +1364,7 @@ showStatsButton.addEventListener('click', function() {
 });
 
 // Add uniform color toggle functionality
-document.getElementById('uniform-color-checkbox').addEventListener('change', function() {
-    // Remove all existing markers
-    map.eachLayer((layer) => {
-        if (layer instanceof L.CircleMarker) {
-            map.removeLayer(layer);
-        }
-    });
-    // Add markers again with new color setting
-    addMarkers();
-});
+document.getElementById('uniform-color-checkbox').addEventListener('change', updateMarkerColors);
 
 // Add mode filter functionality
 function initializeModeFilter() {
@@ -971,75 +1452,12 @@ applyModeColors();
 function updateMarkers() {
     // Skip if timeline is active - timeline handles its own markers
     if (isTimelineActive) {
-        updateTimelineDisplay(parseInt(document.getElementById('timeline-slider').value));
+        updateTimelineDisplay(parseInt(document.getElementById('timeline-slider').value), true);
         return;
     }
-    
-    // Remove all existing markers and arcs
-    map.eachLayer((layer) => {
-        if (layer instanceof L.CircleMarker || layer instanceof L.Polyline) {
-            map.removeLayer(layer);
-        }
-    });
-
-    // Get selected modes
-    const selectedModes = Array.from(document.querySelectorAll('.mode-checkbox:checked'))
-        .map(cb => cb.value);
-
-    // Get selected bands
-    const selectedBands = Array.from(document.querySelectorAll('.band-checkbox:checked'))
-        .map(cb => cb.value);
 
-    // Check if lines should be hidden
-    const hideLinesCheckbox = document.getElementById('hide-lines-checkbox');
-    const hideLines = hideLinesCheckbox && hideLinesCheckbox.checked;
-
-    const centerLng = window.mapData.my_longitude;
-    // Add markers and arcs only for selected modes and bands
-    qsos.forEach(qso => {
-        if (selectedModes.includes(qso.mode) && selectedBands.includes(qso.band)) {
-            // Adjust longitude of the marker to match the arc
-            const adjustedLng = adjustLongitude(qso.longitude, centerLng);
-
-            // Add marker
-            const marker = L.circleMarker([qso.latitude, adjustedLng], {
-                radius: 3,
-                fillColor: document.getElementById('uniform-color-checkbox').checked ? getBandColor(qso.band) : '#FF0000',
-                color: '#000',
-                weight: 1,
-                opacity: 1,
-                fillOpacity: 0.8
-            });
-
-            const distanceDisplay = qso.distance !== null && qso.distance !== undefined ? `${qso.distance} km` : 'N/A';
-            
-            marker.bindPopup(`
-                <strong>${qso.call}</strong><br>
-                Date: ${qso.date}<br>
-                Time: ${qso.time}<br>
-                Mode: ${qso.mode}<br>
-                Band: ${qso.band}<br>
-                Grid: ${qso.grid}<br>
-                DXCC: ${qso.dxcc}<br>
-                Distance: ${distanceDisplay}
-            `);
-
-            marker.addTo(map);
-
-            // Draw arc only if lines are not hidden
-            if (!hideLines) {
-                try {
-                    const arc = drawArc(
-                        [window.mapData.my_latitude, window.mapData.my_longitude],
-                        [qso.latitude, adjustedLng]
-                    );
-                    arc.addTo(map);
-                } catch (e) {
-                    console.log(e);
-                }
-            }
-        }
-    });
+    const { modes, bands } = getSelectedFilters();
+    applyFilters(modes, bands);
 }
 
 // Initialize mode filter after map is loaded
@@ -1113,9 +1531,6 @@ function initializeBandFilter() {
 // Initialize band filter after map is loaded
 initializeBandFilter();
 
-// Update markers when uniform color checkbox changes
-document.getElementById('uniform-color-checkbox').addEventListener('change', updateMarkers);
-
 // Add event listener for hide lines checkbox
 document.getElementById('hide-lines-checkbox').addEventListener('change', updateMarkers);
 
@@ -1,7 +1,11 @@
-from flask import Blueprint, render_template, request, redirect, flash, url_for
-from pyhamtools.locator import locator_to_latlong
-from qsomap.common.log_reader import read_log_file
+from flask import Blueprint, render_template, request, redirect, flash, url_for, jsonify
+from qsomap.common.log_reader import LogFileProcessor
 from qsomap.common.grid_validator import validate_grid_square
+from qsomap.common.grid_aggregation import build_grid_aggregates
+from qsomap.common.density_grid import build_density_grid
+from qsomap.common.timeline_index import build_timeline_index
+from qsomap.common.result_cache import log_hash, processed_logs, wrapped_statistics
+from qsomap.common.wrapped_stats import compute_wrapped_statistics
 from markupsafe import Markup
 
 upload_bp = Blueprint('upload', __name__)
@@ -76,6 +80,8 @@ def validate_locator(my_locator):
 
 def convert_locator_to_coordinates(locator):
     """Convert locator to coordinates and flash error message if invalid, return tuple (lat, lng) or (None, None)"""
+    from pyhamtools.locator import locator_to_latlong
+
     try:
         latitude, longitude = locator_to_latlong(locator)
         return latitude, longitude
@@ -98,6 +104,31 @@ def read_file_content(file):
             return None
 
 
+def process_log(file_content, my_latitude, my_longitude):
+    """
+    Process log file and compute everything the QSO list page needs.
+
+    Args:
+        file_content: Log file content as string
+        my_latitude: Own latitude
+        my_longitude: Own longitude
+
+    Returns:
+        Dictionary with QSOs, error report, summary statistics, grid
+        aggregates, density grid and timeline index
+    """
+    processor = LogFileProcessor(my_latitude, my_longitude)
+    qsos = processor.process(file_content)
+    return {
+        'qsos': qsos,
+        'errors': processor.errors.summary(),
+        'summary': processor.statistics.summary(),
+        'grid_aggregates': build_grid_aggregates(qsos),
+        'density_grid': build_density_grid(qsos),
+        'timeline': build_timeline_index(qsos),
+    }
+
+
 @upload_bp.route('/upload', methods=['GET', 'POST'])
 def upload_file():
     if request.method == 'POST':
@@ -129,17 +160,66 @@ def upload_file():
         if not file_content:
             return redirect(url_for('upload.upload_file'))
 
-        # Process QSO data
-        qsos = read_log_file(file_content, my_latitude, my_longitude)
+        # Process QSO data (same file and location again is served from cache)
+        cache_key = log_hash(file_content, my_latitude, my_longitude)
+        result = processed_logs.get(cache_key)
+        if result is None:
+            result = process_log(file_content, my_latitude, my_longitude)
+            processed_logs.put(cache_key, result)
         flash('File uploaded successfully!')
 
         return render_template(
             'qso_list.html',
-            qsos=qsos,
             my_latitude=my_latitude,
             my_longitude=my_longitude,
             callsign=callsign,
-            filename=filename
+            filename=filename,
+            **result
         )
 
     return render_template('main.html')
+
+
+@upload_bp.route('/api/v1/wrapped', methods=['POST'])
+def wrapped_api():
+    """
+    Compute Ham Wrapped statistics of an uploaded log.
+
+    Form fields: file (ADIF or Cabrillo log) and optional my_locator. The
+    optional year query parameter selects a single year.
+
+    Returns:
+        JSON {years: {year: statistics}}, or {year, stats} when a year is
+        requested; error message with status 400 (invalid input) or 404
+        (no QSOs in the requested year)
+    """
+    file = request.files.get('file')
+    if file is None or not file.filename or not allowed_file(file.filename):
+        return jsonify({'error': 'Please upload ADIF (.adif, .adi) or Cabrillo (.cbr, .log, .cabrillo) file.'}), 400
+
+    my_latitude, my_longitude = None, None
+    my_locator = sanitize_text_input(request.form.get('my_locator'))
+    if my_locator:
+        my_locator = my_locator.upper()
+        if not validate_grid_square(my_locator):
+            return jsonify({'error': 'Invalid locator format.'}), 400
+        from pyhamtools.locator import locator_to_latlong
+        my_latitude, my_longitude = locator_to_latlong(my_locator)
+
+    year = request.args.get('year', type=int)
+    file_content = read_file_content(file)
+    if not file_content:
+        return jsonify({'error': 'Empty file.'}), 400
+
+    # Statistics of all years are computed in one pass, so one entry serves every year
+    cache_key = log_hash(file_content, my_latitude, my_longitude)
+    years = wrapped_statistics.get(cache_key)
+    if years is None:
+        years = compute_wrapped_statistics(file_content, my_latitude, my_longitude)
+        wrapped_statistics.put(cache_key, years)
+
+    if year is None:
+        return jsonify({'years': years})
+    if year not in years:
+        return jsonify({'error': f'No QSOs in {year}.'}), 404
+    return jsonify({'year': year, 'stats': years[year]})
@@ -0,0 +1,110 @@
+"""
+Import time measurement utility based on ``python -X importtime``.
+
+Usage::
+
+    python -m qsomap.utils.import_time [module] [--top N]
+"""
+
+import os
+import re
+import sys
+import argparse
+import subprocess
+from collections import namedtuple
+
+ImportTiming = namedtuple('ImportTiming', ['module', 'self_us', 'cumulative_us', 'depth'])
+
+_IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( +)(\S+)$')
+
+
+def parse_importtime(output):
+    """
+    Parse ``-X importtime`` output.
+
+    Args:
+        output: stderr of a Python process started with ``-X importtime``
+
+    Returns:
+        List of ImportTiming tuples in import completion order
+    """
+    timings = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            timings.append(ImportTiming(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return timings
+
+
+def measure_import_time(module, python=sys.executable, env=None, cwd=None):
+    """
+    Import module in a fresh interpreter and collect its import timings.
+
+    Args:
+        module: Dotted module name to import
+        python: Python executable to use
+        env: Optional environment overrides
+        cwd: Working directory (defaults to the repository root)
+
+    Returns:
+        List of ImportTiming tuples
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    if cwd is None:
+        cwd = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    process_env = dict(os.environ)
+    process_env.update(env or {})
+
+    result = subprocess.run(
+        [python, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=cwd,
+        env=process_env,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+
+    return parse_importtime(result.stderr)
+
+
+def total_import_time_us(timings, module):
+    """Get cumulative import time of module in microseconds (0 if not imported)."""
+    for timing in timings:
+        if timing.module == module:
+            return timing.cumulative_us
+    return 0
+
+
+def format_report(timings, top=20):
+    """
+    Format top-level import breakdown sorted by cumulative time.
+
+    Args:
+        timings: List of ImportTiming tuples
+        top: Number of slowest imports to include
+
+    Returns:
+        Report as string
+    """
+    slowest = sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]
+    lines = [f"{'cumulative [ms]':>16} {'self [ms]':>10}  module"]
+    for timing in slowest:
+        lines.append(
+            f"{timing.cumulative_us / 1000:>16.1f} {timing.self_us / 1000:>10.1f}  "
+            f"{'  ' * timing.depth}{timing.module}"
+        )
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Report import time breakdown of a module.')
+    parser.add_argument('module', nargs='?', default='app', help='module to import (default: app)')
+    parser.add_argument('--top', type=int, default=20, help='number of slowest imports to show')
+    args = parser.parse_args()
+
+    print(format_report(measure_import_time(args.module), args.top))
@@ -0,0 +1,79 @@
+"""
+Non-blocking logging pipeline based on QueueHandler and QueueListener.
+
+Request threads only put log records on an in-memory queue; a background
+listener thread writes them to the real (file/console) handlers, so slow
+disk I/O never stalls a request.
+"""
+
+import queue
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener
+
+_queue_handler = None
+_listener = None
+_handlers = ()
+
+
+def configure_queue_logging(handlers, level=logging.INFO,
+                            fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s'):
+    """
+    Route root logger through a queue to the given handlers.
+
+    Args:
+        handlers: Handlers which do the actual (blocking) output
+        level: Root logger level
+        fmt: Log format applied to all handlers
+
+    Returns:
+        The started QueueListener
+    """
+    global _queue_handler, _handlers
+
+    formatter = logging.Formatter(fmt)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    _handlers = tuple(handlers)
+
+    _queue_handler = QueueHandler(queue.SimpleQueue())
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    root.setLevel(level)
+
+    atexit.register(stop_queue_listener)
+    return _start_listener()
+
+
+def _start_listener():
+    global _listener
+    _listener = QueueListener(_queue_handler.queue, *_handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def restart_queue_listener():
+    """
+    Start a fresh listener after fork.
+
+    The listener thread does not survive fork, so each gunicorn worker has
+    to start its own (see post_fork in gunicorn_config.py). A new queue is
+    used because the parent's queue may have been locked during fork.
+    """
+    if _queue_handler is None:
+        return None
+    _queue_handler.queue = queue.SimpleQueue()
+    return _start_listener()
+
+
+def stop_queue_listener():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        try:
+            _listener.stop()
+        except Exception:
+            pass
+        _listener = None
@@ -3,7 +3,11 @@ Conftest file for pytest configuration and shared fixtures.
 """
 import sys
 import os
+import tempfile
 
 # Add project root to Python path so tests can import modules
 project_root = os.path.dirname(os.path.dirname(__file__))
 sys.path.insert(0, project_root)
+
+# Keep log files written by importing app out of the working tree
+os.environ.setdefault('LOG_DIR', tempfile.mkdtemp(prefix='hamlogmap-logs-'))
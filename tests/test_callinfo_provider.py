@@ -0,0 +1,181 @@
+"""
+Test suite for CallInfoProvider and hot reloading of country data.
+"""
+import os
+import pytest
+import redis
+
+from qsomap.common.callinfo_provider import CallInfoProvider, CountryDataRefresher, ResilientCallinfo
+from qsomap.common.circuit_breaker import CircuitBreaker
+
+POLAND_CTY = """Poland:                   15:  28:  EU:   52.28:   -18.67:    -1.0:  SP:
+    SP,SQ;
+"""
+
+DXPEDITION_CTY = POLAND_CTY + """Canary Islands:           33:  36:  AF:   28.32:    15.85:     0.0:  EA8:
+    EA8,=SP3WKW;
+"""
+
+
+@pytest.fixture
+def country_files(tmp_path, monkeypatch):
+    """Point CallInfoProvider at temporary CTY.DAT and index files."""
+    cty_file = tmp_path / 'cty.dat'
+    cty_file.write_text(POLAND_CTY)
+    index_file = tmp_path / 'cty.idx'
+
+    monkeypatch.setenv('USE_COUNTRYFILE_FROM_REDIS', 'false')
+    monkeypatch.setenv('CTY_DAT_FILE', str(cty_file))
+    monkeypatch.setenv('CTY_INDEX_FILE', str(index_file))
+    monkeypatch.setattr(CallInfoProvider, '_cic', None)
+    monkeypatch.setattr(CallInfoProvider, '_source', None)
+    return cty_file, index_file
+
+
+class FakeLookup:
+    """Lookup returning fixed country or raising configured error."""
+
+    def __init__(self, country, error=None):
+        self.country = country
+        self.error = error
+        self.calls = 0
+
+    def get_all(self, callsign, timestamp=None):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        if callsign == 'UNKNOWN':
+            raise KeyError(callsign)
+        return {'country': self.country}
+
+
+def _touch_newer(path, content):
+    """Rewrite file and move its mtime forward so the change is detected."""
+    stat = os.stat(path)
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+class TestCallInfoProvider:
+    """Test cases for CallInfoProvider."""
+
+    @pytest.mark.unit
+    def test_uses_compiled_index_without_redis(self, country_files):
+        """Test that the compiled index is built and used when Redis is disabled."""
+        cty_file, index_file = country_files
+
+        callinfo = CallInfoProvider.get()
+
+        assert index_file.exists()
+        assert callinfo.get_all('SP3WKW')['country'] == 'Poland'
+
+
+class TestResilientCallinfo:
+    """Test cases for Redis lookups guarded by circuit breaker."""
+
+    @pytest.mark.unit
+    def test_uses_primary_when_healthy(self):
+        """Test that healthy Redis answers lookups."""
+        callinfo = ResilientCallinfo(FakeLookup('Redis'), FakeLookup('Local'))
+
+        assert callinfo.get_all('SP3WKW')['country'] == 'Redis'
+        assert callinfo.metrics()['state'] == CircuitBreaker.CLOSED
+
+    @pytest.mark.unit
+    def test_unknown_callsign_is_not_a_failure(self):
+        """Test that KeyError is propagated without counting as Redis failure."""
+        callinfo = ResilientCallinfo(FakeLookup('Redis'), FakeLookup('Local'))
+
+        with pytest.raises(KeyError):
+            callinfo.get_all('UNKNOWN')
+        assert callinfo.metrics()['failures'] == 0
+
+    @pytest.mark.unit
+    def test_falls_back_and_trips_on_redis_errors(self):
+        """Test that Redis errors use local index and open the breaker."""
+        primary = FakeLookup('Redis', error=redis.TimeoutError('timeout'))
+        callinfo = ResilientCallinfo(primary, FakeLookup('Local'),
+                                     CircuitBreaker(failure_threshold=2, recovery_timeout=60))
+
+        results = [callinfo.get_all('SP3WKW')['country'] for _ in range(5)]
+
+        assert results == ['Local'] * 5
+        # Once open, Redis is not called at all
+        assert primary.calls == 2
+        metrics = callinfo.metrics()
+        assert metrics['state'] == CircuitBreaker.OPEN
+        assert metrics['fallback_lookups'] == 5
+
+    @pytest.mark.unit
+    def test_open_breaker_without_fallback_raises_key_error(self):
+        """Test that lookups fail fast when Redis is down and no local index exists."""
+        callinfo = ResilientCallinfo(FakeLookup('Redis', error=redis.ConnectionError('down')),
+                                     breaker=CircuitBreaker(failure_threshold=1))
+
+        with pytest.raises(KeyError):
+            callinfo.get_all('SP3WKW')
+
+
+class TestCountryDataRefresher:
+    """Test cases for background reloading of country data."""
+
+    @pytest.mark.unit
+    def test_no_reload_when_source_unchanged(self, country_files):
+        """Test that unchanged source does not trigger reload."""
+        old = CallInfoProvider.get()
+        refresher = CountryDataRefresher(interval=60)
+
+        assert refresher.check() is False
+        assert CallInfoProvider.get() is old
+
+    @pytest.mark.unit
+    def test_reload_swaps_snapshot(self, country_files):
+        """Test that changed CTY.DAT is recompiled and swapped in atomically."""
+        cty_file, _ = country_files
+        old = CallInfoProvider.get()
+        reloaded = []
+        refresher = CountryDataRefresher(interval=60, on_reload=reloaded.append)
+
+        _touch_newer(cty_file, DXPEDITION_CTY)
+
+        assert refresher.check() is True
+        new = CallInfoProvider.get()
+        assert new is not old
+        assert reloaded == [new]
+        assert new.get_all('SP3WKW')['country'] == 'Canary Islands'
+        # In-flight requests holding the old snapshot keep working
+        assert old.get_all('SP3WKW')['country'] == 'Poland'
+        # Recompiling the index must not trigger a second reload
+        assert refresher.check() is False
+
+    @pytest.mark.unit
+    def test_index_recompiled_by_another_worker_is_no_new_version(self, country_files):
+        """Test that only CTY.DAT changes trigger a reload, not a recompiled index."""
+        _, index_file = country_files
+        CallInfoProvider.get()
+        refresher = CountryDataRefresher(interval=60)
+
+        stat = os.stat(index_file)
+        os.utime(index_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+        assert refresher.check() is False
+
+    @pytest.mark.unit
+    def test_index_compiled_while_waiting_for_lock(self, country_files, monkeypatch):
+        """Test that a worker does not compile an index another worker compiled meanwhile."""
+        import qsomap.common.callinfo_provider as provider
+
+        compiled = []
+        stale = iter([True, False])
+        monkeypatch.setattr(provider, 'is_index_stale', lambda *args: next(stale))
+        monkeypatch.setattr(provider, 'compile_cty_index', lambda *args: compiled.append(args))
+
+        assert CallInfoProvider.get_index_files() is not None
+        assert compiled == []
+
+    @pytest.mark.unit
+    def test_refresher_disabled_by_default(self, country_files, monkeypatch):
+        """Test that refresher is not started without reload interval."""
+        monkeypatch.delenv('COUNTRY_DATA_RELOAD_INTERVAL', raising=False)
+
+        assert CallInfoProvider.start_refresher() is None
@@ -0,0 +1,86 @@
+"""
+Test suite for the circuit breaker guarding Redis lookups.
+"""
+import pytest
+
+from qsomap.common.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(failure_threshold=3, recovery_timeout=10, clock=clock)
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker state transitions."""
+
+    @pytest.mark.unit
+    def test_starts_closed(self, breaker):
+        """Test that new breaker lets calls through."""
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request()
+
+    @pytest.mark.unit
+    def test_trips_after_consecutive_failures(self, breaker):
+        """Test that breaker opens after failure threshold is reached."""
+        assert breaker.record_failure() is False
+        assert breaker.record_failure() is False
+        assert breaker.record_failure() is True
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+        assert breaker.metrics()['trips'] == 1
+        assert breaker.metrics()['rejected'] == 1
+
+    @pytest.mark.unit
+    def test_success_resets_failure_count(self, breaker):
+        """Test that failures must be consecutive to trip the breaker."""
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    @pytest.mark.unit
+    def test_half_open_probe_recovers(self, breaker, clock):
+        """Test that successful probe after recovery timeout closes the breaker."""
+        for _ in range(3):
+            breaker.record_failure()
+
+        clock.now = 10
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request()
+        # Only one probe at a time
+        assert not breaker.allow_request()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    @pytest.mark.unit
+    def test_half_open_probe_failure_reopens(self, breaker, clock):
+        """Test that failed probe re-opens the breaker."""
+        for _ in range(3):
+            breaker.record_failure()
+
+        clock.now = 10
+        assert breaker.allow_request()
+        assert breaker.record_failure() is True
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.metrics()['trips'] == 2
@@ -0,0 +1,182 @@
+"""
+Test suite for the precompiled, memory-mapped country index.
+"""
+import pytest
+
+import os
+import gzip
+
+from qsomap.common.cty_index import (
+    CtyIndex,
+    CtyIndexError,
+    DEFAULT_CTY_DAT,
+    HEADER,
+    MAGIC,
+    compile_cty_index,
+    compressed_index_file,
+    is_index_stale,
+    parse_cty_dat,
+)
+
+SAMPLE_CTY = """Poland:                   15:  28:  EU:   52.28:   -18.67:    -1.0:  SP:
+    3Z,HF,SN,SO,SP,SQ,SR,=SP3WKW/MM;
+Canary Islands:           33:  36:  AF:   28.32:    15.85:     0.0:  EA8:
+    AM8,AN8,EA8,EB8,EC8,ED8,EE8,EF8,EG8,EH8;
+Asiatic Russia:           17:  30:  AS:   55.88:   -84.08:    -7.0:  UA9:
+    R8,R9,UA8,UA9,UA0(19)[34]{AS}<60.0/-130.0>~-10.0~;
+"""
+
+
+@pytest.fixture
+def index_file(tmp_path):
+    """Compile sample CTY.DAT into temporary index file."""
+    source = tmp_path / 'cty.dat'
+    source.write_text(SAMPLE_CTY)
+    destination = tmp_path / 'cty.idx'
+    compile_cty_index(str(source), str(destination))
+    return str(destination)
+
+
+@pytest.fixture
+def index(index_file):
+    """Open compiled sample index."""
+    cty_index = CtyIndex(index_file)
+    yield cty_index
+    cty_index.close()
+
+
+class TestCtyParser:
+    """Test cases for CTY.DAT parsing."""
+
+    @pytest.mark.unit
+    def test_parse_entities_and_aliases(self):
+        """Test that entities, prefixes and exact calls are parsed."""
+        entities, prefixes, exact_calls = parse_cty_dat(SAMPLE_CTY)
+
+        assert [entity['name'] for entity in entities] == ['Poland', 'Canary Islands', 'Asiatic Russia']
+        assert entities[0]['longitude'] == 18.67  # West positive converted to East positive
+        assert 'SP' in prefixes
+        assert 'SP3WKW/MM' in exact_calls
+
+    @pytest.mark.unit
+    def test_parse_alias_overrides(self):
+        """Test that zone, continent, coordinate and timezone overrides are parsed."""
+        _, prefixes, _ = parse_cty_dat(SAMPLE_CTY)
+
+        entity_id, overrides = prefixes['UA0']
+        assert entity_id == 2
+        assert overrides == {
+            'cqz': 19,
+            'ituz': 34,
+            'continent': 'AS',
+            'latitude': 60.0,
+            'longitude': 130.0,
+            'tz': -10.0,
+        }
+
+
+class TestCtyIndex:
+    """Test cases for lookups in the compiled index."""
+
+    @pytest.mark.unit
+    def test_longest_prefix_match(self, index):
+        """Test lookup by longest matching prefix."""
+        info = index.get_all('SP3WKW')
+
+        assert info['country'] == 'Poland'
+        assert info['continent'] == 'EU'
+        assert info['latitude'] == 52.28
+        assert info['longitude'] == 18.67
+        assert info['cqz'] == 15
+        assert info['ituz'] == 28
+
+    @pytest.mark.unit
+    def test_exact_call_match(self, index):
+        """Test that exact callsign entries take precedence."""
+        assert index.get_all('sp3wkw/mm')['country'] == 'Poland'
+
+    @pytest.mark.unit
+    def test_prefix_overrides_applied(self, index):
+        """Test that alias overrides replace entity defaults."""
+        info = index.get_all('UA0ABC')
+
+        assert info['country'] == 'Asiatic Russia'
+        assert info['cqz'] == 19
+        assert info['ituz'] == 34
+        assert info['latitude'] == 60.0
+        assert info['longitude'] == 130.0
+
+    @pytest.mark.unit
+    def test_portable_callsigns(self, index):
+        """Test resolution of callsigns with slash."""
+        assert index.get_all('EA8/SP3ABC')['country'] == 'Canary Islands'
+        assert index.get_all('SP3ABC/EA8')['country'] == 'Canary Islands'
+        assert index.get_all('SP3ABC/P')['country'] == 'Poland'
+
+    @pytest.mark.unit
+    def test_unknown_callsign_raises_key_error(self, index):
+        """Test that unknown callsigns raise KeyError like pyhamtools Callinfo."""
+        with pytest.raises(KeyError):
+            index.get_all('XX1ABC')
+        assert index.lookup('') is None
+
+    @pytest.mark.unit
+    def test_invalid_index_file(self, tmp_path):
+        """Test that invalid index files are rejected."""
+        invalid = tmp_path / 'invalid.idx'
+        invalid.write_bytes(b'not an index file at all')
+
+        with pytest.raises(CtyIndexError):
+            CtyIndex(str(invalid))
+
+    @pytest.mark.unit
+    def test_index_staleness(self, tmp_path, index_file):
+        """Test detection of missing or outdated index."""
+        source = tmp_path / 'cty.dat'
+
+        assert not is_index_stale(str(source), index_file)
+        assert is_index_stale(str(source), str(tmp_path / 'missing.idx'))
+
+    @pytest.mark.unit
+    def test_index_staleness_format_and_compressed_copy(self, tmp_path, index_file):
+        """Test that index in older format or without gzip copy is recompiled."""
+        source = tmp_path / 'cty.dat'
+        with open(index_file, 'rb') as f:
+            data = f.read()
+
+        with open(index_file, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, 1, 0, 0, 0, 0, 0, 0, 0) + data[HEADER.size:])
+        assert is_index_stale(str(source), index_file)
+
+        with open(index_file, 'wb') as f:
+            f.write(data)
+        (tmp_path / 'cty.idx.gz').unlink()
+        assert is_index_stale(str(source), index_file)
+
+    @pytest.mark.unit
+    def test_compressed_copy(self, index_file):
+        """Test that gzip copy served to the browser holds the same index."""
+        with open(index_file, 'rb') as f:
+            data = f.read()
+        with open(compressed_index_file(index_file), 'rb') as f:
+            compressed = f.read()
+
+        assert gzip.decompress(compressed) == data
+        assert data.startswith(MAGIC)
+
+    @pytest.mark.unit
+    def test_bundled_cty_dat_compiles(self, tmp_path):
+        """Test that bundled CTY.DAT compiles and resolves common callsigns."""
+        destination = tmp_path / 'bundled.idx'
+        compile_cty_index(DEFAULT_CTY_DAT, str(destination))
+
+        bundled = CtyIndex(str(destination))
+        try:
+            assert bundled.get_all('DL1ABC')['country'] == 'Fed. Rep. of Germany'
+            assert bundled.get_all('W1AW')['country'] == 'United States'
+            assert bundled.get_all('JA1ABC')['country'] == 'Japan'
+        finally:
+            bundled.close()
+
+        # Compiled index is smaller than the CTY.DAT text it replaces in the browser
+        assert destination.stat().st_size < os.path.getsize(DEFAULT_CTY_DAT)
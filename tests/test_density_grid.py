@@ -0,0 +1,86 @@
+"""
+Test suite for QSO density grid.
+"""
+import base64
+import struct
+import pytest
+
+from qsomap.common.density_grid import MAX_COUNT, build_density_grid, square_cell
+
+
+def decode(grid, key='all'):
+    data = base64.b64decode(grid['layers'][key])
+    return list(struct.unpack(f"<{len(data) // 2}H", data))
+
+
+class TestDensityGrid:
+    """Test cases for density grid."""
+
+    @pytest.mark.unit
+    def test_square_cell(self):
+        """Test mapping of squares to matrix cells."""
+        assert square_cell('AA00') == (0, 0)
+        assert square_cell('RR99') == (179, 179)
+        assert square_cell('jo60aa') == (140, 96)
+        for locator in (None, '', 'JO', 'SA00', 'JOXX'):
+            assert square_cell(locator) is None
+
+    @pytest.mark.unit
+    def test_cropped_matrix(self):
+        """Test that matrix covers only squares with QSOs."""
+        qsos = [{'grid': 'JO60AA'}, {'grid': 'JO60XX'}, {'grid': 'JO71AA'}, {'grid': ''}]
+
+        grid = build_density_grid(qsos)
+
+        assert (grid['rows'], grid['cols']) == (2, 2)
+        assert (grid['south'], grid['west']) == (50, 12)
+        assert grid['max'] == 2
+        # Rows from south to north: JO60, JO70 / JO61, JO71
+        assert decode(grid) == [2, 0, 0, 1]
+
+    @pytest.mark.unit
+    def test_size_independent_of_qso_count(self):
+        """Test that encoded size depends on area, not on number of QSOs."""
+        small = build_density_grid([{'grid': 'JO60'}, {'grid': 'FN31'}])
+        large = build_density_grid([{'grid': 'JO60'}, {'grid': 'FN31'}] * 50000)
+
+        assert len(small['layers']['all']) == len(large['layers']['all'])
+        assert large['max'] == 50000
+
+    @pytest.mark.unit
+    def test_counts_saturate(self):
+        """Test that counts above uint16 range are saturated."""
+        grid = build_density_grid([{'grid': 'JO60'}] * (MAX_COUNT + 10))
+
+        assert decode(grid) == [MAX_COUNT]
+        assert grid['max'] == MAX_COUNT
+
+    @pytest.mark.unit
+    def test_split_by_band_and_year(self):
+        """Test optional split into one matrix per band or year."""
+        qsos = [
+            {'grid': 'JO60', 'band': '20m', 'date': '20230101'},
+            {'grid': 'JO61', 'band': '40m', 'date': '20240101'},
+        ]
+
+        by_band = build_density_grid(qsos, split_by='band')
+        by_year = build_density_grid(qsos, split_by='year')
+
+        assert sorted(by_band['layers']) == ['20m', '40m']
+        assert decode(by_band, '20m') == [1, 0]
+        assert decode(by_band, '40m') == [0, 1]
+        assert sorted(by_year['layers']) == ['2023', '2024']
+
+    @pytest.mark.unit
+    def test_invalid_split(self):
+        """Test that unsupported split is rejected."""
+        with pytest.raises(ValueError):
+            build_density_grid([], split_by='dxcc')
+
+    @pytest.mark.unit
+    def test_empty(self):
+        """Test grid without any usable squares."""
+        grid = build_density_grid([{'grid': None}])
+
+        assert grid['rows'] == 0
+        assert grid['layers'] == {}
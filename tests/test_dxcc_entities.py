@@ -0,0 +1,46 @@
+"""
+Test suite for DXCC entity numbers and names.
+"""
+import pytest
+
+from qsomap.common.dxcc_entities import (
+    DEFAULT_TABLES_JS, DXCC_ENTITIES, PREFIX_TO_DXCC, dxcc_code, dxcc_name, load_dxcc_tables,
+    render_tables_js,
+)
+
+
+class TestDxccEntities:
+    """Test cases for DXCC tables shared with Ham Wrapped."""
+
+    @pytest.mark.unit
+    def test_tables_loaded(self):
+        """Test that both tables are loaded."""
+        assert len(DXCC_ENTITIES) > 300
+        assert len(PREFIX_TO_DXCC) > 300
+        assert DXCC_ENTITIES[230]['continent'] == 'EU'
+
+    @pytest.mark.unit
+    def test_missing_table(self, tmp_path):
+        """Test that a data file without a table is rejected."""
+        path = tmp_path / 'dxcc.json'
+        path.write_text('{"entities": {"230": {"name": "Federal Republic of Germany"}}}')
+
+        with pytest.raises(ValueError):
+            load_dxcc_tables(str(path))
+
+    @pytest.mark.unit
+    def test_dxcc_from_primary_prefix(self):
+        """Test that primary prefixes map to DXCC numbers and names like in the browser."""
+        assert dxcc_code('DL') == 230
+        assert dxcc_code('*TA1') == dxcc_code('TA1')
+        # Variants fall back to the base prefix
+        assert dxcc_code('SP7') == dxcc_code('SP') == 269
+        assert dxcc_code('') is None
+        assert dxcc_name(230) == 'Federal Republic of Germany'
+        assert dxcc_name(999999) is None
+
+    @pytest.mark.unit
+    def test_browser_tables_up_to_date(self):
+        """Test that dxcc-tables.js was generated from the current dxcc.json."""
+        with open(DEFAULT_TABLES_JS, encoding='utf-8') as f:
+            assert f.read() == render_tables_js(), 'run: make dxcc-tables'
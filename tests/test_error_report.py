@@ -0,0 +1,66 @@
+"""
+Test suite for aggregated parse and lookup error reporting.
+"""
+import logging
+import pytest
+
+from qsomap.common.error_report import ErrorReport
+from qsomap.common.log_reader import CabrilloParser
+
+
+class TestErrorReport:
+    """Test cases for ErrorReport aggregation."""
+
+    @pytest.mark.unit
+    def test_counts_and_limited_samples(self):
+        """Test that errors are counted by type with a bounded number of samples."""
+        report = ErrorReport(max_samples=2)
+        for i in range(1000):
+            report.record('invalid_line', f'line {i}')
+        report.record('unknown_callsign', 'XX1ABC')
+
+        summary = report.summary()
+        assert summary['total'] == 1001
+        assert summary['counts'] == {'invalid_line': 1000, 'unknown_callsign': 1}
+        assert summary['samples']['invalid_line'] == ['line 0', 'line 1']
+
+    @pytest.mark.unit
+    def test_logs_once(self, caplog):
+        """Test that the whole report is written as a single log record."""
+        report = ErrorReport()
+        for i in range(50):
+            report.record('invalid_line', f'line {i}')
+
+        with caplog.at_level(logging.WARNING):
+            report.log(logging.getLogger('test'), 'cabrillo file')
+
+        assert len(caplog.records) == 1
+        assert '50 errors' in caplog.records[0].getMessage()
+
+    @pytest.mark.unit
+    def test_empty_report_not_logged(self, caplog):
+        """Test that nothing is logged without errors."""
+        with caplog.at_level(logging.WARNING):
+            ErrorReport().log(logging.getLogger('test'), 'adif file')
+
+        assert not caplog.records
+
+
+class TestCabrilloErrorAggregation:
+    """Test cases for Cabrillo parser error aggregation."""
+
+    @pytest.mark.unit
+    def test_invalid_lines_recorded(self):
+        """Test that invalid QSO lines are aggregated instead of logged one by one."""
+        content = "\n".join(
+            ["QSO: 14025 CW 2023-11-25 1423 SP3WKW 599 15 DL1ABC 599 14"] +
+            ["QSO: garbage"] * 500 +
+            ["QSO: notafreq CW 2023-11-25 1423 SP3WKW 599 15 DL1ABC 599 14"]
+        )
+        report = ErrorReport()
+
+        qsos = CabrilloParser().parse(content, errors=report)
+
+        assert len(qsos) == 1
+        assert report.counts['invalid_line'] == 501
+        assert len(report.samples['invalid_line']) == report.max_samples
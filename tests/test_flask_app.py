@@ -99,6 +99,8 @@ class TestFlaskApplication:
 
         # Should successfully process the file
         assert response.status_code == 200
+        # Map data includes precomputed grid aggregates
+        assert b'"locator": "JO62"' in response.data
 
     @pytest.mark.unit
     def test_application_configuration(self):
@@ -117,3 +119,156 @@ class TestFlaskApplication:
         """Test that upload blueprint is properly registered."""
         blueprint_names = [bp.name for bp in app.blueprints.values()]
         assert 'upload' in blueprint_names
+
+    @pytest.mark.unit
+    def test_metrics_route(self, client):
+        """Test that country lookup metrics are exposed as JSON."""
+        response = client.get('/api/v1/metrics')
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert 'source' in data['country_lookup']
+        assert 'circuit_breaker' in data['country_lookup']
+
+    @pytest.mark.unit
+    def test_ham_wrapped_cty_index_route(self, client):
+        """Test that compiled country index is served gzip-compressed and revalidated by ETag."""
+        import gzip
+        from qsomap.common.cty_index import MAGIC
+
+        response = client.get('/ham-wrapped/data/cty.idx', headers={'Accept-Encoding': 'gzip'})
+
+        assert response.status_code == 200
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert 'no-cache' in response.headers['Cache-Control']
+        assert gzip.decompress(response.data).startswith(MAGIC)
+
+        etag = response.headers['ETag']
+        response = client.get('/ham-wrapped/data/cty.idx', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+        assert response.status_code == 304
+
+        response = client.get('/ham-wrapped/data/cty.idx')
+        assert 'Content-Encoding' not in response.headers
+        assert response.data.startswith(MAGIC)
+
+    @pytest.mark.unit
+    def test_ham_wrapped_service_worker_route(self, client):
+        """Test that service worker is served with a scope covering the Ham Wrapped page."""
+        response = client.get('/ham-wrapped/sw.js')
+
+        assert response.status_code == 200
+        assert response.mimetype == 'text/javascript'
+        assert response.headers['Service-Worker-Allowed'] == '/ham-wrapped'
+        assert 'no-cache' in response.headers['Cache-Control']
+        assert b'CACHE_NAME' in response.data
+
+    @pytest.mark.integration
+    def test_upload_same_log_served_from_cache(self, client, monkeypatch):
+        """Test that uploading the same log twice processes it only once."""
+        from io import BytesIO
+        import qsomap.upload as upload
+        from qsomap.common.result_cache import ProcessedLogCache
+
+        calls = []
+        process_log = upload.process_log
+
+        def counting_process_log(*args):
+            calls.append(args)
+            return process_log(*args)
+
+        monkeypatch.setattr(upload, 'processed_logs', ProcessedLogCache())
+        monkeypatch.setattr(upload, 'process_log', counting_process_log)
+        adif_content = b"""<EOH>
+<QSO_DATE:8>20241101<TIME_ON:6>120000<CALL:6>SP0ABC<BAND:3>20m<MODE:2>CW<GRIDSQUARE:6>JO62AA<EOR>
+"""
+
+        for _ in range(2):
+            response = client.post('/upload', data={
+                'callsign': 'SP1ABC',
+                'my_locator': 'JO90AA',
+                'file': (BytesIO(adif_content), 'test.adif')
+            }, follow_redirects=True)
+            assert response.status_code == 200
+            assert b'"dxcc_count": 1' in response.data
+
+        assert len(calls) == 1
+
+    @pytest.mark.unit
+    def test_country_data_reload_clears_processed_logs(self, monkeypatch):
+        """Test that results computed with the previous country data are not served after a reload."""
+        import app as app_module
+        from qsomap.common.callinfo_provider import CallInfoProvider
+        from qsomap.common.result_cache import processed_logs, wrapped_statistics
+
+        callbacks = []
+        monkeypatch.setattr(CallInfoProvider, 'start_refresher',
+                            staticmethod(lambda on_reload=None: callbacks.append(on_reload)))
+        monkeypatch.setattr(app, 'callinfo', app.callinfo)
+        processed_logs.put('log', {'qsos': []})
+        wrapped_statistics.put('log', {})
+
+        app_module.start_country_data_refresher()
+        reloaded = object()
+        callbacks[0](reloaded)
+
+        assert app.callinfo is reloaded
+        assert processed_logs.get('log') is None
+        assert wrapped_statistics.get('log') is None
+
+    @pytest.mark.integration
+    def test_wrapped_api_cached_per_log(self, client, monkeypatch):
+        """Test Ham Wrapped statistics endpoint and that each log is processed once for all years."""
+        from io import BytesIO
+        import qsomap.upload as upload
+        from qsomap.common.result_cache import ProcessedLogCache
+
+        calls = []
+        compute = upload.compute_wrapped_statistics
+
+        def counting_compute(*args):
+            calls.append(args)
+            return compute(*args)
+
+        monkeypatch.setattr(upload, 'wrapped_statistics', ProcessedLogCache())
+        monkeypatch.setattr(upload, 'compute_wrapped_statistics', counting_compute)
+        adif_content = b"""<EOH>
+<QSO_DATE:8>20241101<TIME_ON:6>120000<CALL:6>SP0ABC<BAND:3>20m<MODE:2>CW<GRIDSQUARE:6>JO62AA<EOR>
+<QSO_DATE:8>20250102<TIME_ON:4>1200<CALL:5>DL1AA<BAND:3>40m<MODE:3>SSB<GRIDSQUARE:4>JO51<EOR>
+"""
+
+        response = client.post('/api/v1/wrapped', data={
+            'my_locator': 'JO90AA',
+            'file': (BytesIO(adif_content), 'test.adif')
+        })
+        assert response.status_code == 200
+        assert sorted(response.get_json()['years']) == ['2024', '2025']
+
+        response = client.post('/api/v1/wrapped?year=2025', data={
+            'my_locator': 'JO90AA',
+            'file': (BytesIO(adif_content), 'test.adif')
+        })
+        stats = response.get_json()['stats']
+        assert stats['totalQSOs'] == 1
+        assert stats['odx']['call'] == 'DL1AA'
+        assert stats['yearOverYear']['totalQSOs'] == 1
+        assert len(calls) == 1
+
+        response = client.post('/api/v1/wrapped?year=2023', data={
+            'my_locator': 'JO90AA',
+            'file': (BytesIO(adif_content), 'test.adif')
+        })
+        assert response.status_code == 404
+
+    @pytest.mark.unit
+    def test_wrapped_api_invalid_input(self, client):
+        """Test that Ham Wrapped statistics endpoint rejects invalid files and locators."""
+        from io import BytesIO
+
+        response = client.post('/api/v1/wrapped', data={'file': (BytesIO(b'data'), 'test.txt')})
+        assert response.status_code == 400
+
+        response = client.post('/api/v1/wrapped', data={
+            'my_locator': 'XX',
+            'file': (BytesIO(b'<EOH>'), 'test.adif')
+        })
+        assert response.status_code == 400
@@ -0,0 +1,79 @@
+"""
+Test suite for zoom-dependent aggregation of QSOs by Maidenhead locator.
+"""
+import pytest
+
+from qsomap.common.grid_aggregation import (
+    AGGREGATION_LEVELS,
+    aggregate_qsos,
+    build_grid_aggregates,
+    locator_center,
+)
+
+
+def make_qso(grid, band='20m', mode='CW'):
+    return {'call': 'SP1ABC', 'grid': grid, 'band': band, 'mode': mode}
+
+
+class TestGridAggregation:
+    """Test cases for grid aggregation."""
+
+    @pytest.mark.unit
+    def test_locator_center(self):
+        """Test center coordinates of fields and squares."""
+        assert locator_center('JO') == (55.0, 10.0)
+        assert locator_center('JO60') == (50.5, 13.0)
+        assert locator_center('jo60') == (50.5, 13.0)
+
+    @pytest.mark.unit
+    def test_locator_center_invalid(self):
+        """Test that invalid locators are rejected."""
+        for locator in ('', 'J', 'JO6', 'ZZ', 'JO60AA'):
+            with pytest.raises(ValueError):
+                locator_center(locator)
+
+    @pytest.mark.unit
+    def test_aggregate_by_square(self):
+        """Test counting QSOs per square split by band and mode."""
+        qsos = [
+            make_qso('JO60AA'),
+            make_qso('jo60xx', band='40m'),
+            make_qso('JO60AA', mode='SSB'),
+            make_qso('JO61AA'),
+            make_qso('FN31pr'),
+        ]
+
+        cells = aggregate_qsos(qsos, 4)
+
+        assert [cell['locator'] for cell in cells] == ['FN31', 'JO60', 'JO61']
+        jo60 = cells[1]
+        assert jo60['count'] == 3
+        assert jo60['counts'] == {'20m|CW': 1, '40m|CW': 1, '20m|SSB': 1}
+        assert (jo60['latitude'], jo60['longitude']) == locator_center('JO60')
+
+    @pytest.mark.unit
+    def test_aggregate_by_field(self):
+        """Test that squares in the same field are merged."""
+        qsos = [make_qso('JO60AA'), make_qso('JO61AA'), make_qso('FN31pr')]
+
+        cells = aggregate_qsos(qsos, 2)
+
+        assert {cell['locator']: cell['count'] for cell in cells} == {'FN': 1, 'JO': 2}
+
+    @pytest.mark.unit
+    def test_invalid_grids_skipped(self):
+        """Test that QSOs without usable grid are left out."""
+        qsos = [make_qso(''), make_qso(None), make_qso('J'), make_qso('ZZ00')]
+
+        assert aggregate_qsos(qsos, 4) == []
+
+    @pytest.mark.unit
+    def test_build_grid_aggregates(self):
+        """Test that all levels are built in zoom order."""
+        aggregates = build_grid_aggregates([make_qso('JO60AA')])
+
+        assert [level['level'] for level in aggregates] == [name for name, _, _ in AGGREGATION_LEVELS]
+        max_zooms = [level['max_zoom'] for level in aggregates]
+        assert max_zooms == sorted(max_zooms)
+        assert aggregates[0]['cells'][0]['locator'] == 'JO'
+        assert aggregates[1]['cells'][0]['locator'] == 'JO60'
@@ -0,0 +1,57 @@
+"""
+Import time budget tests for worker and CLI startup.
+
+Budgets can be relaxed on slow machines with IMPORT_TIME_BUDGET_MS.
+"""
+import os
+import pytest
+
+from qsomap.utils.import_time import measure_import_time, parse_importtime, total_import_time_us
+
+# Modules which must only be imported on first use
+HEAVY_MODULES = ('pyhamtools', 'redis', 'adif_io')
+
+APP_BUDGET_MS = float(os.environ.get('IMPORT_TIME_BUDGET_MS', '1000'))
+LOG_READER_BUDGET_MS = APP_BUDGET_MS / 10
+
+LOCAL_ENV = {'USE_COUNTRYFILE_FROM_REDIS': 'false', 'COUNTRY_DATA_RELOAD_INTERVAL': '0'}
+
+
+class TestImportTime:
+    """Test cases for import time budget."""
+
+    @pytest.mark.unit
+    def test_parse_importtime(self):
+        """Test parsing of -X importtime output."""
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   qsomap.common.grid_validator\n"
+            "import time:       300 |        420 | qsomap.common.log_reader\n"
+        )
+
+        timings = parse_importtime(output)
+
+        assert [t.module for t in timings] == ['qsomap.common.grid_validator', 'qsomap.common.log_reader']
+        assert timings[0].depth == 1
+        assert total_import_time_us(timings, 'qsomap.common.log_reader') == 420
+
+    @pytest.mark.unit
+    def test_log_reader_defers_heavy_imports(self):
+        """Test that log reader imports no heavy dependencies and stays within budget."""
+        timings = measure_import_time('qsomap.common.log_reader', env=LOCAL_ENV)
+        imported = {t.module for t in timings}
+
+        for module in HEAVY_MODULES + ('flask',):
+            assert module not in imported, f"{module} should be imported lazily"
+        assert total_import_time_us(timings, 'qsomap.common.log_reader') / 1000 < LOG_READER_BUDGET_MS
+
+    @pytest.mark.unit
+    def test_app_import_within_budget(self, tmp_path):
+        """Test that worker startup does not import heavy modules and stays within budget."""
+        # Importing app configures file logging, keep the log out of the working tree
+        timings = measure_import_time('app', env={**LOCAL_ENV, 'LOG_DIR': str(tmp_path)})
+        imported = {t.module for t in timings}
+
+        for module in HEAVY_MODULES:
+            assert module not in imported, f"{module} should be imported lazily"
+        assert total_import_time_us(timings, 'app') / 1000 < APP_BUDGET_MS
@@ -0,0 +1,60 @@
+"""
+Test suite for the queue-based logging pipeline.
+"""
+import logging
+import pytest
+
+from qsomap.utils import logging_setup
+
+
+class ListHandler(logging.Handler):
+    """Handler collecting formatted messages."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+
+
+@pytest.fixture
+def restore_root_logger():
+    """Restore root logger handlers and level after the test."""
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    logging_setup.stop_queue_listener()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+class TestQueueLogging:
+    """Test cases for QueueHandler/QueueListener logging."""
+
+    @pytest.mark.unit
+    def test_records_delivered_through_queue(self, restore_root_logger):
+        """Test that records reach output handlers via the listener thread."""
+        output = ListHandler()
+        logging_setup.configure_queue_logging([output], fmt='%(levelname)s %(message)s')
+
+        logging.getLogger('qsomap.test').warning('queued message')
+        logging_setup.stop_queue_listener()
+
+        assert output.messages == ['WARNING queued message']
+
+    @pytest.mark.unit
+    def test_restart_after_fork(self, restore_root_logger):
+        """Test that a new listener can be started, as done in gunicorn post_fork."""
+        output = ListHandler()
+        logging_setup.configure_queue_logging([output], fmt='%(message)s')
+        logging_setup.stop_queue_listener()
+
+        assert logging_setup.restart_queue_listener() is not None
+        logging.getLogger('qsomap.test').warning('after fork')
+        logging_setup.stop_queue_listener()
+
+        assert output.messages == ['after fork']
@@ -0,0 +1,68 @@
+"""
+Test suite for summary statistics collected during log processing.
+"""
+import pytest
+
+from qsomap.common.qso_summary import QsoSummary
+
+
+def make_qso(call, dxcc='Poland', band='20m', mode='CW', distance=None):
+    return {'call': call, 'dxcc': dxcc, 'band': band, 'mode': mode, 'distance': distance,
+            'date': '20241101', 'grid': 'JO62AA', 'latitude': 52.0, 'longitude': 14.0}
+
+
+class TestQsoSummary:
+    """Test cases for QsoSummary."""
+
+    @pytest.mark.unit
+    def test_counts(self):
+        """Test totals and DXCC/band counts."""
+        summary = QsoSummary()
+        for qso in (make_qso('A'), make_qso('B', dxcc='Germany', band='40m'), make_qso('C', mode='SSB')):
+            summary.add(qso)
+
+        result = summary.summary()
+
+        assert result['total'] == 3
+        assert result['dxcc_count'] == 2
+        assert result['band_count'] == 2
+        assert result['bands'] == [['20m', 2], ['40m', 1]]
+        assert result['dxcc'][0] == {'name': 'Poland', 'total': 2, 'modes': [['CW', 1], ['SSB', 1]]}
+
+    @pytest.mark.unit
+    def test_mode_order_and_ties(self):
+        """Test custom mode order and first-seen order for equal counts."""
+        summary = QsoSummary()
+        for mode in ('RTTY', 'FT8', 'AM', 'CW'):
+            summary.add(make_qso('A', dxcc='Japan', mode=mode))
+        for mode in ('CW', 'SSB', 'FT4', 'FM'):
+            summary.add(make_qso('B', dxcc='Italy', mode=mode))
+
+        result = summary.summary()
+
+        assert [entry['name'] for entry in result['dxcc']] == ['Japan', 'Italy']
+        assert [mode for mode, _ in result['dxcc'][0]['modes']] == ['CW', 'FT8', 'AM', 'RTTY']
+
+    @pytest.mark.unit
+    def test_longest_distance_top_k(self):
+        """Test that only the longest distances are kept, sorted descending."""
+        summary = QsoSummary(longest_count=3)
+        for i, distance in enumerate([100, None, 500, 300, 500, 50, 400]):
+            summary.add(make_qso(f'CALL{i}', distance=distance))
+
+        longest = summary.summary()['longest']
+
+        assert [(qso['call'], qso['distance']) for qso in longest] == [('CALL2', 500), ('CALL4', 500), ('CALL6', 400)]
+        assert set(longest[0]) == {'call', 'dxcc', 'distance', 'band', 'mode', 'date', 'grid'}
+
+    @pytest.mark.unit
+    def test_matches_full_sort(self):
+        """Test that heap-based top-k gives the same result as sorting all QSOs."""
+        qsos = [make_qso(f'CALL{i}', distance=(i * 37) % 50) for i in range(500)]
+        summary = QsoSummary()
+        for qso in qsos:
+            summary.add(qso)
+
+        expected = sorted(qsos, key=lambda qso: -qso['distance'])[:20]
+
+        assert [qso['call'] for qso in summary.summary()['longest']] == [qso['call'] for qso in expected]
@@ -0,0 +1,49 @@
+"""
+Test suite for processed log cache.
+"""
+import pytest
+
+from qsomap.common.result_cache import ProcessedLogCache, log_hash
+
+
+class TestResultCache:
+    """Test cases for processed log cache."""
+
+    @pytest.mark.unit
+    def test_log_hash_depends_on_params(self):
+        """Test that the key changes with content and processing parameters."""
+        assert log_hash('log', 52.0, 21.0) == log_hash('log', 52.0, 21.0)
+        assert log_hash('log', 52.0, 21.0) != log_hash('log', 52.0, 22.0)
+        assert log_hash('log') != log_hash('log2')
+
+    @pytest.mark.unit
+    def test_lru_eviction(self):
+        """Test that least recently used entry is evicted."""
+        cache = ProcessedLogCache(max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+        assert len(cache) == 2
+
+    @pytest.mark.unit
+    def test_disabled(self):
+        """Test that zero size disables caching."""
+        cache = ProcessedLogCache(max_entries=0)
+        cache.put('a', 1)
+
+        assert cache.get('a') is None
+
+    @pytest.mark.unit
+    def test_clear(self):
+        """Test that clearing removes all entries."""
+        cache = ProcessedLogCache()
+        cache.put('a', 1)
+        cache.clear()
+
+        assert cache.get('a') is None
+        assert len(cache) == 0
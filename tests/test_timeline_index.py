@@ -0,0 +1,61 @@
+"""
+Test suite for precomputed timeline index.
+"""
+import pytest
+
+from qsomap.common.timeline_index import build_timeline_index, parse_qso_timestamp
+
+
+class TestTimelineIndex:
+    """Test cases for timeline index."""
+
+    @pytest.mark.unit
+    def test_parse_qso_timestamp(self):
+        """Test conversion of ADIF date and time to epoch seconds (UTC)."""
+        assert parse_qso_timestamp('19700101', '000000') == 0
+        assert parse_qso_timestamp('19700101', '0001') == 60
+        assert parse_qso_timestamp('19700102') == 86400
+        assert parse_qso_timestamp('20240229', '235959') == 1709251199
+
+    @pytest.mark.unit
+    def test_parse_invalid_timestamp(self):
+        """Test that invalid dates and times are rejected."""
+        for date, time in (('', ''), (None, None), ('2024011', ''), ('20240230', ''), ('20240101', '2560'), ('20240101', '12:00')):
+            assert parse_qso_timestamp(date, time) is None
+
+    @pytest.mark.unit
+    def test_sorted_times_and_order(self):
+        """Test that times are sorted and order points back into QSO list."""
+        qsos = [
+            {'date': '20240101', 'time': '1205'},
+            {'date': '', 'time': ''},
+            {'date': '20240101', 'time': '1200'},
+            {'date': '20240101', 'time': '120030'},
+        ]
+
+        index = build_timeline_index(qsos)
+
+        assert index['order'] == [2, 3, 0]
+        assert index['times'] == sorted(index['times'])
+        for timestamp, qso_index in zip(index['times'], index['order']):
+            assert timestamp == parse_qso_timestamp(qsos[qso_index]['date'], qsos[qso_index]['time'])
+
+    @pytest.mark.unit
+    def test_minute_histogram(self):
+        """Test per-minute counts of minutes with QSOs."""
+        qsos = [
+            {'date': '19700101', 'time': '000010'},
+            {'date': '19700101', 'time': '000050'},
+            {'date': '19700101', 'time': '000500'},
+        ]
+
+        index = build_timeline_index(qsos)
+
+        assert index['minutes'] == [0, 5]
+        assert index['counts'] == [2, 1]
+        assert sum(index['counts']) == len(index['times'])
+
+    @pytest.mark.unit
+    def test_empty(self):
+        """Test index for log without dated QSOs."""
+        assert build_timeline_index([{'call': 'SP1ABC'}]) == {'times': [], 'order': [], 'minutes': [], 'counts': []}
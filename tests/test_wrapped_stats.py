@@ -0,0 +1,153 @@
+"""
+Test suite for Ham Wrapped statistics computed on the server.
+"""
+import pytest
+from app import app
+
+from qsomap.common.wrapped_stats import WrappedStatisticsCalculator, compute_wrapped_statistics
+
+ADIF_LOG = """Test log <EOH>
+<CALL:5>DL1AA <QSO_DATE:8>20250104 <TIME_ON:4>1200 <BAND:3>20m <MODE:2>cw <EOR>
+<CALL:5>DL2BB <QSO_DATE:8>20250104 <TIME_ON:4>1300 <BAND:3>40m <MODE:3>ft8 <EOR>
+<CALL:5>JA1AA <QSO_DATE:8>20250105 <TIME_ON:4>0800 <BAND:3>40m <MODE:3>ssb <EOR>
+<CALL:5>W1XYZ <QSO_DATE:8>20250105 <TIME_ON:4>0900 <BAND:3>20m <MODE:3>ssb <DXCC:3>291 <EOR>
+"""
+
+
+def make_qso(call, date='20250104', time='1200', band='20M', mode='CW', country='Poland',
+             continent='EU', distance=None, **fields):
+    qso = {'call': call, 'date': date, 'time': time, 'band': band, 'mode': mode, 'submode': '',
+           'grid': 'JO62AA', 'dxcc': country, 'country': country, 'continent': continent, 'cq_zone': 15,
+           'dxcc_id': None, 'latitude': 52.0, 'longitude': 14.0, 'distance': distance, 'log_distance': None,
+           'contest_id': '', 'sat_name': '', 'prop_mode': '', 'sota_ref': '', 'pota_ref': '', 'iota': '',
+           'wwff_ref': ''}
+    qso.update(fields)
+    return qso
+
+
+class TestWrappedStatistics:
+    """Test cases for WrappedStatisticsCalculator."""
+
+    @pytest.mark.unit
+    def test_statistics_per_year(self):
+        """Test that every year gets its own statistics and undated QSOs are skipped."""
+        qsos = [
+            make_qso('SP1AA', date='20240105'),
+            make_qso('SP1AA', date='20250104'),
+            make_qso('DL1AA', date='20250104', band='40M', country='Germany'),
+            make_qso('JA1AA', date='20250105', continent='AS', country='Japan', mode='MFSK', submode='FT4'),
+            make_qso('W1AA', date=''),
+        ]
+
+        years = WrappedStatisticsCalculator(qsos, has_locator=True).calculate_by_year()
+
+        assert sorted(years) == [2024, 2025]
+        stats = years[2025]
+        assert stats['totalQSOs'] == 3
+        assert stats['uniqueCallsigns']['count'] == 3
+        assert stats['byMode']['distribution'] == {'CW': 2, 'FT4': 1}
+        assert stats['byBand']['favorite'] == {'band': '20M', 'count': 2, 'percentage': '66.7'}
+        assert stats['byContinent']['count'] == 2
+        assert stats['byDXCC']['count'] == 3
+        assert stats['bandSlots']['totalSlots'] == 3
+        assert stats['byDay']['best'] == {'date': '2025-01-04', 'count': 2}
+        # 2025-01-04 is a Saturday (index 6, counted from Sunday like in JavaScript)
+        assert stats['byDayOfWeek']['best']['dayIndex'] == 6
+        assert stats['streaks'] == {'maxStreak': 2, 'maxStreakStart': '2025-01-04', 'maxStreakEnd': '2025-01-05'}
+        assert stats['yearOverYear']['year'] == 2024
+        assert stats['yearOverYear']['totalQSOs'] == 1
+        assert years[2024]['yearOverYear'] is None
+
+    @pytest.mark.unit
+    def test_odx_and_closest(self):
+        """Test ODX and closest QSO from distances computed with own locator."""
+        qsos = [
+            make_qso('DL1AA', distance=600),
+            make_qso('JA1AA', distance=8500, country='Japan'),
+            make_qso('SP1AA', distance=0),
+        ]
+
+        stats = WrappedStatisticsCalculator(qsos, has_locator=True).calculate_by_year()[2025]
+
+        assert stats['odx']['call'] == 'JA1AA'
+        assert stats['odx']['distance'] == 8500
+        assert stats['odx']['dxccName'] == 'Japan'
+        assert stats['closestQSO']['call'] == 'DL1AA'
+
+    @pytest.mark.unit
+    def test_odx_without_locator(self):
+        """Test that without locator log distances are used, otherwise ODX is estimated."""
+        logged = [make_qso('DL1AA', log_distance=650.0), make_qso('JA1AA', latitude=35.0, longitude=139.0)]
+        estimated = [make_qso('JA1AA', latitude=35.0, longitude=139.0)]
+
+        stats = WrappedStatisticsCalculator(logged).calculate_by_year()[2025]
+        assert stats['odx']['call'] == 'DL1AA'
+        assert stats['odx']['distance'] == 650.0
+
+        stats = WrappedStatisticsCalculator(estimated).calculate_by_year()[2025]
+        assert stats['odx']['call'] == 'JA1AA'
+        assert stats['odx']['distance'] > 8000
+        assert stats['closestQSO'] is None
+
+    @pytest.mark.unit
+    def test_rate_longest_day_and_activities(self):
+        """Test QSO rate, longest day, contests and special activities."""
+        qsos = [
+            make_qso('A1', time='1200', contest_id='CQ-WPX'),
+            make_qso('A2', time='1230', contest_id='CQ-WPX', pota_ref='SP-0001'),
+            make_qso('A3', time='1815', sat_name='QO-100'),
+        ]
+
+        stats = WrappedStatisticsCalculator(qsos).calculate_by_year()[2025]
+
+        assert stats['qsoRate']['maxRate'] == 2
+        assert stats['qsoRate']['peakHour'] == '2025-01-04T12:00:00.000Z'
+        assert stats['longestDay']['duration'] == '6.3'
+        assert stats['longestDay']['firstQSO'] == '2025-01-04T12:00:00.000Z'
+        assert stats['contestActivity']['contests'] == [{'contest': 'CQ-WPX', 'count': 2}]
+        assert stats['specialModes']['pota']['count'] == 1
+        assert stats['specialModes']['satellite']['count'] == 1
+        assert stats['firstQSO']['call'] == 'A1'
+        assert stats['lastQSO']['call'] == 'A3'
+
+
+class TestWrappedLogProcessing:
+    """Test cases for statistics computed from a log file with the real country index."""
+
+    @pytest.mark.integration
+    def test_compute_from_adif(self):
+        """Test DXCC numbers and names, continents, CQ zones, bands and modes from an ADIF log."""
+        with app.app_context():
+            stats = compute_wrapped_statistics(ADIF_LOG)[2025]
+
+        assert stats['totalQSOs'] == 4
+        assert stats['byDXCC']['sorted'] == [
+            {'dxcc': 230, 'name': 'Federal Republic of Germany', 'count': 2},
+            {'dxcc': 339, 'name': 'Japan', 'count': 1},
+            # Not in DXCC_DATA, named by the country index
+            {'dxcc': 291, 'name': 'United States', 'count': 1},
+        ]
+        assert stats['bandSlots']['topDxcc'][0] == {
+            'dxcc': '230', 'name': 'Federal Republic of Germany', 'slots': 2, 'bands': ['20M', '40M']}
+        assert stats['byContinent']['distribution'] == {'EU': 2, 'AS': 1, 'NA': 1}
+        assert stats['byBand']['distribution'] == {'20M': 2, '40M': 2}
+        assert stats['byMode']['distribution'] == {'CW': 1, 'FT8': 1, 'SSB': 2}
+        assert stats['firstQSO']['cqZone'] == 14
+
+    @pytest.mark.integration
+    def test_unknown_callsign_has_no_distance(self):
+        """Test that unknown callsigns without a logged locator never become the ODX or closest QSO."""
+        adif = """Test log <EOH>
+<CALL:5>DL1AA <QSO_DATE:8>20250104 <TIME_ON:4>1200 <BAND:3>20m <MODE:2>cw <EOR>
+<CALL:6>Q0ZZZZ <QSO_DATE:8>20250104 <TIME_ON:4>1300 <BAND:3>20m <MODE:2>cw <EOR>
+"""
+        with app.app_context():
+            estimated = compute_wrapped_statistics(adif)[2025]
+            # JO60AA, the default grid of failed lookups, would be closer than DL1AA
+            measured = compute_wrapped_statistics(adif, 52.0, 21.0)[2025]
+
+        assert estimated['totalQSOs'] == 2
+        assert estimated['odx']['call'] == 'DL1AA'
+        assert measured['odx']['call'] == 'DL1AA'
+        assert measured['closestQSO']['call'] == 'DL1AA'
+        assert measured['byDXCC']['count'] == 1